@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AlarmasConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'alarmas'
+
+    def ready(self):
+        import alarmas.signals
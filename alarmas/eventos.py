@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+
+from alarmas.repositories.alarma_repository import AlarmaRepository
+from alarmas.serializers.alarma_serializer import AlarmaSerializer
+from comun.difusion import Difusor
+
+logger = logging.getLogger(__name__)
+
+ALARMA_CREADA = "alarma_creada"
+ALARMA_VISTA = "alarma_vista"
+NO_VISTAS = "no_vistas"
+
+MODO_LOCAL = "local"
+MODO_SONDEO = "sondeo"
+
+# Margen del sondeo: una transacción que confirma tarde puede traer un
+# updated_at algo anterior a la última marca leída
+VENTANA_SONDEO = timedelta(seconds=10)
+
+# Suscriptores (conexiones SSE) de este proceso
+difusor = Difusor()
+
+_sondeo = {"tarea": None}
+
+
+def modo_sondeo() -> bool:
+    return settings.ALARMAS_EVENTOS_MODO == MODO_SONDEO
+
+
+# =========================================================================
+# SUSCRIPCIÓN
+# =========================================================================
+def suscribir() -> asyncio.Queue:
+    """
+    Registra una conexión y retorna su cola de eventos (evento, datos).
+    En modo sondeo arranca, si no corre ya, la tarea que sondea la BD
+    (una por proceso, sin importar cuántas conexiones haya).
+    """
+    cola = difusor.suscribir()
+
+    if modo_sondeo():
+        tarea = _sondeo["tarea"]
+        if tarea is None or tarea.done():
+            _sondeo["tarea"] = asyncio.get_running_loop().create_task(_sondear())
+
+    return cola
+
+
+def desuscribir(cola: asyncio.Queue):
+    difusor.desuscribir(cola)
+
+
+# =========================================================================
+# PUBLICACIÓN (MODO LOCAL)
+# =========================================================================
+def publicar_al_confirmar(evento: str, datos: dict):
+    """
+    Publica el evento a las conexiones de este proceso cuando se confirma
+    la transacción actual (nunca eventos de cambios revertidos). Si `datos`
+    no trae "no_vistas" se agrega el conteo vigente.
+
+    Sin conexiones abiertas no hace nada (ni consulta el conteo). En modo
+    sondeo tampoco: el sondeo ve todos los cambios, también los propios.
+    """
+    if modo_sondeo() or not difusor.hay_suscriptores():
+        return
+
+    transaction.on_commit(lambda: _publicar(evento, datos), robust=True)
+
+
+def _publicar(evento, datos):
+    if "no_vistas" not in datos:
+        datos = {**datos, "no_vistas": AlarmaRepository.contar_no_vistas()}
+    difusor.publicar(evento, datos)
+
+
+def publicar_alarma_creada(alarma):
+    publicar_al_confirmar(ALARMA_CREADA, {"alarma": AlarmaSerializer(alarma).data})
+
+
+def publicar_alarmas_vistas(ids_alarma, no_vistas=None):
+    datos = {"ids": list(ids_alarma)}
+    if no_vistas is not None:
+        datos["no_vistas"] = no_vistas
+    publicar_al_confirmar(ALARMA_VISTA, datos)
+
+
+def publicar_no_vistas(no_vistas=None):
+    publicar_al_confirmar(NO_VISTAS, {} if no_vistas is None else {"no_vistas": no_vistas})
+
+
+# =========================================================================
+# SONDEO DE LA BD (VARIOS WORKERS)
+# =========================================================================
+async def _sondear():
+    """
+    Mientras haya conexiones en este proceso, cada ALARMAS_EVENTOS_INTERVALO
+    segundos lee de la BD las alarmas creadas y vistas desde la última
+    lectura y las difunde. El costo es de tres consultas por intervalo y
+    proceso, no por conexión.
+    """
+    estado = await sync_to_async(_estado_inicial)()
+
+    while difusor.hay_suscriptores():
+        await asyncio.sleep(settings.ALARMAS_EVENTOS_INTERVALO)
+        try:
+            eventos, estado = await sync_to_async(_leer_cambios)(estado)
+        except Exception:
+            logger.exception("Error al sondear los cambios de alarmas.")
+            continue
+
+        for evento, datos in eventos:
+            difusor.publicar(evento, datos)
+
+
+def _estado_inicial():
+    return {
+        "ultimo_id": AlarmaRepository.get_ultimo_id(),
+        "marca": AlarmaRepository.get_ultima_modificacion(),
+        "no_vistas": AlarmaRepository.contar_no_vistas(),
+        "vistas_recientes": {},
+    }
+
+
+def _leer_cambios(estado):
+    """Retorna (eventos, nuevo estado) a partir del estado de la lectura anterior."""
+    creadas = list(AlarmaRepository.get_creadas_despues_de(estado["ultimo_id"]))
+    vistas = list(AlarmaRepository.get_vistas_desde(
+        estado["marca"] - VENTANA_SONDEO if estado["marca"] else None
+    ))
+    no_vistas = AlarmaRepository.contar_no_vistas()
+
+    # Las vistas dentro de la ventana ya emitidas no se repiten
+    recientes = estado["vistas_recientes"]
+    ids_vistas = [
+        fila["id_alarma"] for fila in vistas
+        if recientes.get(fila["id_alarma"]) != fila["updated_at"]
+    ]
+    recientes.update((fila["id_alarma"], fila["updated_at"]) for fila in vistas)
+
+    marcas = [fila["updated_at"] for fila in vistas] + ([estado["marca"]] if estado["marca"] else [])
+    marca = max(marcas) if marcas else None
+    if marca:
+        recientes = {pk: momento for pk, momento in recientes.items() if momento >= marca - VENTANA_SONDEO}
+
+    eventos = [
+        (ALARMA_CREADA, {"alarma": AlarmaSerializer(alarma).data, "no_vistas": no_vistas})
+        for alarma in creadas
+    ]
+    if ids_vistas:
+        eventos.append((ALARMA_VISTA, {"ids": ids_vistas, "no_vistas": no_vistas}))
+    if not eventos and no_vistas != estado["no_vistas"]:
+        # Cambios sin evento propio (p. ej. alarmas eliminadas)
+        eventos.append((NO_VISTAS, {"no_vistas": no_vistas}))
+
+    return eventos, {
+        "ultimo_id": creadas[-1].pk if creadas else estado["ultimo_id"],
+        "marca": marca,
+        "no_vistas": no_vistas,
+        "vistas_recientes": recientes,
+    }
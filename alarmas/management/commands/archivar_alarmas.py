@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from comun.servicios import obtener_servicio
+
+
+class Command(BaseCommand):
+    """
+    Mueve a la tabla alarmas_archivo las alarmas vistas registradas hace
+    más de N días (por defecto ALARMAS_RETENCION_DIAS). Trabaja por lotes
+    en transacciones cortas, así que puede correr con la aplicación en
+    uso; conviene programarlo a diario (cron). Las alarmas no vistas
+    nunca se archivan. El historial completo sigue disponible en
+    /api/alarmas/historial/ y en la exportación.
+
+    Uso:
+        python manage.py archivar_alarmas
+        python manage.py archivar_alarmas --dias 180 --lote 500 --pausa 0.2
+        python manage.py archivar_alarmas --simular
+    """
+
+    help = "Archiva las alarmas vistas más antiguas que la retención."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dias", type=int, default=settings.ALARMAS_RETENCION_DIAS,
+                            help="Días de retención en la tabla viva.")
+        parser.add_argument("--lote", type=int, default=settings.ALARMAS_ARCHIVO_LOTE,
+                            help="Alarmas movidas por transacción.")
+        parser.add_argument("--pausa", type=float, default=0.1,
+                            help="Segundos de espera entre lotes.")
+        parser.add_argument("--simular", action="store_true",
+                            help="Solo informa cuántas alarmas se archivarían.")
+
+    def handle(self, *args, **options):
+        service = obtener_servicio("alarma")
+
+        try:
+            if options["simular"]:
+                cantidad = service.contar_alarmas_archivables(dias=options["dias"])
+                self.stdout.write(f"Se archivarían {cantidad} alarma(s) vistas con más de {options['dias']} días.")
+                return
+
+            total = service.archivar_alarmas(
+                dias=options["dias"],
+                tamano_lote=options["lote"],
+                pausa=options["pausa"]
+            )
+        except ValidationError as e:
+            raise CommandError(e.detail)
+
+        self.stdout.write(self.style.SUCCESS(f"Se archivaron {total} alarma(s)."))
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarmas', '0001_initial'),
+        ('maquinarias', '0004_alter_maquinaria_foto'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alarma',
+            index=models.Index(condition=models.Q(('vista', False)), fields=['maquina', '-fecha_registro'], name='idx_alarma_no_vistas'),
+        ),
+        migrations.AddIndex(
+            model_name='alarma',
+            index=models.Index(fields=['nivel'], name='idx_alarma_nivel'),
+        ),
+        migrations.AddIndex(
+            model_name='alarma',
+            index=models.Index(fields=['-fecha_registro'], name='idx_alarma_fecha_desc'),
+        ),
+    ]
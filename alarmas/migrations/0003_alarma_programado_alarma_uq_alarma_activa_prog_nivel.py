@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarmas', '0002_alarma_idx_alarma_no_vistas_alarma_idx_alarma_nivel_and_more'),
+        ('mantenimientos_programados', '0005_estadomantenimiento'),
+        ('maquinarias', '0004_alter_maquinaria_foto'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alarma',
+            name='programado',
+            field=models.ForeignKey(blank=True, db_column='id_programado', help_text='Mantenimiento programado que originó la alarma (si aplica).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='alarmas', to='mantenimientos_programados.mantenimientoprogramado'),
+        ),
+        migrations.AddConstraint(
+            model_name='alarma',
+            constraint=models.UniqueConstraint(condition=models.Q(('vista', False)), fields=('maquina', 'programado', 'nivel'), name='uq_alarma_activa_prog_nivel'),
+        ),
+    ]
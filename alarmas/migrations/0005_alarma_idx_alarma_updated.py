@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarmas', '0004_alarma_idx_alarma_maq_fecha'),
+        ('mantenimientos_programados', '0005_estadomantenimiento'),
+        ('maquinarias', '0005_maquinaria_foto_miniatura'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alarma',
+            index=models.Index(fields=['updated_at'], name='idx_alarma_updated'),
+        ),
+    ]
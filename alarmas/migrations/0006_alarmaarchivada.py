@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarmas', '0005_alarma_idx_alarma_updated'),
+        ('mantenimientos_programados', '0005_estadomantenimiento'),
+        ('maquinarias', '0005_maquinaria_foto_miniatura'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AlarmaArchivada',
+            fields=[
+                ('id_alarma', models.IntegerField(help_text='ID que tenía la alarma en la tabla viva.', primary_key=True, serialize=False)),
+                ('descripcion', models.TextField(blank=True, null=True)),
+                ('tipo', models.CharField(max_length=50)),
+                ('nivel', models.CharField(choices=[('baja', 'Baja'), ('media', 'Media'), ('alta', 'Alta'), ('crítica', 'Crítica')], max_length=20)),
+                ('fecha_registro', models.DateTimeField(db_column='fecha_registro')),
+                ('vista', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archivada_en', models.DateTimeField(auto_now_add=True, help_text='Fecha en que la alarma se movió al archivo.')),
+                ('maquina', models.ForeignKey(db_column='id_maquina', help_text='Máquina asociada a la alarma.', on_delete=django.db.models.deletion.CASCADE, related_name='alarmas_archivadas', to='maquinarias.maquinaria')),
+                ('programado', models.ForeignKey(blank=True, db_column='id_programado', help_text='Mantenimiento programado que originó la alarma (si aplica).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='alarmas_archivadas', to='mantenimientos_programados.mantenimientoprogramado')),
+            ],
+            options={
+                'verbose_name': 'alarma archivada',
+                'verbose_name_plural': 'alarmas archivadas',
+                'db_table': 'alarmas_archivo',
+                'indexes': [models.Index(fields=['maquina', '-fecha_registro', '-id_alarma'], name='idx_alarma_arch_maq_fecha'), models.Index(fields=['-fecha_registro'], name='idx_alarma_arch_fecha')],
+            },
+        ),
+    ]
@@ -0,0 +1,2 @@
+from .alarma import Alarma
+from .alarma_archivada import AlarmaArchivada
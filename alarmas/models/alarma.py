@@ -1,5 +1,6 @@
 from django.db import models
 
+from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
 from maquinarias.models.maquinaria import Maquinaria
 
 
@@ -20,6 +21,16 @@ class Alarma(models.Model):
         help_text="Máquina asociada a la alarma."
     )
 
+    programado = models.ForeignKey(
+        MantenimientoProgramado,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_column='id_programado',
+        related_name='alarmas',
+        help_text="Mantenimiento programado que originó la alarma (si aplica)."
+    )
+
     descripcion = models.TextField(
         null=True,
         blank=True,
@@ -65,6 +76,31 @@ class Alarma(models.Model):
         db_table = 'alarmas'
         verbose_name = "alarma"
         verbose_name_plural = "alarmas"
+        indexes = [
+            # Índice parcial: solo alarmas pendientes de revisar (vista=False)
+            models.Index(
+                fields=['maquina', '-fecha_registro'],
+                condition=models.Q(vista=False),
+                name='idx_alarma_no_vistas'
+            ),
+            models.Index(fields=['nivel'], name='idx_alarma_nivel'),
+            models.Index(fields=['-fecha_registro'], name='idx_alarma_fecha_desc'),
+            # Historia de la máquina (timeline), vistas y no vistas
+            models.Index(
+                fields=['maquina', '-fecha_registro', '-id_alarma'],
+                name='idx_alarma_maq_fecha'
+            ),
+            # Cambios recientes (sondeo de eventos) y MAX(updated_at) del ETag
+            models.Index(fields=['updated_at'], name='idx_alarma_updated'),
+        ]
+        constraints = [
+            # Una sola alarma no vista por máquina/programado/nivel (upsert idempotente)
+            models.UniqueConstraint(
+                fields=['maquina', 'programado', 'nivel'],
+                condition=models.Q(vista=False),
+                name='uq_alarma_activa_prog_nivel'
+            ),
+        ]
 
     def __str__(self):
         return f"Alarma #{self.id_alarma} - {self.tipo} ({self.nivel})"
\ No newline at end of file
@@ -0,0 +1,82 @@
+from django.db import models
+
+from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
+from maquinarias.models.maquinaria import Maquinaria
+
+
+class AlarmaArchivada(models.Model):
+    """
+    Archivo de alarmas: alarmas vistas más antiguas que la retención
+    (ALARMAS_RETENCION_DIAS), movidas desde la tabla `alarmas` por el
+    comando archivar_alarmas. Así la tabla viva, y con ella los listados y
+    las estadísticas del dashboard, solo contiene lo reciente o pendiente.
+
+    Conserva el id_alarma original (los ids no se repiten entre ambas
+    tablas) y las mismas columnas, más la fecha en que se archivó.
+    """
+
+    id_alarma = models.IntegerField(
+        primary_key=True,
+        help_text="ID que tenía la alarma en la tabla viva."
+    )
+
+    maquina = models.ForeignKey(
+        Maquinaria,
+        on_delete=models.CASCADE,
+        db_column='id_maquina',
+        related_name='alarmas_archivadas',
+        help_text="Máquina asociada a la alarma."
+    )
+
+    programado = models.ForeignKey(
+        MantenimientoProgramado,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_column='id_programado',
+        related_name='alarmas_archivadas',
+        help_text="Mantenimiento programado que originó la alarma (si aplica)."
+    )
+
+    descripcion = models.TextField(null=True, blank=True)
+
+    tipo = models.CharField(max_length=50)
+
+    nivel = models.CharField(
+        max_length=20,
+        choices=[
+            ('baja', 'Baja'),
+            ('media', 'Media'),
+            ('alta', 'Alta'),
+            ('crítica', 'Crítica'),
+        ]
+    )
+
+    fecha_registro = models.DateTimeField(db_column='fecha_registro')
+
+    vista = models.BooleanField(default=True)
+
+    created_at = models.DateTimeField()
+
+    updated_at = models.DateTimeField()
+
+    archivada_en = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Fecha en que la alarma se movió al archivo."
+    )
+
+    class Meta:
+        db_table = 'alarmas_archivo'
+        verbose_name = "alarma archivada"
+        verbose_name_plural = "alarmas archivadas"
+        indexes = [
+            # Historia de la máquina (timeline / historial por máquina)
+            models.Index(
+                fields=['maquina', '-fecha_registro', '-id_alarma'],
+                name='idx_alarma_arch_maq_fecha'
+            ),
+            models.Index(fields=['-fecha_registro'], name='idx_alarma_arch_fecha'),
+        ]
+
+    def __str__(self):
+        return f"Alarma archivada #{self.id_alarma} - {self.tipo} ({self.nivel})"
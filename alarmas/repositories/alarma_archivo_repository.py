@@ -0,0 +1,129 @@
+from django.db.models import BooleanField, Value
+
+from alarmas.models.alarma import Alarma
+from alarmas.models.alarma_archivada import AlarmaArchivada
+from comun.cache import invalidar_por_modelo
+from comun.paginacion import PAGE_SIZE_POR_DEFECTO, PaginaCursor, codificar_cursor, decodificar_cursor
+
+
+class AlarmaArchivoRepository:
+    """
+    Repositorio del archivo de alarmas (AlarmaArchivada) y de las
+    consultas que abarcan toda la historia: tabla viva + archivo, unidas
+    con UNION ALL. Los ids se conservan al archivar, así que id_alarma
+    identifica una alarma en cualquiera de las dos tablas.
+    """
+
+    # Columnas comunes a ambas tablas (en el mismo orden para la unión)
+    COLUMNAS = (
+        "id_alarma",
+        "maquina_id",
+        "programado_id",
+        "descripcion",
+        "tipo",
+        "nivel",
+        "fecha_registro",
+        "vista",
+        "created_at",
+        "updated_at",
+    )
+
+    # =====================================================
+    # ARCHIVADO
+    # =====================================================
+
+    @staticmethod
+    def get_archivables(fecha_limite):
+        """Alarmas vistas registradas antes de `fecha_limite` (candidatas a archivar)."""
+        return Alarma.objects.filter(vista=True, fecha_registro__lt=fecha_limite)
+
+    @staticmethod
+    def archivar_lote(fecha_limite, tamano):
+        """
+        Mueve al archivo hasta `tamano` alarmas archivables (las más
+        antiguas primero): SELECT ... FOR UPDATE SKIP LOCKED, INSERT en el
+        archivo y DELETE por llave primaria. Debe correr dentro de una
+        transacción; las filas que otra transacción tiene bloqueadas (p. ej.
+        una alarma que se está editando) se saltan y quedan para el lote o
+        la ejecución siguiente.
+        Retorna la cantidad de alarmas movidas.
+        """
+        filas = list(
+            AlarmaArchivoRepository.get_archivables(fecha_limite)
+            .select_for_update(skip_locked=True)
+            .order_by('pk')
+            .values(*AlarmaArchivoRepository.COLUMNAS)[:tamano]
+        )
+        if not filas:
+            return 0
+
+        AlarmaArchivada.objects.bulk_create([AlarmaArchivada(**fila) for fila in filas])
+
+        # Un solo DELETE por llave primaria (ver AlarmaRepository.delete_masivo)
+        Alarma.objects.filter(pk__in=[fila["id_alarma"] for fila in filas]).delete()
+
+        invalidar_por_modelo(Alarma)
+        return len(filas)
+
+    @staticmethod
+    def contar():
+        """Retorna el total de alarmas archivadas."""
+        return AlarmaArchivada.objects.count()
+
+    # =====================================================
+    # HISTORIA COMPLETA (VIVA + ARCHIVO)
+    # =====================================================
+
+    @staticmethod
+    def get_historial_page(cursor=None, page_size=None, id_maquina=None, desde=None, hasta=None):
+        """
+        Retorna una PaginaCursor con las alarmas vivas y archivadas (dicts
+        con las COLUMNAS más "archivada"), más recientes primero (id_alarma
+        descendente). Cada rama se filtra por el cursor y se limita a
+        page_size + 1 filas antes de unirlas.
+        """
+        page_size = page_size or PAGE_SIZE_POR_DEFECTO
+        filtros = _filtros(id_maquina, desde, hasta)
+        if cursor:
+            filtros["id_alarma__lt"] = decodificar_cursor(cursor)
+
+        ramas = [
+            modelo.objects.filter(**filtros)
+            .order_by('-pk')
+            .annotate(archivada=Value(archivada, BooleanField()))
+            .values(*AlarmaArchivoRepository.COLUMNAS, "archivada")[:page_size + 1]
+            for modelo, archivada in ((Alarma, False), (AlarmaArchivada, True))
+        ]
+
+        items = list(ramas[0].union(ramas[1], all=True).order_by('-id_alarma')[:page_size + 1])
+        siguiente_cursor = None
+
+        if len(items) > page_size:
+            items = items[:page_size]
+            siguiente_cursor = codificar_cursor(items[-1]["id_alarma"])
+
+        return PaginaCursor(items, siguiente_cursor, page_size)
+
+    @staticmethod
+    def get_para_exportar(campos, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """
+        Igual que AlarmaRepository.get_para_exportar pero sobre toda la
+        historia: queryset .values(*campos) de ambas tablas, ordenado por
+        id_alarma.
+        """
+        filtros = _filtros(id_maquina, fecha_inicio, fecha_fin)
+        vivas = Alarma.objects.filter(**filtros).order_by().values(*campos)
+        archivadas = AlarmaArchivada.objects.filter(**filtros).order_by().values(*campos)
+        return vivas.union(archivadas, all=True).order_by('id_alarma')
+
+
+def _filtros(id_maquina, desde, hasta):
+    """Filtros por máquina y por día de fecha_registro (inclusive)."""
+    filtros = {}
+    if id_maquina:
+        filtros["maquina_id"] = id_maquina
+    if desde:
+        filtros["fecha_registro__date__gte"] = desde
+    if hasta:
+        filtros["fecha_registro__date__lte"] = hasta
+    return filtros
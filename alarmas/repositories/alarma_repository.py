@@ -1,10 +1,13 @@
 from datetime import timedelta
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Count
+from django.db.models import Count, Max
 from django.utils.timezone import now
 
 from alarmas.models.alarma import Alarma
+from comun.cache import invalidar_por_modelo
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class AlarmaRepository:
@@ -16,9 +19,14 @@ class AlarmaRepository:
     """
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todas las alarmas."""
-        return Alarma.objects.all()
+        return limitar_columnas(Alarma.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las alarmas paginada por cursor (más recientes primero)."""
+        return paginar_por_cursor(limitar_columnas(Alarma.objects.all(), columnas), cursor, page_size, orden='-pk')
 
     @staticmethod
     def get_by_id(**kwargs):
@@ -41,6 +49,25 @@ class AlarmaRepository:
         """
         return Alarma.objects.create(**kwargs)
 
+    @staticmethod
+    def upsert_no_vista(id_maquina, id_programado, nivel, **kwargs):
+        """
+        Crea o actualiza la alarma NO vista identificada por
+        (maquina, programado, nivel). Respaldado por el índice único parcial
+        uq_alarma_activa_prog_nivel; si otra transacción la inserta en
+        paralelo, update_or_create reintenta la lectura.
+        Ejemplo:
+        upsert_no_vista(1, 3, 'crítica', tipo='mantenimiento', descripcion='...')
+        Retorna (alarma, creada).
+        """
+        return Alarma.objects.update_or_create(
+            maquina_id=id_maquina,
+            programado_id=id_programado,
+            nivel=nivel,
+            vista=False,
+            defaults=kwargs
+        )
+
     @staticmethod
     def update(id_alarma, **kwargs):
         """
@@ -57,6 +84,51 @@ class AlarmaRepository:
         alarma.save()
         return alarma
 
+    @staticmethod
+    def filtrar(ids=None, id_maquina=None, nivel=None, desde=None, hasta=None, solo_no_vistas=False):
+        """
+        Retorna el queryset de la selección de una operación masiva.
+        desde / hasta filtran por el día de fecha_registro (inclusive).
+        """
+        filtros = {}
+        if ids:
+            filtros["id_alarma__in"] = ids
+        if id_maquina:
+            filtros["maquina_id"] = id_maquina
+        if nivel:
+            filtros["nivel"] = nivel
+        if desde:
+            filtros["fecha_registro__date__gte"] = desde
+        if hasta:
+            filtros["fecha_registro__date__lte"] = hasta
+        if solo_no_vistas:
+            filtros["vista"] = False
+        return Alarma.objects.filter(**filtros)
+
+    @staticmethod
+    def marcar_vistas(alarmas):
+        """
+        Marca como vistas las alarmas no vistas del queryset con un único
+        UPDATE. Retorna la cantidad de alarmas marcadas.
+        """
+        marcadas = alarmas.filter(vista=False).update(vista=True, updated_at=now())
+        invalidar_por_modelo(Alarma)
+        return marcadas
+
+    @staticmethod
+    def delete_masivo(alarmas):
+        """
+        Elimina las alarmas del queryset con un único DELETE.
+        Retorna la cantidad de alarmas eliminadas.
+
+        Alarma no tiene receptores de post_delete ni modelos que la
+        referencien, así que QuerySet.delete() no carga las filas (ver
+        comun.cache.BORRADO_SIN_SENAL); la caché se invalida aquí.
+        """
+        eliminadas, _ = alarmas.delete()
+        invalidar_por_modelo(Alarma)
+        return eliminadas
+
     @staticmethod
     def delete(id_alarma):
         """
@@ -69,6 +141,7 @@ class AlarmaRepository:
             return False
 
         alarma.delete()
+        invalidar_por_modelo(Alarma)
         return True
 
     # =====================================================
@@ -138,6 +211,22 @@ class AlarmaRepository:
             fecha_registro__range=(fecha_inicio, fecha_fin)
         )
 
+    @staticmethod
+    def get_para_exportar(campos, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """
+        Retorna un queryset .values(*campos) ordenado por llave primaria,
+        con los filtros de fecha (día de fecha_registro) y máquina aplicados en SQL.
+        """
+        filtros = {}
+        if fecha_inicio:
+            filtros["fecha_registro__date__gte"] = fecha_inicio
+        if fecha_fin:
+            filtros["fecha_registro__date__lte"] = fecha_fin
+        if id_maquina:
+            filtros["maquina_id"] = id_maquina
+
+        return Alarma.objects.filter(**filtros).values(*campos).order_by('pk')
+
     @staticmethod
     def get_recientes(horas=24):
         """
@@ -184,4 +273,31 @@ class AlarmaRepository:
     @staticmethod
     def get_agrupadas_por_maquina():
         """Retorna alarmas agrupadas por máquina."""
-        return Alarma.objects.values('maquina_id').annotate(count=Count('id_alarma'))
\ No newline at end of file
+        return Alarma.objects.values('maquina_id').annotate(count=Count('id_alarma'))
+
+    # =====================================================
+    # CAMBIOS RECIENTES (EVENTOS EN TIEMPO REAL)
+    # =====================================================
+
+    @staticmethod
+    def get_ultimo_id():
+        """Retorna el mayor id_alarma (0 si no hay alarmas)."""
+        return Alarma.objects.aggregate(ultimo=Max('id_alarma'))['ultimo'] or 0
+
+    @staticmethod
+    def get_ultima_modificacion():
+        """Retorna el mayor updated_at (None si no hay alarmas)."""
+        return Alarma.objects.aggregate(ultima=Max('updated_at'))['ultima']
+
+    @staticmethod
+    def get_creadas_despues_de(id_alarma, limit=100):
+        """Retorna las alarmas con id mayor al dado, en orden de creación."""
+        return Alarma.objects.filter(id_alarma__gt=id_alarma).order_by('id_alarma')[:limit]
+
+    @staticmethod
+    def get_vistas_desde(momento=None):
+        """Retorna (id_alarma, updated_at) de las alarmas vistas modificadas desde `momento`."""
+        alarmas = Alarma.objects.filter(vista=True)
+        if momento:
+            alarmas = alarmas.filter(updated_at__gte=momento)
+        return alarmas.values('id_alarma', 'updated_at')
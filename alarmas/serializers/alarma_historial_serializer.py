@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+
+class AlarmaHistorialSerializer(serializers.Serializer):
+    """
+    Alarma del historial completo (fila de AlarmaArchivoRepository, viva
+    o archivada). Mismos campos que AlarmaSerializer más `archivada`.
+    """
+
+    id_alarma = serializers.IntegerField()
+    maquina = serializers.IntegerField(source="maquina_id")
+    programado = serializers.IntegerField(source="programado_id", allow_null=True)
+    descripcion = serializers.CharField(allow_null=True)
+    tipo = serializers.CharField()
+    nivel = serializers.CharField()
+    fecha_registro = serializers.DateTimeField()
+    vista = serializers.BooleanField()
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+    archivada = serializers.BooleanField()
@@ -0,0 +1,40 @@
+from rest_framework import serializers
+
+from alarmas.models.alarma import Alarma
+
+
+class AlarmaSeleccionSerializer(serializers.Serializer):
+    """
+    Valida la selección de alarmas de las operaciones masivas (body JSON):
+    {"ids": [1, 2, 3]} o filtros
+    {"maquina": 4, "nivel": "crítica", "desde": "2025-01-01", "hasta": "2025-01-31", "no_vistas": true}
+    Los criterios se combinan (AND). Se exige al menos uno: una selección
+    vacía nunca significa "todas".
+    """
+
+    # Tope de ids explícitos por request (para más, usar filtros)
+    MAX_IDS = 1000
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_IDS
+    )
+    maquina = serializers.IntegerField(min_value=1, required=False, source="id_maquina")
+    nivel = serializers.ChoiceField(choices=Alarma._meta.get_field("nivel").choices, required=False)
+    desde = serializers.DateField(required=False)
+    hasta = serializers.DateField(required=False)
+    no_vistas = serializers.BooleanField(required=False, source="solo_no_vistas")
+
+    def validate(self, attrs):
+        if not attrs.get("solo_no_vistas"):
+            attrs.pop("solo_no_vistas", None)
+
+        if not attrs:
+            raise serializers.ValidationError(
+                "Indique los ids o al menos un filtro (maquina, nivel, desde, hasta, no_vistas)."
+            )
+        if attrs.get("desde") and attrs.get("hasta") and attrs["desde"] > attrs["hasta"]:
+            raise serializers.ValidationError({"desde": "La fecha inicial no puede ser posterior a la final."})
+        return attrs
@@ -2,9 +2,10 @@ from django.core.validators import RegexValidator
 from rest_framework import serializers
 
 from alarmas.models.alarma import Alarma
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class AlarmaSerializer(serializers.ModelSerializer):
+class AlarmaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer profesional para la gestión de alarmas.
     Incluye validaciones robustas para garantizar integridad,
@@ -16,6 +17,7 @@ class AlarmaSerializer(serializers.ModelSerializer):
         fields = [
             'id_alarma',
             'maquina',
+            'programado',
             'descripcion',
             'tipo',
             'nivel',
@@ -27,6 +29,7 @@ class AlarmaSerializer(serializers.ModelSerializer):
 
         read_only_fields = (
             'id_alarma',
+            'programado',
             'fecha_registro',
             'created_at',
             'updated_at'
@@ -1,13 +1,20 @@
+import time
+from datetime import timedelta
 from decimal import Decimal
 
-from rest_framework.exceptions import NotFound
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+from rest_framework.exceptions import NotFound, ValidationError
 
+from alarmas import eventos
+from alarmas.repositories.alarma_archivo_repository import AlarmaArchivoRepository
 from alarmas.repositories.alarma_repository import AlarmaRepository
 from alarmas.serializers.alarma_serializer import AlarmaSerializer
 from alarmas.services.alarma_service_interface import IAlarmaService
-from mantenimientos.services.mantenimiento_service import MantenimientoService
-from mantenimientos_programados.services.mantenimiento_programado_service import MantenimientoProgramadoService
-from maquinarias.services.maquinaria_service import MaquinariaService
+from comun.cache import GRUPO_ALARMAS, obtener_o_calcular
+from comun.exportacion import iterar
+from comun.servicios import Dependencia
 
 
 class AlarmaService(IAlarmaService):
@@ -21,11 +28,23 @@ class AlarmaService(IAlarmaService):
     - Consultas y estadísticas para dashboard
     """
 
-    def __init__(self):
-        """Inyección de dependencias de otros servicios."""
-        self.mantenimiento_service = MantenimientoService()
-        self.mantenimiento_programado_service = MantenimientoProgramadoService()
-        self.maquinaria_service = MaquinariaService()
+    # Inyección de dependencias de otros servicios (ver comun.servicios)
+    mantenimiento_service = Dependencia("mantenimiento")
+    mantenimiento_programado_service = Dependencia("mantenimiento_programado")
+    maquinaria_service = Dependencia("maquinaria")
+
+    # Columnas (y orden) de la exportación CSV / NDJSON
+    COLUMNAS_EXPORTACION = [
+        "id_alarma",
+        "maquina_id",
+        "maquina__nombre_maquina",
+        "programado_id",
+        "tipo",
+        "nivel",
+        "descripcion",
+        "fecha_registro",
+        "vista",
+    ]
 
     # =========================================================================
     # MÉTODO PRINCIPAL: VALIDAR Y GENERAR ALARMAS
@@ -41,6 +60,9 @@ class AlarmaService(IAlarmaService):
             * Se calcula horas_proximas = horas_realizadas + intervalo_horas
             * Se compara contra horas_totales de la máquina
             * Se genera alarma CRÍTICA o MEDIA
+
+        La generación es idempotente: si ya existe una alarma no vista para
+        (máquina, programado, nivel) se actualiza en lugar de insertar otra.
         """
 
         # 1. Obtener la máquina
@@ -50,6 +72,7 @@ class AlarmaService(IAlarmaService):
 
         horas_totales = Decimal(str(maquina.horas_totales))
         alarmas_creadas = []
+        alarmas_actualizadas = []
 
         # 2. Obtener todos los mantenimientos programados de la máquina
         programados = (
@@ -61,6 +84,7 @@ class AlarmaService(IAlarmaService):
             return {
                 "id_maquina": id_maquina,
                 "alarmas_creadas": [],
+                "alarmas_actualizadas": [],
                 "cantidad": 0,
                 "mensaje": "La máquina no tiene mantenimientos programados"
             }
@@ -97,8 +121,9 @@ class AlarmaService(IAlarmaService):
                     id_maquina=id_maquina,
                     estado="fuera de servicio"
                 )
-                alarma = self._crear_alarma(
+                alarma, creada = self._registrar_alarma(
                     id_maquina=id_maquina,
+                    id_programado=programado.id_programado,
                     tipo="mantenimiento",
                     nivel="crítica",
                     descripcion=(
@@ -108,12 +133,13 @@ class AlarmaService(IAlarmaService):
                         f"Horas alcanzadas: {horas_totales}"
                     )
                 )
-                alarmas_creadas.append(alarma)
+                (alarmas_creadas if creada else alarmas_actualizadas).append(alarma)
 
             # MEDIA (faltan 20 horas o menos)
             elif 0 < diferencia <= 20:
-                alarma = self._crear_alarma(
+                alarma, creada = self._registrar_alarma(
                     id_maquina=id_maquina,
+                    id_programado=programado.id_programado,
                     tipo="mantenimiento",
                     nivel="media",
                     descripcion=(
@@ -122,53 +148,62 @@ class AlarmaService(IAlarmaService):
                         f"de la máquina {id_maquina} - {maquina.nombre_maquina}."
                     )
                 )
-                alarmas_creadas.append(alarma)
+                (alarmas_creadas if creada else alarmas_actualizadas).append(alarma)
 
         # 6. Respuesta
         return {
             "id_maquina": id_maquina,
             "alarmas_creadas": alarmas_creadas,
+            "alarmas_actualizadas": alarmas_actualizadas,
             "cantidad": len(alarmas_creadas),
             "mensaje": (
-                f"Se crearon {len(alarmas_creadas)} alarma(s)"
-                if alarmas_creadas else
+                f"Se crearon {len(alarmas_creadas)} alarma(s) "
+                f"y se actualizaron {len(alarmas_actualizadas)}"
+                if alarmas_creadas or alarmas_actualizadas else
                 "No se generaron alarmas"
             )
         }
 
     # =========================================================================
-    # UTILIDAD INTERNA: CREAR ALARMA (PERSISTE EN BD)
+    # UTILIDAD INTERNA: REGISTRAR ALARMA (UPSERT EN BD)
     # =========================================================================
 
-    def _crear_alarma(self, id_maquina: int, tipo: str, nivel: str, descripcion: str):
+    def _registrar_alarma(self, id_maquina: int, id_programado: int, tipo: str, nivel: str, descripcion: str):
         """
-        Crea y PERSISTE una alarma en la base de datos.
-        
+        Crea o actualiza (upsert) la alarma no vista de un programado.
+        Mientras la alarma no se marque como vista, las siguientes
+        validaciones solo refrescan su descripción en lugar de duplicarla.
+
         Args:
             id_maquina: ID de la máquina
+            id_programado: ID del mantenimiento programado que la origina
             tipo: tipo de alarma ('mantenimiento')
             nivel: nivel de severidad ('crítica', 'media')
             descripcion: descripción de la alarma
-            
+
         Returns:
-            dict: datos serializados de la alarma creada (incluyendo id_alarma)
+            tuple: (datos serializados de la alarma, True si fue creada)
         """
-        alarma = AlarmaRepository.create(
-            maquina_id=id_maquina,
-            tipo=tipo,
+        alarma, creada = AlarmaRepository.upsert_no_vista(
+            id_maquina=id_maquina,
+            id_programado=id_programado,
             nivel=nivel,
-            descripcion=descripcion,
-            vista=False
+            tipo=tipo,
+            descripcion=descripcion
         )
-        return AlarmaSerializer(alarma).data
+        return AlarmaSerializer(alarma).data, creada
 
     # =========================================================================
     # CRUD: LISTAR
     # =========================================================================
 
-    def listar_alarmas(self):
+    def listar_alarmas(self, columnas=None):
         """Retorna todas las alarmas registradas."""
-        return AlarmaRepository.get_all()
+        return AlarmaRepository.get_all(columnas=columnas)
+
+    def listar_alarmas_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las alarmas (paginación por cursor)."""
+        return AlarmaRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # =========================================================================
     # CRUD: OBTENER UNA
@@ -215,9 +250,47 @@ class AlarmaService(IAlarmaService):
         
         if not existe:
             raise NotFound(f"Alarma con ID {id_alarma} no existe.")
-        
+
+        eventos.publicar_no_vistas()
         return {"mensaje": f"Alarma {id_alarma} eliminada correctamente"}
 
+    # =========================================================================
+    # OPERACIONES MASIVAS
+    # =========================================================================
+
+    @transaction.atomic
+    def marcar_vistas_masivo(self, **seleccion):
+        """
+        Marca como vistas las alarmas seleccionadas por ids y/o filtros
+        (ver AlarmaRepository.filtrar) con un solo UPDATE.
+        Retorna {"afectadas": n, "no_vistas": conteo vigente}.
+        """
+        marcadas = AlarmaRepository.marcar_vistas(AlarmaRepository.filtrar(**seleccion))
+        no_vistas = AlarmaRepository.contar_no_vistas()
+
+        # Con ids explícitos se informan al canal de eventos; con filtros
+        # solo el nuevo conteo (obtener los ids exigiría otra consulta)
+        if marcadas and seleccion.get("ids"):
+            eventos.publicar_alarmas_vistas(seleccion["ids"], no_vistas)
+        elif marcadas:
+            eventos.publicar_no_vistas(no_vistas)
+
+        return {"afectadas": marcadas, "no_vistas": no_vistas}
+
+    @transaction.atomic
+    def eliminar_masivo(self, **seleccion):
+        """
+        Elimina las alarmas seleccionadas por ids y/o filtros con un solo
+        DELETE. Retorna {"afectadas": n, "no_vistas": conteo vigente}.
+        """
+        eliminadas = AlarmaRepository.delete_masivo(AlarmaRepository.filtrar(**seleccion))
+        no_vistas = AlarmaRepository.contar_no_vistas()
+
+        if eliminadas:
+            eventos.publicar_no_vistas(no_vistas)
+
+        return {"afectadas": eliminadas, "no_vistas": no_vistas}
+
     # =========================================================================
     # CONSULTAS ESPECÍFICAS
     # =========================================================================
@@ -249,7 +322,12 @@ class AlarmaService(IAlarmaService):
     def obtener_estadisticas(self):
         """
         Retorna estadísticas de alarmas para el dashboard.
+        Se cachean en el grupo "alarmas" (ver comun.cache).
+        Cuentan solo la tabla viva: las alarmas archivadas quedan fuera.
         """
+        return obtener_o_calcular(GRUPO_ALARMAS, "estadisticas", self._calcular_estadisticas)
+
+    def _calcular_estadisticas(self):
         return {
             "total_no_vistas": AlarmaRepository.contar_no_vistas(),
             "total_criticas": len(AlarmaRepository.get_criticas()),
@@ -259,4 +337,80 @@ class AlarmaService(IAlarmaService):
                 AlarmaRepository.get_ultimas(limit=10),
                 many=True
             ).data
-        }
\ No newline at end of file
+        }
+
+    # =========================================================================
+    # HISTORIAL (TABLA VIVA + ARCHIVO)
+    # =========================================================================
+
+    def listar_historial(self, cursor=None, page_size=None, id_maquina=None, desde=None, hasta=None):
+        """
+        Retorna una página (paginación por cursor) de todas las alarmas,
+        vivas y archivadas, más recientes primero.
+        """
+        return AlarmaArchivoRepository.get_historial_page(
+            cursor=cursor,
+            page_size=page_size,
+            id_maquina=id_maquina,
+            desde=desde,
+            hasta=hasta
+        )
+
+    # =========================================================================
+    # RETENCIÓN: ARCHIVAR ALARMAS VISTAS ANTIGUAS
+    # =========================================================================
+
+    def contar_alarmas_archivables(self, dias: int = None):
+        """Cantidad de alarmas vistas con más de `dias` días (por defecto ALARMAS_RETENCION_DIAS)."""
+        return AlarmaArchivoRepository.get_archivables(self._fecha_limite_retencion(dias)).count()
+
+    def archivar_alarmas(self, dias: int = None, tamano_lote: int = None, pausa: float = 0):
+        """
+        Mueve al archivo las alarmas vistas registradas hace más de `dias`
+        días, en lotes de `tamano_lote` filas. Cada lote es una transacción
+        corta (bloquea solo sus filas), con `pausa` segundos entre lotes
+        para no competir con el tráfico normal. Las alarmas no vistas nunca
+        se archivan.
+        Retorna la cantidad de alarmas archivadas.
+        """
+        tamano_lote = settings.ALARMAS_ARCHIVO_LOTE if tamano_lote is None else tamano_lote
+        if tamano_lote < 1:
+            raise ValidationError({"tamano_lote": "El tamaño de lote debe ser mayor a 0."})
+
+        # Límite fijo para toda la ejecución: los lotes no persiguen alarmas recién vencidas
+        fecha_limite = self._fecha_limite_retencion(dias)
+        total = 0
+
+        while True:
+            with transaction.atomic():
+                movidas = AlarmaArchivoRepository.archivar_lote(fecha_limite, tamano_lote)
+            total += movidas
+
+            if movidas < tamano_lote:
+                return total
+            if pausa:
+                time.sleep(pausa)
+
+    @staticmethod
+    def _fecha_limite_retencion(dias):
+        dias = settings.ALARMAS_RETENCION_DIAS if dias is None else dias
+        if dias < 0:
+            raise ValidationError({"dias": "Los días de retención no pueden ser negativos."})
+        return now() - timedelta(days=dias)
+
+    # =========================================================================
+    # EXPORTAR (STREAMING)
+    # =========================================================================
+    def exportar_alarmas(self, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """
+        Retorna (columnas, filas) para exportar alarmas, incluidas las
+        archivadas. Los filtros se aplican en SQL y `filas` es un iterador
+        por bloques: no se materializa el resultado completo en memoria.
+        """
+        queryset = AlarmaArchivoRepository.get_para_exportar(
+            self.COLUMNAS_EXPORTACION,
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            id_maquina=id_maquina
+        )
+        return self.COLUMNAS_EXPORTACION, iterar(queryset)
@@ -15,10 +15,15 @@ class IAlarmaService(ABC):
         pass
 
     @abstractmethod
-    def listar_alarmas(self):
+    def listar_alarmas(self, columnas=None):
         """Lista todas las alarmas."""
         pass
 
+    @abstractmethod
+    def listar_alarmas_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las alarmas paginada por cursor."""
+        pass
+
     @abstractmethod
     def obtener_alarma(self, id_alarma: int):
         """Obtiene una alarma por ID."""
@@ -34,6 +39,16 @@ class IAlarmaService(ABC):
         """Elimina una alarma."""
         pass
 
+    @abstractmethod
+    def marcar_vistas_masivo(self, **seleccion):
+        """Marca como vistas las alarmas seleccionadas (un solo UPDATE)."""
+        pass
+
+    @abstractmethod
+    def eliminar_masivo(self, **seleccion):
+        """Elimina las alarmas seleccionadas (un solo DELETE)."""
+        pass
+
     @abstractmethod
     def obtener_alarmas_por_maquina(self, id_maquina: int):
         """Obtiene alarmas de una máquina específica."""
@@ -62,4 +77,24 @@ class IAlarmaService(ABC):
     @abstractmethod
     def obtener_estadisticas(self):
         """Retorna estadísticas del dashboard."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def listar_historial(self, cursor=None, page_size=None, id_maquina=None, desde=None, hasta=None):
+        """Retorna una página de las alarmas vivas y archivadas."""
+        pass
+
+    @abstractmethod
+    def contar_alarmas_archivables(self, dias: int = None):
+        """Cantidad de alarmas vistas que superan la retención."""
+        pass
+
+    @abstractmethod
+    def archivar_alarmas(self, dias: int = None, tamano_lote: int = None, pausa: float = 0):
+        """Mueve al archivo, por lotes, las alarmas vistas que superan la retención."""
+        pass
+
+    @abstractmethod
+    def exportar_alarmas(self, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """Retorna (columnas, iterador de filas) para exportar en streaming."""
+        pass
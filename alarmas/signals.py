@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from alarmas import eventos
+from alarmas.models.alarma import Alarma
+from maquinarias.models.maquinaria import Maquinaria
+
+# Publican los cambios de alarmas a las conexiones SSE de este proceso
+# (ver alarmas.eventos). Las escrituras masivas (QuerySet.update/delete)
+# no disparan señales: sus services publican explícitamente. Alarma no
+# tiene receptor de post_delete (se borra sin cargar filas, ver
+# comun.cache.BORRADO_SIN_SENAL): AlarmaService publica al eliminar.
+
+
+@receiver(post_save, sender=Alarma)
+def publicar_al_guardar(sender, instance, created, **kwargs):
+    if created:
+        eventos.publicar_alarma_creada(instance)
+    elif instance.vista:
+        # Idempotente para el cliente: re-guardar una alarma vista solo repite su id
+        eventos.publicar_alarmas_vistas([instance.pk])
+
+
+@receiver(post_delete, sender=Maquinaria)
+def publicar_al_eliminar_maquina(sender, instance, **kwargs):
+    # Sus alarmas se borran en cascada
+    eventos.publicar_no_vistas()
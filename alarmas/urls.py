@@ -1,7 +1,12 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
+from alarmas.views.alarma_eventos_view import AlarmaEventosView
 from alarmas.views.alarma_view import AlarmaViewSet
 
 router = DefaultRouter()
 router.register(r'', AlarmaViewSet, basename='alarmas')
 
-urlpatterns = router.urls
\ No newline at end of file
+urlpatterns = [
+    # Antes del router: si no, 'eventos' se resolvería como el id de una alarma
+    path('eventos/', AlarmaEventosView.as_view(), name='alarmas-eventos'),
+] + router.urls
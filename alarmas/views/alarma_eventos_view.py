@@ -0,0 +1,97 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException
+
+from alarmas import eventos
+from alarmas.repositories.alarma_repository import AlarmaRepository
+from comun.difusion import formatear_sse
+from logins.authentication.jwt_stateless_authentication import JWTStatelessAuthentication
+from logins.permissions.rol_permissions import RolPermission
+
+
+class AlarmaEventosView(View):
+    """
+    Canal de eventos de alarmas (Server-Sent Events), reemplaza el sondeo
+    de /alarmas/no-vistas/.
+
+    GET /api/alarmas/eventos/   (text/event-stream)
+
+    Eventos:
+        no_vistas      {"no_vistas": n}                al conectar y si cambia el conteo
+        alarma_creada  {"alarma": {...}, "no_vistas": n}
+        alarma_vista   {"ids": [...], "no_vistas": n}
+
+    Autenticación: header Authorization: Bearer <token>, o ?token=<token>
+    (EventSource del navegador no permite enviar headers). Permiso
+    "alarma:eventos".
+
+    View asíncrono: cada conexión abierta es una corrutina en espera, no
+    un hilo. Solo funciona servido por ASGI (servimacons.asgi con workers
+    de uvicorn, ver start.sh); bajo WSGI responde 501.
+    """
+
+    permission_key = "alarma"
+    action = "eventos"
+
+    # Espera sugerida al cliente antes de reconectarse (ms)
+    RECONEXION_MS = 3000
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse(
+                {"detail": "Los eventos de alarmas requieren un servidor ASGI."},
+                status=501
+            )
+
+        try:
+            autenticado = await sync_to_async(self._autenticar)(request)
+        except APIException as e:
+            return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+        if not autenticado:
+            return JsonResponse({"detail": "Las credenciales de autenticación no se proveyeron."}, status=401)
+
+        request.user, request.auth = autenticado
+        if not RolPermission().has_permission(request, self):
+            return JsonResponse({"detail": "No tiene permiso para realizar esta acción."}, status=403)
+
+        response = StreamingHttpResponse(self._flujo(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Evita que un proxy (nginx) acumule los eventos
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @staticmethod
+    def _autenticar(request):
+        """Retorna (usuario, token) o None si no se envió token."""
+        autenticacion = JWTStatelessAuthentication()
+        token = request.GET.get("token")
+        if token:
+            validado = autenticacion.get_validated_token(token.encode())
+            return autenticacion.get_user(validado), validado
+        return autenticacion.authenticate(request)
+
+    async def _flujo(self):
+        # Suscribirse antes de leer el conteo: ningún cambio queda entre ambos
+        cola = eventos.suscribir()
+        try:
+            yield f"retry: {self.RECONEXION_MS}\n\n"
+            no_vistas = await sync_to_async(AlarmaRepository.contar_no_vistas)()
+            yield formatear_sse(eventos.NO_VISTAS, {"no_vistas": no_vistas})
+
+            loop = asyncio.get_running_loop()
+            fin = loop.time() + settings.ALARMAS_EVENTOS_DURACION_MAXIMA
+            while loop.time() < fin:
+                try:
+                    evento, datos = await asyncio.wait_for(cola.get(), timeout=settings.ALARMAS_EVENTOS_LATIDO)
+                except asyncio.TimeoutError:
+                    yield ": latido\n\n"
+                    continue
+                yield formatear_sse(evento, datos)
+        finally:
+            eventos.desuscribir(cola)
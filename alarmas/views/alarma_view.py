@@ -1,15 +1,24 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
+from rest_framework.fields import DateField, IntegerField
 from rest_framework.response import Response
 
+from alarmas.models.alarma import Alarma
+from alarmas.serializers.alarma_historial_serializer import AlarmaHistorialSerializer
+from alarmas.serializers.alarma_seleccion_serializer import AlarmaSeleccionSerializer
 from alarmas.serializers.alarma_serializer import AlarmaSerializer
-from alarmas.services.alarma_service import AlarmaService
 from alarmas.services.alarma_service_interface import IAlarmaService
 from logins.permissions.rol_permissions import RolPermission
+from comun.condicional import CondicionalMixin
+from comun.exportacion import ExportacionMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class AlarmaViewSet(viewsets.ModelViewSet):
+class AlarmaViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, ExportacionMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de alarmas.
     Gestiona listado, consulta individual y marcado como vista,
@@ -18,23 +27,29 @@ class AlarmaViewSet(viewsets.ModelViewSet):
 
     permission_key = "alarma"
     permission_classes = [RolPermission]
+    modelo_condicional = Alarma
 
     def __init__(
         self,
-        service: IAlarmaService = AlarmaService(),
+        service: IAlarmaService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("alarma")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todas las alarmas registradas."""
-        alarmas = self.service.listar_alarmas()
-        serializer = AlarmaSerializer(alarmas, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, AlarmaSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_alarmas_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, AlarmaSerializer, campos=campos)
+
+        alarmas = self.service.listar_alarmas(columnas=columnas)
+        return Response(serializar_listado(alarmas, AlarmaSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                OBTENER (GET/{id})
@@ -79,6 +94,44 @@ class AlarmaViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+    # -------------------------------------------------------
+    #      OPERACIONES MASIVAS (POST /marcar-vistas, /eliminar)
+    # -------------------------------------------------------
+    def _seleccion(self, request):
+        seleccion = AlarmaSeleccionSerializer(data=request.data)
+        seleccion.is_valid(raise_exception=True)
+        return seleccion.validated_data
+
+    @action(detail=False, methods=['post'], url_path='marcar-vistas')
+    def marcar_vistas(self, request):
+        """
+        Marca como vistas varias alarmas con un solo UPDATE.
+        POST /alarmas/marcar-vistas/
+        Body: {"ids": [1, 2]} o filtros {"maquina", "nivel", "desde", "hasta", "no_vistas"}
+        Retorna {"afectadas": n, "no_vistas": n}.
+        """
+        try:
+            resultado = self.service.marcar_vistas_masivo(**self._seleccion(request))
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(resultado, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'], url_path='eliminar')
+    def eliminar_masivo(self, request):
+        """
+        Elimina varias alarmas con un solo DELETE.
+        POST /alarmas/eliminar/
+        Body: igual que /marcar-vistas/.
+        Retorna {"afectadas": n, "no_vistas": n}.
+        """
+        try:
+            resultado = self.service.eliminar_masivo(**self._seleccion(request))
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(resultado, status=status.HTTP_200_OK)
+
     # -------------------------------------------------------
     #      ENDPOINT PERSONALIZADO: CANTIDAD NO VISTAS
     # -------------------------------------------------------
@@ -101,3 +154,43 @@ class AlarmaViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    # -------------------------------------------------------
+    #      HISTORIAL COMPLETO, CON ARCHIVADAS (GET /historial)
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='historial')
+    def historial(self, request):
+        """
+        Alarmas vivas y archivadas, más recientes primero, siempre
+        paginadas por cursor. Cada alarma indica si está `archivada`.
+        GET /api/alarmas/historial/?maquina=3&desde=2024-01-01&hasta=2024-12-31&cursor=&page_size=
+        """
+        try:
+            params = request.query_params
+            filtros = {
+                "id_maquina": self._parametro(params, "maquina", IntegerField(min_value=1)),
+                "desde": self._parametro(params, "desde", DateField()),
+                "hasta": self._parametro(params, "hasta", DateField()),
+            }
+            paginacion = self.obtener_parametros_cursor(request) or {}
+            pagina = self.service.listar_historial(**paginacion, **filtros)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        return self.respuesta_paginada(pagina, AlarmaHistorialSerializer)
+
+    # -------------------------------------------------------
+    #             EXPORTAR CSV / NDJSON (GET /exportar)
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        """
+        Exporta alarmas en streaming (CSV o NDJSON), incluidas las archivadas.
+        GET /api/alarmas/exportar/?formato=csv&desde=2025-01-01&hasta=2025-12-31&maquina=3
+        """
+        try:
+            formato, filtros = self.obtener_parametros_exportacion(request)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        columnas, filas = self.service.exportar_alarmas(**filtros)
+        return self.respuesta_exportacion(filas, columnas, formato, nombre="alarmas")
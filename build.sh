@@ -1,2 +1,3 @@
 pip install -r requirements.txt
-python manage.py migrate
\ No newline at end of file
+python manage.py migrate
+python manage.py reconstruir_estados_mantenimiento
\ No newline at end of file
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ComunConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'comun'
+
+    def ready(self):
+        import comun.signals
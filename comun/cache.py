@@ -0,0 +1,188 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+GRUPO_FLOTA = "flota"
+GRUPO_ALARMAS = "alarmas"
+
+# Modelos cuyo cambio invalida cada grupo de resultados cacheados
+DEPENDENCIAS = {
+    GRUPO_FLOTA: [
+        "maquinarias.Maquinaria",
+        "mantenimientos.Mantenimiento",
+        "mantenimientos_programados.MantenimientoProgramado",
+        "mantenimientos_programados.EstadoMantenimiento",
+        "proyecto_maquinaria.ProyectoMaquinaria",
+        "registros_horas_maquinaria.RegistroHorasMaquinaria",
+    ],
+    GRUPO_ALARMAS: [
+        "alarmas.Alarma",
+        # Borrar una máquina borra sus alarmas en cascada (sin señales, ver abajo)
+        "maquinarias.Maquinaria",
+    ],
+}
+
+# Modelos sin receptor de post_delete: así QuerySet.delete() los borra con
+# un solo DELETE (Django solo carga las filas si hay receptores). Sus
+# repositories invalidan explícitamente al borrar.
+BORRADO_SIN_SENAL = {
+    "alarmas.Alarma",
+}
+
+_pendientes = threading.local()
+
+
+def _cache():
+    return caches[settings.DASHBOARD_CACHE_ALIAS]
+
+
+def _llave_version(grupo: str) -> str:
+    return f"dashboard:version:{grupo}"
+
+
+def _version(cache, grupo: str) -> int:
+    version = cache.get(_llave_version(grupo))
+    if version is None:
+        cache.add(_llave_version(grupo), 1, timeout=None)
+        version = cache.get(_llave_version(grupo), 1)
+    return version
+
+
+# =========================================================================
+# LECTURA
+# =========================================================================
+def obtener_o_calcular(grupo: str, clave: str, calcular):
+    """
+    Retorna el resultado cacheado de `calcular()` para (grupo, clave).
+
+    - Fresco: misma versión del grupo y dentro de DASHBOARD_CACHE_TTL → se sirve.
+    - Vencido o invalidado: un solo request toma el candado y recalcula
+      (single-flight). Los demás, con DASHBOARD_CACHE_SWR, reciben el valor
+      anterior mientras tanto (stale-while-revalidate); sin SWR esperan el
+      nuevo valor hasta DASHBOARD_CACHE_BLOQUEO segundos.
+
+    El valor debe ser serializable por el backend de caché (datos planos).
+    """
+    if not settings.DASHBOARD_CACHE_ACTIVA:
+        return calcular()
+
+    cache = _cache()
+    llave = f"dashboard:{grupo}:{clave}"
+    version = _version(cache, grupo)
+    entrada = cache.get(llave)
+
+    if entrada and entrada["version"] == version and time.time() < entrada["expira"]:
+        return entrada["valor"]
+
+    candado = f"{llave}:recalculando"
+    if cache.add(candado, 1, timeout=settings.DASHBOARD_CACHE_BLOQUEO):
+        try:
+            return _recalcular(cache, llave, version, calcular)
+        finally:
+            cache.delete(candado)
+
+    # Otro request ya está recalculando esta entrada
+    if entrada and settings.DASHBOARD_CACHE_SWR:
+        return entrada["valor"]
+
+    return _esperar(cache, llave, version, calcular)
+
+
+def _recalcular(cache, llave: str, version: int, calcular):
+    valor = calcular()
+    ttl = settings.DASHBOARD_CACHE_TTL
+    cache.set(
+        llave,
+        {"version": version, "valor": valor, "expira": time.time() + ttl},
+        timeout=ttl + settings.DASHBOARD_CACHE_STALE_MAX
+    )
+    return valor
+
+
+def _esperar(cache, llave: str, version: int, calcular):
+    """Espera a que el request que tiene el candado publique el valor; si tarda, calcula."""
+    limite = time.monotonic() + settings.DASHBOARD_CACHE_BLOQUEO
+
+    while time.monotonic() < limite:
+        time.sleep(0.05)
+        entrada = cache.get(llave)
+        if entrada and entrada["version"] >= version:
+            return entrada["valor"]
+
+    logger.warning("Tiempo de espera agotado para %s; se calcula sin caché.", llave)
+    return calcular()
+
+
+# =========================================================================
+# INVALIDACIÓN
+# =========================================================================
+def invalidar(*grupos: str):
+    """
+    Invalida los grupos indicados al confirmarse la transacción actual
+    (o de inmediato si no hay transacción). Invalidar antes del commit
+    permitiría que otro request recalcule con datos aún no confirmados.
+    """
+    if not hasattr(_pendientes, "grupos"):
+        _pendientes.grupos = set()
+
+    _pendientes.grupos.update(grupos)
+    transaction.on_commit(_aplicar_invalidaciones)
+
+
+def _aplicar_invalidaciones():
+    grupos = getattr(_pendientes, "grupos", set())
+    _pendientes.grupos = set()
+    if not grupos:
+        return
+
+    cache = _cache()
+    for grupo in grupos:
+        llave = _llave_version(grupo)
+        cache.add(llave, 1, timeout=None)
+        try:
+            cache.incr(llave)
+        except ValueError:
+            # La llave expiró/se desalojó entre add e incr
+            cache.set(llave, int(time.time()), timeout=None)
+
+
+def invalidar_por_modelo(modelo):
+    """Invalida los grupos que dependen del modelo (clase o instancia)."""
+    grupos = grupos_de_modelo(modelo)
+    if grupos:
+        invalidar(*grupos)
+
+
+def grupos_de_modelo(modelo):
+    etiqueta = modelo._meta.label
+    return [grupo for grupo, etiquetas in DEPENDENCIAS.items() if etiqueta in etiquetas]
+
+
+def conectar_senales():
+    """
+    Conecta post_save / post_delete de los modelos de DEPENDENCIAS (y solo
+    de ellos: un receptor sin sender desactivaría el borrado rápido de
+    QuerySet.delete() en todos los modelos) para invalidar sus grupos.
+    Se llama en ComunConfig.ready(), con todos los modelos registrados.
+    Las escrituras masivas (QuerySet.update, bulk_create) no disparan
+    señales: sus repositories llaman a invalidar_por_modelo explícitamente.
+    """
+    from django.apps import apps
+    from django.db.models.signals import post_delete, post_save
+
+    etiquetas = {etiqueta for etiquetas in DEPENDENCIAS.values() for etiqueta in etiquetas}
+    for etiqueta in sorted(etiquetas):
+        modelo = apps.get_model(etiqueta)
+        post_save.connect(_al_cambiar, sender=modelo, dispatch_uid=f"cache_dashboard_save:{etiqueta}")
+        if etiqueta not in BORRADO_SIN_SENAL:
+            post_delete.connect(_al_cambiar, sender=modelo, dispatch_uid=f"cache_dashboard_delete:{etiqueta}")
+
+
+def _al_cambiar(sender, **kwargs):
+    invalidar_por_modelo(sender)
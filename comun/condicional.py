@@ -0,0 +1,120 @@
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from comun.repositories.estado_tabla_repository import EstadoTablaRepository
+
+
+class _NoModificado(Exception):
+    """Corta el request después de la autenticación y permisos con un 304."""
+
+    def __init__(self, respuesta):
+        super().__init__()
+        self.respuesta = respuesta
+
+
+def modelos_dependientes(modelo):
+    """
+    Modelos cuyo borrado cambia filas de `modelo` sin tocar su updated_at:
+    los destinos de sus ForeignKey con on_delete SET_NULL / SET_DEFAULT
+    (Django los aplica con un UPDATE masivo).
+    """
+    return [
+        campo.related_model
+        for campo in modelo._meta.concrete_fields
+        if campo.is_relation and campo.remote_field.on_delete in (models.SET_NULL, models.SET_DEFAULT)
+    ]
+
+
+class CondicionalMixin:
+    """
+    Mixin para ViewSets: GET condicional (ETag / Last-Modified) en list y
+    retrieve, calculado desde MAX(updated_at) + COUNT(*) de la tabla.
+
+    - list: estado de toda la tabla `modelo_condicional`.
+    - retrieve: estado de la fila pedida.
+    En ambos casos se suma el de las tablas de modelos_dependientes(), cuyo
+    borrado anula FKs sin cambiar updated_at. Todo sale de una consulta.
+
+    Con If-None-Match / If-Modified-Since vigentes se responde 304 después
+    de autenticar y verificar permisos, sin llamar al service ni
+    serializar. Las escrituras que no pasan por save() (QuerySet.update)
+    deben actualizar updated_at para invalidar el ETag. Last-Modified no
+    refleja borrados (solo el ETag, vía COUNT): los clientes deben
+    preferir If-None-Match.
+    """
+
+    # Modelo que serializan list/retrieve (obligatorio en cada ViewSet)
+    modelo_condicional = None
+    acciones_condicionales = ("list", "retrieve")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._validadores = None
+
+        if request.method not in ("GET", "HEAD") or self.action not in self.acciones_condicionales:
+            return
+
+        self._validadores = self.obtener_validadores(request, kwargs.get(self.lookup_url_kwarg or self.lookup_field))
+        if self._validadores is None:
+            return
+
+        etag, ultimo = self._validadores
+        respuesta = get_conditional_response(
+            request, etag=etag, last_modified=ultimo and int(ultimo.timestamp())
+        )
+        if isinstance(respuesta, HttpResponseNotModified):
+            self._agregar_validadores(respuesta)
+            raise _NoModificado(respuesta)
+
+    def obtener_validadores(self, request, pk=None):
+        """
+        Retorna (etag, última modificación) del recurso pedido, o None si
+        no se puede calcular (p. ej. una pk no numérica: el handler
+        responde el error habitual).
+        """
+        modelo = self.modelo_condicional
+        queryset = modelo.objects.all()
+        if pk is not None:
+            try:
+                queryset = queryset.filter(pk=modelo._meta.pk.to_python(pk))
+            except ValidationError:
+                return None
+
+        estados = EstadoTablaRepository.get_estados(
+            [queryset] + [dependiente.objects.all() for dependiente in modelos_dependientes(modelo)]
+        )
+
+        # El formato (JSON, API navegable) y los campos pedidos (?fields= /
+        # ?omit=, ver comun.seleccion_campos) también distinguen la representación
+        firma = "|".join(
+            [request.accepted_renderer.format or ""]
+            + [request.query_params.get(parametro, "") for parametro in ("fields", "omit")]
+            + [f"{ultimo.isoformat() if ultimo else ''}:{total}" for ultimo, total in estados]
+        )
+        etag = f'"{hashlib.sha1(firma.encode()).hexdigest()[:32]}"'
+        ultimos = [ultimo for ultimo, _ in estados if ultimo]
+        return etag, max(ultimos) if ultimos else None
+
+    def _agregar_validadores(self, response):
+        etag, ultimo = self._validadores
+        response["ETag"] = etag
+        if ultimo:
+            response["Last-Modified"] = http_date(ultimo.timestamp())
+        # Datos autenticados: el cliente puede guardarlos, pero revalida siempre
+        response.setdefault("Cache-Control", "private, no-cache")
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NoModificado):
+            return exc.respuesta
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "_validadores", None) and response.status_code == 200:
+            self._agregar_validadores(response)
+        return response
@@ -0,0 +1,121 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+
+from django.conf import settings
+from django.db import connection
+
+# Cantidad de repeticiones de una misma consulta a partir de la cual se
+# considera un posible N+1 (p. ej. una consulta por cada fila de un listado)
+UMBRAL_N_MAS_UNO = 3
+
+_LISTA_PARAMETROS = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_CADENAS = re.compile(r"'(?:[^']|'')*'")
+_NUMEROS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_ESPACIOS = re.compile(r"\s+")
+
+
+class PresupuestoConsultasExcedido(AssertionError):
+    """Un endpoint ejecutó más consultas SQL que su presupuesto declarado."""
+
+
+def huella_sql(sql: str) -> str:
+    """
+    Normaliza una sentencia SQL para agrupar las que solo difieren en sus
+    parámetros: literales → ?, listas IN (%s, %s, ...) → (...).
+    """
+    sql = _LISTA_PARAMETROS.sub("(...)", sql)
+    sql = _CADENAS.sub("?", sql)
+    sql = _NUMEROS.sub("?", sql)
+    return _ESPACIOS.sub(" ", sql.replace("%s", "?")).strip()
+
+
+class RegistroConsultas:
+    """
+    Acumula las consultas SQL ejecutadas en una conexión.
+    Se instala con connection.execute_wrapper (ver registrar_consultas).
+    """
+
+    def __init__(self):
+        self.consultas = []  # [(huella, duracion_ms)]
+
+    def __call__(self, execute, sql, params, many, context):
+        inicio = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.consultas.append((huella_sql(sql), (time.perf_counter() - inicio) * 1000))
+
+    @property
+    def total(self) -> int:
+        return len(self.consultas)
+
+    @property
+    def tiempo_ms(self) -> float:
+        return sum(duracion for _, duracion in self.consultas)
+
+    def duplicadas(self) -> dict:
+        """Retorna {huella: repeticiones} de las consultas ejecutadas más de una vez."""
+        conteo = Counter(huella for huella, _ in self.consultas)
+        return {huella: n for huella, n in conteo.most_common() if n > 1}
+
+    def sospechas_n_mas_uno(self) -> dict:
+        """Consultas repetidas UMBRAL_N_MAS_UNO veces o más (posible N+1)."""
+        return {huella: n for huella, n in self.duplicadas().items() if n >= UMBRAL_N_MAS_UNO}
+
+    def resumen(self) -> dict:
+        duplicadas = self.duplicadas()
+        return {
+            "consultas": self.total,
+            "tiempo_db_ms": round(self.tiempo_ms, 2),
+            "duplicadas": sum(duplicadas.values()) - len(duplicadas),
+            "n_mas_uno": self.sospechas_n_mas_uno(),
+        }
+
+
+@contextmanager
+def registrar_consultas():
+    """
+    Registra las consultas ejecutadas dentro del bloque.
+
+    Ejemplo:
+        with registrar_consultas() as registro:
+            servicio.obtener_resumen_maquinarias()
+        registro.total, registro.tiempo_ms, registro.duplicadas()
+    """
+    registro = RegistroConsultas()
+    with connection.execute_wrapper(registro):
+        yield registro
+
+
+def obtener_presupuesto(ruta: str):
+    """
+    Retorna el máximo de consultas declarado para la ruta en
+    settings.PRESUPUESTO_CONSULTAS ({ruta o patrón glob: máximo}),
+    o None si la ruta no tiene presupuesto.
+    """
+    presupuestos = settings.PRESUPUESTO_CONSULTAS
+
+    if ruta in presupuestos:
+        return presupuestos[ruta]
+
+    for patron, maximo in presupuestos.items():
+        if fnmatchcase(ruta, patron):
+            return maximo
+    return None
+
+
+def verificar_presupuesto(ruta: str, registro: RegistroConsultas):
+    """Lanza PresupuestoConsultasExcedido si el registro supera el presupuesto de la ruta."""
+    maximo = obtener_presupuesto(ruta)
+    if maximo is None or registro.total <= maximo:
+        return
+
+    detalle = "".join(
+        f"\n  {n}x {huella[:200]}" for huella, n in registro.duplicadas().items()
+    )
+    raise PresupuestoConsultasExcedido(
+        f"{ruta} ejecutó {registro.total} consultas (presupuesto: {maximo}).{detalle}"
+    )
@@ -0,0 +1,65 @@
+import asyncio
+import json
+import threading
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class Difusor:
+    """
+    Publicación/suscripción en memoria del proceso (sin dependencias).
+
+    Cada suscriptor es una asyncio.Queue del event loop que la creó (una
+    conexión SSE). `publicar` es seguro desde cualquier hilo: los views
+    síncronos y las señales corren en hilos del executor, así que el
+    evento se entrega con loop.call_soon_threadsafe.
+
+    Solo alcanza a los suscriptores de este proceso; con varios workers se
+    complementa con un sondeo de la BD (ver alarmas.eventos).
+    """
+
+    # Eventos en espera por suscriptor; un cliente lento pierde los más nuevos
+    # (al reconectarse recibe el estado vigente)
+    TAMANO_COLA = 100
+
+    def __init__(self):
+        self._suscriptores = {}
+        self._candado = threading.Lock()
+
+    def suscribir(self) -> asyncio.Queue:
+        """Registra un suscriptor en el event loop actual y retorna su cola."""
+        cola = asyncio.Queue(maxsize=self.TAMANO_COLA)
+        with self._candado:
+            self._suscriptores[cola] = asyncio.get_running_loop()
+        return cola
+
+    def desuscribir(self, cola: asyncio.Queue):
+        with self._candado:
+            self._suscriptores.pop(cola, None)
+
+    def hay_suscriptores(self) -> bool:
+        return bool(self._suscriptores)
+
+    def publicar(self, evento: str, datos: dict):
+        """Entrega (evento, datos) a todos los suscriptores del proceso."""
+        with self._candado:
+            suscriptores = list(self._suscriptores.items())
+
+        for cola, loop in suscriptores:
+            try:
+                loop.call_soon_threadsafe(self._entregar, cola, (evento, datos))
+            except RuntimeError:
+                # El loop del suscriptor ya se cerró
+                self.desuscribir(cola)
+
+    @staticmethod
+    def _entregar(cola, mensaje):
+        try:
+            cola.put_nowait(mensaje)
+        except asyncio.QueueFull:
+            pass
+
+
+def formatear_sse(evento: str, datos: dict) -> str:
+    """Serializa un evento en el formato text/event-stream."""
+    return f"event: {evento}\ndata: {json.dumps(datos, cls=DjangoJSONEncoder, ensure_ascii=False)}\n\n"
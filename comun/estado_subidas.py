@@ -0,0 +1,84 @@
+from collections.abc import Mapping
+
+from django.db.models import QuerySet
+from django.db.models.manager import BaseManager
+from rest_framework import serializers
+
+from comun.models.subida_media import SubidaMedia
+from comun.repositories.subida_media_repository import SubidaMediaRepository
+
+# Estado visible para el cliente: 'subiendo' sigue siendo pendiente (el
+# ETag del objeto solo cambia cuando la subida termina, ver MediaService)
+ESTADOS_CLIENTE = {
+    SubidaMedia.PENDIENTE: SubidaMedia.PENDIENTE,
+    SubidaMedia.SUBIENDO: SubidaMedia.PENDIENTE,
+    SubidaMedia.COMPLETADA: SubidaMedia.COMPLETADA,
+    SubidaMedia.ERROR: SubidaMedia.ERROR,
+}
+
+
+class EstadoSubidaField(serializers.Field):
+    """
+    Campo de solo lectura `<campo>_estado`: estado de la última subida en
+    segundo plano de `campo` ('pendiente', 'completada' o 'error'), o None
+    si nunca se agendó un archivo para ese campo.
+
+        foto_estado = EstadoSubidaField("foto")
+
+    En un listado los estados de todos los objetos salen de una sola
+    consulta (la primera fila los carga para el resto).
+    """
+
+    def __init__(self, campo, **kwargs):
+        self.campo = campo
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instancia):
+        if isinstance(instancia, Mapping):
+            # Datos ya serializados (los services retornan serializer.data)
+            return instancia.get(self.field_name)
+        return self._estados(instancia).get(instancia.pk, {}).get(self.campo)
+
+    def _estados(self, instancia):
+        """
+        {pk: {campo: estado}} cargado una vez por serializer raíz. Con
+        many=True se cargan de una vez todos los objetos del listado.
+        """
+        raiz = self.root
+        if not hasattr(raiz, "_estados_subida"):
+            ids = [instancia.pk]
+            if isinstance(raiz, serializers.ListSerializer):
+                ids = llaves(raiz.instance)
+            raiz._estados_subida = cargar_estados(instancia._meta.model, ids, campos_estado(self.parent))
+        return raiz._estados_subida
+
+
+def llaves(objetos):
+    """
+    Llaves primarias de un listado: de un QuerySet, como subconsulta (un
+    listado completo no envía miles de parámetros); de una lista, sus pk.
+    """
+    if isinstance(objetos, BaseManager):
+        objetos = objetos.all()
+    if isinstance(objetos, QuerySet):
+        return objetos.values("pk")
+    return [objeto.pk for objeto in objetos]
+
+
+def campos_estado(serializer):
+    """Campos de subida con `<campo>_estado` entre los campos del serializer."""
+    return [campo.campo for campo in serializer.fields.values() if isinstance(campo, EstadoSubidaField)]
+
+
+def cargar_estados(modelo, ids, campos):
+    """
+    {id: {campo: estado para el cliente}} con la última subida de cada
+    campo de los objetos `ids` (lista o subconsulta de llaves); los objetos
+    y campos sin subidas no aparecen.
+    """
+    estados = {}
+    for pk, campo, estado in SubidaMediaRepository.get_ultimos_estados(modelo, ids, campos):
+        estados.setdefault(pk, {})[campo] = ESTADOS_CLIENTE[estado]
+    return estados
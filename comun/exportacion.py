@@ -0,0 +1,153 @@
+import csv
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import DateField, IntegerField
+
+TIPOS_CONTENIDO = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson; charset=utf-8",
+}
+
+# Tamaño aproximado de cada bloque enviado al cliente
+TAMANO_BLOQUE = 64 * 1024
+
+
+def iterar(queryset):
+    """
+    Recorre un queryset por bloques de EXPORTACION_CHUNK_SIZE filas sin
+    cachearlo (en PostgreSQL usa un cursor del lado del servidor).
+    """
+    return queryset.iterator(chunk_size=settings.EXPORTACION_CHUNK_SIZE)
+
+
+def exportar_csv(filas, columnas):
+    """
+    Genera el CSV (encabezado + filas) en bloques de ~TAMANO_BLOQUE.
+    `filas` es un iterable de diccionarios (p. ej. queryset.values().iterator()).
+    """
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    escritor.writerow(columnas)
+
+    for fila in filas:
+        escritor.writerow([fila[columna] for columna in columnas])
+        if buffer.tell() >= TAMANO_BLOQUE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def exportar_ndjson(filas, columnas):
+    """Genera una línea JSON por fila (NDJSON) en bloques de ~TAMANO_BLOQUE."""
+    bloque = []
+    tamano = 0
+
+    for fila in filas:
+        linea = json.dumps({columna: fila[columna] for columna in columnas},
+                           cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+        bloque.append(linea)
+        tamano += len(linea)
+        if tamano >= TAMANO_BLOQUE:
+            yield "".join(bloque)
+            bloque, tamano = [], 0
+
+    yield "".join(bloque)
+
+
+GENERADORES = {"csv": exportar_csv, "ndjson": exportar_ndjson}
+
+
+async def iterar_en_hilo(generador):
+    """
+    Versión asíncrona de un generador síncrono de bloques, para servirlo
+    por ASGI sin que Django lo materialice entero (StreamingHttpResponse
+    convierte a lista los iteradores síncronos bajo ASGI).
+
+    Cada bloque se pide en un hilo propio de esta respuesta, siempre el
+    mismo: el cursor del lado del servidor y su conexión no cambian de
+    hilo. Al terminar (o si el cliente se desconecta) cierra el generador
+    y la conexión en ese mismo hilo.
+    """
+    hilo = ThreadPoolExecutor(max_workers=1, thread_name_prefix="exportacion")
+    siguiente = sync_to_async(next, thread_sensitive=False, executor=hilo)
+    fin = object()
+    try:
+        while (bloque := await siguiente(generador, fin)) is not fin:
+            yield bloque
+    finally:
+        await sync_to_async(_cerrar, thread_sensitive=False, executor=hilo)(generador)
+        hilo.shutdown(wait=False)
+
+
+def _cerrar(generador):
+    generador.close()
+    connections.close_all()
+
+
+class ExportacionMixin:
+    """
+    Mixin para ViewSets con endpoints de exportación en streaming.
+
+    Parámetros de query soportados:
+        formato=csv|ndjson  (por defecto csv)
+        desde=YYYY-MM-DD, hasta=YYYY-MM-DD, maquina=<id>
+
+    El service recibe los filtros (se aplican en SQL) y retorna un
+    iterador de diccionarios; la respuesta se escribe a medida que se
+    leen las filas, así la memoria no depende del tamaño del resultado.
+    """
+
+    def obtener_parametros_exportacion(self, request):
+        """
+        Retorna (formato, filtros) con filtros = {"fecha_inicio", "fecha_fin", "id_maquina"}.
+        Lanza ValidationError si algún parámetro no es válido.
+        """
+        params = request.query_params
+        formato = params.get("formato", "csv").lower()
+        if formato not in GENERADORES:
+            raise ValidationError({"formato": f"Formato no soportado. Use: {', '.join(GENERADORES)}."})
+
+        filtros = {
+            "fecha_inicio": self._parametro(params, "desde", DateField()),
+            "fecha_fin": self._parametro(params, "hasta", DateField()),
+            "id_maquina": self._parametro(params, "maquina", IntegerField(min_value=1)),
+        }
+        if filtros["fecha_inicio"] and filtros["fecha_fin"] and filtros["fecha_inicio"] > filtros["fecha_fin"]:
+            raise ValidationError({"desde": "La fecha inicial no puede ser posterior a la final."})
+
+        return formato, filtros
+
+    @staticmethod
+    def _parametro(params, nombre, campo):
+        valor = params.get(nombre)
+        if valor in (None, ""):
+            return None
+        try:
+            return campo.to_internal_value(valor)
+        except ValidationError as e:
+            raise ValidationError({nombre: e.detail})
+
+    def respuesta_exportacion(self, filas, columnas, formato: str, nombre: str):
+        """
+        Respuesta en streaming con las filas en el formato pedido, como
+        archivo adjunto. Servida por ASGI el contenido es asíncrono (ver
+        iterar_en_hilo); por WSGI, el generador síncrono tal cual.
+        """
+        contenido = GENERADORES[formato](filas, columnas)
+        if isinstance(self.request._request, ASGIRequest):
+            contenido = iterar_en_hilo(contenido)
+
+        response = StreamingHttpResponse(contenido, content_type=TIPOS_CONTENIDO[formato])
+        response["Content-Disposition"] = f'attachment; filename="{nombre}.{formato}"'
+        return response
@@ -0,0 +1,169 @@
+import datetime
+import decimal
+from functools import lru_cache
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from comun.estado_subidas import EstadoSubidaField, cargar_estados, llaves
+from comun.seleccion_campos import columnas_modelo
+
+# Campos cuyo to_representation deja igual el valor que entrega la BD
+# (str(str), int(int), bool, float): se copian sin convertir
+_IDENTIDAD = {
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.URLField,
+    serializers.SlugField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.FloatField,
+}
+
+
+def serializar_listado(queryset, serializer_class, campos=None):
+    """
+    Serializa un listado con la misma forma JSON que
+    serializer_class(queryset, many=True, campos=campos).data, sin crear
+    instancias del modelo ni recorrer los campos del serializer por fila:
+    lee tuplas con values_list() y las convierte con conversores por
+    campo compilados una sola vez por (serializer, campos).
+
+    Si el serializer tiene campos que no leen una columna propia del
+    modelo (source anidado, métodos), si `queryset` no es un QuerySet o si
+    LECTURA_RAPIDA_ACTIVA es False, usa el serializer de siempre.
+    """
+    if not settings.LECTURA_RAPIDA_ACTIVA or not isinstance(queryset, QuerySet):
+        return serializer_class(queryset, many=True, campos=campos).data
+
+    lector = compilar_lector(
+        serializer_class,
+        tuple(campos) if campos is not None else None,
+        timezone.get_current_timezone() if settings.USE_TZ else None
+    )
+    if lector is None:
+        return serializer_class(queryset, many=True, campos=campos).data
+    return lector.leer(queryset)
+
+
+class LectorRapido:
+    """
+    Lector compilado de un serializer: columnas a leer con values_list()
+    y, por columna, la llave de salida y su conversor (None = sin convertir).
+    `estados` son las (llave, campo) de los EstadoSubidaField: su columna
+    es la llave primaria y el estado se completa con una sola consulta.
+    """
+
+    def __init__(self, columnas, claves, conversores, estados=()):
+        self.columnas = columnas
+        self.claves = claves
+        self.conversores = conversores
+        self.estados = estados
+
+    def leer(self, queryset):
+        claves = self.claves
+        conversores = self.conversores
+        filas = [
+            {
+                clave: valor if valor is None or conversor is None else conversor(valor)
+                for clave, conversor, valor in zip(claves, conversores, fila)
+            }
+            for fila in queryset.values_list(*self.columnas)
+        ]
+        if self.estados and filas:
+            self._completar_estados(queryset, filas)
+        return filas
+
+    def _completar_estados(self, queryset, filas):
+        clave_pk = self.estados[0][0]
+        estados = cargar_estados(queryset.model, llaves(queryset), [campo for _, campo in self.estados])
+        for fila in filas:
+            estados_fila = estados.get(fila[clave_pk], {})
+            for clave, campo in self.estados:
+                fila[clave] = estados_fila.get(campo)
+
+
+@lru_cache(maxsize=256)
+def compilar_lector(serializer_class, campos=None, zona=None):
+    """
+    Retorna el LectorRapido de serializer_class (limitado a `campos`, en
+    la zona horaria `zona`) o None si no se puede leer por columnas.
+    """
+    serializer = serializer_class(campos=list(campos) if campos is not None else None)
+    legibles = [campo for campo in serializer.fields.values() if not campo.write_only]
+
+    columnas = columnas_modelo(serializer_class, legibles)
+    if columnas is None:
+        return None
+
+    return LectorRapido(
+        tuple(columnas),
+        tuple(campo.field_name for campo in legibles),
+        tuple(_conversor(campo, zona) for campo in legibles),
+        tuple((campo.field_name, campo.campo) for campo in legibles if isinstance(campo, EstadoSubidaField))
+    )
+
+
+# =========================================================================
+# CONVERSORES
+# =========================================================================
+# Replican el to_representation de cada campo de DRF para los valores que
+# entrega la BD. Los None no pasan por el conversor (Serializer los deja
+# en None). Lo que no se replica usa el to_representation del campo.
+def _conversor(campo, zona):
+    tipo = type(campo)
+
+    if tipo in _IDENTIDAD or tipo is EstadoSubidaField:
+        return None
+
+    if isinstance(campo, serializers.PrimaryKeyRelatedField):
+        # values_list() ya entrega la llave foránea
+        return None if campo.pk_field is None else campo.pk_field.to_representation
+
+    if tipo is serializers.DateTimeField:
+        formato = getattr(campo, "format", api_settings.DATETIME_FORMAT)
+        zona_campo = getattr(campo, "timezone", zona)
+        if formato is not None and formato.lower() == ISO_8601 and zona_campo is not None:
+            return _fecha_hora_iso(zona_campo, campo.to_representation)
+
+    if tipo is serializers.DateField:
+        formato = getattr(campo, "format", api_settings.DATE_FORMAT)
+        if formato is not None and formato.lower() == ISO_8601:
+            return datetime.date.isoformat
+
+    if tipo is serializers.DecimalField:
+        coerce_to_string = getattr(campo, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        if coerce_to_string and not campo.localize and not campo.normalize_output and campo.decimal_places is not None:
+            return _decimal_texto(campo)
+
+    if tipo is serializers.ChoiceField:
+        opciones = campo.choice_strings_to_values
+        return lambda valor: valor if valor == "" else opciones.get(str(valor), valor)
+
+    return campo.to_representation
+
+
+def _fecha_hora_iso(zona, respaldo):
+    def convertir(valor):
+        if valor.tzinfo is None:
+            return respaldo(valor)
+        texto = valor.astimezone(zona).isoformat()
+        return texto[:-6] + "Z" if texto.endswith("+00:00") else texto
+    return convertir
+
+
+def _decimal_texto(campo):
+    contexto = decimal.getcontext().copy()
+    if campo.max_digits is not None:
+        contexto.prec = campo.max_digits
+    exponente = decimal.Decimal(".1") ** campo.decimal_places
+    redondeo = campo.rounding
+
+    def convertir(valor):
+        if not isinstance(valor, decimal.Decimal):
+            valor = decimal.Decimal(str(valor).strip())
+        return f"{valor.quantize(exponente, rounding=redondeo, context=contexto):f}"
+    return convertir
@@ -0,0 +1,67 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Se ejecuta en un proceso limpio: mide lo que paga cada worker al arrancar
+# (django.setup() + importar el URLconf, que importa todas las vistas)
+SCRIPT_ARRANQUE = """
+import gc, json, resource, time
+inicio = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+segundos = time.perf_counter() - inicio
+servicios = sum(
+    1 for objeto in gc.get_objects()
+    if type(objeto).__name__.endswith("Service") and ".services." in type(objeto).__module__
+)
+print(json.dumps({
+    "segundos": segundos,
+    "memoria_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "servicios": servicios,
+}))
+"""
+
+
+class Command(BaseCommand):
+    """
+    Mide el arranque de un worker: tiempo de django.setup() + carga del
+    URLconf, memoria máxima del proceso y cantidad de instancias de
+    servicios creadas durante el arranque. Cada repetición corre en un
+    subproceso nuevo para no reutilizar módulos ya importados.
+
+    Uso:
+        python manage.py benchmark_arranque --repeticiones 10
+    """
+
+    help = "Mide tiempo, memoria y servicios instanciados al arrancar un worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeticiones", type=int, default=10,
+                            help="Cantidad de arranques a medir.")
+
+    def handle(self, *args, **options):
+        entorno = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE)}
+
+        mediciones = []
+        for _ in range(options["repeticiones"]):
+            salida = subprocess.run(
+                [sys.executable, "-c", SCRIPT_ARRANQUE],
+                capture_output=True, text=True, check=True, env=entorno,
+                cwd=settings.BASE_DIR
+            )
+            mediciones.append(json.loads(salida.stdout.strip().splitlines()[-1]))
+
+        tiempos = [m["segundos"] * 1000 for m in mediciones]
+        self.stdout.write(f"Arranques medidos:        {len(mediciones)}")
+        self.stdout.write(f"Tiempo mediano:           {statistics.median(tiempos):.1f} ms")
+        self.stdout.write(f"Tiempo mínimo:            {min(tiempos):.1f} ms")
+        self.stdout.write(f"Memoria máxima (mediana): {statistics.median(m['memoria_kb'] for m in mediciones) / 1024:.1f} MB")
+        self.stdout.write(f"Servicios instanciados:   {mediciones[-1]['servicios']}")
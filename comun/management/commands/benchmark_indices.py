@@ -0,0 +1,202 @@
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from alarmas.models.alarma import Alarma
+from mantenimientos.models.mantenimiento import Mantenimiento
+from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
+from maquinarias.models.maquinaria import Maquinaria
+from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
+from proyectos.models.proyecto import Proyecto
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+
+# Modelos cuyos índices/constraints se comparan
+MODELOS_INDEXADOS = [Mantenimiento, ProyectoMaquinaria, RegistroHorasMaquinaria, Alarma]
+
+
+class Command(BaseCommand):
+    """
+    Benchmark del paquete de índices de las rutas de consulta más usadas.
+
+    Dentro de una transacción que siempre se revierte:
+    1. Siembra un dataset sintético (opcional, --maquinas).
+    2. Ejecuta cada consulta con los índices actuales (plan + tiempo).
+    3. Elimina los índices/constraints del paquete y repite la medición.
+
+    La base de datos queda exactamente igual que antes de ejecutar el comando.
+
+    Uso:
+        python manage.py benchmark_indices --maquinas 500 --repeticiones 30
+    """
+
+    help = "Compara planes de consulta y tiempos con y sin los índices de las rutas calientes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--maquinas", type=int, default=300,
+                            help="Máquinas sintéticas a sembrar (0 = usar los datos actuales).")
+        parser.add_argument("--repeticiones", type=int, default=20,
+                            help="Ejecuciones por consulta para calcular la mediana.")
+        parser.add_argument("--planes", action="store_true",
+                            help="Imprime el plan completo (EXPLAIN) de cada consulta.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["maquinas"]:
+                self._sembrar(options["maquinas"])
+            self._analizar()
+
+            con_indices = self._medir(options["repeticiones"])
+            omitidos = self._eliminar_indices()
+            self._analizar()
+            sin_indices = self._medir(options["repeticiones"])
+
+            transaction.set_rollback(True)
+
+        self._reportar(con_indices, sin_indices, omitidos, options["planes"])
+
+    # ---------------------------------------------------------
+    # CONSULTAS
+    # ---------------------------------------------------------
+    def _consultas(self):
+        """Consultas representativas de las rutas calientes."""
+        # Última máquina creada: con --maquinas es una de las sembradas
+        maquina = Maquinaria.objects.order_by("-pk").first()
+        programado = MantenimientoProgramado.objects.filter(maquina=maquina).first()
+        registro = RegistroHorasMaquinaria.objects.filter(maquina=maquina).first()
+        fecha = registro.fecha if registro else date.today()
+
+        return [
+            ("mantenimiento: último por máquina/programado",
+             Mantenimiento.objects.filter(maquina=maquina, programado=programado)
+             .order_by("-fecha_mantenimiento")[:1]),
+            ("proyecto_maquinaria: última asignación",
+             ProyectoMaquinaria.objects.filter(maquina=maquina).order_by("-created_at")[:1]),
+            ("proyecto_maquinaria: asignaciones activas",
+             ProyectoMaquinaria.objects.filter(maquina=maquina, finalizado=False)),
+            ("registro_horas: por máquina y fecha",
+             RegistroHorasMaquinaria.objects.filter(maquina=maquina, fecha=fecha)),
+            ("alarmas: no vistas de una máquina",
+             Alarma.objects.filter(maquina=maquina, vista=False).order_by("-fecha_registro")),
+            ("alarmas: por nivel",
+             Alarma.objects.filter(nivel="crítica")),
+            ("alarmas: últimas 10",
+             Alarma.objects.order_by("-fecha_registro")[:10]),
+        ]
+
+    def _medir(self, repeticiones):
+        """Retorna {nombre: (mediana_ms, plan)} para cada consulta."""
+        resultados = {}
+
+        for nombre, queryset in self._consultas():
+            plan = queryset.explain()
+            tiempos = []
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                list(queryset.all())
+                tiempos.append((time.perf_counter() - inicio) * 1000)
+            resultados[nombre] = (statistics.median(tiempos), plan)
+
+        return resultados
+
+    # ---------------------------------------------------------
+    # ÍNDICES
+    # ---------------------------------------------------------
+    def _eliminar_indices(self):
+        """
+        Elimina los índices y constraints declarados en Meta de los
+        modelos indexados. Retorna los nombres que no pudieron eliminarse
+        (p. ej. UNIQUE embebidos en la tabla en SQLite).
+        """
+        omitidos = []
+        qn = connection.ops.quote_name
+
+        with connection.cursor() as cursor:
+            for modelo in MODELOS_INDEXADOS:
+                for index in modelo._meta.indexes:
+                    cursor.execute(f"DROP INDEX {qn(index.name)}")
+
+                for constraint in modelo._meta.constraints:
+                    if connection.vendor == "postgresql":
+                        cursor.execute(
+                            f"ALTER TABLE {qn(modelo._meta.db_table)} DROP CONSTRAINT {qn(constraint.name)}"
+                        )
+                    else:
+                        omitidos.append(constraint.name)
+
+        return omitidos
+
+    def _analizar(self):
+        """Actualiza las estadísticas del planificador."""
+        with connection.cursor() as cursor:
+            for modelo in MODELOS_INDEXADOS:
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(modelo._meta.db_table)}")
+
+    # ---------------------------------------------------------
+    # DATASET SINTÉTICO
+    # ---------------------------------------------------------
+    def _sembrar(self, cantidad):
+        """Siembra máquinas con mantenimientos, asignaciones, registros y alarmas."""
+        random.seed(42)
+        hoy = date.today()
+
+        proyecto = Proyecto.objects.create(nombre_proyecto="Benchmark índices")
+        maquinas = Maquinaria.objects.bulk_create([
+            Maquinaria(nombre_maquina=f"Benchmark {i}", horas_totales=Decimal(random.randint(0, 5000)))
+            for i in range(cantidad)
+        ])
+        programados = MantenimientoProgramado.objects.bulk_create([
+            MantenimientoProgramado(maquina=maquina, nombre=f"Programado {j}",
+                                    tipo="preventivo", intervalo_horas=250)
+            for maquina in maquinas for j in range(3)
+        ])
+
+        Mantenimiento.objects.bulk_create([
+            Mantenimiento(maquina_id=programado.maquina_id, programado=programado,
+                          tipo_mantenimiento="preventivo", descripcion="benchmark",
+                          fecha_mantenimiento=hoy - timedelta(days=k * 30),
+                          horas_realizadas=Decimal(k * 250), costo=Decimal("100"))
+            for programado in programados for k in range(10)
+        ], batch_size=2000)
+
+        ProyectoMaquinaria.objects.bulk_create([
+            ProyectoMaquinaria(proyecto=proyecto, maquina=maquina, finalizado=k < 4)
+            for maquina in maquinas for k in range(5)
+        ], batch_size=2000)
+
+        RegistroHorasMaquinaria.objects.bulk_create([
+            RegistroHorasMaquinaria(maquina=maquina, fecha=hoy - timedelta(days=d),
+                                    horas_trabajadas=Decimal(random.randint(1, 12)))
+            for maquina in maquinas for d in range(60)
+        ], batch_size=2000)
+
+        niveles = ["baja", "media", "alta", "crítica"]
+        Alarma.objects.bulk_create([
+            Alarma(maquina=maquina, tipo="mantenimiento", nivel=random.choice(niveles),
+                   vista=random.random() < 0.9)
+            for maquina in maquinas for _ in range(20)
+        ], batch_size=2000)
+
+    # ---------------------------------------------------------
+    # REPORTE
+    # ---------------------------------------------------------
+    def _reportar(self, con_indices, sin_indices, omitidos, mostrar_planes):
+        self.stdout.write(f"Motor: {connection.vendor}\n")
+        self.stdout.write(f"{'consulta':<48}{'sin índices':>14}{'con índices':>14}")
+
+        for nombre, (ms_con, plan_con) in con_indices.items():
+            ms_sin, plan_sin = sin_indices[nombre]
+            self.stdout.write(f"{nombre:<48}{ms_sin:>11.3f} ms{ms_con:>11.3f} ms")
+            if mostrar_planes:
+                self.stdout.write(f"  - sin índices:\n{plan_sin}\n  - con índices:\n{plan_con}\n")
+
+        if omitidos:
+            self.stdout.write(self.style.WARNING(
+                f"No se pudieron eliminar en {connection.vendor}: {', '.join(omitidos)}"
+            ))
+
+        self.stdout.write(self.style.SUCCESS("Benchmark terminado; los cambios fueron revertidos."))
@@ -0,0 +1,127 @@
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from comun.lectura_rapida import compilar_lector, serializar_listado
+from mantenimientos.models.mantenimiento import Mantenimiento
+from mantenimientos.serializers.mantenimiento_serializer import MantenimientoSerializer
+from maquinarias.models.maquinaria import Maquinaria
+from maquinarias.serializers.maquinaria_serializer import MaquinariaSerializer
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+from registros_horas_maquinaria.serializers.registro_horas_maquinaria_serializer import (
+    RegistroHorasMaquinariaSerializer,
+)
+
+DIAS_POR_MAQUINA = 1000
+LOTE_SIEMBRA = 10000
+
+# (etiqueta, modelo, serializer)
+LISTADOS = (
+    ("maquinarias", Maquinaria, MaquinariaSerializer),
+    ("mantenimientos", Mantenimiento, MantenimientoSerializer),
+    ("registros de horas", RegistroHorasMaquinaria, RegistroHorasMaquinariaSerializer),
+)
+
+
+class Command(BaseCommand):
+    """
+    Compara filas/segundo del listado completo serializado con el
+    ModelSerializer (instancias + to_representation por fila) y con la
+    lectura rápida (values_list + conversores compilados, ver
+    comun.lectura_rapida), para maquinarias, mantenimientos y registros
+    de horas. Ambos tiempos incluyen la consulta.
+
+    Dentro de una transacción que siempre se revierte siembra `--filas`
+    filas por listado. Antes de medir verifica que ambos caminos
+    produzcan exactamente la misma salida; si difieren, falla.
+
+    Uso:
+        python manage.py benchmark_serializacion --filas 20000 --repeticiones 5
+    """
+
+    help = "Filas/segundo del ModelSerializer vs la lectura rápida en los listados."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--filas", type=int, default=20000,
+                            help="Filas a sembrar por listado.")
+        parser.add_argument("--repeticiones", type=int, default=5,
+                            help="Mediciones por camino (se reporta la mejor).")
+
+    def handle(self, *args, **options):
+        filas = options["filas"]
+        repeticiones = max(options["repeticiones"], 1)
+
+        with transaction.atomic():
+            inicio = time.perf_counter()
+            self._sembrar(filas)
+            self.stdout.write(f"Sembradas {filas} filas por listado en {time.perf_counter() - inicio:.1f} s")
+
+            for etiqueta, modelo, serializer_class in LISTADOS:
+                queryset = modelo.objects.all()
+                if compilar_lector(serializer_class) is None:
+                    raise CommandError(f"{serializer_class.__name__} no admite la lectura rápida.")
+
+                esperado = serializer_class(queryset.all(), many=True).data
+                if serializar_listado(queryset.all(), serializer_class) != esperado:
+                    raise CommandError(f"La lectura rápida de {etiqueta} no coincide con {serializer_class.__name__}.")
+
+                total = len(esperado)
+                serializer = self._mejor(repeticiones, lambda: serializer_class(queryset.all(), many=True).data)
+                rapida = self._mejor(repeticiones, lambda: serializar_listado(queryset.all(), serializer_class))
+
+                self.stdout.write(
+                    f"{etiqueta:<20} {total:>8} filas  "
+                    f"serializer {total / serializer:>10,.0f} filas/s  "
+                    f"lectura rápida {total / rapida:>10,.0f} filas/s  "
+                    f"x{serializer / rapida:.1f}"
+                )
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _mejor(repeticiones, funcion):
+        """Menor tiempo (segundos) de `repeticiones` ejecuciones."""
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            funcion()
+            tiempos.append(time.perf_counter() - inicio)
+        return min(tiempos)
+
+    def _sembrar(self, filas):
+        maquinas = Maquinaria.objects.bulk_create([
+            Maquinaria(
+                nombre_maquina=f"Benchmark serialización {i}",
+                horas_totales=Decimal("1234.50"),
+                fecha_adquisicion=date(2020, 1, 1) + timedelta(days=i % 1000),
+            )
+            for i in range(filas)
+        ])
+        inicio = date.today() - timedelta(days=DIAS_POR_MAQUINA)
+
+        for modelo, crear in (
+            (Mantenimiento, lambda n, maquina: Mantenimiento(
+                maquina_id=maquina.pk,
+                tipo_mantenimiento="preventivo",
+                descripcion="benchmark",
+                fecha_mantenimiento=inicio + timedelta(days=n % DIAS_POR_MAQUINA),
+                costo=Decimal("150000.00"),
+                horas_realizadas=Decimal("250.00"),
+            )),
+            (RegistroHorasMaquinaria, lambda n, maquina: RegistroHorasMaquinaria(
+                maquina_id=maquina.pk,
+                fecha=inicio + timedelta(days=n % DIAS_POR_MAQUINA),
+                horas_trabajadas=Decimal("8.00"),
+                observaciones="benchmark",
+            )),
+        ):
+            lote = []
+            for n in range(filas):
+                lote.append(crear(n, maquinas[n // DIAS_POR_MAQUINA]))
+                if len(lote) == LOTE_SIEMBRA:
+                    modelo.objects.bulk_create(lote)
+                    lote = []
+            modelo.objects.bulk_create(lote)
@@ -0,0 +1,117 @@
+import time
+from datetime import date
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+
+from comun.media.backends import IMediaBackend
+from comun.media.staging import eliminar_de_staging
+from comun.services.media_service import MediaService
+from maquinarias.models.maquinaria import Maquinaria
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+
+CAMPOS_FOTOS = ["foto_planilla", "foto_horometro_inicial", "foto_horometro_final"]
+
+# Los archivos del benchmark no son imágenes reales: se omite la optimización
+OPCIONES_SUBIDA = {"carpeta": "benchmark", "optimizar": False}
+
+
+class BackendConLatencia(IMediaBackend):
+    """Backend falso: simula la latencia de red de cada subida y opcionalmente falla un archivo."""
+
+    def __init__(self, latencia: float):
+        self.latencia = latencia
+        self.fallar_en = None
+        self.eliminadas = []
+
+    def subir(self, ruta_local: str, carpeta: str, resource_type: str = "image") -> str:
+        time.sleep(self.latencia)
+        if ruta_local == self.fallar_en:
+            raise RuntimeError("fallo simulado")
+        return f"https://fake.local/{carpeta}/{ruta_local.rsplit('/', 1)[-1]}"
+
+    def eliminar(self, url: str) -> None:
+        self.eliminadas.append(url)
+
+
+class Command(BaseCommand):
+    """
+    Compara la subida secuencial vs. en paralelo (lote) de las tres fotos
+    de un registro de horas usando un backend falso con latencia inyectada.
+    También verifica la semántica todo-o-nada haciendo fallar una foto.
+    Todo se ejecuta en una transacción que se revierte.
+
+    Uso:
+        python manage.py benchmark_subidas --latencia 0.5
+    """
+
+    help = "Benchmark de subida secuencial vs. paralela de las fotos de un registro."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--latencia", type=float, default=0.3,
+                            help="Segundos que tarda cada subida simulada.")
+
+    def handle(self, *args, **options):
+        latencia = options["latencia"]
+
+        with transaction.atomic():
+            maquina = Maquinaria.objects.create(nombre_maquina="Benchmark subidas")
+
+            # --- Secuencial: una subida tras otra ---
+            servicio = MediaService(backend=BackendConLatencia(latencia))
+            registro = self._crear_registro(maquina, dia=1)
+            subidas = [
+                servicio.programar_subida(registro, campo, self._archivo(campo), **OPCIONES_SUBIDA)
+                for campo in CAMPOS_FOTOS
+            ]
+            inicio = time.perf_counter()
+            for subida in subidas:
+                servicio.procesar_subida(subida.id_subida)
+            secuencial = time.perf_counter() - inicio
+
+            # --- Paralelo: un lote ---
+            registro = self._crear_registro(maquina, dia=2)
+            subidas = servicio.programar_subidas(registro, self._archivos(), **OPCIONES_SUBIDA)
+            inicio = time.perf_counter()
+            servicio.procesar_lote(subidas[0].lote)
+            paralelo = time.perf_counter() - inicio
+            registro.refresh_from_db()
+            completas = all(getattr(registro, campo) for campo in CAMPOS_FOTOS)
+
+            # --- Todo-o-nada: falla una foto ---
+            backend_fallido = BackendConLatencia(latencia)
+            servicio_fallido = MediaService(backend=backend_fallido)
+            registro_fallido = self._crear_registro(maquina, dia=3)
+            subidas = servicio_fallido.programar_subidas(registro_fallido, self._archivos(), **OPCIONES_SUBIDA)
+            backend_fallido.fallar_en = subidas[-1].ruta_local
+            with override_settings(MEDIA_UPLOAD_ESPERA_BASE=0):
+                servicio_fallido.procesar_lote(subidas[0].lote)
+            registro_fallido.refresh_from_db()
+            ninguna = not any(getattr(registro_fallido, campo) for campo in CAMPOS_FOTOS)
+            for subida in subidas:
+                eliminar_de_staging(subida.ruta_local)
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"Latencia simulada por subida: {latencia:.2f} s")
+        self.stdout.write(f"Secuencial (3 fotos): {secuencial:.2f} s")
+        self.stdout.write(f"Paralelo   (3 fotos): {paralelo:.2f} s  (x{secuencial / paralelo:.1f})")
+        self.stdout.write(f"Lote exitoso con los 3 campos completos: {completas}")
+        self.stdout.write(
+            f"Lote fallido sin campos escritos: {ninguna}; "
+            f"archivos revertidos en el backend: {len(backend_fallido.eliminadas)}"
+        )
+        self.stdout.write(self.style.SUCCESS("Benchmark terminado; los cambios fueron revertidos."))
+
+    def _crear_registro(self, maquina, dia):
+        return RegistroHorasMaquinaria.objects.create(
+            maquina=maquina, fecha=date(2000, 1, dia), horas_trabajadas=1
+        )
+
+    def _archivo(self, campo):
+        return SimpleUploadedFile(f"{campo}.jpg", b"benchmark")
+
+    def _archivos(self):
+        return {campo: self._archivo(campo) for campo in CAMPOS_FOTOS}
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from comun.services.media_service import MediaService
+
+
+class Command(BaseCommand):
+    """
+    Reintenta las subidas de archivos pendientes o fallidas
+    (por ejemplo, tras un reinicio del servidor o una caída del backend).
+
+    Debe correr en la instancia web (start.sh o un cron en ella), nunca en
+    el build: los archivos a subir están en el staging local de la
+    instancia. Las pendientes solo se toman si llevan --minutos-bloqueo sin
+    que un worker las procese.
+
+    Uso:
+        python manage.py procesar_subidas_pendientes
+    """
+
+    help = "Procesa las subidas de archivos pendientes o con error."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--minutos-bloqueo", type=int, default=15,
+                            help="Minutos tras los cuales una subida 'subiendo' se considera abandonada.")
+        parser.add_argument("--horas-staging", type=int, default=24,
+                            help="Antigüedad mínima de los archivos de staging huérfanos a eliminar.")
+
+    def handle(self, *args, **options):
+        service = MediaService()
+        completadas, con_error = service.procesar_pendientes(
+            minutos_bloqueo=options["minutos_bloqueo"]
+        )
+        eliminados = service.limpiar_staging(antiguedad_horas=options["horas_staging"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Subidas completadas: {completadas}. Con error: {con_error}. "
+            f"Archivos de staging huérfanos eliminados: {eliminados}."
+        ))
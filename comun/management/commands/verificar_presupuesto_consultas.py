@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.test import APIClient
+
+from comun.consultas import PresupuestoConsultasExcedido, registrar_consultas, verificar_presupuesto
+from comun.pruebas import credencial_admin, rutas_con_presupuesto, sembrar_datos_presupuesto
+
+
+class Command(BaseCommand):
+    """
+    Verifica los presupuestos de consultas de settings.PRESUPUESTO_CONSULTAS.
+
+    Dentro de una transacción que siempre se revierte siembra varias
+    máquinas con datos relacionados (para que un N+1 se note), hace GET
+    autenticado como ADMIN a cada ruta con presupuesto y falla si alguna
+    lo supera. Pensado para CI: termina con error si hay regresiones.
+    Las mismas rutas y datos se verifican en las pruebas de comun
+    (python manage.py test comun).
+
+    Uso:
+        python manage.py verificar_presupuesto_consultas --maquinas 10
+    """
+
+    help = "Falla si algún endpoint supera su presupuesto de consultas SQL."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--maquinas", type=int, default=10,
+                            help="Máquinas sintéticas a sembrar antes de medir.")
+
+    def handle(self, *args, **options):
+        resultados = []
+
+        with transaction.atomic():
+            maquina = sembrar_datos_presupuesto(options["maquinas"])
+            client = APIClient(HTTP_HOST=settings.ALLOWED_HOSTS[0])
+            client.credentials(HTTP_AUTHORIZATION=credencial_admin("presupuesto_consultas"))
+
+            for ruta in rutas_con_presupuesto(maquina.id_maquina):
+                with registrar_consultas() as registro:
+                    response = client.get(ruta)
+
+                try:
+                    verificar_presupuesto(ruta, registro)
+                    error = None
+                except PresupuestoConsultasExcedido as e:
+                    error = str(e)
+
+                # Una respuesta de error no mide la ruta real
+                if response.status_code >= 400:
+                    error = f"{ruta} respondió {response.status_code}: {response.content[:200]!r}"
+
+                resultados.append((ruta, response.status_code, registro, error))
+
+            transaction.set_rollback(True)
+
+        self._reportar(resultados)
+
+    def _reportar(self, resultados):
+        fallidos = 0
+        self.stdout.write(f"{'ruta':<52}{'status':>7}{'consultas':>11}{'ms BD':>9}{'dup':>5}")
+
+        for ruta, status, registro, error in resultados:
+            resumen = registro.resumen()
+            linea = (f"{ruta:<52}{status:>7}{resumen['consultas']:>11}"
+                     f"{resumen['tiempo_db_ms']:>9.1f}{resumen['duplicadas']:>5}")
+            if error:
+                fallidos += 1
+                self.stdout.write(self.style.ERROR(linea))
+                self.stdout.write(error)
+            else:
+                self.stdout.write(linea)
+
+        if fallidos:
+            raise CommandError(f"{fallidos} endpoint(s) fallaron o superaron su presupuesto de consultas.")
+
+        self.stdout.write(self.style.SUCCESS("Todos los endpoints están dentro de su presupuesto."))
@@ -0,0 +1,73 @@
+import os
+import shutil
+from abc import ABC, abstractmethod
+
+import cloudinary.uploader
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class IMediaBackend(ABC):
+    """
+    Contrato de un backend de almacenamiento de archivos.
+    Permite reemplazar Cloudinary (p. ej. por el sistema de archivos local
+    en pruebas) configurando `MEDIA_BACKEND` en settings.
+    """
+
+    @abstractmethod
+    def subir(self, ruta_local: str, carpeta: str, resource_type: str = "image") -> str:
+        """Sube el archivo ubicado en `ruta_local` y retorna su URL final."""
+        pass
+
+    @abstractmethod
+    def eliminar(self, url: str) -> None:
+        """Elimina un archivo previamente subido a partir de su URL."""
+        pass
+
+
+class CloudinaryMediaBackend(IMediaBackend):
+    """Backend de producción: sube los archivos a Cloudinary."""
+
+    def subir(self, ruta_local: str, carpeta: str, resource_type: str = "image") -> str:
+        resultado = cloudinary.uploader.upload(
+            ruta_local,
+            folder=carpeta,  # carpeta lógica en Cloudinary
+            resource_type=resource_type
+        )
+        return resultado.get("secure_url")
+
+    def eliminar(self, url: str) -> None:
+        # https://res.cloudinary.com/<cloud>/<tipo>/upload/v123/<carpeta>/<id>.<ext>
+        ruta = url.split("/upload/", 1)[-1]
+        partes = ruta.split("/")
+        if partes[0].startswith("v") and partes[0][1:].isdigit():
+            partes = partes[1:]
+        public_id = os.path.splitext("/".join(partes))[0]
+        cloudinary.uploader.destroy(public_id)
+
+
+class LocalMediaBackend(IMediaBackend):
+    """
+    Backend de sistema de archivos local (desarrollo y pruebas).
+    Copia el archivo a MEDIA_ROOT/<carpeta>/ y retorna MEDIA_URL/<carpeta>/<archivo>.
+    """
+
+    def subir(self, ruta_local: str, carpeta: str, resource_type: str = "image") -> str:
+        destino = os.path.join(settings.MEDIA_ROOT, carpeta)
+        os.makedirs(destino, exist_ok=True)
+
+        nombre = os.path.basename(ruta_local)
+        shutil.copyfile(ruta_local, os.path.join(destino, nombre))
+
+        return f"{settings.MEDIA_URL.rstrip('/')}/{carpeta}/{nombre}"
+
+    def eliminar(self, url: str) -> None:
+        relativa = url.removeprefix(settings.MEDIA_URL.rstrip('/')).lstrip('/')
+        ruta = os.path.join(settings.MEDIA_ROOT, relativa)
+        if os.path.exists(ruta):
+            os.remove(ruta)
+
+
+def obtener_backend() -> IMediaBackend:
+    """Instancia el backend configurado en settings.MEDIA_BACKEND."""
+    return import_string(settings.MEDIA_BACKEND)()
@@ -0,0 +1,105 @@
+import os
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from comun.media.staging import eliminar_de_staging, nueva_ruta_staging
+
+# Decodificadores habilitados: cualquier otro formato se rechaza sin parsearlo
+# (JPEG incluye también las MPO de algunas cámaras de celular)
+FORMATOS_ENTRADA = ("JPEG", "PNG", "WEBP", "GIF", "BMP", "TIFF")
+
+EXTENSIONES = {"WEBP": ".webp", "JPEG": ".jpg"}
+
+
+class ImagenInvalida(ValueError):
+    """El archivo recibido no es una imagen válida o excede los límites."""
+
+
+def procesar_imagen(ruta_original: str, con_miniatura: bool = False):
+    """
+    Normaliza una imagen en staging antes de subirla:
+    - Valida que sea una imagen real de un formato permitido y de tamaño razonable.
+    - Aplica la orientación EXIF y descarta los metadatos (EXIF, GPS, ICC).
+    - Limita el lado mayor a settings.MEDIA_IMAGEN_LADO_MAXIMO.
+    - Re-codifica a settings.MEDIA_IMAGEN_FORMATO (WEBP/JPEG) con
+      settings.MEDIA_IMAGEN_CALIDAD.
+    - Opcionalmente genera una miniatura de settings.MEDIA_MINIATURA_LADO.
+
+    El archivo original se elimina siempre (también si es inválido).
+    Retorna (ruta_optimizada, ruta_miniatura | None).
+    Lanza ImagenInvalida si el archivo no se puede procesar.
+    """
+    lado_maximo = settings.MEDIA_IMAGEN_LADO_MAXIMO
+
+    try:
+        with Image.open(ruta_original, formats=FORMATOS_ENTRADA) as imagen:
+            if imagen.width * imagen.height > settings.MEDIA_IMAGEN_MAX_PIXELES:
+                raise ImagenInvalida("La imagen excede la resolución máxima permitida.")
+
+            # En JPEG decodifica directamente a una escala reducida (mucho más rápido)
+            imagen.draft("RGB", (lado_maximo, lado_maximo))
+            imagen = ImageOps.exif_transpose(imagen)
+            imagen = _normalizar_modo(imagen)
+            imagen.thumbnail((lado_maximo, lado_maximo), Image.Resampling.LANCZOS)
+
+            ruta_optimizada = _guardar(imagen)
+            ruta_miniatura = None
+
+            if con_miniatura:
+                miniatura = imagen.copy()
+                lado = settings.MEDIA_MINIATURA_LADO
+                miniatura.thumbnail((lado, lado), Image.Resampling.LANCZOS)
+                ruta_miniatura = _guardar(miniatura)
+
+    except ImagenInvalida:
+        raise
+    except (OSError, ValueError, SyntaxError, Image.DecompressionBombError):
+        raise ImagenInvalida("El archivo no es una imagen válida.")
+    finally:
+        eliminar_de_staging(ruta_original)
+
+    return ruta_optimizada, ruta_miniatura
+
+
+def _normalizar_modo(imagen: Image.Image) -> Image.Image:
+    """
+    Convierte a RGB (o RGBA si hay transparencia y el formato la admite).
+    JPEG no tiene canal alfa: la transparencia se aplana sobre fondo blanco.
+    """
+    tiene_alfa = imagen.mode in ("RGBA", "LA", "PA") or "transparency" in imagen.info
+
+    if not tiene_alfa:
+        return imagen if imagen.mode == "RGB" else imagen.convert("RGB")
+
+    imagen = imagen.convert("RGBA")
+    if settings.MEDIA_IMAGEN_FORMATO == "WEBP":
+        return imagen
+
+    fondo = Image.new("RGB", imagen.size, (255, 255, 255))
+    fondo.paste(imagen, mask=imagen.getchannel("A"))
+    return fondo
+
+
+def _guardar(imagen: Image.Image) -> str:
+    """
+    Guarda la imagen en staging con el formato y calidad configurados.
+    No se pasa `exif` ni `icc_profile`, así que los metadatos no se copian.
+    """
+    formato = settings.MEDIA_IMAGEN_FORMATO
+    ruta = nueva_ruta_staging(EXTENSIONES[formato])
+
+    opciones = {"quality": settings.MEDIA_IMAGEN_CALIDAD}
+    if formato == "JPEG":
+        opciones.update(optimize=True, progressive=True)
+    else:
+        opciones.update(method=4)
+
+    try:
+        imagen.save(ruta, formato, **opciones)
+    except Exception:
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        raise
+
+    return ruta
@@ -0,0 +1,50 @@
+import os
+import time
+import uuid
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+
+
+def nueva_ruta_staging(extension: str = "") -> str:
+    """Retorna una ruta única (aún sin crear) dentro de settings.MEDIA_STAGING_DIR."""
+    os.makedirs(settings.MEDIA_STAGING_DIR, exist_ok=True)
+    return os.path.join(settings.MEDIA_STAGING_DIR, f"{uuid.uuid4().hex}{extension}")
+
+
+def guardar_en_staging(archivo: UploadedFile) -> str:
+    """
+    Copia el archivo recibido en el request al directorio local de staging
+    (settings.MEDIA_STAGING_DIR) y retorna su ruta absoluta.
+    Es una escritura local y rápida: la subida real ocurre en segundo plano.
+    """
+    extension = os.path.splitext(archivo.name or "")[1].lower()
+    ruta = nueva_ruta_staging(extension)
+
+    with open(ruta, "wb") as destino:
+        for chunk in archivo.chunks():
+            destino.write(chunk)
+
+    return ruta
+
+
+def listar_staging_antiguos(antiguedad_horas: int):
+    """Retorna las rutas de staging modificadas hace más de `antiguedad_horas` horas."""
+    directorio = settings.MEDIA_STAGING_DIR
+    if not os.path.isdir(directorio):
+        return []
+
+    limite = time.time() - antiguedad_horas * 3600
+    rutas = (os.path.join(directorio, nombre) for nombre in os.listdir(directorio))
+    return [ruta for ruta in rutas if os.path.isfile(ruta) and os.path.getmtime(ruta) < limite]
+
+
+def existe_en_staging(ruta: str) -> bool:
+    """Indica si el archivo de staging sigue en el disco de esta máquina."""
+    return bool(ruta) and os.path.isfile(ruta)
+
+
+def eliminar_de_staging(ruta: str) -> None:
+    """Elimina un archivo de staging si todavía existe."""
+    if ruta and os.path.exists(ruta):
+        os.remove(ruta)
@@ -0,0 +1,75 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_archivos = None
+_lock = threading.Lock()
+
+
+def obtener_executor() -> ThreadPoolExecutor:
+    """Pool de hilos compartido para subidas de archivos (creación perezosa)."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.MEDIA_UPLOAD_WORKERS,
+                thread_name_prefix="media-upload"
+            )
+    return _executor
+
+
+def obtener_executor_archivos() -> ThreadPoolExecutor:
+    """
+    Pool acotado para subir en paralelo los archivos de un lote.
+    Es independiente del pool de tareas: una tarea que espera a sus
+    archivos nunca ocupa los hilos que deben subirlos.
+    """
+    global _executor_archivos
+    with _lock:
+        if _executor_archivos is None:
+            _executor_archivos = ThreadPoolExecutor(
+                max_workers=settings.MEDIA_UPLOAD_PARALELAS,
+                thread_name_prefix="media-file"
+            )
+    return _executor_archivos
+
+
+def subir_en_paralelo(funcion, elementos):
+    """
+    Ejecuta `funcion(elemento)` para cada elemento en el pool de archivos
+    y retorna los resultados en el mismo orden. La latencia total es la
+    de la subida más lenta, no la suma de todas.
+    """
+    if len(elementos) <= 1:
+        return [funcion(elemento) for elemento in elementos]
+
+    futuros = [obtener_executor_archivos().submit(funcion, elemento) for elemento in elementos]
+    return [futuro.result() for futuro in futuros]
+
+
+def _ejecutar(funcion, *args):
+    """Ejecuta la tarea y libera las conexiones a BD del hilo al terminar."""
+    try:
+        return funcion(*args)
+    except Exception:
+        logger.exception("Error en la tarea de subida de archivos %s%s", funcion.__name__, args)
+    finally:
+        connections.close_all()
+
+
+def encolar(funcion, *args):
+    """
+    Ejecuta `funcion(*args)` en el pool de subidas.
+    Con settings.MEDIA_SUBIDA_SINCRONA = True se ejecuta en línea
+    (útil en pruebas y scripts).
+    """
+    if settings.MEDIA_SUBIDA_SINCRONA:
+        return funcion(*args)
+
+    return obtener_executor().submit(_ejecutar, funcion, *args)
@@ -0,0 +1,63 @@
+import logging
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from comun.consultas import PresupuestoConsultasExcedido, registrar_consultas, verificar_presupuesto
+
+logger = logging.getLogger(__name__)
+
+
+class PresupuestoConsultasMiddleware:
+    """
+    Mide las consultas SQL de cada request:
+    - Cantidad, tiempo total en BD y consultas duplicadas (posibles N+1).
+    - Las expone en el header `Server-Timing` (visible en las devtools).
+    - Las registra como log estructurado (logger `comun.middleware`,
+      atributo `consultas` del LogRecord).
+    - Si la ruta tiene presupuesto en settings.PRESUPUESTO_CONSULTAS y lo
+      supera, registra una advertencia; con PRESUPUESTO_CONSULTAS_ESTRICTO
+      además lanza PresupuestoConsultasExcedido (falla el request/la prueba).
+
+    Se activa con settings.MONITOREO_CONSULTAS.
+    """
+
+    def __init__(self, get_response):
+        if not settings.MONITOREO_CONSULTAS:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with registrar_consultas() as registro:
+            response = self.get_response(request)
+
+        resumen = registro.resumen()
+        self._agregar_server_timing(response, resumen)
+
+        nivel = logging.WARNING if resumen["n_mas_uno"] else logging.INFO
+        logger.log(
+            nivel,
+            "%s %s → %s consultas, %.1f ms en BD, %s duplicadas",
+            request.method, request.path, resumen["consultas"],
+            resumen["tiempo_db_ms"], resumen["duplicadas"],
+            extra={"consultas": {"metodo": request.method, "ruta": request.path,
+                                 "status": response.status_code, **resumen}}
+        )
+
+        try:
+            verificar_presupuesto(request.path, registro)
+        except PresupuestoConsultasExcedido as e:
+            logger.warning("Presupuesto de consultas excedido: %s", e)
+            if settings.PRESUPUESTO_CONSULTAS_ESTRICTO:
+                raise
+
+        return response
+
+    @staticmethod
+    def _agregar_server_timing(response, resumen):
+        metricas = (
+            f'db;dur={resumen["tiempo_db_ms"]};desc="{resumen["consultas"]} consultas", '
+            f'db-dup;desc="{resumen["duplicadas"]} duplicadas"'
+        )
+        existente = response.get("Server-Timing")
+        response["Server-Timing"] = f"{existente}, {metricas}" if existente else metricas
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubidaMedia',
+            fields=[
+                ('id_subida', models.AutoField(primary_key=True, serialize=False)),
+                ('object_id', models.PositiveIntegerField()),
+                ('campo', models.CharField(help_text='Campo del objeto que recibe la URL final.', max_length=50)),
+                ('ruta_local', models.CharField(max_length=500)),
+                ('carpeta', models.CharField(max_length=150)),
+                ('resource_type', models.CharField(default='image', max_length=20)),
+                ('estado', models.CharField(choices=[('pendiente', 'Pendiente'), ('subiendo', 'Subiendo'), ('completada', 'Completada'), ('error', 'Error')], default='pendiente', max_length=20)),
+                ('intentos', models.PositiveSmallIntegerField(default=0)),
+                ('url', models.CharField(blank=True, max_length=500, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Subida de archivo',
+                'verbose_name_plural': 'Subidas de archivos',
+                'db_table': 'subidas_media',
+                'indexes': [models.Index(fields=['estado', 'updated_at'], name='idx_subida_media_estado'), models.Index(fields=['content_type', 'object_id'], name='idx_subida_media_objeto')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comun', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subidamedia',
+            name='lote',
+            field=models.UUIDField(blank=True, db_index=True, help_text='Agrupa archivos que se suben en paralelo con semántica todo-o-nada.', null=True),
+        ),
+    ]
@@ -0,0 +1 @@
+from .subida_media import SubidaMedia
@@ -0,0 +1,68 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+
+class SubidaMedia(models.Model):
+    """
+    Subida de archivo en segundo plano.
+
+    El archivo se guarda primero en el staging local y la fila destino
+    (maquinaria, usuario, registro, ...) se confirma sin esperar a la subida.
+    Un worker sube el archivo al backend configurado y, al terminar,
+    escribe la URL en `<objeto>.<campo>`.
+    """
+
+    PENDIENTE = 'pendiente'
+    SUBIENDO = 'subiendo'
+    COMPLETADA = 'completada'
+    ERROR = 'error'
+
+    ESTADOS = [
+        (PENDIENTE, 'Pendiente'),
+        (SUBIENDO, 'Subiendo'),
+        (COMPLETADA, 'Completada'),
+        (ERROR, 'Error'),
+    ]
+
+    id_subida = models.AutoField(primary_key=True)
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    objeto = GenericForeignKey('content_type', 'object_id')
+
+    campo = models.CharField(
+        max_length=50,
+        help_text="Campo del objeto que recibe la URL final."
+    )
+
+    ruta_local = models.CharField(max_length=500)
+    carpeta = models.CharField(max_length=150)
+    resource_type = models.CharField(max_length=20, default='image')
+
+    lote = models.UUIDField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text="Agrupa archivos que se suben en paralelo con semántica todo-o-nada."
+    )
+
+    estado = models.CharField(max_length=20, choices=ESTADOS, default=PENDIENTE)
+    intentos = models.PositiveSmallIntegerField(default=0)
+    url = models.CharField(max_length=500, null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'subidas_media'
+        verbose_name = "Subida de archivo"
+        verbose_name_plural = "Subidas de archivos"
+        indexes = [
+            models.Index(fields=['estado', 'updated_at'], name='idx_subida_media_estado'),
+            models.Index(fields=['content_type', 'object_id'], name='idx_subida_media_objeto'),
+        ]
+
+    def __str__(self):
+        return f"Subida #{self.id_subida} - {self.campo} ({self.estado})"
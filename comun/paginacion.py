@@ -0,0 +1,140 @@
+import base64
+import binascii
+
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+PAGE_SIZE_POR_DEFECTO = 50
+PAGE_SIZE_MAXIMO = 500
+
+
+class PaginaCursor:
+    """
+    Resultado de una consulta paginada por cursor (keyset).
+
+    - items: lista de instancias de la página actual
+    - siguiente_cursor: cursor opaco para pedir la siguiente página (None si no hay más)
+    - page_size: tamaño de página aplicado
+    """
+
+    def __init__(self, items, siguiente_cursor, page_size):
+        self.items = items
+        self.siguiente_cursor = siguiente_cursor
+        self.page_size = page_size
+
+
+def codificar_cursor(valor) -> str:
+    """Codifica el último valor de la llave de orden en un cursor opaco."""
+    return base64.urlsafe_b64encode(str(valor).encode()).decode()
+
+
+def decodificar_cursor(cursor: str) -> int:
+    """
+    Decodifica un cursor opaco a su valor de llave (entero).
+    Lanza ValidationError si el cursor no es válido.
+    """
+    try:
+        return int(decodificar_cursor_texto(cursor))
+    except ValueError:
+        raise ValidationError({"cursor": "El cursor enviado no es válido."})
+
+
+def decodificar_cursor_texto(cursor: str) -> str:
+    """
+    Decodifica un cursor opaco al texto original (para llaves compuestas,
+    que el llamador interpreta). Lanza ValidationError si no es válido.
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError({"cursor": "El cursor enviado no es válido."})
+
+
+def paginar_por_cursor(queryset, cursor=None, page_size=None, orden='pk'):
+    """
+    Pagina un queryset por keyset sobre una llave única y estable
+    (por defecto la llave primaria), sin OFFSET:
+
+        WHERE pk > :cursor ORDER BY pk LIMIT :page_size + 1
+
+    Parámetros:
+    - queryset: queryset base (ya filtrado por el repository).
+    - cursor: cursor opaco recibido de la página anterior (opcional).
+    - page_size: tamaño de página (por defecto PAGE_SIZE_POR_DEFECTO).
+    - orden: 'pk' ascendente o '-pk' descendente (o el nombre de otra llave única).
+
+    Retorna un PaginaCursor.
+    """
+    page_size = page_size or PAGE_SIZE_POR_DEFECTO
+    descendente = orden.startswith('-')
+    campo = orden.lstrip('-')
+
+    queryset = queryset.order_by(orden)
+
+    if cursor:
+        valor = decodificar_cursor(cursor)
+        lookup = f"{campo}__lt" if descendente else f"{campo}__gt"
+        queryset = queryset.filter(**{lookup: valor})
+
+    # Se pide un elemento extra para saber si existe una página siguiente
+    items = list(queryset[:page_size + 1])
+    siguiente_cursor = None
+
+    if len(items) > page_size:
+        items = items[:page_size]
+        siguiente_cursor = codificar_cursor(getattr(items[-1], campo))
+
+    return PaginaCursor(items, siguiente_cursor, page_size)
+
+
+class PaginacionCursorMixin:
+    """
+    Mixin para ViewSets: activa la paginación por cursor solo cuando
+    el cliente envía `cursor` o `page_size` (opt-in). Sin esos parámetros
+    los endpoints conservan la respuesta completa actual.
+
+    Respuesta paginada:
+        {
+            "results": [...],
+            "next_cursor": str | null,
+            "page_size": int
+        }
+    """
+
+    def obtener_parametros_cursor(self, request):
+        """
+        Retorna {"cursor": str | None, "page_size": int} si la paginación
+        fue solicitada, o None en caso contrario.
+        """
+        cursor = request.query_params.get("cursor")
+        page_size = request.query_params.get("page_size")
+
+        if cursor is None and page_size is None:
+            return None
+
+        if page_size is None:
+            page_size = PAGE_SIZE_POR_DEFECTO
+        else:
+            try:
+                page_size = int(page_size)
+            except ValueError:
+                raise ValidationError({"page_size": "El tamaño de página debe ser un entero."})
+
+            if page_size < 1 or page_size > PAGE_SIZE_MAXIMO:
+                raise ValidationError({
+                    "page_size": f"El tamaño de página debe estar entre 1 y {PAGE_SIZE_MAXIMO}."
+                })
+
+        return {"cursor": cursor or None, "page_size": page_size}
+
+    def respuesta_paginada(self, pagina: PaginaCursor, serializer_class, **kwargs):
+        """Serializa una PaginaCursor con el serializer dado (kwargs: argumentos del serializer)."""
+        return Response(
+            {
+                "results": serializer_class(pagina.items, many=True, **kwargs).data,
+                "next_cursor": pagina.siguiente_cursor,
+                "page_size": pagina.page_size,
+            },
+            status=status.HTTP_200_OK
+        )
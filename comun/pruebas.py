@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from alarmas.models.alarma import Alarma
+from comun.consultas import (
+    PresupuestoConsultasExcedido,
+    obtener_presupuesto,
+    registrar_consultas,
+    verificar_presupuesto,
+)
+from logins.models.login import Login
+from mantenimientos.models.mantenimiento import Mantenimiento
+from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
+from maquinarias.models.maquinaria import Maquinaria
+from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
+from proyectos.models.proyecto import Proyecto
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+
+
+class PresupuestoConsultasMixin:
+    """
+    Mixin para TestCase / APITestCase que verifica la cantidad de consultas SQL.
+
+    Ejemplo:
+        class MaquinariaApiTests(PresupuestoConsultasMixin, APITestCase):
+            def test_resumen(self):
+                self.client.force_authenticate(...)
+                self.assertPresupuestoDeclarado("/api/maquinarias/resumen/")
+
+            def test_servicio(self):
+                with self.assertMaximoConsultas(2):
+                    MaquinariaService().obtener_resumen_maquinarias()
+    """
+
+    @contextmanager
+    def assertMaximoConsultas(self, maximo: int):
+        """Falla si el bloque ejecuta más de `maximo` consultas; muestra las duplicadas."""
+        with registrar_consultas() as registro:
+            yield registro
+
+        if registro.total > maximo:
+            duplicadas = "".join(f"\n  {n}x {huella}" for huella, n in registro.duplicadas().items())
+            self.fail(f"Se ejecutaron {registro.total} consultas (máximo: {maximo}).{duplicadas}")
+
+    def assertPresupuestoDeclarado(self, ruta: str, **kwargs):
+        """
+        Hace GET a la ruta con self.client y falla si supera el presupuesto
+        declarado en settings.PRESUPUESTO_CONSULTAS. Retorna la respuesta.
+        """
+        if obtener_presupuesto(ruta) is None:
+            self.fail(f"La ruta {ruta} no tiene presupuesto en settings.PRESUPUESTO_CONSULTAS.")
+
+        with registrar_consultas() as registro:
+            response = self.client.get(ruta, **kwargs)
+
+        try:
+            verificar_presupuesto(ruta, registro)
+        except PresupuestoConsultasExcedido as e:
+            self.fail(str(e))
+
+        return response
+
+
+# =========================================================================
+# DATOS PARA MEDIR LOS PRESUPUESTOS
+# =========================================================================
+def sembrar_datos_presupuesto(cantidad: int = 10):
+    """
+    Siembra `cantidad` máquinas con programados, mantenimientos,
+    asignaciones, registros y alarmas (para que un N+1 se note).
+    Retorna la última máquina (la que reemplaza '*' en las rutas).
+    """
+    hoy = date.today()
+    proyecto = Proyecto.objects.create(nombre_proyecto="Presupuesto consultas")
+
+    maquinas = [
+        Maquinaria.objects.create(nombre_maquina=f"Presupuesto {i}", horas_totales=Decimal(300 * i))
+        for i in range(cantidad)
+    ]
+    for maquina in maquinas:
+        programado = MantenimientoProgramado.objects.create(
+            maquina=maquina, nombre="Cambio de aceite", tipo="preventivo", intervalo_horas=250
+        )
+        Mantenimiento.objects.create(
+            maquina=maquina, programado=programado, tipo_mantenimiento="preventivo",
+            descripcion="presupuesto", fecha_mantenimiento=hoy,
+            horas_realizadas=Decimal(0), costo=Decimal(100)
+        )
+        ProyectoMaquinaria.objects.create(proyecto=proyecto, maquina=maquina, horas_totales=100)
+        RegistroHorasMaquinaria.objects.bulk_create([
+            RegistroHorasMaquinaria(maquina=maquina, proyecto=proyecto,
+                                    fecha=hoy - timedelta(days=d), horas_trabajadas=8)
+            for d in range(3)
+        ])
+        Alarma.objects.create(maquina=maquina, programado=programado,
+                              tipo="mantenimiento", nivel="alta")
+
+    return maquinas[-1]
+
+
+def credencial_admin(username: str) -> str:
+    """Crea un login ADMIN y retorna su header Authorization (Bearer <token>)."""
+    login = Login(username=username, rol="ADMIN")
+    login.set_unusable_password()
+    login.save()
+
+    token = AccessToken.for_user(login)
+    token["rol"] = login.rol
+    return f"Bearer {token}"
+
+
+def rutas_con_presupuesto(id_maquina: int):
+    """Rutas de settings.PRESUPUESTO_CONSULTAS con '*' reemplazado por `id_maquina`."""
+    return [patron.replace("*", str(id_maquina)) for patron in settings.PRESUPUESTO_CONSULTAS]
@@ -0,0 +1,26 @@
+from django.db.models import Count, IntegerField, Max, Value
+
+
+class EstadoTablaRepository:
+    """
+    Repositorio del "estado" de tablas para validadores HTTP (ETag /
+    Last-Modified): última modificación y cantidad de filas.
+    """
+
+    @staticmethod
+    def get_estados(querysets):
+        """
+        Retorna [(MAX(updated_at), COUNT(*))] de cada queryset, en el mismo
+        orden, con una sola consulta (UNION ALL de agregados). Una tabla
+        vacía retorna (None, 0).
+        """
+        ramas = [
+            queryset.order_by()
+            .values(orden=Value(orden, IntegerField()))
+            .annotate(ultimo=Max("updated_at"), total=Count("pk"))
+            for orden, queryset in enumerate(querysets)
+        ]
+        consulta = ramas[0].union(*ramas[1:], all=True) if len(ramas) > 1 else ramas[0]
+
+        estados = {fila["orden"]: (fila["ultimo"], fila["total"]) for fila in consulta}
+        return [estados.get(orden, (None, 0)) for orden in range(len(ramas))]
@@ -0,0 +1,140 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Max, Q
+from django.utils.timezone import now
+
+from comun.models.subida_media import SubidaMedia
+
+
+class SubidaMediaRepository:
+    """
+    Repositorio para las subidas de archivos en segundo plano.
+    """
+
+    @staticmethod
+    def get_by_id(**kwargs):
+        """
+        Obtiene una subida por cualquier campo.
+        Retorna None si no existe.
+        """
+        try:
+            return SubidaMedia.objects.get(**kwargs)
+        except ObjectDoesNotExist:
+            return None
+
+    @staticmethod
+    def create(**kwargs):
+        """Registra una nueva subida pendiente."""
+        return SubidaMedia.objects.create(**kwargs)
+
+    @staticmethod
+    def reclamar(id_subida: int) -> bool:
+        """
+        Marca la subida como 'subiendo' solo si está pendiente o con error.
+        El UPDATE condicional evita que dos workers procesen la misma subida.
+        Retorna True si este worker la reclamó.
+        """
+        return SubidaMedia.objects.filter(
+            id_subida=id_subida,
+            estado__in=[SubidaMedia.PENDIENTE, SubidaMedia.ERROR]
+        ).update(estado=SubidaMedia.SUBIENDO, updated_at=now()) == 1
+
+    @staticmethod
+    def reclamar_lote(lote):
+        """
+        Marca como 'subiendo' las subidas pendientes o con error de un lote
+        y las retorna. Si otro worker ya tomó el lote retorna una lista vacía.
+        """
+        reclamadas = SubidaMedia.objects.filter(
+            lote=lote,
+            estado__in=[SubidaMedia.PENDIENTE, SubidaMedia.ERROR]
+        ).update(estado=SubidaMedia.SUBIENDO, updated_at=now())
+
+        if not reclamadas:
+            return []
+
+        return list(
+            SubidaMedia.objects
+            .filter(lote=lote, estado=SubidaMedia.SUBIENDO)
+            .select_related('content_type')
+            .order_by('id_subida')
+        )
+
+    @staticmethod
+    def marcar_completada(subida: SubidaMedia, url: str, intentos: int):
+        subida.estado = SubidaMedia.COMPLETADA
+        subida.url = url
+        subida.intentos = intentos
+        subida.error = None
+        subida.save(update_fields=['estado', 'url', 'intentos', 'error', 'updated_at'])
+        return subida
+
+    @staticmethod
+    def marcar_error(subida: SubidaMedia, error: str, intentos: int):
+        subida.estado = SubidaMedia.ERROR
+        subida.error = error
+        subida.intentos = intentos
+        subida.save(update_fields=['estado', 'error', 'intentos', 'updated_at'])
+        return subida
+
+    @staticmethod
+    def existe_posterior_completada(subida: SubidaMedia) -> bool:
+        """
+        Indica si una subida más reciente para el mismo objeto y campo
+        ya terminó (en ese caso esta no debe sobrescribir la URL).
+        """
+        return SubidaMedia.objects.filter(
+            content_type_id=subida.content_type_id,
+            object_id=subida.object_id,
+            campo=subida.campo,
+            id_subida__gt=subida.id_subida,
+            estado=SubidaMedia.COMPLETADA
+        ).exists()
+
+    @staticmethod
+    def get_ultimos_estados(modelo, ids, campos):
+        """
+        (object_id, campo, estado) de la última subida de cada campo de los
+        objetos `ids` (lista o subconsulta de llaves) del modelo dado. Una
+        sola consulta (sin buscar el ContentType aparte).
+        """
+        subidas = SubidaMedia.objects.filter(
+            content_type__app_label=modelo._meta.app_label,
+            content_type__model=modelo._meta.model_name,
+            object_id__in=ids,
+            campo__in=campos
+        )
+        ultimas = subidas.values('object_id', 'campo').annotate(ultima=Max('id_subida')).values('ultima')
+        return SubidaMedia.objects.filter(id_subida__in=ultimas).values_list('object_id', 'campo', 'estado')
+
+    @staticmethod
+    def get_reintentables(max_intentos: int, pendientes_antes_de):
+        """
+        Subidas con error, o pendientes sin cambios desde `pendientes_antes_de`,
+        que aún no agotan sus intentos. Las pendientes recientes las está por
+        tomar el pool de workers: no se le quitan.
+        """
+        return SubidaMedia.objects.filter(
+            Q(estado=SubidaMedia.ERROR) | Q(estado=SubidaMedia.PENDIENTE, updated_at__lt=pendientes_antes_de),
+            intentos__lt=max_intentos
+        ).order_by('id_subida')
+
+    @staticmethod
+    def get_rutas_en_uso(rutas):
+        """De las rutas dadas, retorna las que pertenecen a subidas no completadas."""
+        return set(
+            SubidaMedia.objects
+            .filter(ruta_local__in=rutas)
+            .exclude(estado=SubidaMedia.COMPLETADA)
+            .values_list('ruta_local', flat=True)
+        )
+
+    @staticmethod
+    def liberar_bloqueadas(antes_de):
+        """
+        Devuelve a 'pendiente' las subidas que quedaron en 'subiendo'
+        (p. ej. el proceso se reinició a mitad de la subida).
+        """
+        return SubidaMedia.objects.filter(
+            estado=SubidaMedia.SUBIENDO,
+            updated_at__lt=antes_de
+        ).update(estado=SubidaMedia.PENDIENTE)
@@ -0,0 +1,96 @@
+from rest_framework.exceptions import ValidationError
+
+from comun.estado_subidas import EstadoSubidaField
+
+
+class CamposDinamicosMixin:
+    """
+    Mixin para ModelSerializers: el argumento `campos` limita los campos
+    de la representación (los demás se descartan antes de serializar).
+
+        MaquinariaSerializer(maquinarias, many=True, campos=["id_maquina", "nombre_maquina"])
+
+    Sin `campos` el serializer se comporta igual que siempre. Con
+    many=True DRF pasa el argumento al serializer hijo.
+    """
+
+    def __init__(self, *args, campos=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if campos is not None:
+            for nombre in set(self.fields) - set(campos):
+                self.fields.pop(nombre)
+
+
+class SeleccionCamposMixin:
+    """
+    Mixin para ViewSets: sparse fieldsets en los listados.
+
+        ?fields=id_maquina,nombre_maquina   solo esos campos
+        ?omit=foto,foto_miniatura           todos menos esos
+
+    Además de recortar la respuesta, traduce los campos pedidos a las
+    columnas del modelo para que el repository las limite con .only() y
+    el resto no se lea de la BD.
+    """
+
+    def obtener_seleccion_campos(self, request, serializer_class):
+        """
+        Retorna (campos, columnas):
+        - campos: nombres para el argumento `campos` del serializer, o None (todos).
+        - columnas: columnas del modelo para .only(), o None si no se puede
+          acotar (algún campo no corresponde a una columna propia del modelo).
+        Lanza ValidationError si se piden campos inexistentes.
+        """
+        incluir = self._lista_parametro(request, "fields")
+        omitir = self._lista_parametro(request, "omit")
+        if incluir is None and omitir is None:
+            return None, None
+
+        campos_serializer = serializer_class().fields
+        for parametro, nombres in (("fields", incluir), ("omit", omitir)):
+            desconocidos = set(nombres or []) - campos_serializer.keys()
+            if desconocidos:
+                raise ValidationError({
+                    parametro: f"Campos no válidos: {', '.join(sorted(desconocidos))}. "
+                               f"Use: {', '.join(campos_serializer)}."
+                })
+
+        campos = [
+            nombre for nombre in campos_serializer
+            if (incluir is None or nombre in incluir) and nombre not in (omitir or [])
+        ]
+        return campos, columnas_modelo(serializer_class, [campos_serializer[nombre] for nombre in campos])
+
+    @staticmethod
+    def _lista_parametro(request, nombre):
+        valor = request.query_params.get(nombre)
+        if valor is None:
+            return None
+        return [parte.strip() for parte in valor.split(",") if parte.strip()]
+
+
+def columnas_modelo(serializer_class, campos):
+    """
+    Columnas del modelo del serializer que leen los `campos` dados (objetos
+    Field), para QuerySet.only(). Retorna None si algún campo no lee
+    directamente una columna del modelo (source anidado, "*" o un método):
+    en ese caso no se acota la consulta. Los EstadoSubidaField leen la
+    llave primaria (el estado se consulta aparte).
+    """
+    modelo = serializer_class.Meta.model
+    columnas_propias = {campo.name for campo in modelo._meta.concrete_fields}
+
+    columnas = []
+    for campo in campos:
+        if isinstance(campo, EstadoSubidaField):
+            columnas.append(modelo._meta.pk.name)
+            continue
+        if campo.source not in columnas_propias:
+            return None
+        columnas.append(campo.source)
+    return columnas
+
+
+def limitar_columnas(queryset, columnas=None):
+    """Aplica .only(*columnas) si se pidieron columnas (la llave primaria siempre se lee)."""
+    return queryset.only(*columnas) if columnas else queryset
@@ -0,0 +1,369 @@
+import logging
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.utils.timezone import now
+from rest_framework.exceptions import ValidationError
+
+from comun.cache import invalidar_por_modelo
+from comun.media.backends import IMediaBackend, obtener_backend
+from comun.media.imagenes import ImagenInvalida, procesar_imagen
+from comun.media.staging import eliminar_de_staging, existe_en_staging, guardar_en_staging, listar_staging_antiguos
+from comun.media.workers import encolar, subir_en_paralelo
+from comun.repositories.subida_media_repository import SubidaMediaRepository
+from comun.services.media_service_interface import IMediaService
+
+logger = logging.getLogger(__name__)
+
+# Campo del modelo donde se guarda la miniatura de `<campo>` (p. ej. foto_miniatura)
+SUFIJO_MINIATURA = "_miniatura"
+
+
+def _tiene_campo(instancia, nombre: str) -> bool:
+    try:
+        instancia._meta.get_field(nombre)
+        return True
+    except FieldDoesNotExist:
+        return False
+
+
+class MediaService(IMediaService):
+    """
+    Servicio de subida de archivos en segundo plano.
+
+    Flujo:
+    1. El request guarda el archivo en el staging local (rápido) y registra
+       una SubidaMedia 'pendiente' dentro de su transacción.
+    2. Al confirmarse la transacción, la subida se encola en el pool de workers.
+    3. El worker sube el archivo al backend (Cloudinary por defecto) con
+       reintentos y backoff exponencial, y escribe la URL en el objeto destino.
+
+    Las imágenes se validan y normalizan al recibirlas (sin EXIF, resolución
+    acotada, re-codificadas a WebP/JPEG) y, si el modelo lo admite, se genera
+    una miniatura `<campo>_miniatura` para los listados.
+
+    Varios archivos del mismo objeto (p. ej. las tres fotos de un registro)
+    pueden agendarse como un lote: se suben en paralelo y con semántica
+    todo-o-nada (programar_subidas / procesar_lote).
+
+    Las subidas que no terminan (reinicio del proceso, backend caído)
+    se reintentan con `python manage.py procesar_subidas_pendientes`, que
+    debe correr en la instancia web (start.sh / cron): los archivos están
+    en su staging local. Una subida cuyo archivo ya no está en el staging
+    falla de forma definitiva.
+
+    Los clientes ven el estado de la última subida de cada campo en
+    `<campo>_estado` (ver comun.estado_subidas): al terminar una subida,
+    con URL o con error, cambia el updated_at (y el ETag) del objeto.
+    """
+
+    def __init__(self, backend: IMediaBackend = None):
+        self.backend = backend or obtener_backend()
+
+    # ----------------------------------------------------------------------
+    # Programar
+    # ----------------------------------------------------------------------
+    def programar_subida(self, instancia, campo: str, archivo, carpeta: str,
+                         resource_type: str = "image", optimizar: bool = True):
+        """
+        Ejemplo:
+            programar_subida(maquinaria, "foto", foto_file, carpeta="maquinarias/photos")
+        Si el modelo tiene `<campo>_miniatura`, la miniatura se agenda junto
+        con la imagen como un lote. Retorna la SubidaMedia del campo.
+        """
+        rutas = self._preparar_archivo(instancia, campo, archivo, resource_type, optimizar)
+        if len(rutas) > 1:
+            return self._registrar_lote(instancia, rutas, carpeta, resource_type)[0]
+
+        subida = SubidaMediaRepository.create(
+            content_type=ContentType.objects.get_for_model(instancia),
+            object_id=instancia.pk,
+            campo=campo,
+            ruta_local=rutas[campo],
+            carpeta=carpeta,
+            resource_type=resource_type
+        )
+
+        # Solo se sube si la fila destino realmente se confirmó
+        transaction.on_commit(lambda: encolar(self.procesar_subida, subida.id_subida))
+        return subida
+
+    def programar_subidas(self, instancia, archivos: dict, carpeta: str,
+                          resource_type: str = "image", optimizar: bool = True):
+        """
+        Agenda varios archivos de un mismo objeto como un lote todo-o-nada.
+        Ejemplo:
+            programar_subidas(registro, {"foto_planilla": f1, "foto_horometro_final": f2},
+                              carpeta="registros/photos")
+        Los campos con archivo vacío se ignoran. Retorna las SubidaMedia creadas.
+        """
+        archivos = {campo: archivo for campo, archivo in archivos.items() if archivo}
+        if not archivos:
+            return []
+
+        rutas = {}
+        for campo, archivo in archivos.items():
+            rutas.update(self._preparar_archivo(instancia, campo, archivo, resource_type, optimizar))
+
+        return self._registrar_lote(instancia, rutas, carpeta, resource_type)
+
+    def _preparar_archivo(self, instancia, campo: str, archivo, resource_type: str, optimizar: bool):
+        """
+        Guarda el archivo en staging y, si es una imagen a optimizar, la valida,
+        la normaliza (ver comun.media.imagenes) y genera la miniatura cuando el
+        modelo tiene el campo `<campo>_miniatura`.
+        Retorna {campo: ruta_local} (más la miniatura si corresponde).
+        """
+        try:
+            ruta_local = guardar_en_staging(archivo)
+        except OSError:
+            raise ValidationError({campo: "Error al recibir el archivo."})
+
+        if not (optimizar and resource_type == "image"):
+            return {campo: ruta_local}
+
+        campo_miniatura = f"{campo}{SUFIJO_MINIATURA}"
+        con_miniatura = _tiene_campo(instancia, campo_miniatura)
+
+        try:
+            ruta_local, ruta_miniatura = procesar_imagen(ruta_local, con_miniatura=con_miniatura)
+        except ImagenInvalida as e:
+            raise ValidationError({campo: str(e)})
+
+        rutas = {campo: ruta_local}
+        if ruta_miniatura:
+            rutas[campo_miniatura] = ruta_miniatura
+        return rutas
+
+    def _registrar_lote(self, instancia, rutas: dict, carpeta: str, resource_type: str):
+        """Registra las SubidaMedia de un lote y lo encola al confirmar la transacción."""
+        lote = uuid.uuid4()
+        content_type = ContentType.objects.get_for_model(instancia)
+
+        subidas = [
+            SubidaMediaRepository.create(
+                content_type=content_type,
+                object_id=instancia.pk,
+                campo=campo,
+                ruta_local=ruta_local,
+                carpeta=carpeta,
+                resource_type=resource_type,
+                lote=lote
+            )
+            for campo, ruta_local in rutas.items()
+        ]
+
+        transaction.on_commit(lambda: encolar(self.procesar_lote, lote))
+        return subidas
+
+    # ----------------------------------------------------------------------
+    # Procesar (worker)
+    # ----------------------------------------------------------------------
+    def procesar_subida(self, id_subida: int):
+        """
+        Sube el archivo de una SubidaMedia. Si otro worker ya la tomó
+        o ya está completada, no hace nada.
+        Retorna la SubidaMedia procesada o None.
+        """
+        if not SubidaMediaRepository.reclamar(id_subida):
+            return None
+
+        subida = SubidaMediaRepository.get_by_id(id_subida=id_subida)
+        url, error, usados = self._subir_con_reintentos(subida)
+
+        if error:
+            with transaction.atomic():
+                SubidaMediaRepository.marcar_error(subida, error=error, intentos=subida.intentos + usados)
+                self._marcar_objeto_modificado(subida)
+            return subida
+
+        self._aplicar_urls([(subida, url)])
+        SubidaMediaRepository.marcar_completada(subida, url=url, intentos=subida.intentos + usados)
+        eliminar_de_staging(subida.ruta_local)
+        return subida
+
+    def procesar_lote(self, lote):
+        """
+        Sube en paralelo todos los archivos de un lote (todo-o-nada):
+        - Si todos suben, escribe todas las URLs en el objeto destino a la vez.
+        - Si alguno falla, elimina del backend los que sí subieron y marca
+          el lote completo con error para reintentarlo después.
+        Retorna la lista de SubidaMedia del lote (vacía si otro worker lo tomó).
+        """
+        subidas = SubidaMediaRepository.reclamar_lote(lote)
+        if not subidas:
+            return []
+
+        faltantes = [subida for subida in subidas if not existe_en_staging(subida.ruta_local)]
+        if faltantes:
+            # Sin uno de sus archivos el lote nunca podrá completarse (todo-o-nada)
+            motivo = "; ".join(f"{subida.campo}: {self._error_staging(subida)}" for subida in faltantes)
+            with transaction.atomic():
+                for subida in subidas:
+                    SubidaMediaRepository.marcar_error(
+                        subida,
+                        error=motivo,
+                        intentos=subida.intentos + self._intentos_restantes(subida)
+                    )
+                self._marcar_objeto_modificado(subidas[0])
+            for subida in subidas:
+                eliminar_de_staging(subida.ruta_local)
+            return subidas
+
+        resultados = subir_en_paralelo(self._subir_con_reintentos, subidas)
+        fallidas = [(subida, error) for subida, (_, error, _) in zip(subidas, resultados) if error]
+
+        if fallidas:
+            self._revertir_subidas(
+                [url for url, error, _ in resultados if not error]
+            )
+            motivo = "; ".join(f"{subida.campo}: {error}" for subida, error in fallidas)
+            with transaction.atomic():
+                for subida, (_, error, usados) in zip(subidas, resultados):
+                    SubidaMediaRepository.marcar_error(
+                        subida,
+                        error=error or f"Lote revertido ({motivo})",
+                        intentos=subida.intentos + usados
+                    )
+                self._marcar_objeto_modificado(subidas[0])
+            return subidas
+
+        # Solo las escrituras finales van en transacción (nunca la red)
+        with transaction.atomic():
+            self._aplicar_urls([(subida, url) for subida, (url, _, _) in zip(subidas, resultados)])
+            for subida, (url, _, usados) in zip(subidas, resultados):
+                SubidaMediaRepository.marcar_completada(subida, url=url, intentos=subida.intentos + usados)
+
+        for subida in subidas:
+            eliminar_de_staging(subida.ruta_local)
+
+        return subidas
+
+    def _subir_con_reintentos(self, subida):
+        """
+        Sube el archivo de la subida con reintentos y backoff exponencial.
+        No accede a la BD (se ejecuta también en los hilos de subida paralela).
+        Retorna (url, error, intentos_usados); url es None si falló.
+
+        Si el archivo no está en el staging el error es definitivo: no se
+        reintenta ni se espera, y se consumen los intentos restantes para
+        que procesar_pendientes no la vuelva a tomar.
+        """
+        if not existe_en_staging(subida.ruta_local):
+            error = self._error_staging(subida)
+            logger.error("Subida #%s: %s", subida.id_subida, error)
+            return None, error, self._intentos_restantes(subida)
+
+        reintentos = settings.MEDIA_UPLOAD_REINTENTOS
+
+        for intento in range(1, reintentos + 1):
+            try:
+                url = self.backend.subir(subida.ruta_local, subida.carpeta, subida.resource_type)
+                return url, None, intento
+            except Exception as e:
+                logger.warning("Subida #%s falló (intento %s/%s): %s", subida.id_subida, intento, reintentos, e)
+                if intento == reintentos:
+                    return None, str(e) or e.__class__.__name__, intento
+                time.sleep(settings.MEDIA_UPLOAD_ESPERA_BASE * 2 ** (intento - 1))
+
+    @staticmethod
+    def _error_staging(subida):
+        return f"El archivo {subida.ruta_local} no existe en el staging de esta máquina."
+
+    @staticmethod
+    def _intentos_restantes(subida):
+        return max(settings.MEDIA_UPLOAD_MAX_INTENTOS - subida.intentos, 1)
+
+    def _revertir_subidas(self, urls):
+        """Elimina del backend los archivos ya subidos de un lote fallido."""
+        for url in urls:
+            try:
+                self.backend.eliminar(url)
+            except Exception as e:
+                logger.warning("No se pudo eliminar el archivo %s: %s", url, e)
+
+    def _aplicar_urls(self, subidas_urls):
+        """
+        Escribe las URLs en los campos del objeto destino con un solo UPDATE,
+        omitiendo los campos que una subida posterior ya actualizó.
+        """
+        campos = {
+            subida.campo: url
+            for subida, url in subidas_urls
+            if not SubidaMediaRepository.existe_posterior_completada(subida)
+        }
+        if not campos:
+            return
+
+        subida = subidas_urls[0][0]
+        modelo = subida.content_type.model_class()
+        # QuerySet.update no aplica auto_now: sin esto el ETag no cambiaría
+        modelo.objects.filter(pk=subida.object_id).update(**campos, updated_at=now())
+        invalidar_por_modelo(modelo)
+
+    @staticmethod
+    def _marcar_objeto_modificado(subida):
+        """
+        Actualiza el updated_at del objeto destino de una subida fallida: su
+        `<campo>_estado` cambió sin tocar la fila y el ETag debe reflejarlo.
+        """
+        modelo = subida.content_type.model_class()
+        modelo.objects.filter(pk=subida.object_id).update(updated_at=now())
+
+    # ----------------------------------------------------------------------
+    # Reprocesar
+    # ----------------------------------------------------------------------
+    def procesar_pendientes(self, minutos_bloqueo: int = 15):
+        """
+        Libera las subidas que quedaron en 'subiendo' hace más de
+        `minutos_bloqueo` minutos y procesa en línea las reintentables (las
+        pendientes solo si llevan ese mismo tiempo sin que un worker las tome).
+        Retorna (completadas, con_error).
+        """
+        limite = now() - timedelta(minutes=minutos_bloqueo)
+        SubidaMediaRepository.liberar_bloqueadas(limite)
+
+        completadas = con_error = 0
+        lotes_procesados = set()
+        reintentables = (
+            SubidaMediaRepository
+            .get_reintentables(max_intentos=settings.MEDIA_UPLOAD_MAX_INTENTOS, pendientes_antes_de=limite)
+            .values_list('id_subida', 'lote')
+        )
+
+        for id_subida, lote in list(reintentables):
+            if lote is None:
+                procesadas = [self.procesar_subida(id_subida)]
+            elif lote not in lotes_procesados:
+                lotes_procesados.add(lote)
+                procesadas = self.procesar_lote(lote)
+            else:
+                continue
+
+            for subida in filter(None, procesadas):
+                if subida.estado == subida.COMPLETADA:
+                    completadas += 1
+                else:
+                    con_error += 1
+
+        return completadas, con_error
+
+    def limpiar_staging(self, antiguedad_horas: int = 24):
+        """
+        Elimina los archivos de staging antiguos que no pertenecen a ninguna
+        subida pendiente (quedan cuando la transacción del request se revierte).
+        Retorna la cantidad de archivos eliminados.
+        """
+        rutas = listar_staging_antiguos(antiguedad_horas)
+        en_uso = SubidaMediaRepository.get_rutas_en_uso(rutas)
+
+        huerfanas = [ruta for ruta in rutas if ruta not in en_uso]
+        for ruta in huerfanas:
+            eliminar_de_staging(ruta)
+
+        return len(huerfanas)
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+
+
+class IMediaService(ABC):
+    """
+    Interfaz del servicio de subida de archivos en segundo plano.
+    """
+
+    @abstractmethod
+    def programar_subida(self, instancia, campo: str, archivo, carpeta: str,
+                         resource_type: str = "image", optimizar: bool = True):
+        """
+        Guarda el archivo en staging (optimizando las imágenes) y agenda
+        su subida para cuando la transacción actual se confirme.
+        """
+        pass
+
+    @abstractmethod
+    def programar_subidas(self, instancia, archivos: dict, carpeta: str,
+                          resource_type: str = "image", optimizar: bool = True):
+        """
+        Agenda varios archivos de un mismo objeto como un lote
+        que se sube en paralelo con semántica todo-o-nada.
+        """
+        pass
+
+    @abstractmethod
+    def procesar_subida(self, id_subida: int):
+        """Sube el archivo (con reintentos) y escribe la URL en el objeto destino."""
+        pass
+
+    @abstractmethod
+    def procesar_lote(self, lote):
+        """Sube en paralelo los archivos de un lote; si uno falla, revierte los demás."""
+        pass
+
+    @abstractmethod
+    def procesar_pendientes(self):
+        """Reintenta las subidas pendientes o fallidas."""
+        pass
+
+    @abstractmethod
+    def limpiar_staging(self, antiguedad_horas: int = 24):
+        """Elimina archivos de staging huérfanos (p. ej. de transacciones revertidas)."""
+        pass
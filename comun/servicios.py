@@ -0,0 +1,108 @@
+import threading
+from contextlib import contextmanager
+
+from django.utils.module_loading import import_string
+
+# Nombre → clase concreta de cada servicio. Se importan recién al pedirlos,
+# así cargar una vista no arrastra el grafo completo de servicios.
+SERVICIOS = {
+    "alarma": "alarmas.services.alarma_service.AlarmaService",
+    "conductor": "conductores.services.conductor_service.ConductorService",
+    "costo_mantenimiento": "mantenimientos.services.costo_mantenimiento_service.CostoMantenimientoService",
+    "curso": "cursos.services.curso_service.CursoService",
+    "empresa": "empresas.services.empresa_service.EmpresaService",
+    "estado_mantenimiento": "mantenimientos_programados.services.estado_mantenimiento_service.EstadoMantenimientoService",
+    "hoja_vida": "hojas_vida.services.hoja_vida_service.HojaVidaService",
+    "login": "logins.services.login_service.LoginService",
+    "mantenimiento": "mantenimientos.services.mantenimiento_service.MantenimientoService",
+    "mantenimiento_programado": "mantenimientos_programados.services.mantenimiento_programado_service.MantenimientoProgramadoService",
+    "maquinaria": "maquinarias.services.maquinaria_service.MaquinariaService",
+    "media": "comun.services.media_service.MediaService",
+    "pronostico_mantenimiento": "maquinarias.services.pronostico_mantenimiento_service.PronosticoMantenimientoService",
+    "proyecto": "proyectos.services.proyecto_service.ProyectoService",
+    "proyecto_maquinaria": "proyecto_maquinaria.services.proyecto_maquinaria_service.ProyectoMaquinariaService",
+    "registro_horas_maquinaria": "registros_horas_maquinaria.services.registro_horas_maquinaria_service.RegistroHorasMaquinariaService",
+    "usuario": "usuarios.services.usuario_service.UsuarioService",
+    "utilizacion": "registros_horas_maquinaria.services.utilizacion_service.UtilizacionService",
+}
+
+
+class RegistroServicios:
+    """
+    Contenedor de servicios: cada servicio se construye la primera vez que
+    se pide y luego se reutiliza en todo el proceso (los servicios no
+    guardan estado por request).
+
+    En pruebas, `sustituir` reemplaza temporalmente un servicio por otra
+    instancia (p. ej. un doble de prueba).
+    """
+
+    def __init__(self, rutas: dict):
+        self._rutas = rutas
+        self._instancias = {}
+        self._sustitutos = {}
+        self._candado = threading.Lock()
+
+    def obtener(self, nombre: str):
+        if nombre in self._sustitutos:
+            return self._sustitutos[nombre]
+
+        instancia = self._instancias.get(nombre)
+        if instancia is None:
+            clase = import_string(self._rutas[nombre])
+            with self._candado:
+                instancia = self._instancias.get(nombre)
+                if instancia is None:
+                    instancia = self._instancias[nombre] = clase()
+        return instancia
+
+    @contextmanager
+    def sustituir(self, nombre: str, instancia):
+        """
+        Ejemplo:
+            with registro_servicios.sustituir("media", MediaService(backend=falso)):
+                ...
+        """
+        if nombre not in self._rutas:
+            raise KeyError(f"Servicio no registrado: {nombre}")
+
+        anterior = self._sustitutos.get(nombre)
+        self._sustitutos[nombre] = instancia
+        try:
+            yield instancia
+        finally:
+            if anterior is None:
+                del self._sustitutos[nombre]
+            else:
+                self._sustitutos[nombre] = anterior
+
+    def reiniciar(self):
+        """Descarta las instancias creadas (se reconstruyen al pedirlas)."""
+        with self._candado:
+            self._instancias.clear()
+
+
+registro_servicios = RegistroServicios(SERVICIOS)
+
+
+def obtener_servicio(nombre: str):
+    """Retorna la instancia compartida del servicio `nombre` (ver SERVICIOS)."""
+    return registro_servicios.obtener(nombre)
+
+
+class Dependencia:
+    """
+    Atributo de clase que resuelve un servicio del registro al accederlo,
+    en lugar de construirlo en __init__:
+
+        class AlarmaService(IAlarmaService):
+            maquinaria_service = Dependencia("maquinaria")
+    """
+
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+
+    def __get__(self, instancia, propietario):
+        if instancia is None:
+            return self
+        return registro_servicios.obtener(self.nombre)
@@ -0,0 +1,4 @@
+from comun.cache import conectar_senales
+
+# Invalida la caché del dashboard cuando cambian sus modelos de origen
+conectar_senales()
@@ -0,0 +1,98 @@
+import csv
+import io
+from datetime import datetime
+
+from rest_framework.exceptions import ValidationError
+
+EXTENSIONES_CSV = (".csv", ".txt")
+EXTENSIONES_XLSX = (".xlsx",)
+
+# Bytes leídos para detectar el separador de un CSV (, ; o tabulador)
+_MUESTRA_CSV = 4096
+
+
+def leer_filas(archivo, max_filas: int):
+    """
+    Itera las filas de un archivo CSV o XLSX subido como
+    (numero_fila, {columna: valor}), con los encabezados en minúsculas.
+    El archivo se lee de forma incremental (sin cargarlo completo en memoria);
+    las filas vacías se omiten. `numero_fila` es la fila del archivo
+    (la 1 es el encabezado), para reportar errores al usuario.
+
+    Lanza ValidationError si el formato no es soportado, falta el
+    encabezado o se supera `max_filas`.
+    """
+    nombre = (getattr(archivo, "name", "") or "").lower()
+
+    if nombre.endswith(EXTENSIONES_XLSX):
+        filas = _leer_xlsx(archivo)
+    elif nombre.endswith(EXTENSIONES_CSV):
+        filas = _leer_csv(archivo)
+    else:
+        raise ValidationError({"archivo": "Formato no soportado: use CSV o XLSX."})
+
+    encabezado = next(filas, None)
+    if not encabezado or not any(encabezado):
+        raise ValidationError({"archivo": "El archivo no tiene encabezado."})
+    columnas = [str(c).strip().lower() if c is not None else "" for c in encabezado]
+
+    leidas = 0
+    for numero, valores in enumerate(filas, start=2):
+        if not any(v not in (None, "") for v in valores):
+            continue
+
+        leidas += 1
+        if leidas > max_filas:
+            raise ValidationError({"archivo": f"El archivo supera el máximo de {max_filas} filas."})
+
+        yield numero, {
+            columna: _normalizar(valor)
+            for columna, valor in zip(columnas, valores)
+            if columna
+        }
+
+
+def _leer_csv(archivo):
+    archivo.seek(0)
+    muestra = archivo.read(_MUESTRA_CSV)
+    archivo.seek(0)
+
+    try:
+        dialecto = csv.Sniffer().sniff(muestra.decode("utf-8-sig", errors="ignore"), delimiters=",;\t")
+    except csv.Error:
+        dialecto = csv.excel
+
+    texto = io.TextIOWrapper(archivo, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.reader(texto, dialecto)
+    except UnicodeDecodeError:
+        raise ValidationError({"archivo": "El CSV debe estar codificado en UTF-8."})
+    finally:
+        # No cerrar el archivo subido junto con el wrapper
+        texto.detach()
+
+
+def _leer_xlsx(archivo):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValidationError({"archivo": "La importación de XLSX requiere el paquete openpyxl."})
+
+    try:
+        libro = load_workbook(archivo, read_only=True, data_only=True)
+    except Exception:
+        raise ValidationError({"archivo": "El archivo XLSX no es válido."})
+
+    try:
+        yield from libro.worksheets[0].iter_rows(values_only=True)
+    finally:
+        libro.close()
+
+
+def _normalizar(valor):
+    if isinstance(valor, str):
+        return valor.strip()
+    # Excel guarda las fechas como datetime
+    if isinstance(valor, datetime):
+        return valor.date()
+    return valor
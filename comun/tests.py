@@ -0,0 +1,94 @@
+from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from comun.models.subida_media import SubidaMedia
+from comun.pruebas import (
+    PresupuestoConsultasMixin,
+    credencial_admin,
+    rutas_con_presupuesto,
+    sembrar_datos_presupuesto,
+)
+from maquinarias.models.maquinaria import Maquinaria
+
+
+class PresupuestoConsultasTests(PresupuestoConsultasMixin, APITestCase):
+    """
+    Cada ruta de settings.PRESUPUESTO_CONSULTAS responde sin error y dentro
+    de su presupuesto de consultas (mismos datos que el comando
+    verificar_presupuesto_consultas).
+
+    Uso:
+        python manage.py test comun
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.maquina = sembrar_datos_presupuesto(10)
+        cls.autorizacion = credencial_admin("presupuesto_consultas")
+
+    def setUp(self):
+        self.client.credentials(HTTP_AUTHORIZATION=self.autorizacion)
+
+    def test_rutas_dentro_del_presupuesto(self):
+        for ruta in rutas_con_presupuesto(self.maquina.id_maquina):
+            with self.subTest(ruta=ruta):
+                response = self.assertPresupuestoDeclarado(ruta)
+                self.assertLess(response.status_code, 400, response.content[:200])
+
+
+class EstadoSubidaTests(APITestCase):
+    """
+    `<campo>_estado` refleja la última subida de cada campo, igual en el
+    detalle, el listado paginado y el listado completo (con y sin lectura
+    rápida).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.maquinas = [
+            Maquinaria.objects.create(nombre_maquina=f"Estado subida {i}", horas_totales=0)
+            for i in range(4)
+        ]
+        tipo = ContentType.objects.get_for_model(cls.maquinas[0])
+        # La última subida del campo es la que cuenta
+        for maquina, estados in zip(cls.maquinas, (
+            [SubidaMedia.COMPLETADA, SubidaMedia.PENDIENTE],
+            [SubidaMedia.SUBIENDO],
+            [SubidaMedia.PENDIENTE, SubidaMedia.ERROR],
+            [],
+        )):
+            for estado in estados:
+                SubidaMedia.objects.create(
+                    content_type=tipo, object_id=maquina.pk, campo="foto",
+                    ruta_local="staging/prueba.jpg", carpeta="pruebas", estado=estado
+                )
+        cls.esperado = {
+            cls.maquinas[0].pk: SubidaMedia.PENDIENTE,
+            cls.maquinas[1].pk: SubidaMedia.PENDIENTE,
+            cls.maquinas[2].pk: SubidaMedia.ERROR,
+            cls.maquinas[3].pk: None,
+        }
+        cls.autorizacion = credencial_admin("estado_subidas")
+
+    def setUp(self):
+        self.client.credentials(HTTP_AUTHORIZATION=self.autorizacion)
+
+    def _estados(self, filas):
+        return {fila["id_maquina"]: fila["foto_estado"] for fila in filas if fila["id_maquina"] in self.esperado}
+
+    def test_detalle(self):
+        for pk, estado in self.esperado.items():
+            with self.subTest(pk=pk):
+                self.assertEqual(self.client.get(f"/api/maquinarias/{pk}/").json()["foto_estado"], estado)
+
+    def test_listados(self):
+        for lectura_rapida in (True, False):
+            with self.subTest(lectura_rapida=lectura_rapida), override_settings(LECTURA_RAPIDA_ACTIVA=lectura_rapida):
+                self.assertEqual(self._estados(self.client.get("/api/maquinarias/").json()), self.esperado)
+
+        pagina = self.client.get("/api/maquinarias/", {"page_size": 50}).json()
+        self.assertEqual(self._estados(pagina["results"]), self.esperado)
+
+        campos = self.client.get("/api/maquinarias/", {"fields": "id_maquina,foto_estado"}).json()
+        self.assertEqual(self._estados(campos), self.esperado)
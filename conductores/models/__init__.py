@@ -0,0 +1 @@
+from .conductor import Conductor
@@ -1,5 +1,7 @@
 from django.core.exceptions import ObjectDoesNotExist
 from conductores.models.conductor import Conductor
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class ConductorRepository:
@@ -9,9 +11,14 @@ class ConductorRepository:
     """
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todos los conductores."""
-        return Conductor.objects.all()
+        return limitar_columnas(Conductor.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los conductores paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(Conductor.objects.all(), columnas), cursor, page_size)
 
     @staticmethod
     def get_by_id(**kwargs):
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 from django.core.validators import RegexValidator
 from conductores.models.conductor import Conductor
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class ConductorSerializer(serializers.ModelSerializer):
+class ConductorSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Conductor
         fields = [
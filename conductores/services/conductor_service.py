@@ -45,9 +45,13 @@ class ConductorService(IConductorService):
     # ---------------------------------------------------------
     # LISTAR
     # ---------------------------------------------------------
-    def listar_conductores(self):
+    def listar_conductores(self, columnas=None):
         """Retorna todos los conductores registrados."""
-        return ConductorRepository.get_all()
+        return ConductorRepository.get_all(columnas=columnas)
+
+    def listar_conductores_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los conductores (paginación por cursor)."""
+        return ConductorRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ---------------------------------------------------------
     # OBTENER
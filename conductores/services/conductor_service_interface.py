@@ -12,7 +12,11 @@ class IConductorService(ABC):
         pass
 
     @abstractmethod
-    def listar_conductores(self):
+    def listar_conductores(self, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_conductores_paginado(self, cursor=None, page_size=None, columnas=None):
         pass
 
     @abstractmethod
@@ -1,13 +1,18 @@
 from rest_framework import viewsets, status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from conductores.models.conductor import Conductor
 from conductores.serializers.conductor_serializer import ConductorSerializer
-from conductores.services.conductor_service import ConductorService
 from conductores.services.conductor_service_interface import IConductorService
 from logins.permissions.rol_permissions import RolPermission
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class ConductorViewSet(viewsets.ModelViewSet):
+class ConductorViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de conductores.
     Gestiona listado, creación, consulta individual,
@@ -17,23 +22,29 @@ class ConductorViewSet(viewsets.ModelViewSet):
 
     permission_key = "conductor"
     permission_classes = [RolPermission]
+    modelo_condicional = Conductor
 
     def __init__(
         self,
-        service: IConductorService = ConductorService(),
+        service: IConductorService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("conductor")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todos los conductores."""
-        conductores = self.service.listar_conductores()
-        serializer = ConductorSerializer(conductores, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, ConductorSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_conductores_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, ConductorSerializer, campos=campos)
+
+        conductores = self.service.listar_conductores(columnas=columnas)
+        return Response(serializar_listado(conductores, ConductorSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                 OBTENER (GET/{id})
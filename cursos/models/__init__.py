@@ -1,2 +1 @@
-
-
+from .curso import Curso
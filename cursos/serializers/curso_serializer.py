@@ -4,9 +4,10 @@ from django.core.validators import RegexValidator
 from rest_framework import serializers
 
 from cursos.models.curso import Curso
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class CursoSerializer(serializers.ModelSerializer):
+class CursoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Curso
         fields = [
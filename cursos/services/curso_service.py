@@ -32,9 +32,13 @@ class CursoService(ICursoService):
     # ---------------------------------------------------------
     # LISTAR
     # ---------------------------------------------------------
-    def listar_cursos(self):
+    def listar_cursos(self, columnas=None):
         """Retorna todos los cursos registrados."""
-        return CursoRepository.get_all()
+        return CursoRepository.get_all(columnas=columnas)
+
+    def listar_cursos_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los cursos (paginación por cursor)."""
+        return CursoRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ---------------------------------------------------------
     # OBTENER
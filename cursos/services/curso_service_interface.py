@@ -12,7 +12,11 @@ class ICursoService(ABC):
         pass
 
     @abstractmethod
-    def listar_cursos(self):
+    def listar_cursos(self, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_cursos_paginado(self, cursor=None, page_size=None, columnas=None):
         pass
 
     @abstractmethod
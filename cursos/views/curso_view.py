@@ -3,13 +3,18 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from cursos.models.curso import Curso
 from cursos.serializers.curso_serializer import CursoSerializer
 from cursos.services.curso_service_interface import ICursoService
-from cursos.services.curso_service import CursoService
 from logins.permissions.rol_permissions import RolPermission
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class CursoViewSet(viewsets.ModelViewSet):
+class CursoViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de cursos.
     Gestiona listado, creación, consulta individual,
@@ -19,23 +24,29 @@ class CursoViewSet(viewsets.ModelViewSet):
 
     permission_key = "curso"
     permission_classes = [RolPermission]
+    modelo_condicional = Curso
 
     def __init__(
         self,
-        service: ICursoService = CursoService(),
+        service: ICursoService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("curso")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todos los cursos."""
-        cursos = self.service.listar_cursos()
-        serializer = CursoSerializer(cursos, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, CursoSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_cursos_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, CursoSerializer, campos=campos)
+
+        cursos = self.service.listar_cursos(columnas=columnas)
+        return Response(serializar_listado(cursos, CursoSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                 OBTENER (GET/{id})
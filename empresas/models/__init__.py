@@ -0,0 +1 @@
+from .empresa import Empresa
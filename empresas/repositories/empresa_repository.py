@@ -1,6 +1,8 @@
 from django.core.exceptions import ObjectDoesNotExist
 
 from empresas.models.empresa import Empresa
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class EmpresaRepository:
@@ -13,9 +15,14 @@ class EmpresaRepository:
     #                    LISTAR TODOS
     # ---------------------------------------------------------
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todas las empresas registradas."""
-        return Empresa.objects.all()
+        return limitar_columnas(Empresa.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las empresas paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(Empresa.objects.all(), columnas), cursor, page_size)
 
     # ---------------------------------------------------------
     #                     OBTENER POR CAMPO
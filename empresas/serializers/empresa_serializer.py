@@ -2,9 +2,10 @@ from django.core.validators import RegexValidator, EmailValidator
 from rest_framework import serializers
 
 from empresas.models.empresa import Empresa
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class EmpresaSerializer(serializers.ModelSerializer):
+class EmpresaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Empresa
         fields = [
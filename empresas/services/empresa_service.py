@@ -33,9 +33,13 @@ class EmpresaService(IEmpresaService):
     # ---------------------------------------------------------
     # LISTAR
     # ---------------------------------------------------------
-    def listar_empresas(self):
+    def listar_empresas(self, columnas=None):
         """Retorna todas las empresas registradas."""
-        return EmpresaRepository.get_all()
+        return EmpresaRepository.get_all(columnas=columnas)
+
+    def listar_empresas_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las empresas (paginación por cursor)."""
+        return EmpresaRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ---------------------------------------------------------
     # OBTENER
@@ -13,10 +13,15 @@ class IEmpresaService(ABC):
         pass
 
     @abstractmethod
-    def listar_empresas(self):
+    def listar_empresas(self, columnas=None):
         """Listar todas las empresas registradas."""
         pass
 
+    @abstractmethod
+    def listar_empresas_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las empresas paginada por cursor."""
+        pass
+
     @abstractmethod
     def obtener_empresa(self, **kwargs):
         """Obtener una empresa por ID u otro campo único."""
@@ -2,12 +2,17 @@ from rest_framework import viewsets, status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from empresas.models.empresa import Empresa
 from empresas.serializers.empresa_serializer import EmpresaSerializer
-from empresas.services.empresa_service import EmpresaService
 from empresas.services.empresa_service_interface import IEmpresaService
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class EmpresaViewSet(viewsets.ModelViewSet):
+class EmpresaViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de empresas.
     Gestiona listado, creación, consulta individual,
@@ -15,22 +20,29 @@ class EmpresaViewSet(viewsets.ModelViewSet):
     de negocio al servicio correspondiente (principios SOLID).
     """
 
+    modelo_condicional = Empresa
+
     def __init__(
         self,
-        service: IEmpresaService = EmpresaService(),
+        service: IEmpresaService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("empresa")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todas las empresas."""
-        empresas = self.service.listar_empresas()
-        serializer = EmpresaSerializer(empresas, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, EmpresaSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_empresas_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, EmpresaSerializer, campos=campos)
+
+        empresas = self.service.listar_empresas(columnas=columnas)
+        return Response(serializar_listado(empresas, EmpresaSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                 OBTENER (GET/{id})
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hojas_vida', '0002_alter_hojavida_archivo'),
+        ('maquinarias', '0005_maquinaria_foto_miniatura'),
+        ('usuarios', '0005_usuario_foto_miniatura'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='hojavida',
+            index=models.Index(fields=['maquinaria', '-fecha_registro', '-id_hoja'], name='idx_hoja_vida_maq_fecha'),
+        ),
+    ]
@@ -0,0 +1 @@
+from .hoja_vida import HojaVida
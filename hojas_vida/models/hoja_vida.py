@@ -40,6 +40,13 @@ class HojaVida(models.Model):
         db_table = "hoja_vida"
         verbose_name = "Hoja de Vida"
         verbose_name_plural = "Hojas de Vida"
+        indexes = [
+            # Historia de la máquina (timeline), más reciente primero
+            models.Index(
+                fields=["maquinaria", "-fecha_registro", "-id_hoja"],
+                name="idx_hoja_vida_maq_fecha"
+            ),
+        ]
 
     def __str__(self):
         return f"Hoja de Vida #{self.id_hoja} - Máquina {self.descripcion}"
\ No newline at end of file
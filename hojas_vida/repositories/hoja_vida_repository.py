@@ -1,5 +1,7 @@
 from django.core.exceptions import ObjectDoesNotExist
 from hojas_vida.models.hoja_vida import HojaVida
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class HojaVidaRepository:
@@ -9,9 +11,14 @@ class HojaVidaRepository:
     """
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todas las hojas de vida."""
-        return HojaVida.objects.all()
+        return limitar_columnas(HojaVida.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las hojas de vida paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(HojaVida.objects.all(), columnas), cursor, page_size)
 
     @staticmethod
     def get_by_id(**kwargs):
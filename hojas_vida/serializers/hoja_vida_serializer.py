@@ -5,9 +5,11 @@ from rest_framework import serializers
 from hojas_vida.models.hoja_vida import HojaVida
 from maquinarias.models.maquinaria import Maquinaria
 from usuarios.models.usuario import Usuario
+from comun.estado_subidas import EstadoSubidaField
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class HojaVidaSerializer(serializers.ModelSerializer):
+class HojaVidaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer profesional para la gestión de hojas de vida.
     Incluye validaciones estrictas para los campos,
@@ -15,6 +17,8 @@ class HojaVidaSerializer(serializers.ModelSerializer):
     de la información almacenada.
     """
 
+    archivo_estado = EstadoSubidaField("archivo")
+
     class Meta:
         model = HojaVida
         fields = [
@@ -23,6 +27,7 @@ class HojaVidaSerializer(serializers.ModelSerializer):
             'usuario',
             'descripcion',
             'archivo',
+            'archivo_estado',
             'fecha_registro',
             'created_at',
             'updated_at'
@@ -1,9 +1,6 @@
-import cloudinary.uploader
-from typing import Optional
-
-from django.core.files.uploadedfile import UploadedFile
-from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.exceptions import NotFound
 
+from comun.servicios import Dependencia
 from hojas_vida.repositories.hoja_vida_repository import HojaVidaRepository
 from hojas_vida.serializers.hoja_vida_serializer import HojaVidaSerializer
 from hojas_vida.services.hoja_vida_service_interface import IHojaVidaService
@@ -19,34 +16,19 @@ class HojaVidaService(IHojaVidaService):
     - Operaciones con el repository
     """
 
-    # ----------------------------------------------------------------------
-    # UTILIDAD: Guardar archivo físicamente
-    # ----------------------------------------------------------------------
-    def _guardar_archivo(self, archivo_file: Optional[UploadedFile]) -> Optional[str]:
-        """
-        Guarda el archivo en 'hojas_vida/files/'.
-        Retorna la URL absoluta final o None.
-        """
-        if archivo_file is None:
-            return None
-
-        try:
-            resultado = cloudinary.uploader.upload(
-                archivo_file,
-                folder="hojas_vida/files",  # carpeta lógica en Cloudinary
-                resource_type="image"  # forzamos imagen
-            )
-            return resultado.get("secure_url")
-
-        except Exception as e:
-            raise ValidationError({"foto": "Error al subir la imagen"})
+    # Inyección de dependencias de otros servicios (ver comun.servicios)
+    media_service = Dependencia("media")
 
     # ----------------------------------------------------------------------
     # Listar Hojas de Vida
     # ----------------------------------------------------------------------
-    def listar_hojas_vida(self):
+    def listar_hojas_vida(self, columnas=None):
         """Retorna todas las hojas de vida registradas."""
-        return HojaVidaRepository.get_all()
+        return HojaVidaRepository.get_all(columnas=columnas)
+
+    def listar_hojas_vida_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las hojas de vida (paginación por cursor)."""
+        return HojaVidaRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ----------------------------------------------------------------------
     # Obtener Hoja de Vida
@@ -82,12 +64,15 @@ class HojaVidaService(IHojaVidaService):
         serializer = HojaVidaSerializer(data=data)
         serializer.is_valid(raise_exception=True)
 
-        # Si viene un archivo → guardarlo
+        hoja = HojaVidaRepository.create(**serializer.validated_data)
+
+        # Si viene un archivo → subirlo en segundo plano
         if archivo_file:
-            ruta_archivo = self._guardar_archivo(archivo_file)
-            serializer.validated_data["archivo"] = ruta_archivo
+            # La hoja de vida puede ser un PDF: se sube tal cual, sin optimizar
+            self.media_service.programar_subida(
+                hoja, "archivo", archivo_file, carpeta="hojas_vida/files", optimizar=False
+            )
 
-        hoja = HojaVidaRepository.create(**serializer.validated_data)
         return hoja
 
     # ----------------------------------------------------------------------
@@ -112,14 +97,17 @@ class HojaVidaService(IHojaVidaService):
         serializer = HojaVidaSerializer(hoja, data=data, partial=True)
         serializer.is_valid(raise_exception=True)
 
-        # ¿Se sube un nuevo archivo?
-        if archivo_file:
-            nueva_ruta = self._guardar_archivo(archivo_file)
-            serializer.validated_data["archivo"] = nueva_ruta
-
         hoja_actualizada = HojaVidaRepository.update(
             hoja, **serializer.validated_data
         )
+
+        # ¿Se sube un nuevo archivo? → en segundo plano
+        if archivo_file:
+            # La hoja de vida puede ser un PDF: se sube tal cual, sin optimizar
+            self.media_service.programar_subida(
+                hoja_actualizada, "archivo", archivo_file, carpeta="hojas_vida/files", optimizar=False
+            )
+
         return hoja_actualizada
 
     # ----------------------------------------------------------------------
@@ -8,7 +8,11 @@ class IHojaVidaService(ABC):
     """
 
     @abstractmethod
-    def listar_hojas_vida(self):
+    def listar_hojas_vida(self, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_hojas_vida_paginado(self, cursor=None, page_size=None, columnas=None):
         pass
 
     @abstractmethod
@@ -2,13 +2,18 @@ from rest_framework import viewsets, status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from hojas_vida.models.hoja_vida import HojaVida
 from hojas_vida.serializers.hoja_vida_serializer import HojaVidaSerializer
-from hojas_vida.services.hoja_vida_service import HojaVidaService
 from hojas_vida.services.hoja_vida_service_interface import IHojaVidaService
 from logins.permissions.rol_permissions import RolPermission
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class HojaVidaViewSet(viewsets.ModelViewSet):
+class HojaVidaViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de hojas de vida.
     Gestiona listado, creación, consulta individual,
@@ -18,23 +23,29 @@ class HojaVidaViewSet(viewsets.ModelViewSet):
 
     permission_key = "hoja_vida"
     permission_classes = [RolPermission]
+    modelo_condicional = HojaVida
 
     def __init__(
         self,
-        service: IHojaVidaService = HojaVidaService(),
+        service: IHojaVidaService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("hoja_vida")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todas las hojas de vida registradas."""
-        hojas = self.service.listar_hojas_vida()
-        serializer = HojaVidaSerializer(hojas, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, HojaVidaSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_hojas_vida_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, HojaVidaSerializer, campos=campos)
+
+        hojas = self.service.listar_hojas_vida(columnas=columnas)
+        return Response(serializar_listado(hojas, HojaVidaSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                     OBTENER (GET/{id})
@@ -0,0 +1,32 @@
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from logins.authentication.token_version import CLAIM_TOKEN_VERSION, obtener_token_version
+
+
+class JWTStatelessAuthentication(JWTStatelessUserAuthentication):
+    """
+    Autenticación JWT sin cargar el Login desde la BD en cada request.
+
+    request.user es un TokenUser construido con los claims que emite
+    LoginService.autenticar_usuario (login_id, rol, username); los
+    permisos ya se resuelven con el claim `rol` (ver RolPermission).
+
+    La revocación se controla con `token_version`: el token se rechaza si
+    su versión no coincide con la vigente del login (cacheada), o si el
+    login fue eliminado o desactivado.
+    """
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+
+        version_vigente = obtener_token_version(validated_token[api_settings.USER_ID_CLAIM])
+        if version_vigente is None:
+            raise AuthenticationFailed("El usuario no existe o está inactivo.", code="user_inactive")
+
+        # Tokens emitidos antes de existir el claim equivalen a la versión 0
+        if validated_token.get(CLAIM_TOKEN_VERSION, 0) != version_vigente:
+            raise AuthenticationFailed("El token fue revocado.", code="token_revoked")
+
+        return user
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from logins.repositories.login_repository import LoginRepository
+
+# Claim del access token con la versión vigente al emitirlo
+CLAIM_TOKEN_VERSION = "token_version"
+
+# Marca en caché para logins inexistentes o inactivos
+_SIN_ACCESO = -1
+
+
+def _llave(id_login) -> str:
+    return f"auth:token_version:{id_login}"
+
+
+def obtener_token_version(id_login):
+    """
+    Retorna la versión de token vigente del login, o None si el login
+    no existe o está inactivo. Se cachea TOKEN_VERSION_CACHE_TTL segundos,
+    así que la BD solo se consulta una vez por login y periodo.
+    """
+    version = cache.get(_llave(id_login))
+
+    if version is None:
+        version = LoginRepository.get_token_version(id_login=id_login)
+        if version is None:
+            version = _SIN_ACCESO
+        cache.set(_llave(id_login), version, timeout=settings.TOKEN_VERSION_CACHE_TTL)
+
+    return None if version == _SIN_ACCESO else version
+
+
+def olvidar_token_version(id_login):
+    """
+    Descarta la versión cacheada al confirmarse la transacción actual,
+    para que el siguiente request lea la versión nueva desde la BD.
+    """
+    transaction.on_commit(lambda: cache.delete(_llave(id_login)))
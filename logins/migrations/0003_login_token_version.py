@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logins', '0002_alter_login_rol'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='login',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
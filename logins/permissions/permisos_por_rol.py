@@ -10,6 +10,7 @@ ROLE_PERMISSIONS = {
         "login:partial_update",
         "login:destroy",
         "login:obtener_por_usuario",
+        "login:revocar_sesiones",
 
         # -------------------------------------------------------
         #                 USUARIO
@@ -36,6 +37,8 @@ ROLE_PERMISSIONS = {
         "maquinaria:maquinarias_pendientes",
         "maquinaria:maquinarias_al_dia",
         "maquinaria:ultimas_maquinarias",
+        "maquinaria:timeline",
+        "maquinaria:proximos_mantenimientos",
 
         # -------------------------------------------------------
         #                 CONDUCTOR
@@ -84,6 +87,7 @@ ROLE_PERMISSIONS = {
         #                 MANTENIMIENTO
         # -------------------------------------------------------
         "mantenimiento:list",
+        "mantenimiento:exportar",
         "mantenimiento:retrieve",
         "mantenimiento:create",
         "mantenimiento:update",
@@ -92,6 +96,16 @@ ROLE_PERMISSIONS = {
         "mantenimiento:mantenimientos_por_maquina",
         "mantenimiento:mantenimientos_por_usuario",
 
+        # -------------------------------------------------------
+        #                 COSTOS DE MANTENIMIENTO
+        # -------------------------------------------------------
+        "costo_mantenimiento:por_maquina",
+        "costo_mantenimiento:top_maquinas",
+        "costo_mantenimiento:por_tipo",
+        "costo_mantenimiento:por_programado",
+        "costo_mantenimiento:por_mes",
+        "costo_mantenimiento:costo_por_hora",
+
         # -------------------------------------------------------
         #                 HOJA DE VIDA
         # -------------------------------------------------------
@@ -118,20 +132,34 @@ ROLE_PERMISSIONS = {
         #                 REGISTRO HORAS MAQUINARIA
         # -------------------------------------------------------
         "registro_horas_maquinaria:list",
+        "registro_horas_maquinaria:exportar",
         "registro_horas_maquinaria:retrieve",
         "registro_horas_maquinaria:create",
+        "registro_horas_maquinaria:importar",
         "registro_horas_maquinaria:update",
         "registro_horas_maquinaria:partial_update",
         "registro_horas_maquinaria:destroy",
-        "registro_horas_maquinaria:registros_por_maquinas",
+        "registro_horas_maquinaria:registros_por_maquina",
+
+        # -------------------------------------------------------
+        #                 UTILIZACIÓN
+        # -------------------------------------------------------
+        "utilizacion:por_maquina",
+        "utilizacion:por_proyecto",
+        "utilizacion:por_operador",
 
         # -------------------------------------------------------
         #                 ALARMA
         # -------------------------------------------------------
         "alarma:list",
+        "alarma:exportar",
+        "alarma:historial",
         "alarma:retrieve",
         "alarma:marcar_como_vista",
+        "alarma:marcar_vistas",
+        "alarma:eliminar_masivo",
         "alarma:cantidad_no_vistas",
+        "alarma:eventos",
 
     },
     "RESPONSABLE_DE_MANTENIMIENTO": {
@@ -146,6 +174,8 @@ ROLE_PERMISSIONS = {
         "maquinaria:maquinarias_pendientes",
         "maquinaria:maquinarias_al_dia",
         "maquinaria:ultimas_maquinarias",
+        "maquinaria:timeline",
+        "maquinaria:proximos_mantenimientos",
 
         # -------------------------------------------------------
         #                 MANTENIMIENTO PROGRAMADO
@@ -162,6 +192,7 @@ ROLE_PERMISSIONS = {
         #                 MANTENIMIENTO
         # -------------------------------------------------------
         "mantenimiento:list",
+        "mantenimiento:exportar",
         "mantenimiento:retrieve",
         "mantenimiento:create",
         "mantenimiento:update",
@@ -170,6 +201,16 @@ ROLE_PERMISSIONS = {
         "mantenimiento:mantenimientos_por_maquina",
         "mantenimiento:mantenimientos_por_usuario",
 
+        # -------------------------------------------------------
+        #                 COSTOS DE MANTENIMIENTO
+        # -------------------------------------------------------
+        "costo_mantenimiento:por_maquina",
+        "costo_mantenimiento:top_maquinas",
+        "costo_mantenimiento:por_tipo",
+        "costo_mantenimiento:por_programado",
+        "costo_mantenimiento:por_mes",
+        "costo_mantenimiento:costo_por_hora",
+
         # -------------------------------------------------------
         #                 HOJA DE VIDA
         # -------------------------------------------------------
@@ -180,8 +221,18 @@ ROLE_PERMISSIONS = {
         #                 ALARMA
         # -------------------------------------------------------
         "alarma:list",
+        "alarma:exportar",
+        "alarma:historial",
         "alarma:retrieve",
         "alarma:cantidad_no_vistas",
+        "alarma:eventos",
+
+        # -------------------------------------------------------
+        #                 UTILIZACIÓN
+        # -------------------------------------------------------
+        "utilizacion:por_maquina",
+        "utilizacion:por_proyecto",
+        "utilizacion:por_operador",
     },
     "OPERADOR": {
         # -------------------------------------------------------
@@ -195,17 +246,21 @@ ROLE_PERMISSIONS = {
         "maquinaria:maquinarias_pendientes",
         "maquinaria:maquinarias_al_dia",
         "maquinaria:ultimas_maquinarias",
+        "maquinaria:timeline",
+        "maquinaria:proximos_mantenimientos",
 
         # -------------------------------------------------------
         #                 REGISTRO HORAS MAQUINARIA
         # -------------------------------------------------------
         "registro_horas_maquinaria:list",
+        "registro_horas_maquinaria:exportar",
         "registro_horas_maquinaria:retrieve",
         "registro_horas_maquinaria:create",
+        "registro_horas_maquinaria:importar",
         "registro_horas_maquinaria:update",
         "registro_horas_maquinaria:partial_update",
         "registro_horas_maquinaria:destroy",
-        "registro_horas_maquinaria:registros_por_maquinas",
+        "registro_horas_maquinaria:registros_por_maquina",
 
         # -------------------------------------------------------
         #                 MANTENIMIENTO PROGRAMADO
@@ -235,8 +290,11 @@ ROLE_PERMISSIONS = {
         #                 ALARMA
         # -------------------------------------------------------
         "alarma:list",
+        "alarma:exportar",
+        "alarma:historial",
         "alarma:retrieve",
         "alarma:cantidad_no_vistas",
+        "alarma:eventos",
     },
     "TECNICO_DE_MANTENIMIENTO": {
         # -------------------------------------------------------
@@ -250,6 +308,8 @@ ROLE_PERMISSIONS = {
         "maquinaria:maquinarias_pendientes",
         "maquinaria:maquinarias_al_dia",
         "maquinaria:ultimas_maquinarias",
+        "maquinaria:timeline",
+        "maquinaria:proximos_mantenimientos",
 
         # -------------------------------------------------------
         #                 HOJA DE VIDA
@@ -273,6 +333,7 @@ ROLE_PERMISSIONS = {
         #                 MANTENIMIENTO
         # -------------------------------------------------------
         "mantenimiento:list",
+        "mantenimiento:exportar",
         "mantenimiento:retrieve",
         "mantenimiento:create",
         "mantenimiento:update",
@@ -285,7 +346,10 @@ ROLE_PERMISSIONS = {
         #                 ALARMA
         # -------------------------------------------------------
         "alarma:list",
+        "alarma:exportar",
+        "alarma:historial",
         "alarma:retrieve",
         "alarma:cantidad_no_vistas",
+        "alarma:eventos",
     }
 }
\ No newline at end of file
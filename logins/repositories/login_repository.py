@@ -1,6 +1,9 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F
 
 from logins.models.login import Login
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class LoginRepository:
@@ -15,9 +18,14 @@ class LoginRepository:
     # -------------------------
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todos los logins registrados."""
-        return Login.objects.all()
+        return limitar_columnas(Login.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los logins paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(Login.objects.all(), columnas), cursor, page_size)
 
     @staticmethod
     def get_by_id(**kwargs):
@@ -58,6 +66,19 @@ class LoginRepository:
         except ObjectDoesNotExist:
             return None
 
+    @staticmethod
+    def get_token_version(id_login: int):
+        """
+        Retorna la versión de token vigente de un login activo.
+        Retorna None si el login no existe o está inactivo.
+        """
+        return (
+            Login.objects
+            .filter(id_login=id_login, is_active=True)
+            .values_list('token_version', flat=True)
+            .first()
+        )
+
     # -------------------------
     # Operaciones CRUD
     # -------------------------
@@ -81,6 +102,16 @@ class LoginRepository:
         login.save()
         return login
 
+    @staticmethod
+    def incrementar_token_version(login: Login):
+        """
+        Incrementa atómicamente la versión de token del login
+        (revoca todos sus JWT emitidos hasta ahora).
+        """
+        Login.objects.filter(pk=login.pk).update(token_version=F('token_version') + 1)
+        login.refresh_from_db(fields=['token_version'])
+        return login
+
     @staticmethod
     def delete(login: Login):
         """
@@ -2,9 +2,10 @@ from django.core.validators import RegexValidator
 from rest_framework import serializers
 
 from logins.models.login import Login
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class LoginCreateSerializer(serializers.ModelSerializer):
+class LoginCreateSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Login
         fields = [
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
 from logins.models.login import Login
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class LoginDetailSerializer(serializers.ModelSerializer):
+class LoginDetailSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Login
         fields = [
@@ -1,8 +1,10 @@
 import time
 
+from django.db import transaction
 from rest_framework.exceptions import AuthenticationFailed, ValidationError
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from logins.authentication.token_version import CLAIM_TOKEN_VERSION, olvidar_token_version
 from logins.models.login import Login
 from logins.repositories.login_repository import LoginRepository
 from logins.serializers.login_create_serializer import LoginCreateSerializer
@@ -14,6 +16,9 @@ class LoginService(ILoginService):
     Servicio profesional para la autenticación de logins.
     """
 
+    # Campos cuyo cambio invalida los tokens ya emitidos
+    CAMPOS_QUE_REVOCAN = {"password", "username", "rol", "is_active"}
+
     # ================================================================
     # Crear Login
     # ================================================================
@@ -84,6 +89,7 @@ class LoginService(ILoginService):
         # Campos extra en el token
         access["rol"] = login.rol
         access["username"] = login.username
+        access[CLAIM_TOKEN_VERSION] = login.token_version
         access["iat"] = int(time.time())
 
         return {
@@ -94,11 +100,15 @@ class LoginService(ILoginService):
     # ================================================================
     # LISTAR LOGINS
     # ================================================================
-    def listar_logins(self):
+    def listar_logins(self, columnas=None):
         """
         Retorna todos los logins registrados.
         """
-        return LoginRepository.get_all()
+        return LoginRepository.get_all(columnas=columnas)
+
+    def listar_logins_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los logins (paginación por cursor)."""
+        return LoginRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ================================================================
     # OBTENER LOGIN POR ID
@@ -121,6 +131,7 @@ class LoginService(ILoginService):
     # ================================================================
     # ACTUALIZAR LOGIN
     # ================================================================
+    @transaction.atomic
     def actualizar_login(self, id_login: int, data: dict):
         """
         Actualiza credenciales.
@@ -136,6 +147,13 @@ class LoginService(ILoginService):
 
         validated = serializer.validated_data
 
+        # Un cambio de credenciales, rol o estado revoca los tokens emitidos
+        # (sus claims `rol`/`username` quedarían desactualizados)
+        revocar = any(
+            campo == "password" or getattr(login, campo) != validated[campo]
+            for campo in self.CAMPOS_QUE_REVOCAN & set(validated)
+        )
+
         # Si se envía password, debe hashearse
         if "password" in validated:
             raw_password = validated.pop("password")
@@ -147,10 +165,32 @@ class LoginService(ILoginService):
             if existing and existing.id_login != login.id_login:
                 raise ValidationError({"username": "Este nombre de usuario ya existe."})
 
-
         # Actualizar con el repository
         login = LoginRepository.update(login, **validated)
 
+        if revocar:
+            self._revocar_tokens(login)
+
+        return login
+
+    # ================================================================
+    # REVOCAR SESIONES
+    # ================================================================
+    @transaction.atomic
+    def revocar_sesiones(self, id_login: int):
+        """
+        Invalida todos los tokens emitidos para el login
+        (cierre de sesión en todos los dispositivos).
+        """
+        login = LoginRepository.get_by_id(id_login=id_login)
+        if not login:
+            raise ValidationError({"detail": "Login no encontrado."})
+
+        return self._revocar_tokens(login)
+
+    def _revocar_tokens(self, login):
+        login = LoginRepository.incrementar_token_version(login)
+        olvidar_token_version(login.id_login)
         return login
 
     # ================================================================
@@ -162,4 +202,5 @@ class LoginService(ILoginService):
             raise ValidationError({"detail": "Login no encontrado."})
 
         LoginRepository.delete(login)
+        olvidar_token_version(id_login)
         return True
\ No newline at end of file
@@ -33,12 +33,17 @@ class ILoginService(ABC):
         pass
 
     @abstractmethod
-    def listar_logins(self):
+    def listar_logins(self, columnas=None):
         """
         Retorna todos los logins registrados.
         """
         pass
 
+    @abstractmethod
+    def listar_logins_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los logins paginada por cursor."""
+        pass
+
     @abstractmethod
     def obtener_login(self, id_login: int):
         """
@@ -61,6 +66,13 @@ class ILoginService(ABC):
         """
         pass
 
+    @abstractmethod
+    def revocar_sesiones(self, id_login: int):
+        """
+        Invalida todos los tokens emitidos para el login.
+        """
+        pass
+
     @abstractmethod
     def eliminar_login(self, id_login: int):
         """
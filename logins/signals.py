@@ -1,8 +1,8 @@
 from django.db.models.signals import post_migrate
 from django.dispatch import receiver
 
+from comun.servicios import obtener_servicio
 from logins.models import Login
-from logins.services.login_service import LoginService
 from usuarios.models.usuario import Usuario
 
 
@@ -38,5 +38,5 @@ def crear_usuario_predeterminado(sender, **kwargs):
         "is_active": True
     }
 
-    service = LoginService()
+    service = obtener_servicio("login")
     service.crear_login(data=login)
@@ -4,15 +4,20 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework_simplejwt.exceptions import AuthenticationFailed
 
+from logins.models.login import Login
 from logins.permissions.rol_permissions import RolPermission
 from logins.serializers.login_detail_serializer import LoginDetailSerializer
 from logins.serializers.login_response_serializer import LoginResponseSerializer
-from logins.services.login_service import LoginService
 from logins.services.login_service_interface import ILoginService
 from usuarios.serializers.usuario_serializer import UsuarioSerializer
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class LoginViewSet(viewsets.ModelViewSet):
+class LoginViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de logins (credenciales).
     Mantiene los principios SOLID delegando la lógica al servicio.
@@ -23,22 +28,28 @@ class LoginViewSet(viewsets.ModelViewSet):
     """
     permission_key = "login"
     permission_classes = [RolPermission]
+    modelo_condicional = Login
     def __init__(
         self,
-        service: ILoginService = LoginService(),
+        service: ILoginService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("login")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todos los logins registrados."""
-        logins = self.service.listar_logins()
-        serializer = LoginDetailSerializer(logins, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, LoginDetailSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_logins_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, LoginDetailSerializer, campos=campos)
+
+        logins = self.service.listar_logins(columnas=columnas)
+        return Response(serializar_listado(logins, LoginDetailSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                 OBTENER (GET/{id})
@@ -106,6 +117,24 @@ class LoginViewSet(viewsets.ModelViewSet):
         except ValidationError as e:
             return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
 
+    # -------------------------------------------------------
+    #       REVOCAR SESIONES (POST /{id}/revocar-sesiones)
+    # -------------------------------------------------------
+    @action(detail=True, methods=["post"], url_path="revocar-sesiones")
+    def revocar_sesiones(self, request, pk=None):
+        """
+        Invalida todos los tokens emitidos para el login
+        (cierre de sesión en todos los dispositivos).
+
+        ejemplo: POST /api/logins/5/revocar-sesiones/
+        """
+        try:
+            self.service.revocar_sesiones(id_login=pk)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
     # -------------------------------------------------------
     #                LOGIN (POST /login)
     # -------------------------------------------------------
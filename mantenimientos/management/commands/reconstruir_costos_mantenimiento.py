@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from comun.servicios import obtener_servicio
+
+
+class Command(BaseCommand):
+    """
+    Reconstruye la tabla de costos mensuales (CostoMantenimientoMes)
+    desde el histórico de mantenimientos. Necesario una vez al desplegar
+    la tabla; luego MantenimientoService la mantiene al día.
+
+    Uso:
+        python manage.py reconstruir_costos_mantenimiento
+    """
+
+    help = "Reconstruye la tabla costos_mantenimiento_mes desde el histórico."
+
+    def handle(self, *args, **options):
+        total = obtener_servicio("costo_mantenimiento").reconstruir()
+        self.stdout.write(self.style.SUCCESS(
+            f"Se generaron {total} fila(s) de costos mensuales."
+        ))
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mantenimientos', '0006_alter_mantenimiento_foto'),
+        ('mantenimientos_programados', '0005_estadomantenimiento'),
+        ('maquinarias', '0004_alter_maquinaria_foto'),
+        ('usuarios', '0004_alter_usuario_foto'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mantenimiento',
+            index=models.Index(fields=['maquina', 'programado', '-fecha_mantenimiento'], name='idx_mant_maq_prog_fecha'),
+        ),
+    ]
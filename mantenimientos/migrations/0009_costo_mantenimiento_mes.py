@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mantenimientos', '0008_mantenimiento_foto_miniatura'),
+        ('maquinarias', '0005_maquinaria_foto_miniatura'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CostoMantenimientoMes',
+            fields=[
+                ('id_costo', models.BigAutoField(primary_key=True, serialize=False)),
+                ('mes', models.DateField(help_text='Primer día del mes.')),
+                ('tipo_mantenimiento', models.CharField(max_length=20)),
+                ('id_programado', models.IntegerField(blank=True, help_text='ID del mantenimiento programado. Nulo = mantenimientos sin programado.', null=True)),
+                ('costo_total', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('cantidad', models.PositiveIntegerField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('maquina', models.ForeignKey(db_column='id_maquina', on_delete=django.db.models.deletion.CASCADE, related_name='costos_mantenimiento', to='maquinarias.maquinaria')),
+            ],
+            options={
+                'verbose_name': 'Costo de mantenimiento por mes',
+                'verbose_name_plural': 'Costos de mantenimiento por mes',
+                'db_table': 'costos_mantenimiento_mes',
+                'indexes': [models.Index(fields=['mes'], name='idx_costo_mant_mes')],
+                'constraints': [models.UniqueConstraint(fields=('maquina', 'mes', 'tipo_mantenimiento', 'id_programado'), name='uq_costo_mantenimiento_mes', nulls_distinct=False)],
+            },
+        ),
+    ]
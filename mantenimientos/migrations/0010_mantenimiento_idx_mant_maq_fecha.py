@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mantenimientos', '0009_costo_mantenimiento_mes'),
+        ('mantenimientos_programados', '0005_estadomantenimiento'),
+        ('maquinarias', '0005_maquinaria_foto_miniatura'),
+        ('usuarios', '0005_usuario_foto_miniatura'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mantenimiento',
+            index=models.Index(fields=['maquina', '-fecha_mantenimiento', '-id_mantenimiento'], name='idx_mant_maq_fecha'),
+        ),
+    ]
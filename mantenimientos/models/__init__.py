@@ -0,0 +1,2 @@
+from .mantenimiento import Mantenimiento
+from .costo_mantenimiento_mes import CostoMantenimientoMes
@@ -0,0 +1,57 @@
+from django.db import models
+
+from maquinarias.models.maquinaria import Maquinaria
+
+
+class CostoMantenimientoMes(models.Model):
+    """
+    Costo de mantenimientos agregado por mes, máquina, tipo y programado.
+
+    Es una tabla derivada de Mantenimiento: MantenimientoService la
+    actualiza al crear, editar o eliminar mantenimientos (solo el mes y
+    la máquina afectados), así los reportes de costos recorren resúmenes
+    y no mantenimientos. Se reconstruye con
+    `python manage.py reconstruir_costos_mantenimiento`.
+    """
+
+    id_costo = models.BigAutoField(primary_key=True)
+
+    mes = models.DateField(help_text="Primer día del mes.")
+
+    maquina = models.ForeignKey(
+        Maquinaria,
+        on_delete=models.CASCADE,
+        db_column='id_maquina',
+        related_name='costos_mantenimiento'
+    )
+
+    tipo_mantenimiento = models.CharField(max_length=20)
+
+    id_programado = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text="ID del mantenimiento programado. Nulo = mantenimientos sin programado."
+    )
+
+    costo_total = models.DecimalField(max_digits=14, decimal_places=2)
+    cantidad = models.PositiveIntegerField()
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'costos_mantenimiento_mes'
+        verbose_name = "Costo de mantenimiento por mes"
+        verbose_name_plural = "Costos de mantenimiento por mes"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['maquina', 'mes', 'tipo_mantenimiento', 'id_programado'],
+                name='uq_costo_mantenimiento_mes',
+                nulls_distinct=False
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['mes'], name='idx_costo_mant_mes'),
+        ]
+
+    def __str__(self):
+        return f"{self.mes:%Y-%m} - Máquina #{self.maquina_id} - {self.tipo_mantenimiento}: {self.costo_total}"
@@ -56,6 +56,7 @@ class Mantenimiento(models.Model):
 
     costo = models.DecimalField(max_digits=10, decimal_places=2)
     foto = models.CharField(max_length=500, null=True, blank=True)
+    foto_miniatura = models.CharField(max_length=500, null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -64,6 +65,18 @@ class Mantenimiento(models.Model):
         db_table = 'mantenimientos'
         verbose_name = "Mantenimiento"
         verbose_name_plural = "Mantenimientos"
+        indexes = [
+            # Último mantenimiento de un programado en una máquina
+            models.Index(
+                fields=['maquina', 'programado', '-fecha_mantenimiento'],
+                name='idx_mant_maq_prog_fecha'
+            ),
+            # Historia de la máquina (timeline), más reciente primero
+            models.Index(
+                fields=['maquina', '-fecha_mantenimiento', '-id_mantenimiento'],
+                name='idx_mant_maq_fecha'
+            ),
+        ]
 
     def __str__(self):
         return f"Mantenimiento #{self.id_mantenimiento} - {self.tipo_mantenimiento}"
@@ -0,0 +1,134 @@
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Count, DateField, Q, Sum
+from django.db.models.functions import TruncMonth
+
+from mantenimientos.models.costo_mantenimiento_mes import CostoMantenimientoMes
+from mantenimientos.models.mantenimiento import Mantenimiento
+from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
+from maquinarias.models.maquinaria import Maquinaria
+
+
+class CostoMantenimientoRepository:
+    """
+    Repositorio de la tabla CostoMantenimientoMes (costos de mantenimiento
+    agregados por mes, máquina, tipo y programado).
+    """
+
+    # Columna de CostoMantenimientoMes por la que se agrupa cada reporte
+    AGRUPACIONES = {
+        "maquina": "maquina_id",
+        "tipo": "tipo_mantenimiento",
+        "programado": "id_programado",
+        "mes": "mes",
+    }
+
+    # ---------------------------------------------------------
+    # MANTENIMIENTO DE LA TABLA
+    # ---------------------------------------------------------
+    @staticmethod
+    def _agregar_mantenimientos(queryset):
+        """Agrupa mantenimientos por mes, máquina, tipo y programado (TruncMonth en la BD)."""
+        return (
+            queryset
+            .annotate(mes=TruncMonth("fecha_mantenimiento", output_field=DateField()))
+            .values("mes", "maquina_id", "tipo_mantenimiento", "programado_id")
+            .annotate(costo_total=Sum("costo"), cantidad=Count("pk"))
+            .order_by()
+        )
+
+    @staticmethod
+    def _instancias(filas):
+        return [
+            CostoMantenimientoMes(
+                mes=fila["mes"],
+                maquina_id=fila["maquina_id"],
+                tipo_mantenimiento=fila["tipo_mantenimiento"],
+                id_programado=fila["programado_id"],
+                costo_total=fila["costo_total"],
+                cantidad=fila["cantidad"],
+            )
+            for fila in filas
+        ]
+
+    @staticmethod
+    @transaction.atomic
+    def recalcular(id_maquina, meses=None):
+        """
+        Recalcula los costos de una máquina en los meses dados ([date día 1])
+        o en todos sus meses si `meses` es None. Bloquea la fila de la
+        máquina para que dos recálculos concurrentes no se pisen.
+        Retorna la cantidad de filas insertadas.
+        """
+        list(Maquinaria.objects.select_for_update().filter(pk=id_maquina).values_list("pk"))
+
+        costos = CostoMantenimientoMes.objects.filter(maquina_id=id_maquina)
+        mantenimientos = Mantenimiento.objects.filter(maquina_id=id_maquina)
+        if meses is not None:
+            costos = costos.filter(mes__in=meses)
+            mantenimientos = mantenimientos.filter(reduce(or_, (
+                Q(fecha_mantenimiento__gte=mes, fecha_mantenimiento__lt=_mes_siguiente(mes))
+                for mes in meses
+            )))
+
+        costos.delete()
+        nuevos = CostoMantenimientoRepository._instancias(
+            CostoMantenimientoRepository._agregar_mantenimientos(mantenimientos)
+        )
+        CostoMantenimientoMes.objects.bulk_create(nuevos)
+        return len(nuevos)
+
+    @staticmethod
+    def reemplazar_todos():
+        """
+        Reconstruye la tabla completa desde los mantenimientos.
+        Debe ejecutarse dentro de una transacción.
+        """
+        CostoMantenimientoMes.objects.all().delete()
+        nuevos = CostoMantenimientoRepository._instancias(
+            CostoMantenimientoRepository._agregar_mantenimientos(Mantenimiento.objects.all())
+        )
+        CostoMantenimientoMes.objects.bulk_create(nuevos, batch_size=1000)
+        return len(nuevos)
+
+    # ---------------------------------------------------------
+    # CONSULTAS
+    # ---------------------------------------------------------
+    @staticmethod
+    def get_totales(agrupacion, desde, hasta, id_maquina=None, limite=None):
+        """
+        Suma costo y cantidad de mantenimientos en los meses [desde, hasta)
+        agrupados por `agrupacion` (maquina, tipo, programado o mes).
+        Ordena por mes, o por costo descendente en las demás agrupaciones.
+        Retorna un queryset .values() con el campo agrupado, costo_total y cantidad.
+        """
+        campo = CostoMantenimientoRepository.AGRUPACIONES[agrupacion]
+
+        queryset = CostoMantenimientoMes.objects.filter(mes__gte=desde, mes__lt=hasta)
+        if id_maquina:
+            queryset = queryset.filter(maquina_id=id_maquina)
+
+        queryset = (
+            queryset
+            .values(campo)
+            .annotate(costo_total=Sum("costo_total"), cantidad=Sum("cantidad"))
+            .order_by(campo if agrupacion == "mes" else "-costo_total")
+        )
+        return queryset[:limite] if limite else queryset
+
+    @staticmethod
+    def get_nombres_maquinas(ids):
+        """Retorna {id_maquina: nombre_maquina} (una consulta)."""
+        return dict(Maquinaria.objects.filter(pk__in=ids).values_list("pk", "nombre_maquina"))
+
+    @staticmethod
+    def get_nombres_programados(ids):
+        """Retorna {id_programado: nombre} (una consulta)."""
+        return dict(MantenimientoProgramado.objects.filter(pk__in=ids).values_list("pk", "nombre"))
+
+
+def _mes_siguiente(mes):
+    return (mes.replace(day=28) + timedelta(days=4)).replace(day=1)
@@ -1,6 +1,8 @@
 from django.core.exceptions import ObjectDoesNotExist
 
 from mantenimientos.models.mantenimiento import Mantenimiento
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class MantenimientoRepository:
@@ -11,9 +13,14 @@ class MantenimientoRepository:
     """
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todos los mantenimientos."""
-        return Mantenimiento.objects.all()
+        return limitar_columnas(Mantenimiento.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los mantenimientos paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(Mantenimiento.objects.all(), columnas), cursor, page_size)
 
     @staticmethod
     def get_by_id(**kwargs):
@@ -76,6 +83,22 @@ class MantenimientoRepository:
         return True
 
 
+    @staticmethod
+    def get_para_exportar(campos, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """
+        Retorna un queryset .values(*campos) ordenado por llave primaria,
+        con los filtros de fecha (fecha_mantenimiento) y máquina aplicados en SQL.
+        """
+        filtros = {}
+        if fecha_inicio:
+            filtros["fecha_mantenimiento__gte"] = fecha_inicio
+        if fecha_fin:
+            filtros["fecha_mantenimiento__lte"] = fecha_fin
+        if id_maquina:
+            filtros["maquina_id"] = id_maquina
+
+        return Mantenimiento.objects.filter(**filtros).values(*campos).order_by('pk')
+
     @staticmethod
     def get_by_maquina(id_maquina):
         """
@@ -84,6 +107,17 @@ class MantenimientoRepository:
         """
         return Mantenimiento.objects.filter(maquina_id=id_maquina)
 
+    @staticmethod
+    def get_page_by_maquina(id_maquina, cursor=None, page_size=None):
+        """
+        Retorna una página de los mantenimientos de una máquina paginada por cursor
+        (más recientes primero).
+        """
+        return paginar_por_cursor(
+            Mantenimiento.objects.filter(maquina_id=id_maquina),
+            cursor, page_size, orden='-pk'
+        )
+
     @staticmethod
     def get_by_usuario(id_usuario):
         """
@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+
+class CostoMantenimientoParametrosSerializer(serializers.Serializer):
+    """
+    Valida los parámetros de query de los reportes de costos:
+    ?desde=YYYY-MM-DD&hasta=YYYY-MM-DD&maquina=<id>&limite=<n>
+    Los reportes cubren los meses completos que contienen [desde, hasta].
+    """
+
+    desde = serializers.DateField(required=False)
+    hasta = serializers.DateField(required=False)
+    maquina = serializers.IntegerField(min_value=1, required=False, source="id_maquina")
+    limite = serializers.IntegerField(min_value=1, max_value=100, required=False)
+
+    def validate(self, attrs):
+        if attrs.get("desde") and attrs.get("hasta") and attrs["desde"] > attrs["hasta"]:
+            raise serializers.ValidationError({"desde": "La fecha inicial no puede ser posterior a la final."})
+        return attrs
@@ -0,0 +1,43 @@
+from rest_framework import serializers
+
+
+class CostoAgrupadoSerializer(serializers.Serializer):
+    """
+    Costos de una clave del reporte: máquina o programado (id), tipo
+    (texto) o mes (fecha del primer día), según la agrupación.
+    """
+
+    clave = serializers.ReadOnlyField()
+    nombre = serializers.CharField(allow_null=True)
+    costo_total = serializers.DecimalField(max_digits=14, decimal_places=2)
+    cantidad = serializers.IntegerField()
+    costo_promedio = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class CostoMantenimientoReporteSerializer(serializers.Serializer):
+    """Respuesta de los reportes de costos agrupados (ver CostoMantenimientoService.obtener_costos)."""
+
+    agrupacion = serializers.CharField()
+    desde = serializers.DateField()
+    hasta = serializers.DateField()
+    costo_total = serializers.DecimalField(max_digits=14, decimal_places=2)
+    cantidad = serializers.IntegerField()
+    resultados = CostoAgrupadoSerializer(many=True)
+
+
+class CostoPorHoraSerializer(serializers.Serializer):
+    """Costo por hora trabajada de una máquina; `costo_por_hora` es nulo si no registró horas."""
+
+    id_maquina = serializers.IntegerField()
+    nombre = serializers.CharField(allow_null=True)
+    costo_total = serializers.DecimalField(max_digits=14, decimal_places=2)
+    horas_trabajadas = serializers.DecimalField(max_digits=14, decimal_places=2)
+    costo_por_hora = serializers.DecimalField(max_digits=14, decimal_places=2, allow_null=True)
+
+
+class CostoPorHoraReporteSerializer(serializers.Serializer):
+    """Respuesta del reporte de costo por hora (ver CostoMantenimientoService.obtener_costo_por_hora)."""
+
+    desde = serializers.DateField()
+    hasta = serializers.DateField()
+    resultados = CostoPorHoraSerializer(many=True)
@@ -3,8 +3,12 @@ from datetime import date
 from django.core.validators import RegexValidator, MinValueValidator
 from rest_framework import serializers
 from mantenimientos.models.mantenimiento import Mantenimiento
+from comun.estado_subidas import EstadoSubidaField
+from comun.seleccion_campos import CamposDinamicosMixin
 
-class MantenimientoSerializer(serializers.ModelSerializer):
+class MantenimientoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+
+    foto_estado = EstadoSubidaField("foto")
 
     class Meta:
         model = Mantenimiento
@@ -19,11 +23,13 @@ class MantenimientoSerializer(serializers.ModelSerializer):
             'horas_realizadas',
             'costo',
             'foto',
+            'foto_miniatura',
+            'foto_estado',
             'created_at',
             'updated_at'
         ]
 
-        read_only_fields = ('id_mantenimiento', 'created_at', 'updated_at')
+        read_only_fields = ('id_mantenimiento', 'foto_miniatura', 'created_at', 'updated_at')
 
         extra_kwargs = {
             'programado': {
@@ -0,0 +1,176 @@
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from comun.servicios import Dependencia
+from mantenimientos.models.mantenimiento import Mantenimiento
+from mantenimientos.repositories.costo_mantenimiento_repository import CostoMantenimientoRepository
+from mantenimientos.services.costo_mantenimiento_service_interface import ICostoMantenimientoService
+from registros_horas_maquinaria.models.resumen_horas_periodo import ResumenHorasPeriodo
+from registros_horas_maquinaria.services.utilizacion_service import desplazar_periodo
+
+CENTAVOS = Decimal("0.01")
+
+
+class CostoMantenimientoService(ICostoMantenimientoService):
+    """
+    Servicio de analítica de costos de mantenimiento.
+
+    Responsabilidades:
+    - Costos por máquina, tipo de mantenimiento, programado y mes
+    - Costo por hora de operación (costos vs. horas de registros)
+    - Máquinas con mayor costo
+    - Mantener CostoMantenimientoMes: cada cambio en un mantenimiento
+      recalcula solo su mes y su máquina, así los reportes recorren
+      resúmenes mensuales y no mantenimientos
+    """
+
+    # Inyección de dependencias de otros servicios (ver comun.servicios)
+    utilizacion_service = Dependencia("utilizacion")
+
+    # Meses que cubren los reportes cuando no se indica `desde`
+    MESES_POR_DEFECTO = 12
+
+    # ----------------------------------------------------------------------
+    # UTILIDAD: rango de meses
+    # ----------------------------------------------------------------------
+    def _rango_meses(self, desde, hasta):
+        """Retorna (primer mes, mes siguiente al último) de los meses que contienen [desde, hasta]."""
+        actual = date.today().replace(day=1)
+        fin = desplazar_periodo((hasta or actual).replace(day=1), ResumenHorasPeriodo.MES)
+        inicio = (
+            desde.replace(day=1) if desde
+            else desplazar_periodo(actual, ResumenHorasPeriodo.MES, 1 - self.MESES_POR_DEFECTO)
+        )
+        if inicio >= fin:
+            raise ValidationError({"desde": "La fecha inicial no puede ser posterior a la final."})
+        return inicio, fin
+
+    def _nombres(self, agrupacion, claves):
+        if agrupacion == "maquina":
+            return CostoMantenimientoRepository.get_nombres_maquinas(claves)
+        if agrupacion == "programado":
+            return CostoMantenimientoRepository.get_nombres_programados([c for c in claves if c is not None])
+        if agrupacion == "tipo":
+            return dict(Mantenimiento._meta.get_field("tipo_mantenimiento").choices)
+        return {mes: f"{mes:%Y-%m}" for mes in claves}
+
+    # ----------------------------------------------------------------------
+    # Costos agrupados
+    # ----------------------------------------------------------------------
+    def obtener_costos(self, agrupacion: str, desde=None, hasta=None, id_maquina=None, limite=None):
+        """
+        Retorna el costo total, la cantidad y el costo promedio de los
+        mantenimientos de los meses que contienen [desde, hasta], agrupados
+        por máquina, tipo, programado o mes. Con `limite` retorna solo las
+        `limite` claves de mayor costo (p. ej. top-N de máquinas).
+        """
+        if agrupacion not in CostoMantenimientoRepository.AGRUPACIONES:
+            raise ValidationError({"agrupacion": "Agrupación no soportada."})
+
+        inicio, fin = self._rango_meses(desde, hasta)
+        campo = CostoMantenimientoRepository.AGRUPACIONES[agrupacion]
+
+        filas = list(CostoMantenimientoRepository.get_totales(
+            agrupacion, inicio, fin, id_maquina=id_maquina, limite=limite
+        ))
+        nombres = self._nombres(agrupacion, [fila[campo] for fila in filas])
+
+        return {
+            "agrupacion": agrupacion,
+            "desde": inicio,
+            "hasta": fin - timedelta(days=1),
+            "costo_total": sum((fila["costo_total"] for fila in filas), Decimal(0)),
+            "cantidad": sum(fila["cantidad"] for fila in filas),
+            "resultados": [
+                {
+                    "clave": fila[campo],
+                    "nombre": nombres.get(fila[campo]),
+                    "costo_total": fila["costo_total"],
+                    "cantidad": fila["cantidad"],
+                    "costo_promedio": (fila["costo_total"] / fila["cantidad"]).quantize(CENTAVOS),
+                }
+                for fila in filas
+            ],
+        }
+
+    # ----------------------------------------------------------------------
+    # Costo por hora de operación
+    # ----------------------------------------------------------------------
+    def obtener_costo_por_hora(self, desde=None, hasta=None, id_maquina=None):
+        """
+        Retorna, por máquina, el costo de mantenimiento, las horas trabajadas
+        (registros de horas) y el costo por hora en los meses que contienen
+        [desde, hasta], de mayor a menor costo por hora. Ambos lados salen
+        de tablas mensuales consolidadas (costos y utilización).
+        """
+        inicio, fin = self._rango_meses(desde, hasta)
+
+        costos = {
+            fila["maquina_id"]: fila["costo_total"]
+            for fila in CostoMantenimientoRepository.get_totales("maquina", inicio, fin, id_maquina=id_maquina)
+        }
+
+        utilizacion = self.utilizacion_service.obtener_utilizacion(
+            ResumenHorasPeriodo.MAQUINA, ResumenHorasPeriodo.MES,
+            desde=inicio, hasta=fin - timedelta(days=1),
+            ids=[id_maquina] if id_maquina else None
+        )
+        horas = defaultdict(Decimal)
+        nombres = {}
+        for fila in utilizacion["resultados"]:
+            horas[fila["id"]] += fila["horas_trabajadas"]
+            nombres[fila["id"]] = fila["nombre"]
+
+        faltantes = costos.keys() - nombres.keys()
+        if faltantes:
+            nombres.update(CostoMantenimientoRepository.get_nombres_maquinas(faltantes))
+
+        resultados = []
+        for id_maq in costos.keys() | horas.keys():
+            costo = costos.get(id_maq, Decimal(0))
+            horas_maquina = horas.get(id_maq, Decimal(0))
+            resultados.append({
+                "id_maquina": id_maq,
+                "nombre": nombres.get(id_maq),
+                "costo_total": costo,
+                "horas_trabajadas": horas_maquina,
+                "costo_por_hora": (costo / horas_maquina).quantize(CENTAVOS) if horas_maquina else None,
+            })
+
+        # Sin horas (costo por hora indefinido) al final
+        resultados.sort(key=lambda r: (r["costo_por_hora"] is None, -(r["costo_por_hora"] or 0), r["id_maquina"]))
+
+        return {
+            "desde": inicio,
+            "hasta": fin - timedelta(days=1),
+            "resultados": resultados,
+        }
+
+    # ----------------------------------------------------------------------
+    # Mantener la tabla de costos
+    # ----------------------------------------------------------------------
+    def actualizar_costos(self, mantenimientos):
+        """
+        Recalcula los costos de los pares (id_maquina, fecha_mantenimiento)
+        dados: solo los meses y máquinas afectados.
+        """
+        meses_por_maquina = defaultdict(set)
+        for id_maquina, fecha in mantenimientos:
+            if id_maquina and fecha:
+                meses_por_maquina[id_maquina].add(fecha.replace(day=1))
+
+        for id_maquina, meses in meses_por_maquina.items():
+            CostoMantenimientoRepository.recalcular(id_maquina, meses)
+
+    def recalcular_maquina(self, id_maquina: int):
+        """Recalcula todos los meses de una máquina (p. ej. al eliminar un programado)."""
+        return CostoMantenimientoRepository.recalcular(id_maquina)
+
+    @transaction.atomic
+    def reconstruir(self):
+        """Reconstruye la tabla completa. Retorna la cantidad de filas generadas."""
+        return CostoMantenimientoRepository.reemplazar_todos()
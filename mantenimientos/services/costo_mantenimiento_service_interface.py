@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+
+
+class ICostoMantenimientoService(ABC):
+    """
+    Interfaz para el servicio de analítica de costos de mantenimiento.
+    Define las operaciones para:
+    - Reportes de costos por máquina, tipo, programado y mes
+    - Costo por hora de operación y máquinas más costosas
+    - Mantenimiento de la tabla de costos mensuales
+    """
+
+    @abstractmethod
+    def obtener_costos(self, agrupacion: str, desde=None, hasta=None, id_maquina=None, limite=None):
+        """Retorna costo total y cantidad de mantenimientos agrupados por `agrupacion`."""
+        pass
+
+    @abstractmethod
+    def obtener_costo_por_hora(self, desde=None, hasta=None, id_maquina=None):
+        """Retorna, por máquina, el costo de mantenimiento por hora trabajada."""
+        pass
+
+    @abstractmethod
+    def actualizar_costos(self, mantenimientos):
+        """Recalcula los meses y máquinas de los pares (id_maquina, fecha) dados."""
+        pass
+
+    @abstractmethod
+    def recalcular_maquina(self, id_maquina: int):
+        """Recalcula todos los meses de una máquina."""
+        pass
+
+    @abstractmethod
+    def reconstruir(self):
+        """Reconstruye la tabla de costos completa desde los mantenimientos."""
+        pass
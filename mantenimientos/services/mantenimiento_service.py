@@ -1,9 +1,8 @@
-import cloudinary.uploader
-from typing import Optional
-
-from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from rest_framework.exceptions import NotFound, ValidationError
 
+from comun.exportacion import iterar
+from comun.servicios import Dependencia
 from mantenimientos.repositories.mantenimiento_repository import MantenimientoRepository
 from mantenimientos.serializers.mantenimiento_serializer import MantenimientoSerializer
 from mantenimientos.services.mantenimiento_service_interface import IMantenimientoService
@@ -19,36 +18,36 @@ class MantenimientoService(IMantenimientoService):
     - Persistencia mediante repository
     """
 
-    # ----------------------------------------------------------------------
-    # UTILIDAD: Guardar archivo físicamente
-    # ----------------------------------------------------------------------
-    def _guardar_foto(self, foto_file: Optional[UploadedFile]) -> Optional[str]:
-        """
-        Guarda la foto del mantenimiento en:
-        mantenimientos/photos/
-
-        Retorna la URL absoluta final que se almacena en la BD.
-        """
-        if not foto_file:
-            return None
-
-        try:
-            resultado = cloudinary.uploader.upload(
-                foto_file,
-                folder="mantenimientos/photos",  # carpeta lógica en Cloudinary
-                resource_type="image"  # forzamos imagen
-            )
-            return resultado.get("secure_url")
-
-        except Exception as e:
-            raise ValidationError({"foto": "Error al subir la imagen"})
+    # Inyección de dependencias de otros servicios (ver comun.servicios)
+    estado_mantenimiento_service = Dependencia("estado_mantenimiento")
+    media_service = Dependencia("media")
+    maquinaria_service = Dependencia("maquinaria")
+    costo_mantenimiento_service = Dependencia("costo_mantenimiento")
+
+    # Columnas (y orden) de la exportación CSV / NDJSON
+    COLUMNAS_EXPORTACION = [
+        "id_mantenimiento",
+        "maquina_id",
+        "maquina__nombre_maquina",
+        "programado_id",
+        "usuario_id",
+        "tipo_mantenimiento",
+        "descripcion",
+        "fecha_mantenimiento",
+        "horas_realizadas",
+        "costo",
+    ]
 
     # ----------------------------------------------------------------------
     # Listar
     # ----------------------------------------------------------------------
-    def listar_mantenimientos(self):
+    def listar_mantenimientos(self, columnas=None):
         """Retorna todos los mantenimientos registrados."""
-        return MantenimientoRepository.get_all()
+        return MantenimientoRepository.get_all(columnas=columnas)
+
+    def listar_mantenimientos_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los mantenimientos (paginación por cursor)."""
+        return MantenimientoRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ----------------------------------------------------------------------
     # Obtener uno
@@ -69,6 +68,12 @@ class MantenimientoService(IMantenimientoService):
         """Retorna mantenimientos filtrados por máquina."""
         return MantenimientoRepository.get_by_maquina(id_maquina)
 
+    def obtener_mantenimientos_por_maquina_paginado(self, id_maquina: int, cursor=None, page_size=None):
+        """Retorna una página de mantenimientos de una máquina (paginación por cursor)."""
+        return MantenimientoRepository.get_page_by_maquina(
+            id_maquina, cursor=cursor, page_size=page_size
+        )
+
     def obtener_mantenimientos_por_usuario(self, id_usuario: int):
         """Retorna mantenimientos filtrados por usuario."""
         return MantenimientoRepository.get_by_usuario(id_usuario)
@@ -76,6 +81,7 @@ class MantenimientoService(IMantenimientoService):
     # ----------------------------------------------------------------------
     # Crear
     # ----------------------------------------------------------------------
+    @transaction.atomic
     def crear_mantenimiento(self, data: dict):
         """
         Crea un nuevo mantenimiento.
@@ -98,23 +104,29 @@ class MantenimientoService(IMantenimientoService):
         serializer.is_valid(raise_exception=True)
         maquinaria = serializer.validated_data.get("maquina", None)
 
-        # Guardar foto si viene en el request
-        if foto_file:
-            ruta_foto = self._guardar_foto(foto_file)
-            serializer.validated_data["foto"] = ruta_foto
-
-        from maquinarias.services.maquinaria_service import MaquinariaService
-        maquinaria_service = MaquinariaService()
-        maquinaria_service.actualizar_estado_maquinaria(id_maquina=maquinaria.id_maquina, estado="operativa")
+        self.maquinaria_service.actualizar_estado_maquinaria(id_maquina=maquinaria.id_maquina, estado="operativa")
         mantenimiento = MantenimientoRepository.create(
             **serializer.validated_data
         )
 
+        # Guardar foto si viene en el request (subida en segundo plano)
+        if foto_file:
+            self.media_service.programar_subida(mantenimiento, "foto", foto_file, carpeta="mantenimientos/photos")
+
+        # Mantener la proyección de estados de mantenimiento
+        self.estado_mantenimiento_service.recalcular_programado(mantenimiento.programado)
+
+        # Costos mensuales: solo el mes y la máquina del mantenimiento
+        self.costo_mantenimiento_service.actualizar_costos(
+            [(mantenimiento.maquina_id, mantenimiento.fecha_mantenimiento)]
+        )
+
         return MantenimientoSerializer(mantenimiento).data
 
     # ----------------------------------------------------------------------
     # Actualizar
     # ----------------------------------------------------------------------
+    @transaction.atomic
     def actualizar_mantenimiento(self, id_mantenimiento: int, data: dict):
         """
         Actualiza un mantenimiento existente.
@@ -146,16 +158,31 @@ class MantenimientoService(IMantenimientoService):
         )
         serializer.is_valid(raise_exception=True)
 
-        # Si suben una nueva foto → guardarla
-        if foto_file:
-            nueva_ruta = self._guardar_foto(foto_file)
-            serializer.validated_data["foto"] = nueva_ruta
+        programado_anterior = mantenimiento.programado
+        costo_anterior = (mantenimiento.maquina_id, mantenimiento.fecha_mantenimiento)
 
         mantenimiento_actualizado = MantenimientoRepository.update(
             id_mantenimiento=id_mantenimiento,
             **serializer.validated_data
         )
 
+        # Si suben una nueva foto → subirla en segundo plano
+        if foto_file:
+            self.media_service.programar_subida(
+                mantenimiento_actualizado, "foto", foto_file, carpeta="mantenimientos/photos"
+            )
+
+        # Mantener la proyección (programado anterior y actual, si cambió)
+        self.estado_mantenimiento_service.recalcular_programado(mantenimiento_actualizado.programado)
+        if programado_anterior and programado_anterior != mantenimiento_actualizado.programado:
+            self.estado_mantenimiento_service.recalcular_programado(programado_anterior)
+
+        # Costos mensuales: mes/máquina anterior y actual (pueden haber cambiado)
+        self.costo_mantenimiento_service.actualizar_costos([
+            costo_anterior,
+            (mantenimiento_actualizado.maquina_id, mantenimiento_actualizado.fecha_mantenimiento),
+        ])
+
         return MantenimientoSerializer(mantenimiento_actualizado).data
 
     # ----------------------------------------------------------------------
@@ -167,8 +194,15 @@ class MantenimientoService(IMantenimientoService):
         Lanza error si no existe.
         """
         mantenimiento = self.obtener_mantenimiento(id_mantenimiento)
+        programado = mantenimiento.programado
 
         MantenimientoRepository.delete(id_mantenimiento)
+
+        # Mantener la proyección de estados de mantenimiento
+        self.estado_mantenimiento_service.recalcular_programado(programado)
+        self.costo_mantenimiento_service.actualizar_costos(
+            [(mantenimiento.maquina_id, mantenimiento.fecha_mantenimiento)]
+        )
         return True
 
     # ----------------------------------------------------------------------
@@ -214,3 +248,19 @@ class MantenimientoService(IMantenimientoService):
             id_programado
         )
 
+    # ----------------------------------------------------------------------
+    # Exportar (streaming)
+    # ----------------------------------------------------------------------
+    def exportar_mantenimientos(self, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """
+        Retorna (columnas, filas) para exportar mantenimientos. Los filtros se
+        aplican en SQL y `filas` es un iterador por bloques: no se
+        materializa el resultado completo en memoria.
+        """
+        queryset = MantenimientoRepository.get_para_exportar(
+            self.COLUMNAS_EXPORTACION,
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            id_maquina=id_maquina
+        )
+        return self.COLUMNAS_EXPORTACION, iterar(queryset)
@@ -12,7 +12,11 @@ class IMantenimientoService(ABC):
         pass
 
     @abstractmethod
-    def listar_mantenimientos(self):
+    def listar_mantenimientos(self, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_mantenimientos_paginado(self, cursor=None, page_size=None, columnas=None):
         pass
 
     @abstractmethod
@@ -23,6 +27,10 @@ class IMantenimientoService(ABC):
     def obtener_mantenimientos_por_maquina(self, id_maquina: int):
         pass
 
+    @abstractmethod
+    def obtener_mantenimientos_por_maquina_paginado(self, id_maquina: int, cursor=None, page_size=None):
+        pass
+
     @abstractmethod
     def obtener_mantenimientos_por_usuario(self, id_usuario: int):
         pass
@@ -49,4 +57,9 @@ class IMantenimientoService(ABC):
         Obtiene el último mantenimiento realizado a una máquina según un
         mantenimiento programado específico.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def exportar_mantenimientos(self, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """Retorna (columnas, iterador de filas) para exportar en streaming."""
+        pass
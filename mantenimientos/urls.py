@@ -1,8 +1,11 @@
 
 from rest_framework.routers import DefaultRouter
+from mantenimientos.views.costo_mantenimiento_view import CostoMantenimientoViewSet
 from mantenimientos.views.mantenimiento_view import MantenimientoViewSet
 
 router = DefaultRouter()
+# Antes del prefijo vacío para que "costos" no se tome como un {pk}
+router.register(r'costos', CostoMantenimientoViewSet, basename='costos_mantenimiento')
 router.register(r'', MantenimientoViewSet, basename='manteniemientos')
 
 urlpatterns = router.urls
\ No newline at end of file
@@ -0,0 +1,120 @@
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from logins.permissions.rol_permissions import RolPermission
+from mantenimientos.serializers.costo_mantenimiento_parametros_serializer import \
+    CostoMantenimientoParametrosSerializer
+from mantenimientos.serializers.costo_mantenimiento_serializer import \
+    CostoMantenimientoReporteSerializer, CostoPorHoraReporteSerializer
+from mantenimientos.services.costo_mantenimiento_service_interface import ICostoMantenimientoService
+from comun.servicios import obtener_servicio
+
+
+class CostoMantenimientoViewSet(viewsets.ViewSet):
+    """
+    Analítica de costos de mantenimiento (sobre la tabla de costos mensuales).
+
+    Parámetros comunes: ?desde=YYYY-MM-DD&hasta=YYYY-MM-DD&maquina=<id>
+    Por defecto cubren los últimos 12 meses, incluido el actual.
+    """
+
+    permission_key = "costo_mantenimiento"
+    permission_classes = [RolPermission]
+
+    # Límite por defecto del top de máquinas más costosas
+    LIMITE_TOP = 10
+
+    def __init__(self, service: ICostoMantenimientoService = None, **kwargs):
+        super().__init__(**kwargs)
+        self.service = service or obtener_servicio("costo_mantenimiento")
+
+    def _parametros(self, request):
+        parametros = CostoMantenimientoParametrosSerializer(data=request.query_params)
+        parametros.is_valid(raise_exception=True)
+        return parametros.validated_data
+
+    def _reporte(self, request, agrupacion, limite=None):
+        try:
+            parametros = self._parametros(request)
+            if limite:
+                parametros.setdefault("limite", limite)
+            data = self.service.obtener_costos(agrupacion, **parametros)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(CostoMantenimientoReporteSerializer(data).data, status=status.HTTP_200_OK)
+
+    # -------------------------------------------------------
+    #                     POR MÁQUINA
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='maquinas')
+    def por_maquina(self, request):
+        """
+        GET /api/mantenimientos/costos/maquinas/
+        Costo total, cantidad y costo promedio por máquina (de mayor a menor costo).
+        """
+        return self._reporte(request, "maquina")
+
+    # -------------------------------------------------------
+    #                     TOP MÁQUINAS
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='top-maquinas')
+    def top_maquinas(self, request):
+        """
+        GET /api/mantenimientos/costos/top-maquinas/?limite=10
+        Las `limite` máquinas con mayor costo de mantenimiento.
+        """
+        return self._reporte(request, "maquina", limite=self.LIMITE_TOP)
+
+    # -------------------------------------------------------
+    #                     POR TIPO
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='tipos')
+    def por_tipo(self, request):
+        """
+        GET /api/mantenimientos/costos/tipos/
+        Costos por tipo de mantenimiento (preventivo, correctivo, predictivo).
+        """
+        return self._reporte(request, "tipo")
+
+    # -------------------------------------------------------
+    #                     POR PROGRAMADO
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='programados')
+    def por_programado(self, request):
+        """
+        GET /api/mantenimientos/costos/programados/
+        Costos por mantenimiento programado (clave null = sin programado).
+        """
+        return self._reporte(request, "programado")
+
+    # -------------------------------------------------------
+    #                     POR MES
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='mensual')
+    def por_mes(self, request):
+        """
+        GET /api/mantenimientos/costos/mensual/
+        Serie mensual de costos (ordenada por mes).
+        """
+        return self._reporte(request, "mes")
+
+    # -------------------------------------------------------
+    #                 COSTO POR HORA DE OPERACIÓN
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='por-hora')
+    def costo_por_hora(self, request):
+        """
+        GET /api/mantenimientos/costos/por-hora/
+        Costo de mantenimiento por hora trabajada de cada máquina.
+        """
+        try:
+            parametros = self._parametros(request)
+            parametros.pop("limite", None)
+            data = self.service.obtener_costo_por_hora(**parametros)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(CostoPorHoraReporteSerializer(data).data, status=status.HTTP_200_OK)
@@ -3,13 +3,19 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from mantenimientos.models.mantenimiento import Mantenimiento
 from logins.permissions.rol_permissions import RolPermission
 from mantenimientos.serializers.mantenimiento_serializer import MantenimientoSerializer
-from mantenimientos.services.mantenimiento_service import MantenimientoService
 from mantenimientos.services.mantenimiento_service_interface import IMantenimientoService
+from comun.condicional import CondicionalMixin
+from comun.exportacion import ExportacionMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class MantenimientoViewSet(viewsets.ModelViewSet):
+class MantenimientoViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, ExportacionMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de mantenimientos.
     Gestiona listado, creación, consulta individual,
@@ -19,23 +25,29 @@ class MantenimientoViewSet(viewsets.ModelViewSet):
 
     permission_key = "mantenimiento"
     permission_classes = [RolPermission]
+    modelo_condicional = Mantenimiento
 
     def __init__(
         self,
-        service: IMantenimientoService = MantenimientoService(),
+        service: IMantenimientoService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("mantenimiento")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todos los mantenimientos."""
-        mantenimientos = self.service.listar_mantenimientos()
-        serializer = MantenimientoSerializer(mantenimientos, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, MantenimientoSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_mantenimientos_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, MantenimientoSerializer, campos=campos)
+
+        mantenimientos = self.service.listar_mantenimientos(columnas=columnas)
+        return Response(serializar_listado(mantenimientos, MantenimientoSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                     OBTENER (GET/{id})
@@ -103,7 +115,13 @@ class MantenimientoViewSet(viewsets.ModelViewSet):
         """
         Endpoint para listar mantenimientos por máquina.
         GET /mantenimientos/maquina/{id_maquina}/
+        Acepta paginación por cursor con ?cursor= y ?page_size=.
         """
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.obtener_mantenimientos_por_maquina_paginado(id_maquina, **paginacion)
+            return self.respuesta_paginada(pagina, MantenimientoSerializer)
+
         mantenimientos = self.service.obtener_mantenimientos_por_maquina(id_maquina)
         serializer = MantenimientoSerializer(mantenimientos, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -120,3 +138,20 @@ class MantenimientoViewSet(viewsets.ModelViewSet):
         mantenimientos = self.service.obtener_mantenimientos_por_usuario(id_usuario)
         serializer = MantenimientoSerializer(mantenimientos, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    # -------------------------------------------------------
+    #             EXPORTAR CSV / NDJSON (GET /exportar)
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        """
+        Exporta mantenimientos en streaming (CSV o NDJSON).
+        GET /api/mantenimientos/exportar/?formato=csv&desde=2025-01-01&hasta=2025-12-31&maquina=3
+        """
+        try:
+            formato, filtros = self.obtener_parametros_exportacion(request)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        columnas, filas = self.service.exportar_mantenimientos(**filtros)
+        return self.respuesta_exportacion(filas, columnas, formato, nombre="mantenimientos")
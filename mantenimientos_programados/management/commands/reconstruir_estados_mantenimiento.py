@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from mantenimientos_programados.services.estado_mantenimiento_service import EstadoMantenimientoService
+
+
+class Command(BaseCommand):
+    """
+    Reconstruye la proyección EstadoMantenimiento desde el histórico
+    de mantenimientos y las horas totales actuales de cada máquina.
+
+    Uso:
+        python manage.py reconstruir_estados_mantenimiento
+    """
+
+    help = "Reconstruye la tabla estados_mantenimiento desde el histórico."
+
+    def handle(self, *args, **options):
+        total = EstadoMantenimientoService().reconstruir()
+        self.stdout.write(self.style.SUCCESS(
+            f"Se reconstruyeron {total} estado(s) de mantenimiento."
+        ))
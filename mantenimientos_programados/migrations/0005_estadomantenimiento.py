@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mantenimientos_programados', '0004_alter_mantenimientoprogramado_nombre'),
+        ('maquinarias', '0004_alter_maquinaria_foto'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EstadoMantenimiento',
+            fields=[
+                ('id_estado', models.AutoField(primary_key=True, serialize=False)),
+                ('horas_proximas', models.DecimalField(blank=True, decimal_places=2, help_text='Horas del último mantenimiento + intervalo. Nulo si nunca se ha realizado.', max_digits=12, null=True)),
+                ('diferencia', models.DecimalField(blank=True, decimal_places=2, help_text='horas_proximas - horas_totales de la máquina.', max_digits=12, null=True)),
+                ('estado', models.CharField(choices=[('vencido', 'Vencido'), ('pendiente', 'Pendiente'), ('al_dia', 'Al día'), ('sin_historial', 'Sin historial')], default='sin_historial', max_length=20)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('maquina', models.ForeignKey(db_column='id_maquina', on_delete=django.db.models.deletion.CASCADE, related_name='estados_mantenimiento', to='maquinarias.maquinaria')),
+                ('programado', models.OneToOneField(db_column='id_programado', on_delete=django.db.models.deletion.CASCADE, related_name='estado_mantenimiento', to='mantenimientos_programados.mantenimientoprogramado')),
+            ],
+            options={
+                'verbose_name': 'Estado de mantenimiento',
+                'verbose_name_plural': 'Estados de mantenimiento',
+                'db_table': 'estados_mantenimiento',
+                'indexes': [models.Index(fields=['estado', 'maquina'], name='idx_estado_mant_estado_maq')],
+            },
+        ),
+    ]
@@ -0,0 +1,2 @@
+from .mantenimiento_programado import MantenimientoProgramado
+from .estado_mantenimiento import EstadoMantenimiento
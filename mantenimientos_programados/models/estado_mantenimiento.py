@@ -0,0 +1,99 @@
+from decimal import Decimal
+
+from django.db import models
+
+from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
+from maquinarias.models.maquinaria import Maquinaria
+
+
+class EstadoMantenimiento(models.Model):
+    """
+    Proyección desnormalizada del próximo mantenimiento de cada
+    mantenimiento programado (par máquina/programado).
+
+    Se mantiene incrementalmente desde los servicios de registros de horas,
+    mantenimientos y mantenimientos programados, y puede reconstruirse
+    desde el histórico con el comando `reconstruir_estados_mantenimiento`.
+    """
+
+    # Horas restantes a partir de las cuales un mantenimiento se considera pendiente
+    HORAS_ALERTA_PENDIENTE = Decimal("20")
+
+    VENCIDO = 'vencido'
+    PENDIENTE = 'pendiente'
+    AL_DIA = 'al_dia'
+    SIN_HISTORIAL = 'sin_historial'
+
+    ESTADOS = [
+        (VENCIDO, 'Vencido'),
+        (PENDIENTE, 'Pendiente'),
+        (AL_DIA, 'Al día'),
+        (SIN_HISTORIAL, 'Sin historial'),
+    ]
+
+    id_estado = models.AutoField(primary_key=True)
+
+    programado = models.OneToOneField(
+        MantenimientoProgramado,
+        on_delete=models.CASCADE,
+        db_column='id_programado',
+        related_name='estado_mantenimiento'
+    )
+
+    maquina = models.ForeignKey(
+        Maquinaria,
+        on_delete=models.CASCADE,
+        db_column='id_maquina',
+        related_name='estados_mantenimiento'
+    )
+
+    horas_proximas = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="Horas del último mantenimiento + intervalo. Nulo si nunca se ha realizado."
+    )
+
+    diferencia = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text="horas_proximas - horas_totales de la máquina."
+    )
+
+    estado = models.CharField(
+        max_length=20,
+        choices=ESTADOS,
+        default=SIN_HISTORIAL
+    )
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'estados_mantenimiento'
+        verbose_name = "Estado de mantenimiento"
+        verbose_name_plural = "Estados de mantenimiento"
+        indexes = [
+            models.Index(fields=['estado', 'maquina'], name='idx_estado_mant_estado_maq'),
+        ]
+
+    @classmethod
+    def clasificar(cls, diferencia):
+        """
+        Retorna el estado correspondiente a una diferencia de horas:
+        VENCIDO → diferencia <= 0
+        PENDIENTE → 0 < diferencia <= HORAS_ALERTA_PENDIENTE
+        AL_DIA → resto. SIN_HISTORIAL si la diferencia es None.
+        """
+        if diferencia is None:
+            return cls.SIN_HISTORIAL
+        if diferencia <= 0:
+            return cls.VENCIDO
+        if diferencia <= cls.HORAS_ALERTA_PENDIENTE:
+            return cls.PENDIENTE
+        return cls.AL_DIA
+
+    def __str__(self):
+        return f"Programado #{self.programado_id} - {self.estado}"
@@ -0,0 +1,106 @@
+from django.db.models import Case, CharField, F, OuterRef, Subquery, Value, When
+
+from comun.cache import invalidar_por_modelo
+from mantenimientos_programados.models.estado_mantenimiento import EstadoMantenimiento
+from maquinarias.models.maquinaria import Maquinaria
+
+
+class EstadoMantenimientoRepository:
+    """
+    Repositorio para la proyección EstadoMantenimiento.
+    Encapsula las escrituras incrementales y las consultas
+    del tablero de estado de mantenimiento.
+    """
+
+    @staticmethod
+    def get_all():
+        """Retorna todos los estados de mantenimiento."""
+        return EstadoMantenimiento.objects.all()
+
+    @staticmethod
+    def get_by_maquina(id_maquina: int):
+        """Retorna los estados de mantenimiento de una máquina."""
+        return EstadoMantenimiento.objects.filter(maquina_id=id_maquina)
+
+    @staticmethod
+    def upsert(id_programado: int, id_maquina: int, horas_proximas, diferencia, estado: str):
+        """
+        Crea o actualiza el estado de un mantenimiento programado.
+        Ejemplo:
+            upsert(3, 1, Decimal('500'), Decimal('12.5'), 'pendiente')
+        """
+        estado_mantenimiento, _ = EstadoMantenimiento.objects.update_or_create(
+            programado_id=id_programado,
+            defaults={
+                "maquina_id": id_maquina,
+                "horas_proximas": horas_proximas,
+                "diferencia": diferencia,
+                "estado": estado,
+            }
+        )
+        return estado_mantenimiento
+
+    @staticmethod
+    def update_horas_maquina(id_maquina: int, horas_totales):
+        """
+        Recalcula diferencia y estado de todos los programados de una
+        máquina en una sola sentencia UPDATE, a partir de sus nuevas
+        horas totales.
+        Retorna la cantidad de filas actualizadas.
+        """
+        limite_pendiente = horas_totales + EstadoMantenimiento.HORAS_ALERTA_PENDIENTE
+        invalidar_por_modelo(EstadoMantenimiento)
+
+        return (
+            EstadoMantenimiento.objects
+            .filter(maquina_id=id_maquina, horas_proximas__isnull=False)
+            .update(
+                diferencia=F('horas_proximas') - Value(horas_totales),
+                estado=Case(
+                    When(horas_proximas__lte=horas_totales, then=Value(EstadoMantenimiento.VENCIDO)),
+                    When(horas_proximas__lte=limite_pendiente, then=Value(EstadoMantenimiento.PENDIENTE)),
+                    default=Value(EstadoMantenimiento.AL_DIA),
+                    output_field=CharField()
+                )
+            )
+        )
+
+    @staticmethod
+    def update_horas_maquinas(ids_maquina):
+        """
+        Igual que update_horas_maquina, pero para varias máquinas en una
+        sola sentencia UPDATE: toma las horas totales vigentes de cada
+        máquina con una subconsulta.
+        Retorna la cantidad de filas actualizadas.
+        """
+        horas_totales = Subquery(
+            Maquinaria.objects.filter(pk=OuterRef('maquina_id')).values('horas_totales')[:1]
+        )
+        invalidar_por_modelo(EstadoMantenimiento)
+
+        return (
+            EstadoMantenimiento.objects
+            .filter(maquina_id__in=ids_maquina, horas_proximas__isnull=False)
+            .update(
+                diferencia=F('horas_proximas') - horas_totales,
+                estado=Case(
+                    When(horas_proximas__lte=horas_totales, then=Value(EstadoMantenimiento.VENCIDO)),
+                    When(
+                        horas_proximas__lte=horas_totales + Value(EstadoMantenimiento.HORAS_ALERTA_PENDIENTE),
+                        then=Value(EstadoMantenimiento.PENDIENTE)
+                    ),
+                    default=Value(EstadoMantenimiento.AL_DIA),
+                    output_field=CharField()
+                )
+            )
+        )
+
+    @staticmethod
+    def reemplazar_todos(estados):
+        """
+        Reemplaza la proyección completa por la lista de instancias dada.
+        Debe ejecutarse dentro de una transacción.
+        """
+        EstadoMantenimiento.objects.all().delete()
+        invalidar_por_modelo(EstadoMantenimiento)
+        return EstadoMantenimiento.objects.bulk_create(estados, batch_size=1000)
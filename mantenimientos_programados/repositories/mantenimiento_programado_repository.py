@@ -1,6 +1,10 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import OuterRef, Subquery
 
+from mantenimientos.models.mantenimiento import Mantenimiento
 from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class MantenimientoProgramadoRepository:
@@ -11,9 +15,14 @@ class MantenimientoProgramadoRepository:
 
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todos los mantenimientos programados."""
-        return MantenimientoProgramado.objects.all()
+        return limitar_columnas(MantenimientoProgramado.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los mantenimientos programados paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(MantenimientoProgramado.objects.all(), columnas), cursor, page_size)
 
     @staticmethod
     def get_by_id(**kwargs):
@@ -38,6 +47,27 @@ class MantenimientoProgramadoRepository:
         """
         return MantenimientoProgramado.objects.filter(maquina_id=id_maquina)
 
+    @staticmethod
+    def get_all_con_ultimo_mantenimiento():
+        """
+        Retorna todos los mantenimientos programados anotados con las horas
+        del último mantenimiento real (misma máquina + mismo programado),
+        resuelto con una subconsulta correlacionada en una sola consulta.
+
+        Anotaciones:
+        - horas_ultimo_mantenimiento: Decimal, o None si nunca se ha realizado.
+        """
+        ultimo_mantenimiento = (
+            Mantenimiento.objects
+            .filter(maquina_id=OuterRef('maquina_id'), programado_id=OuterRef('pk'))
+            .order_by('-fecha_mantenimiento', '-id_mantenimiento')
+        )
+        return MantenimientoProgramado.objects.annotate(
+            horas_ultimo_mantenimiento=Subquery(
+                ultimo_mantenimiento.values('horas_realizadas')[:1]
+            )
+        )
+
     @staticmethod
     def get_by_maquina_y_tipo(id_maquina: int, tipo: str):
         """
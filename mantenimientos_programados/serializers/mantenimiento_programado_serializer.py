@@ -4,9 +4,10 @@ from mantenimientos_programados.models.mantenimiento_programado import Mantenimi
 from mantenimientos_programados.repositories.mantenimiento_programado_repository import \
     MantenimientoProgramadoRepository
 from maquinarias.models.maquinaria import Maquinaria
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class MantenimientoProgramadoSerializer(serializers.ModelSerializer):
+class MantenimientoProgramadoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer profesional para la gestión de mantenimientos programados.
     Incluye validaciones de negocio, consistencia de datos y formatos adecuados.
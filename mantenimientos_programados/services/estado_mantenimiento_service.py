@@ -0,0 +1,121 @@
+from decimal import Decimal
+
+from django.db import transaction
+
+from mantenimientos.repositories.mantenimiento_repository import MantenimientoRepository
+from mantenimientos_programados.models.estado_mantenimiento import EstadoMantenimiento
+from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
+from mantenimientos_programados.repositories.estado_mantenimiento_repository import EstadoMantenimientoRepository
+from mantenimientos_programados.repositories.mantenimiento_programado_repository import MantenimientoProgramadoRepository
+from mantenimientos_programados.services.estado_mantenimiento_service_interface import IEstadoMantenimientoService
+from maquinarias.models.maquinaria import Maquinaria
+
+
+class EstadoMantenimientoService(IEstadoMantenimientoService):
+    """
+    Servicio que mantiene la proyección EstadoMantenimiento.
+
+    Reglas (idénticas al cálculo desde el histórico):
+    - horas_proximas = horas_realizadas del último mantenimiento + intervalo_horas
+    - diferencia = horas_proximas - horas_totales de la máquina
+    - Si el programado nunca se ha realizado → 'sin_historial'
+    """
+
+    # ----------------------------------------------------------------------
+    # Recalcular un programado (crear/actualizar programado o mantenimiento)
+    # ----------------------------------------------------------------------
+    def recalcular_programado(self, programado: MantenimientoProgramado):
+        """
+        Recalcula horas_proximas, diferencia y estado de un programado
+        a partir de su último mantenimiento real.
+        """
+        if not programado:
+            return None
+
+        ultimo = MantenimientoRepository.get_ultimo_por_maquina_y_programado(
+            programado.maquina_id,
+            programado.id_programado
+        )
+
+        horas_proximas = None
+        diferencia = None
+
+        if ultimo:
+            horas_totales = Decimal(str(programado.maquina.horas_totales))
+            horas_proximas = (
+                Decimal(str(ultimo.horas_realizadas)) + Decimal(str(programado.intervalo_horas))
+            )
+            diferencia = horas_proximas - horas_totales
+
+        return EstadoMantenimientoRepository.upsert(
+            id_programado=programado.id_programado,
+            id_maquina=programado.maquina_id,
+            horas_proximas=horas_proximas,
+            diferencia=diferencia,
+            estado=EstadoMantenimiento.clasificar(diferencia)
+        )
+
+    # ----------------------------------------------------------------------
+    # Recalcular una máquina (cambio de horas totales)
+    # ----------------------------------------------------------------------
+    def recalcular_maquina(self, maquina: Maquinaria):
+        """
+        Recalcula diferencia y estado de todos los programados de la máquina
+        con un único UPDATE. Retorna la cantidad de estados actualizados.
+        """
+        if not maquina:
+            return 0
+
+        return EstadoMantenimientoRepository.update_horas_maquina(
+            id_maquina=maquina.id_maquina,
+            horas_totales=Decimal(str(maquina.horas_totales))
+        )
+
+    def recalcular_maquinas(self, ids_maquina):
+        """
+        Igual que recalcular_maquina para varias máquinas, con un único
+        UPDATE. Retorna la cantidad de estados actualizados.
+        """
+        if not ids_maquina:
+            return 0
+
+        return EstadoMantenimientoRepository.update_horas_maquinas(ids_maquina=list(ids_maquina))
+
+    # ----------------------------------------------------------------------
+    # Reconstruir desde el histórico
+    # ----------------------------------------------------------------------
+    @transaction.atomic
+    def reconstruir(self):
+        """
+        Reconstruye la proyección completa con una consulta set-based
+        sobre programados + último mantenimiento. Retorna la cantidad de
+        estados generados.
+        """
+        programados = (
+            MantenimientoProgramadoRepository
+            .get_all_con_ultimo_mantenimiento()
+            .select_related('maquina')
+        )
+
+        estados = []
+        for programado in programados:
+            horas_proximas = None
+            diferencia = None
+
+            if programado.horas_ultimo_mantenimiento is not None:
+                horas_proximas = (
+                    Decimal(str(programado.horas_ultimo_mantenimiento))
+                    + Decimal(str(programado.intervalo_horas))
+                )
+                diferencia = horas_proximas - Decimal(str(programado.maquina.horas_totales))
+
+            estados.append(EstadoMantenimiento(
+                programado_id=programado.id_programado,
+                maquina_id=programado.maquina_id,
+                horas_proximas=horas_proximas,
+                diferencia=diferencia,
+                estado=EstadoMantenimiento.clasificar(diferencia)
+            ))
+
+        EstadoMantenimientoRepository.reemplazar_todos(estados)
+        return len(estados)
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+
+class IEstadoMantenimientoService(ABC):
+    """
+    Interfaz para el servicio de la proyección EstadoMantenimiento.
+    Define las operaciones de actualización incremental y reconstrucción.
+    """
+
+    @abstractmethod
+    def recalcular_programado(self, programado):
+        """Recalcula el estado de un mantenimiento programado."""
+        pass
+
+    @abstractmethod
+    def recalcular_maquina(self, maquina):
+        """Recalcula los estados de una máquina tras cambiar sus horas totales."""
+        pass
+
+    @abstractmethod
+    def recalcular_maquinas(self, ids_maquina):
+        """Recalcula los estados de varias máquinas tras cambiar sus horas totales."""
+        pass
+
+    @abstractmethod
+    def reconstruir(self):
+        """Reconstruye la proyección completa desde el histórico."""
+        pass
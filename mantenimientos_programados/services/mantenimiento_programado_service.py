@@ -1,5 +1,6 @@
 from rest_framework.exceptions import ValidationError
 
+from comun.servicios import Dependencia
 from mantenimientos_programados.repositories.mantenimiento_programado_repository import MantenimientoProgramadoRepository
 from mantenimientos_programados.serializers.mantenimiento_programado_serializer import MantenimientoProgramadoSerializer
 from mantenimientos_programados.services.mantenimiento_programado_service_interface import IMantenimientoProgramadoService
@@ -12,6 +13,10 @@ class MantenimientoProgramadoService(IMantenimientoProgramadoService):
     asegurando reglas de negocio como la existencia de la máquina asociada.
     """
 
+    # Inyección de dependencias de otros servicios (ver comun.servicios)
+    estado_mantenimiento_service = Dependencia("estado_mantenimiento")
+    costo_mantenimiento_service = Dependencia("costo_mantenimiento")
+
     # ---------------------------------------------------------
     # CREAR
     # ---------------------------------------------------------
@@ -38,14 +43,21 @@ class MantenimientoProgramadoService(IMantenimientoProgramadoService):
             **serializer.validated_data
         )
 
+        # Registrar el programado en la proyección de estados
+        self.estado_mantenimiento_service.recalcular_programado(mantenimiento)
+
         return MantenimientoProgramadoSerializer(mantenimiento).data
 
     # ---------------------------------------------------------
     # LISTAR
     # ---------------------------------------------------------
-    def listar_mantenimientos_programados(self):
+    def listar_mantenimientos_programados(self, columnas=None):
         """Retorna todos los mantenimientos programados registrados."""
-        return MantenimientoProgramadoRepository.get_all()
+        return MantenimientoProgramadoRepository.get_all(columnas=columnas)
+
+    def listar_mantenimientos_programados_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los mantenimientos programados (paginación por cursor)."""
+        return MantenimientoProgramadoRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ---------------------------------------------------------
     # OBTENER
@@ -111,6 +123,9 @@ class MantenimientoProgramadoService(IMantenimientoProgramadoService):
             **serializer.validated_data
         )
 
+        # El intervalo o la máquina pudieron cambiar → recalcular su estado
+        self.estado_mantenimiento_service.recalcular_programado(mantenimiento_actualizado)
+
         return MantenimientoProgramadoSerializer(mantenimiento_actualizado).data
 
     # ---------------------------------------------------------
@@ -122,7 +137,10 @@ class MantenimientoProgramadoService(IMantenimientoProgramadoService):
         - Verifica existencia
         - Lanza error si no existe
         - Retorna True al eliminar correctamente
+        - Sus mantenimientos quedan sin programado (SET_NULL): se
+          recalculan los costos mensuales de la máquina
         """
+        programado = MantenimientoProgramadoRepository.get_by_id(id_programado=id_programado)
         eliminado = MantenimientoProgramadoRepository.delete(id_programado)
 
         if not eliminado:
@@ -130,6 +148,7 @@ class MantenimientoProgramadoService(IMantenimientoProgramadoService):
                 "id_programado": "No se encontró el mantenimiento programado a eliminar."
             })
 
+        self.costo_mantenimiento_service.recalcular_maquina(programado.maquina_id)
         return True
 
     # ---------------------------------------------------------
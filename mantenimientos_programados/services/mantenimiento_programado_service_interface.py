@@ -13,10 +13,15 @@ class IMantenimientoProgramadoService(ABC):
         pass
 
     @abstractmethod
-    def listar_mantenimientos_programados(self):
+    def listar_mantenimientos_programados(self, columnas=None):
         """Retorna todos los mantenimientos programados."""
         pass
 
+    @abstractmethod
+    def listar_mantenimientos_programados_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los mantenimientos programados paginada por cursor."""
+        pass
+
     @abstractmethod
     def obtener_mantenimiento_programado(self, **kwargs):
         """
@@ -3,12 +3,17 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from mantenimientos_programados.models.mantenimiento_programado import MantenimientoProgramado
 from logins.permissions.rol_permissions import RolPermission
 from mantenimientos_programados.serializers.mantenimiento_programado_serializer import MantenimientoProgramadoSerializer
-from mantenimientos_programados.services.mantenimiento_programado_service import MantenimientoProgramadoService
 from mantenimientos_programados.services.mantenimiento_programado_service_interface import IMantenimientoProgramadoService
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
-class MantenimientoProgramadoViewSet(viewsets.ModelViewSet):
+class MantenimientoProgramadoViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de mantenimientos programados.
     Gestiona listado, creación, consulta individual,
@@ -18,23 +23,29 @@ class MantenimientoProgramadoViewSet(viewsets.ModelViewSet):
 
     permission_key = "mantenimiento_programado"
     permission_classes = [RolPermission]
+    modelo_condicional = MantenimientoProgramado
 
     def __init__(
         self,
-        service: IMantenimientoProgramadoService = MantenimientoProgramadoService(),
+        service: IMantenimientoProgramadoService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("mantenimiento_programado")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todos los mantenimientos programados."""
-        mantenimientos = self.service.listar_mantenimientos_programados()
-        serializer = MantenimientoProgramadoSerializer(mantenimientos, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, MantenimientoProgramadoSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_mantenimientos_programados_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, MantenimientoProgramadoSerializer, campos=campos)
+
+        mantenimientos = self.service.listar_mantenimientos_programados(columnas=columnas)
+        return Response(serializar_listado(mantenimientos, MantenimientoProgramadoSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                OBTENER (GET/{id})
@@ -0,0 +1 @@
+from .maquinaria import Maquinaria
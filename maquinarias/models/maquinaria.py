@@ -26,6 +26,7 @@ class Maquinaria(models.Model):
         default='operativa'
     )
     foto = models.CharField(max_length=500, null=True, blank=True)
+    foto_miniatura = models.CharField(max_length=500, null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
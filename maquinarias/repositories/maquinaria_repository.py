@@ -1,8 +1,15 @@
 from decimal import Decimal, InvalidOperation
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Case, Count, DecimalField, Exists, F, OuterRef, Q, Subquery, Value, When
+from django.utils.timezone import now
 
+from mantenimientos_programados.models.estado_mantenimiento import EstadoMantenimiento
 from maquinarias.models.maquinaria import Maquinaria
+from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
+from comun.cache import invalidar_por_modelo
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 class MaquinariaRepository:
     """
@@ -11,9 +18,82 @@ class MaquinariaRepository:
     """
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todas las maquinarias."""
-        return Maquinaria.objects.all()
+        return limitar_columnas(Maquinaria.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las maquinarias paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(Maquinaria.objects.all(), columnas), cursor, page_size)
+
+    @staticmethod
+    def get_all_con_ultimo_proyecto():
+        """
+        Retorna todas las maquinarias anotadas con el estado de su último
+        proyecto asignado (ordenado por created_at), en una sola consulta.
+
+        Anotaciones:
+        - ultimo_proyecto_finalizado: True/False, o None si nunca tuvo proyecto.
+        """
+        ultimo_proyecto = (
+            ProyectoMaquinaria.objects
+            .filter(maquina_id=OuterRef('pk'))
+            .order_by('-created_at')
+        )
+        return Maquinaria.objects.annotate(
+            ultimo_proyecto_finalizado=Subquery(ultimo_proyecto.values('finalizado')[:1])
+        )
+
+    @staticmethod
+    def _tiene_estado_mantenimiento(*estados):
+        """Exists correlacionado: la máquina tiene algún programado en los estados dados."""
+        return Exists(
+            EstadoMantenimiento.objects.filter(maquina_id=OuterRef('pk'), estado__in=estados)
+        )
+
+    @staticmethod
+    def filter_by_estado_mantenimiento(estado):
+        """
+        Retorna las maquinarias con al menos un mantenimiento programado
+        en el estado dado, leyendo la proyección estados_mantenimiento.
+        Ejemplo: filter_by_estado_mantenimiento('vencido')
+        """
+        return Maquinaria.objects.filter(
+            MaquinariaRepository._tiene_estado_mantenimiento(estado)
+        )
+
+    @staticmethod
+    def get_al_dia():
+        """
+        Retorna las maquinarias sin programados vencidos ni pendientes.
+        """
+        return Maquinaria.objects.exclude(
+            MaquinariaRepository._tiene_estado_mantenimiento(
+                EstadoMantenimiento.VENCIDO,
+                EstadoMantenimiento.PENDIENTE
+            )
+        )
+
+    @staticmethod
+    def get_resumen_estados():
+        """
+        Retorna en una sola consulta los conteos del tablero:
+        total, en_operacion, vencidos y pendientes (exclusivo de vencidos).
+        """
+        return (
+            MaquinariaRepository.get_all_con_ultimo_proyecto()
+            .annotate(
+                vencida=MaquinariaRepository._tiene_estado_mantenimiento(EstadoMantenimiento.VENCIDO),
+                pendiente=MaquinariaRepository._tiene_estado_mantenimiento(EstadoMantenimiento.PENDIENTE),
+            )
+            .aggregate(
+                total=Count('pk'),
+                en_operacion=Count('pk', filter=Q(ultimo_proyecto_finalizado=False)),
+                vencidos=Count('pk', filter=Q(vencida=True)),
+                pendientes=Count('pk', filter=Q(vencida=False, pendiente=True)),
+            )
+        )
 
     @staticmethod
     def get_by(**kwargs):
@@ -27,6 +107,10 @@ class MaquinariaRepository:
         except ObjectDoesNotExist:
             return None
 
+    @staticmethod
+    def exists(id_maquina):
+        """Retorna True si existe la maquinaria (sin cargar la fila)."""
+        return Maquinaria.objects.filter(pk=id_maquina).exists()
 
     @staticmethod
     def filter_by_estado(estado):
@@ -70,23 +154,69 @@ class MaquinariaRepository:
     @staticmethod
     def update_horas_totales(maquina: Maquinaria, horas_a_sumar):
         """
-        Actualiza las horas totales de una maquinaria sumando un valor dado.
+        Suma horas a horas_totales con un UPDATE atómico en la BD
+        (F('horas_totales') + horas), así registros concurrentes no pierden horas.
+        La fila queda bloqueada hasta el fin de la transacción.
 
         Parámetros:
         - maquina: instancia de Maquinaria (no un ID).
         - horas_a_sumar: cantidad de horas a añadir (puede ser decimal).
 
         Retorna:
-        - maquinaria actualizada.
-        - None si la instancia no es válida.
+        - maquinaria con horas_totales recargado desde la BD.
+        - None si la instancia no es válida o la máquina está fuera de servicio.
         """
         if not maquina or not isinstance(maquina, Maquinaria):
             return None
 
-        maquina.horas_totales = maquina.horas_totales + horas_a_sumar
-        maquina.save()
+        actualizadas = (
+            Maquinaria.objects
+            .filter(pk=maquina.pk)
+            .exclude(estado='fuera de servicio')
+            .update(horas_totales=F('horas_totales') + horas_a_sumar, updated_at=now())
+        )
+        if not actualizadas:
+            return None
+
+        # UPDATE masivo: no dispara post_save
+        invalidar_por_modelo(Maquinaria)
+        maquina.refresh_from_db(fields=['horas_totales', 'updated_at'])
         return maquina
 
+    @staticmethod
+    def get_for_update_in_bulk(ids):
+        """
+        Retorna {id_maquina: Maquinaria} de los IDs dados, bloqueando las
+        filas (SELECT ... FOR UPDATE) hasta el fin de la transacción.
+        Los IDs inexistentes no aparecen en el diccionario.
+        """
+        return Maquinaria.objects.select_for_update().in_bulk(ids)
+
+    @staticmethod
+    def sumar_horas_por_maquina(horas_por_maquina: dict):
+        """
+        Suma a cada máquina sus horas ({id_maquina: horas}) con un único
+        UPDATE (CASE por id), atómico igual que update_horas_totales.
+        Las máquinas fuera de servicio no se actualizan.
+        Retorna la cantidad de máquinas actualizadas.
+        """
+        if not horas_por_maquina:
+            return 0
+
+        incremento = Case(
+            *[When(pk=id_maquina, then=Value(horas)) for id_maquina, horas in horas_por_maquina.items()],
+            output_field=DecimalField(max_digits=12, decimal_places=2)
+        )
+        actualizadas = (
+            Maquinaria.objects
+            .filter(pk__in=horas_por_maquina)
+            .exclude(estado='fuera de servicio')
+            .update(horas_totales=F('horas_totales') + incremento, updated_at=now())
+        )
+
+        invalidar_por_modelo(Maquinaria)
+        return actualizadas
+
     @staticmethod
     def update_estado(maquinaria: Maquinaria):
         """
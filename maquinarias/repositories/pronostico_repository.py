@@ -0,0 +1,47 @@
+from django.db.models import F, Sum
+
+from mantenimientos_programados.models.estado_mantenimiento import EstadoMantenimiento
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+
+
+class PronosticoRepository:
+    """
+    Consultas del pronóstico de próximos mantenimientos. Cada una cubre
+    toda la flota de una vez (una consulta agregada, no una por máquina).
+    """
+
+    @staticmethod
+    def get_horas_por_maquina(desde, hasta):
+        """
+        Retorna {id_maquina: horas trabajadas} sumando los registros con
+        fecha entre `desde` y `hasta` (inclusive), en un solo GROUP BY.
+        Las máquinas sin registros en el rango no aparecen.
+        """
+        filas = (
+            RegistroHorasMaquinaria.objects
+            .filter(fecha__gte=desde, fecha__lte=hasta)
+            .values("maquina_id")
+            .annotate(horas=Sum("horas_trabajadas"))
+            .order_by()
+        )
+        return {fila["maquina_id"]: fila["horas"] for fila in filas}
+
+    @staticmethod
+    def get_estados():
+        """
+        Retorna los pares máquina/programado con sus horas restantes
+        (EstadoMantenimiento.diferencia) y los nombres para mostrar.
+        """
+        return (
+            EstadoMantenimiento.objects
+            .values(
+                "maquina_id",
+                "programado_id",
+                "diferencia",
+                "estado",
+                nombre_maquina=F("maquina__nombre_maquina"),
+                nombre_programado=F("programado__nombre"),
+                tipo=F("programado__tipo"),
+            )
+            .order_by("maquina_id", "programado_id")
+        )
@@ -0,0 +1,186 @@
+from datetime import datetime, time
+
+from django.db import connection
+from django.db.models import CharField, DateTimeField, DecimalField, F, IntegerField, Q, TextField, Value
+from django.db.models.functions import Cast
+from rest_framework.exceptions import ValidationError
+
+from alarmas.models.alarma import Alarma
+from alarmas.models.alarma_archivada import AlarmaArchivada
+from comun.paginacion import PAGE_SIZE_POR_DEFECTO, PaginaCursor, codificar_cursor, decodificar_cursor_texto
+from hojas_vida.models.hoja_vida import HojaVida
+from mantenimientos.models.mantenimiento import Mantenimiento
+from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+
+_TEXTO_NULO = Cast(Value(None), TextField())
+_DECIMAL_NULO = Cast(Value(None), DecimalField(max_digits=14, decimal_places=2))
+
+
+class TimelineRepository:
+    """
+    Historia de vida de una máquina: une alarmas, asignaciones a proyectos,
+    hojas de vida, mantenimientos y registros de horas en una sola
+    consulta (UNION ALL) ordenada por fecha, paginada por keyset.
+
+    Cada rama de la unión se filtra por el cursor, se ordena por su índice
+    (máquina, fecha) y se limita a page_size + 1 filas; la consulta externa
+    mezcla esas ramas ya ordenadas (k-way merge en la BD). Así una página
+    cuesta lo mismo al principio que en lo profundo de la historia.
+
+    Orden: fecha descendente, luego fuente y llave primaria descendentes.
+    Los eventos con fecha (sin hora) se ubican a la medianoche de ese día.
+    """
+
+    # tipo → (modelo, campo de máquina, campo de fecha, {categoria, detalle, valor})
+    # El orden de la lista desempata eventos con la misma fecha: no cambiarlo
+    # sin invalidar los cursores emitidos.
+    FUENTES = {
+        "alarma": (Alarma, "maquina_id", "fecha_registro", {
+            "categoria": Cast(F("nivel"), TextField()),
+            "detalle": F("descripcion"),
+            "valor": _DECIMAL_NULO,
+        }),
+        "asignacion": (ProyectoMaquinaria, "maquina_id", "created_at", {
+            "categoria": Cast(F("proyecto__nombre_proyecto"), TextField()),
+            "detalle": _TEXTO_NULO,
+            "valor": F("horas_totales"),
+        }),
+        "hoja_vida": (HojaVida, "maquinaria_id", "fecha_registro", {
+            "categoria": _TEXTO_NULO,
+            "detalle": F("descripcion"),
+            "valor": _DECIMAL_NULO,
+        }),
+        "mantenimiento": (Mantenimiento, "maquina_id", "fecha_mantenimiento", {
+            "categoria": Cast(F("tipo_mantenimiento"), TextField()),
+            "detalle": F("descripcion"),
+            "valor": F("costo"),
+        }),
+        "registro_horas": (RegistroHorasMaquinaria, "maquina_id", "fecha", {
+            "categoria": Cast(F("proyecto__nombre_proyecto"), TextField()),
+            "detalle": F("observaciones"),
+            "valor": F("horas_trabajadas"),
+        }),
+        "alarma_archivada": (AlarmaArchivada, "maquina_id", "fecha_registro", {
+            "categoria": Cast(F("nivel"), TextField()),
+            "detalle": F("descripcion"),
+            "valor": _DECIMAL_NULO,
+        }),
+    }
+
+    COLUMNAS = ("fuente", "orden", "id_evento", "fecha_evento", "categoria", "detalle", "valor")
+
+    @staticmethod
+    def get_page(id_maquina, cursor=None, page_size=None, tipos=None):
+        """
+        Retorna una PaginaCursor con los eventos de la máquina (dicts con
+        las COLUMNAS), más recientes primero. `tipos` limita las fuentes.
+        """
+        page_size = page_size or PAGE_SIZE_POR_DEFECTO
+        posicion = _decodificar(cursor) if cursor else None
+
+        if tipos and "alarma" in tipos:
+            # Las alarmas archivadas siguen siendo parte de la historia
+            tipos = {*tipos, "alarma_archivada"}
+
+        ramas = [
+            TimelineRepository._rama(tipo, orden, id_maquina, posicion, page_size + 1)
+            for orden, tipo in enumerate(TimelineRepository.FUENTES)
+            if not tipos or tipo in tipos
+        ]
+
+        if len(ramas) == 1:
+            # Una sola fuente: la rama ya viene ordenada y limitada
+            queryset = ramas[0]
+        else:
+            queryset = (
+                ramas[0].union(*ramas[1:], all=True)
+                .order_by("-fecha_evento", "-orden", "-id_evento")[:page_size + 1]
+            )
+
+        items = list(queryset)
+        siguiente_cursor = None
+
+        if len(items) > page_size:
+            items = items[:page_size]
+            ultimo = items[-1]
+            siguiente_cursor = codificar_cursor(
+                f"{ultimo['fecha_evento'].isoformat()}|{ultimo['orden']}|{ultimo['id_evento']}"
+            )
+
+        return PaginaCursor(items, siguiente_cursor, page_size)
+
+    @staticmethod
+    def _rama(tipo, orden, id_maquina, posicion, limite):
+        modelo, campo_maquina, campo_fecha, columnas = TimelineRepository.FUENTES[tipo]
+        es_fecha = modelo._meta.get_field(campo_fecha).get_internal_type() == "DateField"
+
+        queryset = modelo.objects.filter(**{campo_maquina: id_maquina})
+        if posicion:
+            queryset = queryset.filter(_despues_de(posicion, orden, campo_fecha, es_fecha))
+
+        return (
+            queryset
+            .order_by(f"-{campo_fecha}", "-pk")
+            .annotate(
+                fuente=Value(tipo, CharField()),
+                orden=Value(orden, IntegerField()),
+                id_evento=F("pk"),
+                fecha_evento=Cast(campo_fecha, DateTimeField()) if es_fecha else F(campo_fecha),
+                **columnas
+            )
+            .values(*TimelineRepository.COLUMNAS)[:limite]
+        )
+
+
+# =========================================================================
+# KEYSET
+# =========================================================================
+def _decodificar(cursor):
+    """Cursor → (fecha_evento, orden, id_evento)."""
+    try:
+        fecha, orden, id_evento = decodificar_cursor_texto(cursor).split("|")
+        return datetime.fromisoformat(fecha), int(orden), int(id_evento)
+    except ValueError:
+        raise ValidationError({"cursor": "El cursor enviado no es válido."})
+
+
+def _despues_de(posicion, orden, campo, es_fecha):
+    """
+    Condición de las filas de una rama que van después del cursor en el
+    orden (fecha, orden, pk) descendente. Se expresa sobre la columna
+    original (no sobre el Cast) para que use el índice (máquina, fecha).
+    """
+    momento, orden_cursor, id_cursor = posicion
+
+    if orden < orden_cursor:
+        return _antes_de(campo, es_fecha, momento, inclusivo=True)
+    if orden > orden_cursor:
+        return _antes_de(campo, es_fecha, momento, inclusivo=False)
+
+    condicion = _antes_de(campo, es_fecha, momento, inclusivo=False)
+    if not es_fecha:
+        return condicion | Q(**{campo: momento, "pk__lt": id_cursor})
+
+    dia, medianoche = _dia(momento)
+    if medianoche:
+        condicion |= Q(**{campo: dia, "pk__lt": id_cursor})
+    return condicion
+
+
+def _antes_de(campo, es_fecha, momento, inclusivo):
+    """fecha_evento < momento (o <=) expresado sobre la columna original."""
+    if not es_fecha:
+        return Q(**{f"{campo}__lte" if inclusivo else f"{campo}__lt": momento})
+
+    # Un día D se ubica en D 00:00 (zona de la conexión)
+    dia, medianoche = _dia(momento)
+    if inclusivo or not medianoche:
+        return Q(**{f"{campo}__lte": dia})
+    return Q(**{f"{campo}__lt": dia})
+
+
+def _dia(momento):
+    """Retorna (día de `momento` en la zona de la conexión, si es exactamente su medianoche)."""
+    local = momento.astimezone(connection.timezone)
+    return local.date(), local.time() == time.min
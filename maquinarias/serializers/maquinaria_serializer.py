@@ -3,8 +3,12 @@ from datetime import date
 from rest_framework import serializers
 from django.core.validators import RegexValidator
 from maquinarias.models.maquinaria import Maquinaria
+from comun.estado_subidas import EstadoSubidaField
+from comun.seleccion_campos import CamposDinamicosMixin
+
+class MaquinariaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+    foto_estado = EstadoSubidaField("foto")
 
-class MaquinariaSerializer(serializers.ModelSerializer):
     class Meta:
         model = Maquinaria
         fields = [
@@ -17,10 +21,12 @@ class MaquinariaSerializer(serializers.ModelSerializer):
             'horas_totales',
             'estado',
             'foto',
+            'foto_miniatura',
+            'foto_estado',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ('id_maquina', 'created_at', 'updated_at')
+        read_only_fields = ('id_maquina', 'foto_miniatura', 'created_at', 'updated_at')
 
         extra_kwargs = {
             'nombre_maquina': {
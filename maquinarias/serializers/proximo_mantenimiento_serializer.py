@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+
+class ProximoMantenimientoSerializer(serializers.Serializer):
+    """
+    Pronóstico del próximo mantenimiento de un par máquina/programado
+    (ver PronosticoMantenimientoService). `fecha_estimada` y
+    `dias_restantes` son nulos si no hay historial o la máquina no
+    registró horas en la ventana.
+    """
+
+    id_maquina = serializers.IntegerField()
+    nombre_maquina = serializers.CharField()
+    id_programado = serializers.IntegerField()
+    nombre_programado = serializers.CharField()
+    tipo = serializers.CharField()
+    estado = serializers.CharField()
+    horas_restantes = serializers.DecimalField(max_digits=12, decimal_places=2, allow_null=True)
+    tasa_diaria = serializers.DecimalField(max_digits=12, decimal_places=2)
+    dias_restantes = serializers.IntegerField(allow_null=True)
+    fecha_estimada = serializers.DateField(allow_null=True)
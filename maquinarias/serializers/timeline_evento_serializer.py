@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+
+class TimelineEventoSerializer(serializers.Serializer):
+    """
+    Evento de la historia de una máquina (fila de TimelineRepository).
+    `tipo` indica la fuente: alarma, asignacion, hoja_vida, mantenimiento,
+    registro_horas o alarma_archivada; `id` es la llave primaria en esa
+    fuente.
+    """
+
+    tipo = serializers.CharField(source="fuente")
+    id = serializers.IntegerField(source="id_evento")
+    fecha = serializers.DateTimeField(source="fecha_evento")
+    categoria = serializers.CharField(allow_null=True)
+    detalle = serializers.CharField(allow_null=True)
+    valor = serializers.DecimalField(max_digits=14, decimal_places=2, allow_null=True)
@@ -1,17 +1,17 @@
-import cloudinary.uploader
 from decimal import Decimal
-from typing import Optional
 
-from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from rest_framework.exceptions import ValidationError, NotFound
 
-from mantenimientos.services.mantenimiento_service import MantenimientoService
-from mantenimientos_programados.services.mantenimiento_programado_service import MantenimientoProgramadoService
+from comun.cache import GRUPO_FLOTA, obtener_o_calcular
+from comun.servicios import Dependencia
+from mantenimientos_programados.models.estado_mantenimiento import EstadoMantenimiento
+from mantenimientos_programados.repositories.estado_mantenimiento_repository import EstadoMantenimientoRepository
 from maquinarias.models.maquinaria import Maquinaria
 from maquinarias.serializers.maquinaria_serializer import MaquinariaSerializer
 from maquinarias.repositories.maquinaria_repository import MaquinariaRepository
+from maquinarias.repositories.timeline_repository import TimelineRepository
 from maquinarias.services.maquinaria_service_interface import IMaquinariaService
-from proyecto_maquinaria.services.proyecto_maquinaria_service import ProyectoMaquinariaService
 
 
 class MaquinariaService(IMaquinariaService):
@@ -21,36 +21,17 @@ class MaquinariaService(IMaquinariaService):
     aplicando reglas de negocio como la unicidad de la serie.
     """
 
-    def __init__(self):
-        self.mantenimiento_service = MantenimientoService()
-        self.mantenimiento_programado_service = MantenimientoProgramadoService()
-        self.proyecto_maquinaria_service = ProyectoMaquinariaService()
-
-    # ----------------------------------------------------------------------
-    # UTILIDAD: Guardar foto físicamente
-    # ----------------------------------------------------------------------
-    def _guardar_foto(self, foto_file: Optional[UploadedFile]) -> Optional[str]:
-        """
-        Guarda la foto en maquinarias/photos/
-        Retorna la URL absoluta final que se almacenará en BD.
-        """
-        if not foto_file:
-            return None
-
-        try:
-            resultado = cloudinary.uploader.upload(
-                foto_file,
-                folder="maquinarias/photos",  # carpeta lógica en Cloudinary
-                resource_type="image"  # forzamos imagen
-            )
-            return resultado.get("secure_url")
-
-        except Exception as e:
-            raise ValidationError({"foto": "Error al subir la imagen"})
+    # Inyección de dependencias de otros servicios (ver comun.servicios)
+    mantenimiento_service = Dependencia("mantenimiento")
+    mantenimiento_programado_service = Dependencia("mantenimiento_programado")
+    proyecto_maquinaria_service = Dependencia("proyecto_maquinaria")
+    estado_mantenimiento_service = Dependencia("estado_mantenimiento")
+    media_service = Dependencia("media")
 
     # ---------------------------------------------------------
     # CREAR
     # ---------------------------------------------------------
+    @transaction.atomic
     def crear_maquinaria(self, data: dict):
         """
         Crea una maquinaria:
@@ -76,23 +57,26 @@ class MaquinariaService(IMaquinariaService):
                 "serie": "Esta serie ya está registrada."
             })
 
-        # Si viene una foto → guardarla en disco
-        if foto_file:
-            ruta_foto = self._guardar_foto(foto_file)
-            serializer.validated_data["foto"] = ruta_foto
-
         maquinaria = MaquinariaRepository.create(
             **serializer.validated_data
         )
 
+        # Si viene una foto → se sube en segundo plano y el campo se completa al terminar
+        if foto_file:
+            self.media_service.programar_subida(maquinaria, "foto", foto_file, carpeta="maquinarias/photos")
+
         return MaquinariaSerializer(maquinaria).data
 
     # ---------------------------------------------------------
     # LISTAR
     # ---------------------------------------------------------
-    def listar_maquinarias(self):
+    def listar_maquinarias(self, columnas=None):
         """Retorna todas las maquinarias registradas."""
-        return MaquinariaRepository.get_all()
+        return MaquinariaRepository.get_all(columnas=columnas)
+
+    def listar_maquinarias_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las maquinarias (paginación por cursor)."""
+        return MaquinariaRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ---------------------------------------------------------
     # OBTENER
@@ -115,6 +99,7 @@ class MaquinariaService(IMaquinariaService):
     # ---------------------------------------------------------
     # ACTUALIZAR (PUT o PATCH)
     # ---------------------------------------------------------
+    @transaction.atomic
     def actualizar_maquinaria(self, id_maquina: int, data: dict):
         """
         Actualiza una maquinaria:
@@ -152,16 +137,19 @@ class MaquinariaService(IMaquinariaService):
                     "serie": "Otra maquinaria ya está registrada con esta serie."
                 })
 
-        # Manejo opcional de foto
-        if foto_file:
-            nueva_ruta = self._guardar_foto(foto_file)
-            serializer.validated_data["foto"] = nueva_ruta
-
         maquinaria_actualizada = MaquinariaRepository.update(
             maquinaria,
             **serializer.validated_data
         )
 
+        # Manejo opcional de foto (la anterior se conserva hasta completar la subida)
+        if foto_file:
+            self.media_service.programar_subida(maquinaria_actualizada, "foto", foto_file, carpeta="maquinarias/photos")
+
+        # Si cambian las horas totales → recalcular estados de mantenimiento
+        if "horas_totales" in serializer.validated_data:
+            self.estado_mantenimiento_service.recalcular_maquina(maquinaria_actualizada)
+
         return maquinaria_actualizada
 
 
@@ -200,12 +188,21 @@ class MaquinariaService(IMaquinariaService):
                 "estado": "No se pueden registrar horas en una máquina fuera de servicio."
             })
 
-        # Llamar al repository
+        # Llamar al repository (UPDATE atómico con F(); no pierde horas concurrentes)
         maquinaria_actualizada = MaquinariaRepository.update_horas_totales(
             maquina=maquina,
             horas_a_sumar=horas_a_sumar
         )
 
+        # Otro request pudo dejarla fuera de servicio después de la validación
+        if maquinaria_actualizada is None:
+            raise ValidationError({
+                "estado": "No se pueden registrar horas en una máquina fuera de servicio."
+            })
+
+        # Mantener la proyección de estados de mantenimiento
+        self.estado_mantenimiento_service.recalcular_maquina(maquinaria_actualizada)
+
         return maquinaria_actualizada
 
     # ---------------------------------------------------------
@@ -258,6 +255,72 @@ class MaquinariaService(IMaquinariaService):
 
         return True
 
+    # =========================================================================
+    # MOTOR DE CLASIFICACIÓN DE LA FLOTA
+    # =========================================================================
+    def clasificar_maquinarias(self):
+        """
+        Clasifica TODAS las máquinas por estado de mantenimiento leyendo la
+        proyección estados_mantenimiento (dos consultas, sin N+1):
+
+        1. Maquinarias anotadas con el estado de su último proyecto.
+        2. Estados de mantenimiento con historial (programado incluido).
+
+        Returns:
+            list[dict] (en el orden de listar_maquinarias) con:
+            {
+                "maquina": Maquinaria,
+                "en_operacion": bool,
+                "vencida": bool,      # al menos un programado vencido
+                "pendiente": bool,    # al menos un programado pendiente
+                "estado": "vencidos" | "pendientes" | "al_dia",
+                "peor_programado": MantenimientoProgramado | None,
+                "diferencia": Decimal | None   # diferencia del peor programado
+            }
+        """
+        clasificacion = [
+            {
+                "maquina": maquina,
+                "en_operacion": maquina.ultimo_proyecto_finalizado is False,
+                "vencida": False,
+                "pendiente": False,
+                "estado": "al_dia",
+                "peor_programado": None,
+                "diferencia": None,
+            }
+            for maquina in MaquinariaRepository.get_all_con_ultimo_proyecto()
+        ]
+        por_maquina = {item["maquina"].id_maquina: item for item in clasificacion}
+
+        estados = (
+            EstadoMantenimientoRepository.get_all()
+            .filter(diferencia__isnull=False)
+            .select_related('programado')
+        )
+
+        for estado in estados:
+            item = por_maquina.get(estado.maquina_id)
+            if item is None:
+                continue
+
+            if estado.estado == EstadoMantenimiento.VENCIDO:
+                item["vencida"] = True
+            elif estado.estado == EstadoMantenimiento.PENDIENTE:
+                item["pendiente"] = True
+
+            if item["diferencia"] is None or estado.diferencia < item["diferencia"]:
+                item["diferencia"] = estado.diferencia
+                item["peor_programado"] = estado.programado
+
+        # Una sola categoría por máquina (vencido > pendiente > al día)
+        for item in clasificacion:
+            if item["vencida"]:
+                item["estado"] = "vencidos"
+            elif item["pendiente"]:
+                item["estado"] = "pendientes"
+
+        return clasificacion
+
     # =========================================================================
     # RESUMEN GENERAL DE MAQUINARIAS
     # =========================================================================
@@ -268,15 +331,14 @@ class MaquinariaService(IMaquinariaService):
         
         Métricas:
         - en_operacion: máquinas con proyecto activo (finalizado=False)
-        - al_dia: máquinas con mantenimiento programado en > 48 horas
-        - pendientes: máquinas con mantenimiento programado en <= 48 horas
+        - al_dia: máquinas sin mantenimientos vencidos ni pendientes
+        - pendientes: máquinas con mantenimiento programado en <= 20 horas
         - vencidos: máquinas que ya alcanzaron/superaron el límite de horas
         
         Reglas:
-        1. Para cada máquina, evalúa PREVENTIVO y PREDICTIVO por separado
-        2. Cada tipo de mantenimiento suma 1 punto a UNA SOLA categoría
+        1. Cada máquina suma 1 punto a UNA SOLA categoría
            (vencido > pendiente > al_día, en ese orden)
-        3. El estado en_operacion es independiente
+        2. El estado en_operacion es independiente
            (una máquina puede estar vencida Y en operación)
         
         Returns:
@@ -286,83 +348,21 @@ class MaquinariaService(IMaquinariaService):
                 "pendientes": int,
                 "vencidos": int
             }
-        """
-        
-        # Contadores
-        resumen = {
-            "en_operacion": 0,
-            "al_dia": 0,
-            "pendientes": 0,
-            "vencidos": 0
-        }
-
-        # Obtener todas las máquinas
-        maquinas = self.listar_maquinarias()
-
-        # Iterar sobre cada máquina
-        for maquina in maquinas:
-            id_maquina = maquina.id_maquina
-            horas_totales = Decimal(str(maquina.horas_totales))
-
-            # ======================================================
-            # 1. EVALUAR ESTADO DE OPERACIÓN (INDEPENDIENTE)
-            # ======================================================
-            ultimo_proyecto = self.proyecto_maquinaria_service.obtener_ultimo_proyecto_por_maquina(
-                id_maquina=id_maquina
-            )
-
-            # Si existe proyecto activo → suma a en_operacion
-            if ultimo_proyecto and not ultimo_proyecto.finalizado:
-                resumen["en_operacion"] += 1
-
-            programados = self.mantenimiento_programado_service.obtener_programados_por_maquina(id_maquina)
-
-            if not programados:
-                resumen["al_dia"] += 1
-                continue
-
-            estado_maquina = "al_dia"
-
-            for programado in programados:
-
-                ultimo_mantenimiento = self.mantenimiento_service.obtener_ultimo_mantenimiento_por_maquina_y_programado(
-                    id_maquina=id_maquina,
-                    id_programado=programado.id_programado
-                )
-
-                # Si no existe mantenimiento del tipo → ignorar
-                if not ultimo_mantenimiento:
-                    continue
 
+        El resultado se cachea en el grupo "flota" (ver comun.cache) y se
+        invalida al confirmarse cualquier escritura de sus modelos.
+        """
+        return obtener_o_calcular(GRUPO_FLOTA, "resumen", self._calcular_resumen_maquinarias)
 
-                # ======================================================
-                # CALCULAR HORAS
-                # ======================================================
-                horas_realizadas = Decimal(str(ultimo_mantenimiento.horas_realizadas))
-                intervalo_horas = Decimal(str(programado.intervalo_horas))
-                
-                horas_proximas = horas_realizadas + intervalo_horas
-                diferencia = horas_proximas - horas_totales
-
-                # ======================================================
-                # CLASIFICAR: VENCIDO → PENDIENTE → AL DÍA
-                # (Orden obligatorio para exclusividad)
-                # ======================================================
-                if diferencia <= 0:
-                    estado_maquina = "vencidos"
-                    break  # ya es el peor estado posible
-
-                elif 0 < diferencia <= 20:
-                    if estado_maquina != "pendientes":  # no sobrescribir si ya estaba en "vencidos"
-                        estado_maquina = "pendientes"
-                    # NO hacemos break porque podría haber un vencido en los que faltan
-
-                    # ---------------------------------------
-                    # 4. Incrementar UNA SOLA categoría por máquina
-                    # ---------------------------------------
-            resumen[estado_maquina] += 1
+    def _calcular_resumen_maquinarias(self):
+        conteos = MaquinariaRepository.get_resumen_estados()
 
-        return resumen
+        return {
+            "en_operacion": conteos["en_operacion"],
+            "al_dia": conteos["total"] - conteos["vencidos"] - conteos["pendientes"],
+            "pendientes": conteos["pendientes"],
+            "vencidos": conteos["vencidos"]
+        }
 
     # =========================================================================
     # LISTA DE MAQUINARIAS EN OPERACION
@@ -372,20 +372,9 @@ class MaquinariaService(IMaquinariaService):
         Retorna las maquinarias actualmente en operación.
         Una maquinaria está en operación si su último proyecto no está finalizado.
         """
-        maquinarias_operacion = []
-        maquinas = self.listar_maquinarias()
-
-        for maquina in maquinas:
-            id_maquina = maquina.id_maquina
-
-            ultimo_proyecto = self.proyecto_maquinaria_service.obtener_ultimo_proyecto_por_maquina(
-                id_maquina=id_maquina
-            )
-
-            if ultimo_proyecto and not ultimo_proyecto.finalizado:
-                maquinarias_operacion.append(maquina)
-
-        return maquinarias_operacion
+        return MaquinariaRepository.get_all_con_ultimo_proyecto().filter(
+            ultimo_proyecto_finalizado=False
+        )
 
     # =========================================================================
     # LISTA DE MAQUINARIAS VENCIDAS
@@ -395,35 +384,7 @@ class MaquinariaService(IMaquinariaService):
         Retorna maquinarias con al menos un mantenimiento programado vencido.
         VENCIDO = horas_proximas <= horas_totales
         """
-        maquinarias_vencidas = []
-        maquinas = self.listar_maquinarias()
-
-        for maquina in maquinas:
-            id_maquina = maquina.id_maquina
-            horas_totales = Decimal(str(maquina.horas_totales))
-
-            programados = self.mantenimiento_programado_service.obtener_programados_por_maquina(id_maquina)
-
-            for programado in programados:
-
-                # Obtener último mantenimiento real asociado a este programado
-                ultimo = self.mantenimiento_service.obtener_ultimo_mantenimiento_por_maquina_y_programado(
-                    id_maquina=id_maquina,
-                    id_programado=programado.id_programado
-                )
-
-                if not ultimo:
-                    continue  # Nunca se ha realizado → ignorar
-
-                horas_realizadas = Decimal(str(ultimo.horas_realizadas))
-                intervalo = Decimal(str(programado.intervalo_horas))
-                horas_proximas = horas_realizadas + intervalo
-
-                if horas_proximas <= horas_totales:
-                    maquinarias_vencidas.append(maquina)
-                    break
-
-        return maquinarias_vencidas
+        return MaquinariaRepository.filter_by_estado_mantenimiento(EstadoMantenimiento.VENCIDO)
 
     # =========================================================================
     # LISTA DE MAQUINARIAS PENDIENTES
@@ -433,38 +394,7 @@ class MaquinariaService(IMaquinariaService):
         Retorna maquinarias con al menos un mantenimiento programado próximo.
         PENDIENTE = 0 < (horas_proximas - horas_totales) <= 20
         """
-        maquinarias_pendientes = []
-        maquinas = self.listar_maquinarias()
-
-        for maquina in maquinas:
-            id_maquina = maquina.id_maquina
-            horas_totales = Decimal(str(maquina.horas_totales))
-
-            programados = self.mantenimiento_programado_service.obtener_programados_por_maquina(id_maquina)
-
-            for programado in programados:
-
-                ultimo = self.mantenimiento_service.obtener_ultimo_mantenimiento_por_maquina_y_programado(
-                    id_maquina=id_maquina,
-                    id_programado=programado.id_programado
-                )
-
-                if not ultimo:
-                    continue
-
-                horas_realizadas = Decimal(str(ultimo.horas_realizadas))
-                intervalo = Decimal(str(programado.intervalo_horas))
-                horas_proximas = horas_realizadas + intervalo
-
-                diferencia = horas_proximas - horas_totales
-
-                # pendiente: faltan entre 1 y 20 horas
-                if 0 < diferencia <= 20:
-                    maquinarias_pendientes.append(maquina)
-                    break
-
-        return maquinarias_pendientes
-
+        return MaquinariaRepository.filter_by_estado_mantenimiento(EstadoMantenimiento.PENDIENTE)
 
     # =========================================================================
     # LISTA DE MAQUINARIAS AL DIA
@@ -474,46 +404,61 @@ class MaquinariaService(IMaquinariaService):
         Retorna maquinarias que están totalmente al día.
         AL DÍA = ninguna vencida y ninguna pendiente.
         """
-        maquinarias_al_dia = []
-        maquinas = self.listar_maquinarias()
-
-        for maquina in maquinas:
-            id_maquina = maquina.id_maquina
-            horas_totales = Decimal(str(maquina.horas_totales))
-
-            programados = self.mantenimiento_programado_service.obtener_programados_por_maquina(id_maquina)
-
-            estado = "al_dia"
-
-            for programado in programados:
-
-                ultimo = self.mantenimiento_service.obtener_ultimo_mantenimiento_por_maquina_y_programado(
-                    id_maquina=id_maquina,
-                    id_programado=programado.id_programado
-                )
-
-                if not ultimo:
-                    continue
+        return MaquinariaRepository.get_al_dia()
 
-                horas_realizadas = Decimal(str(ultimo.horas_realizadas))
-                intervalo = Decimal(str(programado.intervalo_horas))
-                horas_proximas = horas_realizadas + intervalo
+    # =========================================================================
+    # LISTADOS DEL DASHBOARD (CACHEADOS)
+    # =========================================================================
+    def obtener_listado_dashboard(self, categoria: str):
+        """
+        Retorna la lista serializada de maquinarias de una categoría del
+        dashboard: "en-operacion", "vencidas", "pendientes" o "al-dia".
+        Se cachea igual que el resumen (grupo "flota").
+        """
+        consultas = {
+            "en-operacion": self.obtener_maquinarias_operacion,
+            "vencidas": self.obtener_maquinarias_vencidas,
+            "pendientes": self.obtener_maquinarias_pendientes,
+            "al-dia": self.obtener_maquinarias_al_dia,
+        }
+        if categoria not in consultas:
+            raise ValidationError({"categoria": f"Categoría no válida: {categoria}"})
 
-                diferencia = horas_proximas - horas_totales
+        return obtener_o_calcular(
+            GRUPO_FLOTA,
+            f"listado:{categoria}",
+            lambda: list(MaquinariaSerializer(consultas[categoria](), many=True).data)
+        )
 
-                if horas_proximas <= horas_totales:
-                    estado = "vencida"
-                    break
+    def listar_ultimas_maquinarias(self):
+        """Retorna las ultimas maquinarias creadas o actualizadas"""
+        return MaquinariaRepository.get_last_updated(limit=10)
 
-                if 0 < diferencia <= 20:
-                    estado = "pendiente"
-                    break
+    # ---------------------------------------------------------
+    # HISTORIA DE VIDA (TIMELINE)
+    # ---------------------------------------------------------
+    def obtener_timeline(self, id_maquina: int, cursor=None, page_size=None, tipos=None):
+        """
+        Retorna una página (PaginaCursor) de la historia de la máquina:
+        alarmas, asignaciones, hojas de vida, mantenimientos y registros
+        de horas en un solo orden cronológico (más recientes primero).
+        `tipos` limita las fuentes (ver TimelineRepository.FUENTES).
+        Lanza NotFound si la máquina no existe.
+        """
+        if tipos:
+            desconocidos = set(tipos) - TimelineRepository.FUENTES.keys()
+            if desconocidos:
+                raise ValidationError({
+                    "tipos": f"Tipos no soportados: {', '.join(sorted(desconocidos))}. "
+                             f"Use: {', '.join(TimelineRepository.FUENTES)}."
+                })
 
-            if estado == "al_dia":
-                maquinarias_al_dia.append(maquina)
+        try:
+            id_maquina = int(id_maquina)
+        except (TypeError, ValueError):
+            raise NotFound("La maquinaria solicitada no existe.")
 
-        return maquinarias_al_dia
+        if not MaquinariaRepository.exists(id_maquina):
+            raise NotFound("La maquinaria solicitada no existe.")
 
-    def listar_ultimas_maquinarias(self):
-        """Retorna las ultimas maquinarias creadas o actualizadas"""
-        return MaquinariaRepository.get_last_updated(limit=10)
\ No newline at end of file
+        return TimelineRepository.get_page(id_maquina, cursor=cursor, page_size=page_size, tipos=tipos)
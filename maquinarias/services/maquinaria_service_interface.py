@@ -15,7 +15,11 @@ class IMaquinariaService(ABC):
         pass
 
     @abstractmethod
-    def listar_maquinarias(self):
+    def listar_maquinarias(self, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_maquinarias_paginado(self, cursor=None, page_size=None, columnas=None):
         pass
 
     @abstractmethod
@@ -38,6 +42,11 @@ class IMaquinariaService(ABC):
     def eliminar_maquinaria(self, id_maquina: int):
         pass
 
+    @abstractmethod
+    def clasificar_maquinarias(self):
+        """Clasifica todas las máquinas por estado de mantenimiento (set-based)."""
+        pass
+
     @abstractmethod
     def obtener_resumen_maquinarias(self):
         pass
@@ -58,7 +67,16 @@ class IMaquinariaService(ABC):
     def obtener_maquinarias_al_dia(self):
         pass
 
+    @abstractmethod
+    def obtener_listado_dashboard(self, categoria: str):
+        pass
+
     @abstractmethod
     def listar_ultimas_maquinarias(self):
         """Retorna las ultimas maquinarias creadas o actualizadas"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def obtener_timeline(self, id_maquina: int, cursor=None, page_size=None, tipos=None):
+        """Retorna una página de la historia de la máquina (todas las fuentes, por fecha)."""
+        pass
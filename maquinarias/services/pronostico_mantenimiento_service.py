@@ -0,0 +1,98 @@
+import math
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+
+from comun.cache import GRUPO_FLOTA, obtener_o_calcular
+from maquinarias.repositories.pronostico_repository import PronosticoRepository
+from maquinarias.services.pronostico_mantenimiento_service_interface import IPronosticoMantenimientoService
+
+
+class PronosticoMantenimientoService(IPronosticoMantenimientoService):
+    """
+    Servicio de pronóstico de próximos mantenimientos.
+
+    Las alarmas y EstadoMantenimiento saben cuántas horas faltan para cada
+    mantenimiento programado; este servicio estima CUÁNDO se cumplirán:
+
+        tasa_diaria     = horas trabajadas en los últimos PRONOSTICO_VENTANA_DIAS / días de la ventana
+        dias_restantes  = ceil(horas_restantes / tasa_diaria)
+        fecha_estimada  = hoy + dias_restantes
+
+    Se calcula para toda la flota con dos consultas (horas por máquina y
+    estados de mantenimiento) y se cachea en el grupo "flota": se recalcula
+    cuando cambian los registros de horas o los estados.
+    """
+
+    # Campos por los que se puede ordenar (prefijo "-" = descendente)
+    ORDENES = ("fecha_estimada", "dias_restantes", "horas_restantes", "tasa_diaria", "nombre_maquina")
+    ORDEN_POR_DEFECTO = "fecha_estimada"
+
+    def obtener_proximos_mantenimientos(self, orden: str = None):
+        """
+        Retorna la lista de pronósticos ordenada por `orden`. Los pares sin
+        fecha estimada (sin historial o sin horas en la ventana) van al
+        final en cualquier orden.
+        Lanza ValidationError si el orden no es válido.
+        """
+        orden = orden or self.ORDEN_POR_DEFECTO
+        campo = orden.lstrip("-")
+        if campo not in self.ORDENES:
+            raise ValidationError({
+                "orden": f"Orden no soportado. Use: {', '.join(self.ORDENES)} (prefijo '-' para descendente)."
+            })
+
+        hoy = date.today()
+        pronosticos = obtener_o_calcular(
+            GRUPO_FLOTA,
+            f"proximos_mantenimientos:{hoy.isoformat()}",
+            lambda: self._calcular(hoy)
+        )
+
+        con_valor = [p for p in pronosticos if p[campo] is not None]
+        sin_valor = [p for p in pronosticos if p[campo] is None]
+        con_valor.sort(key=lambda p: p[campo], reverse=orden.startswith("-"))
+        return con_valor + sin_valor
+
+    def _calcular(self, hoy: date):
+        ventana = settings.PRONOSTICO_VENTANA_DIAS
+        horas_por_maquina = PronosticoRepository.get_horas_por_maquina(
+            hoy - timedelta(days=ventana - 1), hoy
+        )
+
+        pronosticos = []
+        for fila in PronosticoRepository.get_estados():
+            tasa = (horas_por_maquina.get(fila["maquina_id"], Decimal("0")) / ventana).quantize(Decimal("0.01"))
+            restantes = fila["diferencia"]
+            dias = self._dias_restantes(restantes, tasa)
+
+            pronosticos.append({
+                "id_maquina": fila["maquina_id"],
+                "nombre_maquina": fila["nombre_maquina"],
+                "id_programado": fila["programado_id"],
+                "nombre_programado": fila["nombre_programado"],
+                "tipo": fila["tipo"],
+                "estado": fila["estado"],
+                "horas_restantes": restantes,
+                "tasa_diaria": tasa,
+                "dias_restantes": dias,
+                "fecha_estimada": hoy + timedelta(days=dias) if dias is not None else None,
+            })
+
+        return pronosticos
+
+    @staticmethod
+    def _dias_restantes(horas_restantes, tasa_diaria):
+        """
+        Días hasta cumplir las horas restantes al ritmo dado.
+        0 si ya está vencido; None si no hay historial o la máquina no se usó.
+        """
+        if horas_restantes is None:
+            return None
+        if horas_restantes <= 0:
+            return 0
+        if tasa_diaria <= 0:
+            return None
+        return math.ceil(horas_restantes / tasa_diaria)
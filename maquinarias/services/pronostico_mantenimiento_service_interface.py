@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class IPronosticoMantenimientoService(ABC):
+    """
+    Interfaz del servicio de pronóstico de próximos mantenimientos.
+    """
+
+    @abstractmethod
+    def obtener_proximos_mantenimientos(self, orden: str = None):
+        """
+        Retorna, por cada par máquina/programado, la fecha estimada del
+        próximo mantenimiento según el ritmo de uso reciente de la máquina.
+        """
+        pass
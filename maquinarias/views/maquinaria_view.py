@@ -3,12 +3,20 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from maquinarias.models.maquinaria import Maquinaria
 from logins.permissions.rol_permissions import RolPermission
 from maquinarias.serializers.maquinaria_serializer import MaquinariaSerializer
-from maquinarias.services.maquinaria_service import MaquinariaService
+from maquinarias.serializers.proximo_mantenimiento_serializer import ProximoMantenimientoSerializer
+from maquinarias.serializers.timeline_evento_serializer import TimelineEventoSerializer
 from maquinarias.services.maquinaria_service_interface import IMaquinariaService
+from maquinarias.services.pronostico_mantenimiento_service_interface import IPronosticoMantenimientoService
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PAGE_SIZE_POR_DEFECTO, PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
-class MaquinariaViewSet(viewsets.ModelViewSet):
+class MaquinariaViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de maquinarias.
     Gestiona listado, creación, consulta individual,
@@ -18,23 +26,31 @@ class MaquinariaViewSet(viewsets.ModelViewSet):
 
     permission_key = "maquinaria"
     permission_classes = [RolPermission]
+    modelo_condicional = Maquinaria
 
     def __init__(
         self,
-        service: IMaquinariaService = MaquinariaService(),
+        service: IMaquinariaService = None,
+        pronostico_service: IPronosticoMantenimientoService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("maquinaria")
+        self.pronostico_service = pronostico_service or obtener_servicio("pronostico_mantenimiento")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todas las maquinarias."""
-        maquinarias = self.service.listar_maquinarias()
-        serializer = MaquinariaSerializer(maquinarias, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, MaquinariaSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_maquinarias_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, MaquinariaSerializer, campos=campos)
+
+        maquinarias = self.service.listar_maquinarias(columnas=columnas)
+        return Response(serializar_listado(maquinarias, MaquinariaSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                 OBTENER (GET/{id})
@@ -136,9 +152,8 @@ class MaquinariaViewSet(viewsets.ModelViewSet):
         GET /api/maquinarias/en-operacion/
         """
         try:
-            maquinarias = self.service.obtener_maquinarias_operacion()
-            serializer = MaquinariaSerializer(maquinarias, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            maquinarias = self.service.obtener_listado_dashboard("en-operacion")
+            return Response(maquinarias, status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response(
@@ -156,9 +171,8 @@ class MaquinariaViewSet(viewsets.ModelViewSet):
         GET /api/maquinarias/vencidas/
         """
         try:
-            maquinarias = self.service.obtener_maquinarias_vencidas()
-            serializer = MaquinariaSerializer(maquinarias, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            maquinarias = self.service.obtener_listado_dashboard("vencidas")
+            return Response(maquinarias, status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response(
@@ -176,9 +190,8 @@ class MaquinariaViewSet(viewsets.ModelViewSet):
         GET /api/maquinarias/pendientes/
         """
         try:
-            maquinarias = self.service.obtener_maquinarias_pendientes()
-            serializer = MaquinariaSerializer(maquinarias, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            maquinarias = self.service.obtener_listado_dashboard("pendientes")
+            return Response(maquinarias, status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response(
@@ -196,9 +209,8 @@ class MaquinariaViewSet(viewsets.ModelViewSet):
         GET /api/maquinarias/al-dia/
         """
         try:
-            maquinarias = self.service.obtener_maquinarias_al_dia()
-            serializer = MaquinariaSerializer(maquinarias, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            maquinarias = self.service.obtener_listado_dashboard("al-dia")
+            return Response(maquinarias, status=status.HTTP_200_OK)
 
         except Exception as e:
             return Response(
@@ -221,3 +233,45 @@ class MaquinariaViewSet(viewsets.ModelViewSet):
                 {"detail": f"Error al obtener las ultimas maquinarias: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    # -------------------------------------------------------
+    #   PRONÓSTICO DE MANTENIMIENTOS (GET /proximos-mantenimientos)
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='proximos-mantenimientos')
+    def proximos_mantenimientos(self, request):
+        """
+        Fecha estimada del próximo mantenimiento de cada máquina/programado,
+        según las horas restantes y el ritmo de uso reciente de la máquina.
+        GET /api/maquinarias/proximos-mantenimientos/?orden=fecha_estimada
+        orden: fecha_estimada (por defecto), dias_restantes, horas_restantes,
+        tasa_diaria o nombre_maquina; prefijo "-" para descendente.
+        """
+        try:
+            pronosticos = self.pronostico_service.obtener_proximos_mantenimientos(
+                orden=request.query_params.get("orden")
+            )
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = ProximoMantenimientoSerializer(pronosticos, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    # -------------------------------------------------------
+    #          HISTORIA DE LA MÁQUINA (GET/{id}/timeline)
+    # -------------------------------------------------------
+    @action(detail=True, methods=['get'], url_path='timeline')
+    def timeline(self, request, pk=None):
+        """
+        Historia unificada de la máquina (alarmas, asignaciones, hojas de
+        vida, mantenimientos y registros de horas), más reciente primero.
+        GET /api/maquinarias/{id}/timeline/?cursor=&page_size=&tipos=alarma,mantenimiento
+        Siempre paginado por cursor.
+        """
+        paginacion = self.obtener_parametros_cursor(request) or {
+            "cursor": None, "page_size": PAGE_SIZE_POR_DEFECTO
+        }
+        tipos = request.query_params.get("tipos")
+        tipos = [t.strip() for t in tipos.split(",") if t.strip()] if tipos else None
+
+        pagina = self.service.obtener_timeline(pk, tipos=tipos, **paginacion)
+        return self.respuesta_paginada(pagina, TimelineEventoSerializer)
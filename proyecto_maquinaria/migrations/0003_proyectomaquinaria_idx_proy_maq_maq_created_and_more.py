@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maquinarias', '0004_alter_maquinaria_foto'),
+        ('proyecto_maquinaria', '0002_rename_horas_proyectomaquinaria_horas_acumuladas_and_more'),
+        ('proyectos', '0004_alter_proyecto_empresa'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='proyectomaquinaria',
+            index=models.Index(fields=['maquina', '-created_at'], name='idx_proy_maq_maq_created'),
+        ),
+        migrations.AddIndex(
+            model_name='proyectomaquinaria',
+            index=models.Index(fields=['maquina', 'finalizado'], name='idx_proy_maq_maq_final'),
+        ),
+    ]
@@ -0,0 +1 @@
+from .proyecto_maquinaria import ProyectoMaquinaria
@@ -45,6 +45,12 @@ class ProyectoMaquinaria(models.Model):
         db_table = 'proyecto_maquinaria'
         verbose_name = "Proyecto-Maquinaria"
         verbose_name_plural = "Proyectos-Maquinaria"
+        indexes = [
+            # Última asignación de una máquina
+            models.Index(fields=['maquina', '-created_at'], name='idx_proy_maq_maq_created'),
+            # Asignaciones activas/finalizadas de una máquina
+            models.Index(fields=['maquina', 'finalizado'], name='idx_proy_maq_maq_final'),
+        ]
 
     def __str__(self):
         return f"Proyecto #{self.proyecto.id_proyecto} - Máquina #{self.maquina.id_maquina}"
@@ -1,6 +1,11 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Case, DecimalField, F, Q, Value, When
+from django.utils.timezone import now
 
 from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
+from comun.cache import invalidar_por_modelo
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class ProyectoMaquinariaRepository:
@@ -11,9 +16,14 @@ class ProyectoMaquinariaRepository:
     """
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todas las asignaciones de máquinas a proyectos."""
-        return ProyectoMaquinaria.objects.all()
+        return limitar_columnas(ProyectoMaquinaria.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las asignaciones paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(ProyectoMaquinaria.objects.all(), columnas), cursor, page_size)
 
     @staticmethod
     def get_by_id(**kwargs):
@@ -60,14 +70,92 @@ class ProyectoMaquinariaRepository:
         return asignacion
 
     @staticmethod
-    def update_horas_acumuladas(proyecto_maquinaria: ProyectoMaquinaria, horas_a_sumar ):
+    def get_for_update(**kwargs):
+        """
+        Igual que get_by_id, pero bloquea la fila (SELECT ... FOR UPDATE)
+        hasta el fin de la transacción. Debe llamarse dentro de transaction.atomic.
+        Retorna None si no existe.
+        """
+        try:
+            return ProyectoMaquinaria.objects.select_for_update().get(**kwargs)
+        except ObjectDoesNotExist:
+            return None
+
+    @staticmethod
+    def update_horas_acumuladas(proyecto_maquinaria: ProyectoMaquinaria, horas_a_sumar):
+        """
+        Suma horas a horas_acumuladas con un UPDATE atómico (F()).
+        Retorna la asignación recargada o None si la instancia no es válida.
+        """
         if not proyecto_maquinaria or not isinstance(proyecto_maquinaria, ProyectoMaquinaria):
             return None
 
-        proyecto_maquinaria.horas_acumuladas += horas_a_sumar
-        proyecto_maquinaria.save()
+        ProyectoMaquinaria.objects.filter(pk=proyecto_maquinaria.pk).update(
+            horas_acumuladas=F('horas_acumuladas') + horas_a_sumar,
+            updated_at=now()
+        )
+        invalidar_por_modelo(ProyectoMaquinaria)
+        proyecto_maquinaria.refresh_from_db(fields=['horas_acumuladas', 'updated_at'])
         return proyecto_maquinaria
 
+    @staticmethod
+    def get_for_update_por_pares(pares):
+        """
+        Retorna {(id_maquina, id_proyecto): ProyectoMaquinaria} de los pares
+        dados en una sola consulta, bloqueando las filas (SELECT ... FOR UPDATE).
+        Los pares sin asignación no aparecen en el diccionario.
+        """
+        pares = set(pares)
+        if not pares:
+            return {}
+
+        filtro = Q()
+        for id_maquina, id_proyecto in pares:
+            filtro |= Q(maquina_id=id_maquina, proyecto_id=id_proyecto)
+
+        return {
+            (asignacion.maquina_id, asignacion.proyecto_id): asignacion
+            for asignacion in ProyectoMaquinaria.objects.select_for_update().filter(filtro)
+        }
+
+    @staticmethod
+    def sumar_horas_por_asignacion(horas_por_asignacion: dict):
+        """
+        Suma a cada asignación sus horas ({id_proyecto_maquinaria: horas}) con
+        un único UPDATE (CASE por id) y marca como finalizadas las que
+        alcanzaron sus horas pactadas. Retorna la cantidad de asignaciones
+        actualizadas.
+        """
+        if not horas_por_asignacion:
+            return 0
+
+        incremento = Case(
+            *[When(pk=id_asignacion, then=Value(horas)) for id_asignacion, horas in horas_por_asignacion.items()],
+            output_field=DecimalField(max_digits=12, decimal_places=2)
+        )
+        asignaciones = ProyectoMaquinaria.objects.filter(pk__in=horas_por_asignacion)
+        actualizadas = asignaciones.update(
+            horas_acumuladas=F('horas_acumuladas') + incremento,
+            updated_at=now()
+        )
+        asignaciones.filter(
+            finalizado=False, horas_acumuladas__gte=F('horas_totales')
+        ).update(finalizado=True)
+
+        invalidar_por_modelo(ProyectoMaquinaria)
+        return actualizadas
+
+    @staticmethod
+    def update_fields(proyecto_maquinaria: ProyectoMaquinaria, **kwargs):
+        """
+        Guarda solo los campos indicados (save(update_fields=...)).
+        Ejemplo: update_fields(asignacion, horas_acumuladas=120, finalizado=True)
+        """
+        for key, value in kwargs.items():
+            setattr(proyecto_maquinaria, key, value)
+
+        proyecto_maquinaria.save(update_fields=[*kwargs, 'updated_at'])
+        return proyecto_maquinaria
 
 
     @staticmethod
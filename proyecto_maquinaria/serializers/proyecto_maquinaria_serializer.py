@@ -2,9 +2,10 @@ from datetime import date
 
 from rest_framework import serializers
 from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class ProyectoMaquinariaSerializer(serializers.ModelSerializer):
+class ProyectoMaquinariaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     """
     Serializer profesional para ProyectoMaquinaria.
     Incluye validaciones sólidas y consistentes con el modelo actualizado.
@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+from django.db import transaction
 from rest_framework.exceptions import NotFound, ValidationError
 
 from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
@@ -20,9 +21,21 @@ class ProyectoMaquinariaService(IProyectoMaquinariaService):
     # ----------------------------------------------------------------------
     # Listar
     # ----------------------------------------------------------------------
-    def listar_asignaciones(self):
+    def listar_asignaciones(self, columnas=None):
         """Retorna todas las asignaciones de máquinas a proyectos."""
-        return ProyectoMaquinariaRepository.get_all()
+        return ProyectoMaquinariaRepository.get_all(columnas=columnas)
+
+    def listar_asignaciones_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de las asignaciones (paginación por cursor)."""
+        return ProyectoMaquinariaRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
+
+    def listar_por_proyecto(self, id_proyecto: int):
+        """Retorna las asignaciones de un proyecto (filtradas en la BD)."""
+        return ProyectoMaquinariaRepository.get_by_proyecto(id_proyecto)
+
+    def listar_por_maquina(self, id_maquina: int):
+        """Retorna las asignaciones de una máquina (filtradas en la BD)."""
+        return ProyectoMaquinariaRepository.get_by_maquina(id_maquina)
 
     # ----------------------------------------------------------------------
     # Obtener una asignación
@@ -94,6 +107,7 @@ class ProyectoMaquinariaService(IProyectoMaquinariaService):
     # ----------------------------------------------------------------------
     # Actualizar horas acumuladas
     # ----------------------------------------------------------------------
+    @transaction.atomic
     def sumar_horas_acumuladas(self, proyecto_maquinaria: ProyectoMaquinaria,
                                horas_a_sumar: Decimal) -> ProyectoMaquinaria:
         """
@@ -101,9 +115,14 @@ class ProyectoMaquinariaService(IProyectoMaquinariaService):
 
         Reglas:
         - No permitir sumar si ya llegó al total y está finalizado.
+        - No permitir exceder las horas pactadas.
         - Si estaba finalizado pero no ha alcanzado las horas totales, se reactiva.
         - Si llega a las horas totales, se marca finalizado automáticamente.
         - Devuelve la instancia actualizada de ProyectoMaquinaria.
+
+        Las reglas se evalúan sobre la fila bloqueada (SELECT ... FOR UPDATE):
+        registros concurrentes de la misma asignación se serializan y
+        ninguno pisa las horas del otro.
         """
 
         # -----------------------------------------
@@ -112,43 +131,55 @@ class ProyectoMaquinariaService(IProyectoMaquinariaService):
         if not proyecto_maquinaria or not isinstance(proyecto_maquinaria, ProyectoMaquinaria):
             raise NotFound(detail="La asignación de proyecto-maquinaria no existe.")
 
+        # Releer con bloqueo: la instancia recibida puede estar desactualizada
+        asignacion = ProyectoMaquinariaRepository.get_for_update(
+            id_proyecto_maquinaria=proyecto_maquinaria.id_proyecto_maquinaria
+        )
+        if asignacion is None:
+            raise NotFound(detail="La asignación de proyecto-maquinaria no existe.")
+
         # Asegurar Decimal
         horas_a_sumar = Decimal(horas_a_sumar)
 
-        horas_actuales = proyecto_maquinaria.horas_acumuladas
-        horas_totales = proyecto_maquinaria.horas_totales
+        horas_actuales = asignacion.horas_acumuladas
+        horas_totales = asignacion.horas_totales
+        finalizado = asignacion.finalizado
 
         # -----------------------------------------
         # Reglas de negocio sobre finalizado / horas
         # -----------------------------------------
 
         # Si está finalizado y ya cumplió las horas → no permitir sumar más
-        if proyecto_maquinaria.finalizado and horas_actuales >= horas_totales:
+        if finalizado and horas_actuales >= horas_totales:
             raise ValidationError("La máquina ya completó las horas pactadas para este proyecto.")
 
         # Si está finalizado pero todavía no alcanza el total (caso muy raro)
-        if proyecto_maquinaria.finalizado and horas_actuales < horas_totales:
-            proyecto_maquinaria.finalizado = False
+        if finalizado and horas_actuales < horas_totales:
+            finalizado = False
 
-        # Sumar horas (sin exceder total)
         nuevas_horas = horas_actuales + horas_a_sumar
 
-        if nuevas_horas >= horas_totales:
-            nuevas_horas = horas_totales
-            proyecto_maquinaria.finalizado = True
+        # El serializer valida esto con una lectura sin bloqueo; aquí se
+        # re-valida con el valor vigente por si otro registro sumó antes
+        if nuevas_horas > horas_totales:
+            raise ValidationError(
+                f"Las horas registradas ({horas_a_sumar}) exceden el límite permitido para este "
+                f"proyecto ({horas_totales} h). Horas acumuladas actuales: {horas_actuales}."
+            )
+
+        if nuevas_horas == horas_totales:
+            finalizado = True
 
         # -----------------------------------------
-        # Guardar cambios
+        # Guardar cambios (solo las columnas que cambian)
         # -----------------------------------------
 
-        asignacion_actualizada = ProyectoMaquinariaRepository.update(
-            id_proyecto_maquinaria=proyecto_maquinaria.id_proyecto_maquinaria,
+        return ProyectoMaquinariaRepository.update_fields(
+            asignacion,
             horas_acumuladas=nuevas_horas,
-            finalizado=proyecto_maquinaria.finalizado
+            finalizado=finalizado
         )
 
-        return asignacion_actualizada
-
     def obtener_ultimo_proyecto_por_maquina(self, id_maquina: int):
       """
       Obtiene el último proyecto asociado a una máquina.
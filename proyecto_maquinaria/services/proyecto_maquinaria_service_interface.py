@@ -11,7 +11,19 @@ class IProyectoMaquinariaService(ABC):
     """
 
     @abstractmethod
-    def listar_asignaciones(self):
+    def listar_asignaciones(self, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_asignaciones_paginado(self, cursor=None, page_size=None, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_por_proyecto(self, id_proyecto: int):
+        pass
+
+    @abstractmethod
+    def listar_por_maquina(self, id_maquina: int):
         pass
 
     @abstractmethod
@@ -3,13 +3,18 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
 from logins.permissions.rol_permissions import RolPermission
 from proyecto_maquinaria.serializers.proyecto_maquinaria_serializer import ProyectoMaquinariaSerializer
-from proyecto_maquinaria.services.proyecto_maquinaria_service import ProyectoMaquinariaService
 from proyecto_maquinaria.services.proyecto_maquinaria_service_interface import IProyectoMaquinariaService
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class ProyectoMaquinariaViewSet(viewsets.ModelViewSet):
+class ProyectoMaquinariaViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de asignaciones de máquinas a proyectos.
     Gestiona listado, creación, consulta individual,
@@ -19,23 +24,29 @@ class ProyectoMaquinariaViewSet(viewsets.ModelViewSet):
 
     permission_key = "proyecto_maquinaria"
     permission_classes = [RolPermission]
+    modelo_condicional = ProyectoMaquinaria
 
     def __init__(
         self,
-        service: IProyectoMaquinariaService = ProyectoMaquinariaService(),
+        service: IProyectoMaquinariaService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("proyecto_maquinaria")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todas las asignaciones."""
-        asignaciones = self.service.listar_asignaciones()
-        serializer = ProyectoMaquinariaSerializer(asignaciones, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, ProyectoMaquinariaSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_asignaciones_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, ProyectoMaquinariaSerializer, campos=campos)
+
+        asignaciones = self.service.listar_asignaciones(columnas=columnas)
+        return Response(serializar_listado(asignaciones, ProyectoMaquinariaSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                     OBTENER (GET/{id})
@@ -104,8 +115,7 @@ class ProyectoMaquinariaViewSet(viewsets.ModelViewSet):
         Endpoint para listar asignaciones por proyecto.
         GET /proyecto_maquinaria/proyecto/{id_proyecto}/
         """
-        asignaciones = self.service.listar_asignaciones()
-        asignaciones = [a for a in asignaciones if a.proyecto.id_proyecto == int(id_proyecto)]
+        asignaciones = self.service.listar_por_proyecto(id_proyecto)
         serializer = ProyectoMaquinariaSerializer(asignaciones, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -118,7 +128,6 @@ class ProyectoMaquinariaViewSet(viewsets.ModelViewSet):
         Endpoint para listar asignaciones por máquina.
         GET /proyecto_maquinaria/maquina/{id_maquina}/
         """
-        asignaciones = self.service.listar_asignaciones()
-        asignaciones = [a for a in asignaciones if a.maquina.id_maquina == int(id_maquina)]
+        asignaciones = self.service.listar_por_maquina(id_maquina)
         serializer = ProyectoMaquinariaSerializer(asignaciones, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
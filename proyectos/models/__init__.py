@@ -0,0 +1 @@
+from .proyecto import Proyecto
@@ -1,5 +1,7 @@
 from django.core.exceptions import ObjectDoesNotExist
 from proyectos.models.proyecto import Proyecto
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class ProyectoRepository:
@@ -9,9 +11,14 @@ class ProyectoRepository:
     """
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todos los proyectos."""
-        return Proyecto.objects.all()
+        return limitar_columnas(Proyecto.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los proyectos paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(Proyecto.objects.all(), columnas), cursor, page_size)
 
     @staticmethod
     def get_by_id(**kwargs):
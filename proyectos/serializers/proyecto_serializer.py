@@ -4,9 +4,10 @@ from django.core.validators import RegexValidator
 from rest_framework import serializers
 
 from proyectos.models.proyecto import Proyecto
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class ProyectoSerializer(serializers.ModelSerializer):
+class ProyectoSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
     class Meta:
         model = Proyecto
         fields = [
@@ -42,9 +42,13 @@ class ProyectoService(IProyectoService):
     # ----------------------------------------------------------------------
     # Listar Proyectos
     # ----------------------------------------------------------------------
-    def listar_proyectos(self):
+    def listar_proyectos(self, columnas=None):
         """Retorna todos los proyectos existentes."""
-        return ProyectoRepository.get_all()
+        return ProyectoRepository.get_all(columnas=columnas)
+
+    def listar_proyectos_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los proyectos (paginación por cursor)."""
+        return ProyectoRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ----------------------------------------------------------------------
     # Obtener Proyecto
@@ -9,7 +9,11 @@ class IProyectoService(ABC):
         pass
 
     @abstractmethod
-    def listar_proyectos(self):
+    def listar_proyectos(self, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_proyectos_paginado(self, cursor=None, page_size=None, columnas=None):
         pass
 
     @abstractmethod
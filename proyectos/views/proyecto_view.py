@@ -3,12 +3,17 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from proyectos.models.proyecto import Proyecto
 from logins.permissions.rol_permissions import RolPermission
 from proyectos.serializers.proyecto_serializer import ProyectoSerializer
 from proyectos.services.proyecto_service_interface import IProyectoService
-from proyectos.services.proyecto_service import ProyectoService
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
-class ProyectoViewSet(viewsets.ModelViewSet):
+class ProyectoViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de proyectos.
     Gestiona listado, creación, consulta individual,
@@ -18,23 +23,29 @@ class ProyectoViewSet(viewsets.ModelViewSet):
 
     permission_key = "proyecto"
     permission_classes = [RolPermission]
+    modelo_condicional = Proyecto
 
     def __init__(
         self,
-        service: IProyectoService = ProyectoService(),
+        service: IProyectoService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("proyecto")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todos los proyectos registradas."""
-        proyectos = self.service.listar_proyectos()
-        serializer = ProyectoSerializer(proyectos, many=True).data
-        return Response(serializer, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, ProyectoSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_proyectos_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, ProyectoSerializer, campos=campos)
+
+        proyectos = self.service.listar_proyectos(columnas=columnas)
+        return Response(serializar_listado(proyectos, ProyectoSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                 OBTENER (GET/{id})
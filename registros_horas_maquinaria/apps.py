@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class RegistrosHorasMaquinariaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'registros_horas_maquinaria'
+
+    def ready(self):
+        import registros_horas_maquinaria.signals
@@ -0,0 +1,232 @@
+import asyncio
+import gc
+import resource
+import time
+import tracemalloc
+import warnings
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from logins.models.login import Login
+from maquinarias.models.maquinaria import Maquinaria
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+
+# Días distintos por máquina (un registro por máquina y fecha)
+DIAS_POR_MAQUINA = 1000
+LOTE_SIEMBRA = 10000
+
+
+def rss_actual_kb():
+    """Memoria residente actual del proceso en KB (Linux; en otros sistemas, el máximo histórico)."""
+    try:
+        with open("/proc/self/status") as status:
+            for linea in status:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class Command(BaseCommand):
+    """
+    Mide la memoria de la exportación en streaming de registros de horas.
+
+    Dentro de una transacción que siempre se revierte siembra `--filas`
+    registros y descarga /api/registros-horarios-maquinaria/exportar/
+    en CSV y NDJSON a través de toda la pila (middleware, vista, service),
+    descartando cada bloque recibido. Reporta el pico de RSS sobre la
+    línea base tras la siembra y el pico de memoria Python (tracemalloc):
+    con streaming deben ser constantes aunque crezca `--filas`. Con `--materializado` mide además, para
+    comparar, el listado completo actual (GET /) sobre las mismas filas.
+
+    Con `--asgi` descarga a través del handler ASGI (como en producción
+    con uvicorn) y reporta si Django avisó que materializó la respuesta.
+    Las vistas corren entonces en otros hilos y conexiones, así que la
+    siembra se confirma y se borra al terminar en vez de revertirse.
+
+    Uso:
+        python manage.py benchmark_exportacion --filas 1000000
+        python manage.py benchmark_exportacion --filas 1000000 --asgi
+    """
+
+    help = "Pico de memoria de la exportación en streaming de registros de horas."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--filas", type=int, default=1_000_000,
+                            help="Registros de horas a sembrar y exportar.")
+        parser.add_argument("--materializado", action="store_true",
+                            help="Medir también el listado completo (materializa todo en memoria).")
+        parser.add_argument("--asgi", action="store_true",
+                            help="Descargar a través del handler ASGI en vez del cliente de pruebas.")
+
+    def handle(self, *args, **options):
+        filas = options["filas"]
+
+        if options["asgi"]:
+            self._handle_asgi(filas, options["materializado"])
+            return
+
+        with transaction.atomic():
+            inicio = time.perf_counter()
+            self._sembrar(filas)
+            self.stdout.write(f"Sembrados {filas} registros en {time.perf_counter() - inicio:.1f} s")
+
+            client = self._cliente_admin()
+            for formato in ("csv", "ndjson"):
+                self._medir(client, f"/api/registros-horarios-maquinaria/exportar/?formato={formato}",
+                            f"exportar {formato}", streaming=True)
+
+            if options["materializado"]:
+                self._medir(client, "/api/registros-horarios-maquinaria/", "listado completo", streaming=False)
+
+            transaction.set_rollback(True)
+
+    def _handle_asgi(self, filas, materializado):
+        inicio = time.perf_counter()
+        maquinas = self._sembrar(filas)
+        self.stdout.write(f"Sembrados {filas} registros en {time.perf_counter() - inicio:.1f} s")
+
+        login = self._login_admin()
+        try:
+            token = self._token(login)
+            rutas = [(f"/api/registros-horarios-maquinaria/exportar/?formato={formato}", f"exportar {formato}")
+                     for formato in ("csv", "ndjson")]
+            if materializado:
+                rutas.append(("/api/registros-horarios-maquinaria/", "listado completo"))
+
+            aplicacion = get_asgi_application()
+            for ruta, etiqueta in rutas:
+                asyncio.run(self._medir_asgi(aplicacion, ruta, etiqueta, token))
+        finally:
+            RegistroHorasMaquinaria.objects.filter(maquina__in=maquinas).delete()
+            Maquinaria.objects.filter(pk__in=[maquina.pk for maquina in maquinas]).delete()
+            login.delete()
+
+    async def _medir_asgi(self, aplicacion, ruta, etiqueta, token):
+        path, _, query = ruta.partition("?")
+        host = settings.ALLOWED_HOSTS[0]
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "headers": [(b"host", host.encode()), (b"authorization", f"Bearer {token}".encode())],
+            "client": ("127.0.0.1", 0),
+            "server": (host, 80),
+        }
+        pedido_enviado = False
+        estado = {"status": None, "bytes": 0, "pico": 0}
+
+        async def receive():
+            nonlocal pedido_enviado
+            if not pedido_enviado:
+                pedido_enviado = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # El cliente no se desconecta: Django cancela esta espera al terminar
+            await asyncio.Future()
+
+        async def send(mensaje):
+            if mensaje["type"] == "http.response.start":
+                estado["status"] = mensaje["status"]
+            elif mensaje["type"] == "http.response.body":
+                estado["bytes"] += len(mensaje.get("body", b""))
+                estado["pico"] = max(estado["pico"], rss_actual_kb())
+
+        gc.collect()
+        base = estado["pico"] = rss_actual_kb()
+        tracemalloc.start()
+        inicio = time.perf_counter()
+
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter("always")
+            await aplicacion(scope, receive, send)
+
+        segundos = time.perf_counter() - inicio
+        _, pico_python = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        materializada = any("synchronous iterators" in str(aviso.message) for aviso in avisos)
+        self.stdout.write(
+            f"{etiqueta:<18} status {estado['status']}  {estado['bytes'] / 1024 ** 2:8.1f} MB en {segundos:6.1f} s  "
+            f"pico RSS +{(estado['pico'] - base) / 1024:7.1f} MB  pico Python {pico_python / 1024 ** 2:7.1f} MB"
+            + ("  (Django materializó la respuesta)" if materializada else "")
+        )
+
+    def _medir(self, client, ruta, etiqueta, streaming):
+        gc.collect()
+        base = rss_actual_kb()
+        pico = base
+        total_bytes = 0
+        tracemalloc.start()
+        inicio = time.perf_counter()
+
+        response = client.get(ruta)
+        if streaming:
+            for bloque in response.streaming_content:
+                total_bytes += len(bloque)
+                pico = max(pico, rss_actual_kb())
+        else:
+            total_bytes = len(response.content)
+            pico = max(pico, rss_actual_kb())
+
+        segundos = time.perf_counter() - inicio
+        _, pico_python = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.stdout.write(
+            f"{etiqueta:<18} status {response.status_code}  {total_bytes / 1024 ** 2:8.1f} MB en {segundos:6.1f} s  "
+            f"pico RSS +{(pico - base) / 1024:7.1f} MB  pico Python {pico_python / 1024 ** 2:7.1f} MB"
+        )
+
+    def _sembrar(self, filas):
+        maquinas = Maquinaria.objects.bulk_create([
+            Maquinaria(nombre_maquina=f"Benchmark exportación {i}", horas_totales=Decimal(0))
+            for i in range(-(-filas // DIAS_POR_MAQUINA))
+        ])
+        inicio = date.today() - timedelta(days=DIAS_POR_MAQUINA)
+
+        lote = []
+        for n in range(filas):
+            maquina = maquinas[n // DIAS_POR_MAQUINA]
+            lote.append(RegistroHorasMaquinaria(
+                maquina_id=maquina.pk,
+                fecha=inicio + timedelta(days=n % DIAS_POR_MAQUINA),
+                horas_trabajadas=Decimal("8.00"),
+                observaciones="benchmark"
+            ))
+            if len(lote) == LOTE_SIEMBRA:
+                RegistroHorasMaquinaria.objects.bulk_create(lote)
+                lote = []
+        RegistroHorasMaquinaria.objects.bulk_create(lote)
+        return maquinas
+
+    def _cliente_admin(self):
+        client = APIClient(HTTP_HOST=settings.ALLOWED_HOSTS[0])
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self._token(self._login_admin())}")
+        return client
+
+    @staticmethod
+    def _login_admin():
+        login = Login(username="benchmark_exportacion", rol="ADMIN")
+        login.set_unusable_password()
+        login.save()
+        return login
+
+    @staticmethod
+    def _token(login):
+        token = AccessToken.for_user(login)
+        token["rol"] = login.rol
+        token["username"] = login.username
+        return token
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from comun.servicios import obtener_servicio
+from registros_horas_maquinaria.models.resumen_horas_periodo import ResumenHorasPeriodo
+
+
+class Command(BaseCommand):
+    """
+    Consolida en ResumenHorasPeriodo los periodos (día, semana, mes) que
+    se cerraron desde la última ejecución. Los reportes también consolidan
+    al consultarse; correrlo de noche (cron) evita que la primera consulta
+    del día pague ese costo.
+
+    Uso:
+        python manage.py consolidar_utilizacion
+        python manage.py consolidar_utilizacion --reconstruir
+    """
+
+    help = "Consolida los resúmenes de horas de los periodos cerrados."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reconstruir", action="store_true",
+                            help="Descarta los resúmenes existentes y los recalcula desde los registros.")
+
+    def handle(self, *args, **options):
+        service = obtener_servicio("utilizacion")
+
+        for granularidad, _ in ResumenHorasPeriodo.GRANULARIDADES:
+            insertados = service.consolidar(granularidad, reconstruir=options["reconstruir"])
+            self.stdout.write(f"{granularidad}: {insertados} resúmenes insertados.")
+
+        self.stdout.write(self.style.SUCCESS("Resúmenes de utilización al día."))
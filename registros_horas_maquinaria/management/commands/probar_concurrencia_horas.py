@@ -0,0 +1,117 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from maquinarias.models.maquinaria import Maquinaria
+from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
+from proyectos.models.proyecto import Proyecto
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+from registros_horas_maquinaria.services.registro_horas_maquinaria_service import \
+    RegistroHorasMaquinariaService
+
+
+class Command(BaseCommand):
+    """
+    Arnés de concurrencia para la suma de horas.
+
+    Lanza `--registros` llamadas a crear_registro en paralelo (`--hilos`
+    hilos, cada uno con su propia conexión) contra la misma máquina y el
+    mismo proyecto, y verifica que no se pierdan horas:
+    - Maquinaria.horas_totales aumentó exactamente lo registrado.
+    - ProyectoMaquinaria.horas_acumuladas es exactamente lo registrado.
+
+    Crea datos propios y los elimina al terminar. Los resultados solo son
+    significativos en PostgreSQL (SQLite serializa las escrituras).
+
+    Uso:
+        python manage.py probar_concurrencia_horas --hilos 8 --registros 40
+    """
+
+    help = "Verifica que registros de horas concurrentes no pierdan horas."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hilos", type=int, default=8,
+                            help="Cantidad de requests simultáneos.")
+        parser.add_argument("--registros", type=int, default=40,
+                            help="Cantidad total de registros a crear.")
+        parser.add_argument("--horas", type=Decimal, default=Decimal("1.5"),
+                            help="Horas de cada registro.")
+
+    def handle(self, *args, **options):
+        hilos = options["hilos"]
+        total = options["registros"]
+        horas = options["horas"]
+
+        proyecto = Proyecto.objects.create(nombre_proyecto="Prueba de concurrencia")
+        maquina = Maquinaria.objects.create(
+            nombre_maquina="Prueba de concurrencia",
+            horas_totales=Decimal("100.00")
+        )
+        asignacion = ProyectoMaquinaria.objects.create(
+            proyecto=proyecto,
+            maquina=maquina,
+            horas_totales=horas * total
+        )
+        horas_iniciales = maquina.horas_totales
+
+        try:
+            errores = self._ejecutar_en_paralelo(maquina, proyecto, hilos, total, horas)
+
+            maquina.refresh_from_db()
+            asignacion.refresh_from_db()
+            creados = RegistroHorasMaquinaria.objects.filter(maquina=maquina).count()
+            esperadas = horas * creados
+
+            self.stdout.write(f"Registros creados: {creados}/{total} con {hilos} hilos")
+            for error in errores[:5]:
+                self.stdout.write(self.style.WARNING(f"  error: {error}"))
+
+            self.stdout.write(
+                f"Maquinaria.horas_totales: {maquina.horas_totales} "
+                f"(esperado {horas_iniciales + esperadas})"
+            )
+            self.stdout.write(
+                f"ProyectoMaquinaria.horas_acumuladas: {asignacion.horas_acumuladas} "
+                f"(esperado {esperadas}); finalizado={asignacion.finalizado}"
+            )
+
+            if (maquina.horas_totales != horas_iniciales + esperadas
+                    or asignacion.horas_acumuladas != esperadas):
+                raise CommandError("Se perdieron horas en registros concurrentes.")
+            if creados != total:
+                raise CommandError(f"Fallaron {total - creados} registro(s) de horas.")
+        finally:
+            maquina.delete()
+            proyecto.delete()
+
+        self.stdout.write(self.style.SUCCESS("No se perdieron horas; datos de prueba eliminados."))
+
+    def _ejecutar_en_paralelo(self, maquina, proyecto, hilos, total, horas):
+        """Ejecuta los crear_registro en paralelo y retorna los errores obtenidos."""
+        servicio = RegistroHorasMaquinariaService()
+        inicio = threading.Barrier(min(hilos, total))
+        errores = []
+
+        def crear(indice):
+            if indice < inicio.parties:
+                inicio.wait()  # la primera tanda arranca a la vez
+            try:
+                servicio.crear_registro({
+                    "maquina": maquina.id_maquina,
+                    "proyecto": proyecto.id_proyecto,
+                    "fecha": (date.today() - timedelta(days=indice)).isoformat(),
+                    "horas_trabajadas": str(horas),
+                })
+            except Exception as e:
+                errores.append(f"{e.__class__.__name__}: {e}")
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=hilos) as executor:
+            list(executor.map(crear, range(total)))
+
+        return errores
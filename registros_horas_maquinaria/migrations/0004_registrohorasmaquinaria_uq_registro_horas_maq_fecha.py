@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maquinarias', '0004_alter_maquinaria_foto'),
+        ('proyectos', '0004_alter_proyecto_empresa'),
+        ('registros_horas_maquinaria', '0003_alter_registrohorasmaquinaria_foto_horometro_final_and_more'),
+        ('usuarios', '0004_alter_usuario_foto'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='registrohorasmaquinaria',
+            constraint=models.UniqueConstraint(fields=('maquina', 'fecha'), name='uq_registro_horas_maq_fecha'),
+        ),
+    ]
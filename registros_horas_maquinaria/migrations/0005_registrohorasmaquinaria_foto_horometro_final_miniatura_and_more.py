@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registros_horas_maquinaria', '0004_registrohorasmaquinaria_uq_registro_horas_maq_fecha'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='registrohorasmaquinaria',
+            name='foto_horometro_final_miniatura',
+            field=models.URLField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AddField(
+            model_name='registrohorasmaquinaria',
+            name='foto_horometro_inicial_miniatura',
+            field=models.URLField(blank=True, max_length=500, null=True),
+        ),
+        migrations.AddField(
+            model_name='registrohorasmaquinaria',
+            name='foto_planilla_miniatura',
+            field=models.URLField(blank=True, max_length=500, null=True),
+        ),
+    ]
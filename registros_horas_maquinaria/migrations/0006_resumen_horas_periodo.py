@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registros_horas_maquinaria', '0005_registrohorasmaquinaria_foto_horometro_final_miniatura_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConsolidacionUtilizacion',
+            fields=[
+                ('granularidad', models.CharField(choices=[('dia', 'Día'), ('semana', 'Semana'), ('mes', 'Mes')], max_length=10, primary_key=True, serialize=False)),
+                ('consolidado_hasta', models.DateField(blank=True, help_text='Inicio del primer periodo aún no consolidado. Nulo = nada consolidado.', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Consolidación de utilización',
+                'verbose_name_plural': 'Consolidaciones de utilización',
+                'db_table': 'consolidacion_utilizacion',
+            },
+        ),
+        migrations.CreateModel(
+            name='ResumenHorasPeriodo',
+            fields=[
+                ('id_resumen', models.BigAutoField(primary_key=True, serialize=False)),
+                ('granularidad', models.CharField(choices=[('dia', 'Día'), ('semana', 'Semana'), ('mes', 'Mes')], max_length=10)),
+                ('dimension', models.CharField(choices=[('maquina', 'Máquina'), ('proyecto', 'Proyecto'), ('usuario', 'Operador')], max_length=10)),
+                ('inicio', models.DateField(help_text='Primer día del periodo (lunes para semanas, día 1 para meses).')),
+                ('id_entidad', models.IntegerField(blank=True, help_text='ID de la máquina, proyecto o usuario. Nulo = registros sin proyecto/usuario.', null=True)),
+                ('horas_trabajadas', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('registros', models.PositiveIntegerField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Resumen de horas por periodo',
+                'verbose_name_plural': 'Resúmenes de horas por periodo',
+                'db_table': 'resumen_horas_periodo',
+                'constraints': [models.UniqueConstraint(fields=('granularidad', 'dimension', 'inicio', 'id_entidad'), name='uq_resumen_horas_periodo', nulls_distinct=False)],
+            },
+        ),
+    ]
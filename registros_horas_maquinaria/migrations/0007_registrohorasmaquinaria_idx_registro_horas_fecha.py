@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maquinarias', '0005_maquinaria_foto_miniatura'),
+        ('proyectos', '0004_alter_proyecto_empresa'),
+        ('registros_horas_maquinaria', '0006_resumen_horas_periodo'),
+        ('usuarios', '0005_usuario_foto_miniatura'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='registrohorasmaquinaria',
+            index=models.Index(fields=['fecha'], name='idx_registro_horas_fecha'),
+        ),
+    ]
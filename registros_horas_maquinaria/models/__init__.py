@@ -0,0 +1,3 @@
+from .registro_horas_maquinaria import RegistroHorasMaquinaria
+from .resumen_horas_periodo import ResumenHorasPeriodo
+from .consolidacion_utilizacion import ConsolidacionUtilizacion
@@ -0,0 +1,36 @@
+from django.db import models
+
+from registros_horas_maquinaria.models.resumen_horas_periodo import ResumenHorasPeriodo
+
+
+class ConsolidacionUtilizacion(models.Model):
+    """
+    Hasta dónde está consolidada ResumenHorasPeriodo para cada granularidad.
+
+    Los periodos que empiezan antes de `consolidado_hasta` ya están en la
+    tabla de resúmenes; los siguientes se calculan desde los registros.
+    La fila también sirve de candado (SELECT ... FOR UPDATE) para que la
+    consolidación y los recálculos de una granularidad no se crucen.
+    """
+
+    granularidad = models.CharField(
+        max_length=10,
+        primary_key=True,
+        choices=ResumenHorasPeriodo.GRANULARIDADES
+    )
+
+    consolidado_hasta = models.DateField(
+        null=True,
+        blank=True,
+        help_text="Inicio del primer periodo aún no consolidado. Nulo = nada consolidado."
+    )
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'consolidacion_utilizacion'
+        verbose_name = "Consolidación de utilización"
+        verbose_name_plural = "Consolidaciones de utilización"
+
+    def __str__(self):
+        return f"{self.granularidad}: consolidado hasta {self.consolidado_hasta}"
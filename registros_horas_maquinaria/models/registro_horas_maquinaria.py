@@ -53,6 +53,11 @@ class RegistroHorasMaquinaria(models.Model):
     foto_horometro_inicial = models.URLField(max_length=500, blank=True, null=True)
     foto_horometro_final = models.URLField(max_length=500, blank=True, null=True)
 
+    # Miniaturas generadas al subir cada foto (para listados)
+    foto_planilla_miniatura = models.URLField(max_length=500, blank=True, null=True)
+    foto_horometro_inicial_miniatura = models.URLField(max_length=500, blank=True, null=True)
+    foto_horometro_final_miniatura = models.URLField(max_length=500, blank=True, null=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -60,6 +65,14 @@ class RegistroHorasMaquinaria(models.Model):
         db_table = 'registros_horas_maquinaria'
         verbose_name = "registro_horas_maquinaria"
         verbose_name_plural = "registros_horas_maquinaria"
+        constraints = [
+            # Un solo registro de horas por máquina y fecha
+            models.UniqueConstraint(fields=['maquina', 'fecha'], name='uq_registro_horas_maq_fecha'),
+        ]
+        indexes = [
+            # Horas recientes de toda la flota (pronóstico de mantenimientos)
+            models.Index(fields=['fecha'], name='idx_registro_horas_fecha'),
+        ]
 
     def __str__(self):
         return f"Registro #{self.id_registro} - Máquina #{self.maquina.id_maquina} - {self.fecha}"
\ No newline at end of file
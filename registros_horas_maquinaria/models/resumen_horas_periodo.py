@@ -0,0 +1,67 @@
+from django.db import models
+
+
+class ResumenHorasPeriodo(models.Model):
+    """
+    Horas trabajadas consolidadas por periodo cerrado (día, semana o mes)
+    y por máquina, proyecto u operador.
+
+    Es una tabla derivada de RegistroHorasMaquinaria: la mantiene
+    UtilizacionService y solo contiene periodos ya cerrados, así los
+    reportes históricos no vuelven a recorrer los registros originales.
+    """
+
+    DIA = 'dia'
+    SEMANA = 'semana'
+    MES = 'mes'
+
+    GRANULARIDADES = [
+        (DIA, 'Día'),
+        (SEMANA, 'Semana'),
+        (MES, 'Mes'),
+    ]
+
+    MAQUINA = 'maquina'
+    PROYECTO = 'proyecto'
+    USUARIO = 'usuario'
+
+    DIMENSIONES = [
+        (MAQUINA, 'Máquina'),
+        (PROYECTO, 'Proyecto'),
+        (USUARIO, 'Operador'),
+    ]
+
+    id_resumen = models.BigAutoField(primary_key=True)
+
+    granularidad = models.CharField(max_length=10, choices=GRANULARIDADES)
+    dimension = models.CharField(max_length=10, choices=DIMENSIONES)
+
+    inicio = models.DateField(
+        help_text="Primer día del periodo (lunes para semanas, día 1 para meses)."
+    )
+
+    id_entidad = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text="ID de la máquina, proyecto o usuario. Nulo = registros sin proyecto/usuario."
+    )
+
+    horas_trabajadas = models.DecimalField(max_digits=12, decimal_places=2)
+    registros = models.PositiveIntegerField()
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'resumen_horas_periodo'
+        verbose_name = "Resumen de horas por periodo"
+        verbose_name_plural = "Resúmenes de horas por periodo"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['granularidad', 'dimension', 'inicio', 'id_entidad'],
+                name='uq_resumen_horas_periodo',
+                nulls_distinct=False
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.granularidad} {self.inicio} - {self.dimension} #{self.id_entidad}: {self.horas_trabajadas} h"
@@ -1,6 +1,9 @@
 from django.core.exceptions import ObjectDoesNotExist
 
 from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+from comun.cache import invalidar_por_modelo
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 
 class RegistroHorasMaquinariaRepository:
@@ -15,9 +18,14 @@ class RegistroHorasMaquinariaRepository:
     # ---------------------------------------------------------
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todos los registros de horas."""
-        return RegistroHorasMaquinaria.objects.all()
+        return limitar_columnas(RegistroHorasMaquinaria.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los registros de horas paginada por cursor (más recientes primero)."""
+        return paginar_por_cursor(limitar_columnas(RegistroHorasMaquinaria.objects.all(), columnas), cursor, page_size, orden='-pk')
 
     @staticmethod
     def get_by_id(**kwargs):
@@ -46,6 +54,17 @@ class RegistroHorasMaquinariaRepository:
         """
         return RegistroHorasMaquinaria.objects.create(**kwargs)
 
+    @staticmethod
+    def bulk_create(registros):
+        """
+        Inserta una lista de instancias de RegistroHorasMaquinaria en lotes.
+        Retorna las instancias creadas.
+        """
+        creados = RegistroHorasMaquinaria.objects.bulk_create(registros, batch_size=1000)
+        # bulk_create no dispara post_save
+        invalidar_por_modelo(RegistroHorasMaquinaria)
+        return creados
+
     @staticmethod
     def update(id_registro, **kwargs):
         """
@@ -82,6 +101,47 @@ class RegistroHorasMaquinariaRepository:
     # ---------------------------------------------------------
     # CONSULTAS PERSONALIZADAS
     # ---------------------------------------------------------
+    @staticmethod
+    def get_para_exportar(campos, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """
+        Retorna un queryset .values(*campos) ordenado por llave primaria,
+        con los filtros de fecha (fecha) y máquina aplicados en SQL.
+        """
+        filtros = {}
+        if fecha_inicio:
+            filtros["fecha__gte"] = fecha_inicio
+        if fecha_fin:
+            filtros["fecha__lte"] = fecha_fin
+        if id_maquina:
+            filtros["maquina_id"] = id_maquina
+
+        return RegistroHorasMaquinaria.objects.filter(**filtros).values(*campos).order_by('pk')
+
+    @staticmethod
+    def get_pares_existentes(ids_maquina, fechas):
+        """
+        Retorna el conjunto de pares (id_maquina, fecha) que ya tienen
+        registro, entre las máquinas y fechas dadas (una sola consulta).
+        """
+        return set(
+            RegistroHorasMaquinaria.objects
+            .filter(maquina_id__in=ids_maquina, fecha__in=fechas)
+            .values_list('maquina_id', 'fecha')
+        )
+
+
+    @staticmethod
+    def get_fechas_distintas(**filtros):
+        """
+        Retorna el conjunto de fechas con registros que cumplen los filtros.
+        Ejemplo: get_fechas_distintas(proyecto_id=3)
+        """
+        return set(
+            RegistroHorasMaquinaria.objects
+            .filter(**filtros)
+            .values_list('fecha', flat=True)
+            .distinct()
+        )
 
     @staticmethod
     def get_by_maquina(id_maquina):
@@ -91,6 +151,17 @@ class RegistroHorasMaquinariaRepository:
         """
         return RegistroHorasMaquinaria.objects.filter(maquina_id=id_maquina)
 
+    @staticmethod
+    def get_page_by_maquina(id_maquina, cursor=None, page_size=None):
+        """
+        Retorna una página de los registros de una máquina paginada por cursor
+        (más recientes primero).
+        """
+        return paginar_por_cursor(
+            RegistroHorasMaquinaria.objects.filter(maquina_id=id_maquina),
+            cursor, page_size, orden='-pk'
+        )
+
     @staticmethod
     def get_by_proyecto(id_proyecto):
         """
@@ -138,7 +209,7 @@ class RegistroHorasMaquinariaRepository:
         return (
             RegistroHorasMaquinaria.objects
             .filter(maquina_id=id_maquina)
-            .aggregate(total=Sum('hojas_trabajadas'))
+            .aggregate(total=Sum('horas_trabajadas'))
         )
 
     @staticmethod
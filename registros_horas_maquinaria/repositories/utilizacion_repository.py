@@ -0,0 +1,152 @@
+from functools import reduce
+from operator import or_
+
+from django.db.models import Count, DateField, F, Min, Q, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+
+from maquinarias.models.maquinaria import Maquinaria
+from proyectos.models.proyecto import Proyecto
+from registros_horas_maquinaria.models.consolidacion_utilizacion import ConsolidacionUtilizacion
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+from registros_horas_maquinaria.models.resumen_horas_periodo import ResumenHorasPeriodo
+from usuarios.models.usuario import Usuario
+
+
+class UtilizacionRepository:
+    """
+    Repositorio de los reportes de utilización.
+    Agrega RegistroHorasMaquinaria por periodo con Trunc* en la BD y
+    mantiene la tabla ResumenHorasPeriodo de periodos cerrados.
+    """
+
+    TRUNC = {
+        ResumenHorasPeriodo.DIA: TruncDay,
+        ResumenHorasPeriodo.SEMANA: TruncWeek,
+        ResumenHorasPeriodo.MES: TruncMonth,
+    }
+
+    # Columna de RegistroHorasMaquinaria por la que se agrupa cada dimensión
+    CAMPOS = {
+        ResumenHorasPeriodo.MAQUINA: "maquina_id",
+        ResumenHorasPeriodo.PROYECTO: "proyecto_id",
+        ResumenHorasPeriodo.USUARIO: "usuario_id",
+    }
+
+    # (modelo, campo de nombre) de cada dimensión
+    NOMBRES = {
+        ResumenHorasPeriodo.MAQUINA: (Maquinaria, "nombre_maquina"),
+        ResumenHorasPeriodo.PROYECTO: (Proyecto, "nombre_proyecto"),
+        ResumenHorasPeriodo.USUARIO: (Usuario, "nombre"),
+    }
+
+    # ---------------------------------------------------------
+    # AGREGACIÓN SOBRE LOS REGISTROS
+    # ---------------------------------------------------------
+    @staticmethod
+    def agregar_horas(granularidad, dimension, rangos, ids=None):
+        """
+        Suma las horas de los registros cuyas fechas caen en `rangos`
+        ([(desde, hasta_exclusivo)]), agrupadas por periodo y entidad.
+        Retorna un queryset .values() con inicio, id_entidad, horas_trabajadas y registros.
+        """
+        campo = UtilizacionRepository.CAMPOS[dimension]
+        trunc = UtilizacionRepository.TRUNC[granularidad]
+
+        queryset = RegistroHorasMaquinaria.objects.filter(
+            reduce(or_, (Q(fecha__gte=desde, fecha__lt=hasta) for desde, hasta in rangos))
+        )
+        if ids:
+            queryset = queryset.filter(**{f"{campo}__in": ids})
+
+        return (
+            queryset
+            .annotate(inicio=trunc("fecha", output_field=DateField()), id_entidad=F(campo))
+            .values("inicio", "id_entidad")
+            .annotate(horas_trabajadas=Sum("horas_trabajadas"), registros=Count("pk"))
+            .order_by("inicio", "id_entidad")
+        )
+
+    @staticmethod
+    def get_fecha_minima():
+        """Retorna la fecha del registro de horas más antiguo (o None)."""
+        return RegistroHorasMaquinaria.objects.aggregate(minima=Min("fecha"))["minima"]
+
+    # ---------------------------------------------------------
+    # TABLA DE RESÚMENES (PERIODOS CERRADOS)
+    # ---------------------------------------------------------
+    @staticmethod
+    def get_resumenes(granularidad, dimension, desde, hasta, ids=None):
+        """Retorna los resúmenes consolidados con inicio en [desde, hasta)."""
+        queryset = ResumenHorasPeriodo.objects.filter(
+            granularidad=granularidad,
+            dimension=dimension,
+            inicio__gte=desde,
+            inicio__lt=hasta
+        )
+        if ids:
+            queryset = queryset.filter(id_entidad__in=ids)
+
+        return (
+            queryset
+            .values("inicio", "id_entidad", "horas_trabajadas", "registros")
+            .order_by("inicio", "id_entidad")
+        )
+
+    @staticmethod
+    def reemplazar_resumenes(granularidad, rangos):
+        """
+        Recalcula los resúmenes de los periodos en `rangos` para todas las
+        dimensiones: borra los existentes e inserta la agregación actual
+        de los registros. Los rangos deben coincidir con límites de periodo.
+        Retorna la cantidad de resúmenes insertados.
+        """
+        ResumenHorasPeriodo.objects.filter(
+            reduce(or_, (Q(inicio__gte=desde, inicio__lt=hasta) for desde, hasta in rangos)),
+            granularidad=granularidad
+        ).delete()
+
+        resumenes = [
+            ResumenHorasPeriodo(granularidad=granularidad, dimension=dimension, **fila)
+            for dimension in UtilizacionRepository.CAMPOS
+            for fila in UtilizacionRepository.agregar_horas(granularidad, dimension, rangos)
+        ]
+        ResumenHorasPeriodo.objects.bulk_create(resumenes, batch_size=1000)
+        return len(resumenes)
+
+    @staticmethod
+    def eliminar_resumenes(granularidad):
+        """Elimina todos los resúmenes de una granularidad."""
+        return ResumenHorasPeriodo.objects.filter(granularidad=granularidad).delete()
+
+    # ---------------------------------------------------------
+    # CONSOLIDACIÓN
+    # ---------------------------------------------------------
+    @staticmethod
+    def get_consolidacion(granularidad, bloquear=False):
+        """
+        Retorna la fila de consolidación de la granularidad (la crea si no
+        existe). Con `bloquear` la toma con SELECT ... FOR UPDATE; requiere
+        una transacción abierta.
+        """
+        queryset = ConsolidacionUtilizacion.objects
+        if bloquear:
+            queryset = queryset.select_for_update()
+
+        consolidacion, _ = queryset.get_or_create(granularidad=granularidad)
+        return consolidacion
+
+    @staticmethod
+    def update_consolidado_hasta(granularidad, fecha):
+        """Actualiza hasta dónde está consolidada la granularidad."""
+        return ConsolidacionUtilizacion.objects.filter(granularidad=granularidad).update(
+            consolidado_hasta=fecha
+        )
+
+    # ---------------------------------------------------------
+    # NOMBRES
+    # ---------------------------------------------------------
+    @staticmethod
+    def get_nombres(dimension, ids):
+        """Retorna {id: nombre} de las máquinas, proyectos o usuarios dados (una consulta)."""
+        modelo, campo = UtilizacionRepository.NOMBRES[dimension]
+        return dict(modelo.objects.filter(pk__in=ids).values_list("pk", campo))
@@ -0,0 +1,55 @@
+from datetime import date
+
+from rest_framework import serializers
+
+
+class RegistroHorasImportacionSerializer(serializers.Serializer):
+    """
+    Valida una fila de la importación masiva de registros de horas.
+
+    Solo valida formato y reglas propias de la fila (sin consultas):
+    la existencia de máquinas/proyectos, duplicados y límites de horas
+    se validan en bloque para todo el archivo en el servicio.
+    """
+
+    maquina = serializers.IntegerField(
+        min_value=1,
+        error_messages={"required": "La máquina es obligatoria.",
+                        "invalid": "La máquina debe ser un ID numérico."}
+    )
+    proyecto = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+    usuario = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+    fecha = serializers.DateField(
+        error_messages={"required": "La fecha es obligatoria.",
+                        "invalid": "La fecha debe tener el formato YYYY-MM-DD."}
+    )
+    horas_trabajadas = serializers.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        error_messages={"required": "Las horas trabajadas son obligatorias.",
+                        "invalid": "Debe ingresar un número válido de horas."}
+    )
+    observaciones = serializers.CharField(
+        max_length=2000, required=False, allow_blank=True, allow_null=True,
+        error_messages={"max_length": "Las observaciones pueden tener máximo 2000 caracteres."}
+    )
+
+    def to_internal_value(self, data):
+        # Celdas vacías = columna omitida; se acepta coma decimal ("7,5")
+        data = {k: v for k, v in data.items() if v not in (None, "")}
+        horas = data.get("horas_trabajadas")
+        if isinstance(horas, str):
+            data["horas_trabajadas"] = horas.replace(",", ".")
+        return super().to_internal_value(data)
+
+    def validate_fecha(self, value):
+        """La fecha no puede ser futura."""
+        if value > date.today():
+            raise serializers.ValidationError("La fecha no puede ser futura.")
+        return value
+
+    def validate_horas_trabajadas(self, value):
+        """Las horas registradas deben ser positivas."""
+        if value <= 0:
+            raise serializers.ValidationError("Las horas trabajadas deben ser mayores a 0.")
+        return value
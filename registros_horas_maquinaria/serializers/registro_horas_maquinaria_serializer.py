@@ -5,8 +5,14 @@ from rest_framework import serializers
 
 from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
 from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+from comun.estado_subidas import EstadoSubidaField
+from comun.seleccion_campos import CamposDinamicosMixin
 
-class RegistroHorasMaquinariaSerializer(serializers.ModelSerializer):
+class RegistroHorasMaquinariaSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+
+    foto_planilla_estado = EstadoSubidaField("foto_planilla")
+    foto_horometro_inicial_estado = EstadoSubidaField("foto_horometro_inicial")
+    foto_horometro_final_estado = EstadoSubidaField("foto_horometro_final")
 
     class Meta:
         model = RegistroHorasMaquinaria
@@ -21,11 +27,28 @@ class RegistroHorasMaquinariaSerializer(serializers.ModelSerializer):
             "foto_planilla",
             "foto_horometro_inicial",
             "foto_horometro_final",
+            "foto_planilla_miniatura",
+            "foto_horometro_inicial_miniatura",
+            "foto_horometro_final_miniatura",
+            "foto_planilla_estado",
+            "foto_horometro_inicial_estado",
+            "foto_horometro_final_estado",
             "created_at",
             "updated_at"
         ]
 
-        read_only_fields = ("id_registro", "created_at", "updated_at")
+        read_only_fields = (
+            "id_registro",
+            "foto_planilla_miniatura",
+            "foto_horometro_inicial_miniatura",
+            "foto_horometro_final_miniatura",
+            "created_at",
+            "updated_at"
+        )
+
+        # La unicidad (maquina, fecha) se valida en validate() con su propio
+        # mensaje; el UniqueConstraint del modelo queda como respaldo en BD.
+        validators = []
 
         extra_kwargs = {
             "maquina": {
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+
+from registros_horas_maquinaria.models.resumen_horas_periodo import ResumenHorasPeriodo
+
+
+class UtilizacionParametrosSerializer(serializers.Serializer):
+    """
+    Valida los parámetros de query de los reportes de utilización:
+    ?periodo=dia|semana|mes&desde=YYYY-MM-DD&hasta=YYYY-MM-DD&ids=1,2,3
+    """
+
+    periodo = serializers.ChoiceField(
+        choices=ResumenHorasPeriodo.GRANULARIDADES,
+        source="granularidad",
+        default=ResumenHorasPeriodo.MES,
+        error_messages={"invalid_choice": "Periodo no soportado. Use: dia, semana o mes."}
+    )
+    desde = serializers.DateField(required=False)
+    hasta = serializers.DateField(required=False)
+    ids = serializers.CharField(required=False)
+
+    def validate_ids(self, value):
+        """Lista de IDs separados por coma: '1,2,3' → [1, 2, 3]."""
+        try:
+            ids = [int(valor) for valor in value.split(",") if valor.strip()]
+        except ValueError:
+            raise serializers.ValidationError("Los IDs deben ser números separados por coma.")
+        return ids or None
+
+    def validate(self, attrs):
+        if attrs.get("desde") and attrs.get("hasta") and attrs["desde"] > attrs["hasta"]:
+            raise serializers.ValidationError({"desde": "La fecha inicial no puede ser posterior a la final."})
+        return attrs
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+
+class UtilizacionResultadoSerializer(serializers.Serializer):
+    """
+    Horas trabajadas de una entidad (máquina, proyecto u operador) en un
+    periodo. `id` nulo agrupa los registros sin proyecto/operador;
+    `cerrado` indica que el periodo ya terminó (sale de los resúmenes).
+    """
+
+    inicio = serializers.DateField()
+    id = serializers.IntegerField(allow_null=True)
+    nombre = serializers.CharField(allow_null=True)
+    horas_trabajadas = serializers.DecimalField(max_digits=14, decimal_places=2)
+    registros = serializers.IntegerField()
+    cerrado = serializers.BooleanField()
+
+
+class UtilizacionReporteSerializer(serializers.Serializer):
+    """Respuesta de los reportes de utilización (ver UtilizacionService.obtener_utilizacion)."""
+
+    dimension = serializers.CharField()
+    periodo = serializers.CharField()
+    desde = serializers.DateField()
+    hasta = serializers.DateField()
+    resultados = UtilizacionResultadoSerializer(many=True)
@@ -1,20 +1,25 @@
-import cloudinary.uploader
-from typing import Optional
+from collections import defaultdict
+from decimal import Decimal
 
-from django.core.files.uploadedfile import UploadedFile
-from django.db import transaction
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from rest_framework.exceptions import NotFound, ValidationError
 
-from alarmas.services.alarma_service import AlarmaService
-from maquinarias.services.maquinaria_service import MaquinariaService
-from proyecto_maquinaria.models.proyecto_maquinaria import ProyectoMaquinaria
-from proyecto_maquinaria.services.proyecto_maquinaria_service import ProyectoMaquinariaService
+from comun.exportacion import iterar
+from comun.servicios import Dependencia
+from comun.tabular import leer_filas
+from maquinarias.repositories.maquinaria_repository import MaquinariaRepository
+from proyecto_maquinaria.repositories.proyecto_maquinaria_repository import ProyectoMaquinariaRepository
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
 from registros_horas_maquinaria.repositories.registro_horas_maquinaria_repository import \
     RegistroHorasMaquinariaRepository
+from registros_horas_maquinaria.serializers.registro_horas_importacion_serializer import \
+    RegistroHorasImportacionSerializer
 from registros_horas_maquinaria.serializers.registro_horas_maquinaria_serializer import \
     RegistroHorasMaquinariaSerializer
 from registros_horas_maquinaria.services.registro_horas_maquinaria_service_interface import \
     IRegistroHorasMaquinariaService
+from usuarios.repositories.usuario_repository import UsuarioRepository
 
 
 class RegistroHorasMaquinariaService(IRegistroHorasMaquinariaService):
@@ -27,40 +32,50 @@ class RegistroHorasMaquinariaService(IRegistroHorasMaquinariaService):
     - Actualización de horas_acumuladas (ProyectoMaquinaria)
     - Persistencia mediante repository
     """
-    def __init__(self):
-        """Inyección de dependencias de otros servicios."""
-        self.maquinaria_service = MaquinariaService()
-        self.proyecto_maquinaria_service = ProyectoMaquinariaService()
-        self.alarma_service = AlarmaService()
+
+    # Inyección de dependencias de otros servicios (ver comun.servicios)
+    maquinaria_service = Dependencia("maquinaria")
+    proyecto_maquinaria_service = Dependencia("proyecto_maquinaria")
+    alarma_service = Dependencia("alarma")
+    media_service = Dependencia("media")
+    estado_mantenimiento_service = Dependencia("estado_mantenimiento")
+    utilizacion_service = Dependencia("utilizacion")
+
+    # Columnas (y orden) de la exportación CSV / NDJSON
+    COLUMNAS_EXPORTACION = [
+        "id_registro",
+        "maquina_id",
+        "maquina__nombre_maquina",
+        "proyecto_id",
+        "proyecto__nombre_proyecto",
+        "usuario_id",
+        "fecha",
+        "horas_trabajadas",
+        "observaciones",
+    ]
 
     # ----------------------------------------------------------------------
-    # UTILIDAD: Guardar foto físicamente
+    # UTILIDAD: Programar subida de fotos
     # ----------------------------------------------------------------------
-    def _guardar_foto(self, foto_file: Optional[UploadedFile]) -> Optional[str]:
+    def _programar_fotos(self, registro, fotos: dict):
         """
-        Guarda la foto en registros/photos/
-        Retorna la URL absoluta final que se almacenará en BD.
+        Agenda la subida en segundo plano de las fotos recibidas
+        ({campo: archivo}) a registros/photos/.
+        Las fotos se suben en paralelo como un lote todo-o-nada: o se
+        completan todos los campos o ninguno.
         """
-        if not foto_file:
-            return None
-
-        try:
-            resultado = cloudinary.uploader.upload(
-                foto_file,
-                folder="registros/photos",  # carpeta lógica en Cloudinary
-                resource_type="image"  # forzamos imagen
-            )
-            return resultado.get("secure_url")
-
-        except Exception as e:
-            raise ValidationError({"foto": "Error al subir la imagen"})
+        self.media_service.programar_subidas(registro, fotos, carpeta="registros/photos")
 
     # ----------------------------------------------------------------------
     # Listar
     # ----------------------------------------------------------------------
-    def listar_registros(self):
+    def listar_registros(self, columnas=None):
         """Retorna todos los registros de horas."""
-        return RegistroHorasMaquinariaRepository.get_all()
+        return RegistroHorasMaquinariaRepository.get_all(columnas=columnas)
+
+    def listar_registros_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los registros de horas (paginación por cursor)."""
+        return RegistroHorasMaquinariaRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ----------------------------------------------------------------------
     # Obtener uno
@@ -90,7 +105,10 @@ class RegistroHorasMaquinariaService(IRegistroHorasMaquinariaService):
         2. Suma horas:
             - A Maquinaria.horas_totales
             - A ProyectoMaquinaria.horas_acumuladas (si viene proyecto)
+           Ambas sumas son atómicas (F() / SELECT ... FOR UPDATE), por lo que
+           registros concurrentes de la misma máquina no pierden horas.
         3. Persiste el registro
+        4. Agenda la subida de las fotos (se suben al confirmar la transacción)
         """
         data = data.copy()
         foto_planilla = data.pop("foto_planilla", None)
@@ -107,25 +125,9 @@ class RegistroHorasMaquinariaService(IRegistroHorasMaquinariaService):
             if isinstance(value, list):
                 fotos[key] = value[0] if value else None
 
-        foto_planilla = fotos["foto_planilla"]
-        foto_horometro_inicial = fotos["foto_horometro_inicial"]
-        foto_horometro_final = fotos["foto_horometro_final"]
-
         serializer = RegistroHorasMaquinariaSerializer(data=data)
         serializer.is_valid(raise_exception=True)
 
-        if foto_planilla:
-            ruta_foto = self._guardar_foto(foto_planilla)
-            serializer.validated_data["foto_planilla"] = ruta_foto
-
-        if foto_horometro_inicial:
-            ruta_foto = self._guardar_foto(foto_horometro_inicial)
-            serializer.validated_data["foto_horometro_inicial"] = ruta_foto
-
-        if foto_horometro_final:
-            ruta_foto = self._guardar_foto(foto_horometro_final)
-            serializer.validated_data["foto_horometro_final"] = ruta_foto
-
         maquina = serializer.validated_data["maquina"]
         horas = serializer.validated_data["horas_trabajadas"]
         proyecto = serializer.validated_data.get("proyecto")
@@ -135,27 +137,199 @@ class RegistroHorasMaquinariaService(IRegistroHorasMaquinariaService):
 
         # --- Actualizar acumuladas si está asignada a proyecto ---
         if proyecto:
-            try:
-                pm = ProyectoMaquinaria.objects.get(
-                    maquina=maquina,
-                    proyecto=proyecto
-                )
+            pm = ProyectoMaquinariaRepository.get_by_id(maquina=maquina, proyecto=proyecto)
+            if pm:
                 pm = self.proyecto_maquinaria_service.sumar_horas_acumuladas(pm, horas)
-            except ProyectoMaquinaria.DoesNotExist:
-                pass
 
         # --- Validar y generar alarma
         self.alarma_service.validar_y_generar_alarmas(maquina.id_maquina)
-        # Guardar registro
-        registro = RegistroHorasMaquinariaRepository.create(
-            **serializer.validated_data
-        )
+        # Guardar registro (el UniqueConstraint cubre la carrera maquina+fecha)
+        try:
+            with transaction.atomic():
+                registro = RegistroHorasMaquinariaRepository.create(
+                    **serializer.validated_data
+                )
+        except IntegrityError:
+            raise ValidationError(
+                f"Ya existe un registro para la máquina #{maquina.id_maquina} "
+                f"en la fecha {serializer.validated_data['fecha']}."
+            )
+
+        # Fotos: se suben en segundo plano, fuera de esta transacción
+        self._programar_fotos(registro, fotos)
 
         return RegistroHorasMaquinariaSerializer(registro).data
 
+    # ----------------------------------------------------------------------
+    # Importación masiva (CSV / XLSX)
+    # ----------------------------------------------------------------------
+    def importar_registros(self, archivo, parcial: bool = False):
+        """
+        Importa registros de horas desde un archivo CSV o XLSX con las
+        columnas maquina, fecha, horas_trabajadas y, opcionalmente,
+        proyecto, usuario y observaciones.
+
+        Pasos:
+        1. Lee el archivo fila a fila y valida el formato de cada una
+        2. Valida en bloque (una consulta por regla para todo el archivo):
+           máquinas existentes y en servicio, usuarios, asignación al
+           proyecto (no finalizada y sin exceder las horas pactadas) y
+           duplicados máquina+fecha, en el archivo y en la BD
+        3. Inserta con bulk_create y suma las horas con un UPDATE agrupado
+           por máquina y otro por asignación
+        4. Recalcula estados de mantenimiento y evalúa alarmas una vez
+           por máquina afectada
+
+        Si alguna fila tiene errores no se inserta nada, salvo con
+        `parcial`, que inserta las filas válidas.
+
+        Retorna {"filas": int, "insertados": int, "errores": [{"fila", "errores"}]}.
+        """
+        filas, errores = self._leer_importacion(archivo)
+        total_filas = len(filas) + len(errores)
+
+        with transaction.atomic():
+            registros, horas_por_asignacion = self._validar_importacion(filas, errores)
+
+            if errores and not parcial:
+                registros = []
+            if registros:
+                self._aplicar_importacion(registros, horas_por_asignacion)
+
+        return {
+            "filas": total_filas,
+            "insertados": len(registros),
+            "errores": sorted(errores, key=lambda e: e["fila"]),
+        }
+
+    def _leer_importacion(self, archivo):
+        """Retorna ([(fila, datos_validados)], [errores de formato])."""
+        filas, errores = [], []
+
+        for numero, valores in leer_filas(archivo, max_filas=settings.IMPORTACION_MAX_FILAS):
+            serializer = RegistroHorasImportacionSerializer(data=valores)
+            if serializer.is_valid():
+                filas.append((numero, serializer.validated_data))
+            else:
+                errores.append({"fila": numero, "errores": serializer.errors})
+
+        return filas, errores
+
+    def _validar_importacion(self, filas, errores):
+        """
+        Aplica las reglas de crear_registro a todas las filas con consultas
+        en bloque. Bloquea máquinas y asignaciones hasta el fin de la
+        transacción para que las horas validadas no cambien antes de sumarlas.
+        Agrega a `errores` las filas rechazadas y retorna
+        (registros a insertar, {id_proyecto_maquinaria: horas}).
+        """
+        ids_maquina = {datos["maquina"] for _, datos in filas}
+        maquinas = MaquinariaRepository.get_for_update_in_bulk(ids_maquina)
+        usuarios = UsuarioRepository.get_ids_existentes(
+            {datos["usuario"] for _, datos in filas if datos.get("usuario")}
+        )
+        asignaciones = ProyectoMaquinariaRepository.get_for_update_por_pares(
+            (datos["maquina"], datos["proyecto"]) for _, datos in filas if datos.get("proyecto")
+        )
+        existentes = RegistroHorasMaquinariaRepository.get_pares_existentes(
+            ids_maquina, {datos["fecha"] for _, datos in filas}
+        )
+
+        registros = []
+        vistos = set()
+        horas_por_asignacion = defaultdict(Decimal)
+
+        for numero, datos in filas:
+            id_maquina, fecha, horas = datos["maquina"], datos["fecha"], datos["horas_trabajadas"]
+            id_proyecto, id_usuario = datos.get("proyecto"), datos.get("usuario")
+            problemas = []
+
+            maquina = maquinas.get(id_maquina)
+            if maquina is None:
+                problemas.append(f"La máquina #{id_maquina} no existe.")
+            elif maquina.estado == "fuera de servicio":
+                problemas.append(
+                    f"La máquina #{id_maquina} está fuera de servicio; no se pueden registrar horas."
+                )
+
+            if id_usuario and id_usuario not in usuarios:
+                problemas.append(f"El usuario #{id_usuario} no existe.")
+
+            if (id_maquina, fecha) in existentes:
+                problemas.append(f"Ya existe un registro para la máquina #{id_maquina} en la fecha {fecha}.")
+            elif (id_maquina, fecha) in vistos:
+                problemas.append(f"Registro duplicado en el archivo para la máquina #{id_maquina} en la fecha {fecha}.")
+
+            asignacion = asignaciones.get((id_maquina, id_proyecto)) if id_proyecto else None
+            if id_proyecto and asignacion is None:
+                problemas.append("La máquina no está asignada a este proyecto.")
+            elif asignacion is not None:
+                acumuladas = asignacion.horas_acumuladas + horas_por_asignacion[asignacion.pk]
+                if asignacion.finalizado:
+                    problemas.append("Este proyecto ya fue finalizado; no se pueden registrar más horas.")
+                elif acumuladas + horas > asignacion.horas_totales:
+                    problemas.append(
+                        f"Las horas registradas ({horas}) exceden el límite permitido para este "
+                        f"proyecto ({asignacion.horas_totales} h). Horas acumuladas actuales: {acumuladas}."
+                    )
+
+            if problemas:
+                errores.append({"fila": numero, "errores": {"non_field_errors": problemas}})
+                continue
+
+            vistos.add((id_maquina, fecha))
+            if asignacion is not None:
+                horas_por_asignacion[asignacion.pk] += horas
+
+            registros.append(RegistroHorasMaquinaria(
+                maquina=maquina,
+                proyecto_id=id_proyecto,
+                usuario_id=id_usuario,
+                fecha=fecha,
+                horas_trabajadas=horas,
+                observaciones=datos.get("observaciones") or None,
+            ))
+
+        return registros, horas_por_asignacion
+
+    def _aplicar_importacion(self, registros, horas_por_asignacion):
+        """Inserta los registros validados y propaga sus horas."""
+        RegistroHorasMaquinariaRepository.bulk_create(registros)
+
+        horas_por_maquina = defaultdict(Decimal)
+        for registro in registros:
+            horas_por_maquina[registro.maquina_id] += registro.horas_trabajadas
+
+        MaquinariaRepository.sumar_horas_por_maquina(horas_por_maquina)
+        ProyectoMaquinariaRepository.sumar_horas_por_asignacion(horas_por_asignacion)
+        self.estado_mantenimiento_service.recalcular_maquinas(horas_por_maquina.keys())
+        # bulk_create no dispara señales: se agenda el recálculo de los resúmenes
+        self.utilizacion_service.programar_recalculo({registro.fecha for registro in registros})
+
+        for id_maquina in horas_por_maquina:
+            self.alarma_service.validar_y_generar_alarmas(id_maquina)
+
+    # ----------------------------------------------------------------------
+    # Exportar (streaming)
+    # ----------------------------------------------------------------------
+    def exportar_registros(self, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """
+        Retorna (columnas, filas) para exportar registros de horas. Los filtros se
+        aplican en SQL y `filas` es un iterador por bloques: no se
+        materializa el resultado completo en memoria.
+        """
+        queryset = RegistroHorasMaquinariaRepository.get_para_exportar(
+            self.COLUMNAS_EXPORTACION,
+            fecha_inicio=fecha_inicio,
+            fecha_fin=fecha_fin,
+            id_maquina=id_maquina
+        )
+        return self.COLUMNAS_EXPORTACION, iterar(queryset)
+
     # ----------------------------------------------------------------------
     # Actualizar registro
     # ----------------------------------------------------------------------
+    @transaction.atomic
     def actualizar_registro(self, id_registro: int, data: dict):
         """
         Actualiza parcialmente un registro.
@@ -186,23 +360,17 @@ class RegistroHorasMaquinariaService(IRegistroHorasMaquinariaService):
         )
         serializer.is_valid(raise_exception=True)
 
-        if foto_planilla:
-            ruta_foto = self._guardar_foto(foto_planilla)
-            serializer.validated_data["foto_planilla"] = ruta_foto
-
-        if foto_horometro_inicial:
-            ruta_foto = self._guardar_foto(foto_horometro_inicial)
-            serializer.validated_data["foto_horometro_inicial"] = ruta_foto
-
-        if foto_horometro_final:
-            ruta_foto = self._guardar_foto(foto_horometro_final)
-            serializer.validated_data["foto_horometro_final"] = ruta_foto
-
         actualizado = RegistroHorasMaquinariaRepository.update(
             id_registro=id_registro,
             **serializer.validated_data
         )
 
+        self._programar_fotos(actualizado, {
+            "foto_planilla": foto_planilla,
+            "foto_horometro_inicial": foto_horometro_inicial,
+            "foto_horometro_final": foto_horometro_final
+        })
+
         return RegistroHorasMaquinariaSerializer(actualizado).data
 
     # ----------------------------------------------------------------------
@@ -223,6 +391,11 @@ class RegistroHorasMaquinariaService(IRegistroHorasMaquinariaService):
     def obtener_por_maquina(self, id_maquina: int):
         return RegistroHorasMaquinariaRepository.get_by_maquina(id_maquina)
 
+    def obtener_por_maquina_paginado(self, id_maquina: int, cursor=None, page_size=None):
+        return RegistroHorasMaquinariaRepository.get_page_by_maquina(
+            id_maquina, cursor=cursor, page_size=page_size
+        )
+
     def obtener_por_proyecto(self, id_proyecto: int):
         return RegistroHorasMaquinariaRepository.get_by_proyecto(id_proyecto)
 
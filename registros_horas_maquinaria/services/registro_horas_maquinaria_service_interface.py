@@ -10,10 +10,15 @@ class IRegistroHorasMaquinariaService(ABC):
     """
 
     @abstractmethod
-    def listar_registros(self):
+    def listar_registros(self, columnas=None):
         """Retorna todos los registros de horas."""
         pass
 
+    @abstractmethod
+    def listar_registros_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los registros de horas paginada por cursor."""
+        pass
+
     @abstractmethod
     def obtener_registro(self, id_registro: int):
         """Obtiene un registro por ID. Lanza NotFound si no existe."""
@@ -24,6 +29,16 @@ class IRegistroHorasMaquinariaService(ABC):
         """Crea un registro de horas con validación y actualiza acumulados."""
         pass
 
+    @abstractmethod
+    def importar_registros(self, archivo, parcial: bool = False):
+        """Importa registros de horas desde un archivo CSV/XLSX; retorna el reporte por fila."""
+        pass
+
+    @abstractmethod
+    def exportar_registros(self, fecha_inicio=None, fecha_fin=None, id_maquina=None):
+        """Retorna (columnas, iterador de filas) para exportar en streaming."""
+        pass
+
     @abstractmethod
     def actualizar_registro(self, id_registro: int, data: dict):
         """Actualiza parcialmente un registro existente."""
@@ -42,6 +57,11 @@ class IRegistroHorasMaquinariaService(ABC):
         """Retorna registros filtrados por máquina."""
         pass
 
+    @abstractmethod
+    def obtener_por_maquina_paginado(self, id_maquina: int, cursor=None, page_size=None):
+        """Retorna una página de registros de una máquina paginada por cursor."""
+        pass
+
     @abstractmethod
     def obtener_por_proyecto(self, id_proyecto: int):
         """Retorna registros filtrados por proyecto."""
@@ -0,0 +1,232 @@
+import logging
+import threading
+from datetime import date, timedelta
+
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from registros_horas_maquinaria.models.resumen_horas_periodo import ResumenHorasPeriodo
+from registros_horas_maquinaria.repositories.utilizacion_repository import UtilizacionRepository
+from registros_horas_maquinaria.services.utilizacion_service_interface import IUtilizacionService
+
+logger = logging.getLogger(__name__)
+
+_pendientes = threading.local()
+
+
+# =========================================================================
+# PERIODOS
+# =========================================================================
+def inicio_periodo(fecha: date, granularidad: str) -> date:
+    """Primer día del periodo que contiene `fecha` (mismo criterio que Trunc*)."""
+    if granularidad == ResumenHorasPeriodo.SEMANA:
+        return fecha - timedelta(days=fecha.weekday())
+    if granularidad == ResumenHorasPeriodo.MES:
+        return fecha.replace(day=1)
+    return fecha
+
+
+def desplazar_periodo(inicio: date, granularidad: str, cantidad: int = 1) -> date:
+    """Inicio del periodo `cantidad` periodos después (o antes, si es negativa) de `inicio`."""
+    if granularidad == ResumenHorasPeriodo.SEMANA:
+        return inicio + timedelta(weeks=cantidad)
+    if granularidad == ResumenHorasPeriodo.MES:
+        meses = inicio.year * 12 + inicio.month - 1 + cantidad
+        return date(meses // 12, meses % 12 + 1, 1)
+    return inicio + timedelta(days=cantidad)
+
+
+def unir_periodos(inicios, granularidad: str):
+    """Convierte inicios de periodo en rangos [desde, hasta) uniendo los consecutivos."""
+    rangos = []
+    for inicio in sorted(inicios):
+        fin = desplazar_periodo(inicio, granularidad)
+        if rangos and rangos[-1][1] == inicio:
+            rangos[-1] = (rangos[-1][0], fin)
+        else:
+            rangos.append((inicio, fin))
+    return rangos
+
+
+class UtilizacionService(IUtilizacionService):
+    """
+    Servicio de reportes de utilización de la flota.
+
+    Responsabilidades:
+    - Horas trabajadas por máquina, proyecto u operador, por día/semana/mes
+    - Periodos cerrados: se leen de ResumenHorasPeriodo (sin recorrer registros)
+    - Periodo en curso: se agrega en la BD con Trunc* sobre sus registros
+    - Mantenimiento incremental de los resúmenes: al cerrarse un periodo se
+      consolida solo ese periodo, y los cambios en registros de periodos ya
+      consolidados recalculan solo los periodos afectados
+    """
+
+    # Periodos que se muestran cuando no se indica `desde`
+    PERIODOS_POR_DEFECTO = {
+        ResumenHorasPeriodo.DIA: 31,
+        ResumenHorasPeriodo.SEMANA: 12,
+        ResumenHorasPeriodo.MES: 12,
+    }
+
+    # ----------------------------------------------------------------------
+    # Consultar utilización
+    # ----------------------------------------------------------------------
+    def obtener_utilizacion(self, dimension: str, granularidad: str = ResumenHorasPeriodo.MES,
+                            desde=None, hasta=None, ids=None):
+        """
+        Retorna las horas trabajadas por periodo y entidad (máquina, proyecto
+        u operador) en los periodos que contienen [desde, hasta].
+
+        Por defecto `hasta` es hoy y `desde` cubre PERIODOS_POR_DEFECTO periodos.
+        Un resultado con id None agrupa los registros sin proyecto/operador.
+        """
+        if dimension not in UtilizacionRepository.CAMPOS:
+            raise ValidationError({"dimension": "Dimensión no soportada."})
+        if granularidad not in UtilizacionRepository.TRUNC:
+            raise ValidationError({"periodo": "Periodo no soportado. Use: dia, semana o mes."})
+
+        actual = inicio_periodo(date.today(), granularidad)
+        fin = desplazar_periodo(inicio_periodo(hasta, granularidad) if hasta else actual, granularidad)
+        inicio = (
+            inicio_periodo(desde, granularidad) if desde
+            else desplazar_periodo(actual, granularidad, 1 - self.PERIODOS_POR_DEFECTO[granularidad])
+        )
+        if inicio >= fin:
+            raise ValidationError({"desde": "La fecha inicial no puede ser posterior a la final."})
+
+        filas = []
+
+        # Periodos cerrados: tabla de resúmenes
+        if inicio < actual:
+            self.consolidar(granularidad)
+            filas.extend(UtilizacionRepository.get_resumenes(
+                granularidad, dimension, inicio, min(fin, actual), ids
+            ))
+
+        # Periodo en curso: agregación directa sobre sus registros
+        if fin > actual:
+            filas.extend(UtilizacionRepository.agregar_horas(
+                granularidad, dimension, [(max(inicio, actual), fin)], ids
+            ))
+
+        nombres = UtilizacionRepository.get_nombres(
+            dimension, {fila["id_entidad"] for fila in filas if fila["id_entidad"] is not None}
+        )
+
+        return {
+            "dimension": dimension,
+            "periodo": granularidad,
+            "desde": inicio,
+            "hasta": fin - timedelta(days=1),
+            "resultados": [
+                {
+                    "inicio": fila["inicio"],
+                    "id": fila["id_entidad"],
+                    "nombre": nombres.get(fila["id_entidad"]),
+                    "horas_trabajadas": fila["horas_trabajadas"],
+                    "registros": fila["registros"],
+                    "cerrado": fila["inicio"] < actual,
+                }
+                for fila in filas
+            ],
+        }
+
+    # ----------------------------------------------------------------------
+    # Consolidar periodos cerrados
+    # ----------------------------------------------------------------------
+    def consolidar(self, granularidad: str, reconstruir: bool = False):
+        """
+        Lleva a ResumenHorasPeriodo los periodos cerrados desde la última
+        consolidación (la primera vez, desde el registro más antiguo).
+        Con `reconstruir` descarta los resúmenes y consolida todo de nuevo.
+        Retorna la cantidad de resúmenes insertados.
+        """
+        actual = inicio_periodo(date.today(), granularidad)
+
+        if not reconstruir and UtilizacionRepository.get_consolidacion(granularidad).consolidado_hasta == actual:
+            return 0
+
+        with transaction.atomic():
+            consolidacion = UtilizacionRepository.get_consolidacion(granularidad, bloquear=True)
+            desde = consolidacion.consolidado_hasta
+
+            if reconstruir:
+                UtilizacionRepository.eliminar_resumenes(granularidad)
+                desde = None
+            elif desde == actual:
+                # Otro proceso consolidó mientras se esperaba el candado
+                return 0
+
+            if desde is None:
+                minima = UtilizacionRepository.get_fecha_minima()
+                desde = inicio_periodo(minima, granularidad) if minima else actual
+
+            insertados = 0
+            if desde < actual:
+                insertados = UtilizacionRepository.reemplazar_resumenes(granularidad, [(desde, actual)])
+
+            UtilizacionRepository.update_consolidado_hasta(granularidad, actual)
+
+        return insertados
+
+    # ----------------------------------------------------------------------
+    # Recalcular periodos afectados por cambios en registros
+    # ----------------------------------------------------------------------
+    def programar_recalculo(self, fechas):
+        """
+        Agenda el recálculo de los periodos cerrados que contienen `fechas`
+        para cuando se confirme la transacción actual (o de inmediato si
+        no hay transacción). Las fechas de hoy en adelante se ignoran:
+        pertenecen a periodos en curso, que se calculan al consultarlos.
+        """
+        hoy = date.today()
+        cerradas = {fecha for fecha in map(_como_fecha, fechas) if fecha and fecha < hoy}
+        if not cerradas:
+            return
+
+        if not hasattr(_pendientes, "fechas"):
+            _pendientes.fechas = set()
+
+        _pendientes.fechas.update(cerradas)
+        transaction.on_commit(self._recalcular_pendientes, robust=True)
+
+    def _recalcular_pendientes(self):
+        fechas = getattr(_pendientes, "fechas", set())
+        _pendientes.fechas = set()
+        if fechas:
+            self.recalcular_fechas(fechas)
+
+    def recalcular_fechas(self, fechas):
+        """
+        Recalcula, en cada granularidad, los resúmenes ya consolidados de
+        los periodos que contienen `fechas`. Retorna los resúmenes insertados.
+        """
+        insertados = 0
+
+        for granularidad in UtilizacionRepository.TRUNC:
+            actual = inicio_periodo(date.today(), granularidad)
+            inicios = {inicio_periodo(fecha, granularidad) for fecha in fechas}
+            if not any(inicio < actual for inicio in inicios):
+                continue
+
+            with transaction.atomic():
+                # El candado ordena este recálculo con una consolidación en curso
+                consolidado_hasta = UtilizacionRepository.get_consolidacion(
+                    granularidad, bloquear=True
+                ).consolidado_hasta
+                afectados = [inicio for inicio in inicios if consolidado_hasta and inicio < consolidado_hasta]
+
+                if afectados:
+                    insertados += UtilizacionRepository.reemplazar_resumenes(
+                        granularidad, unir_periodos(afectados, granularidad)
+                    )
+
+        logger.info("Resúmenes de utilización recalculados para %s fecha(s).", len(fechas))
+        return insertados
+
+
+def _como_fecha(valor):
+    """Acepta date o 'YYYY-MM-DD' (p. ej. una instancia creada con la fecha como texto)."""
+    if isinstance(valor, str):
+        return date.fromisoformat(valor)
+    return valor
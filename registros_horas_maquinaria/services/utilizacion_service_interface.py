@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+
+
+class IUtilizacionService(ABC):
+    """
+    Interfaz para el servicio de reportes de utilización.
+    Define las operaciones para:
+    - Consultar horas por máquina, proyecto u operador agrupadas por periodo
+    - Mantener la tabla de resúmenes de periodos cerrados
+    """
+
+    @abstractmethod
+    def obtener_utilizacion(self, dimension: str, granularidad: str = "mes",
+                            desde=None, hasta=None, ids=None):
+        """Retorna las horas por periodo y entidad entre `desde` y `hasta`."""
+        pass
+
+    @abstractmethod
+    def consolidar(self, granularidad: str, reconstruir: bool = False):
+        """Consolida los periodos cerrados pendientes; retorna los resúmenes insertados."""
+        pass
+
+    @abstractmethod
+    def programar_recalculo(self, fechas):
+        """Agenda (al confirmar la transacción) el recálculo de los periodos cerrados de esas fechas."""
+        pass
+
+    @abstractmethod
+    def recalcular_fechas(self, fechas):
+        """Recalcula los resúmenes ya consolidados de los periodos que contienen esas fechas."""
+        pass
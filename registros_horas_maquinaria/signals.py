@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from comun.servicios import obtener_servicio
+from proyectos.models.proyecto import Proyecto
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
+from registros_horas_maquinaria.repositories.registro_horas_maquinaria_repository import \
+    RegistroHorasMaquinariaRepository
+from usuarios.models.usuario import Usuario
+
+# Mantienen ResumenHorasPeriodo al día: cada cambio en un registro de horas
+# de un periodo ya consolidado agenda el recálculo de ese periodo.
+# bulk_create no dispara señales: la importación masiva agenda el recálculo
+# explícitamente (ver RegistroHorasMaquinariaService._aplicar_importacion).
+
+
+@receiver(pre_save, sender=RegistroHorasMaquinaria)
+def recordar_fecha_anterior(sender, instance, **kwargs):
+    # Si cambia la fecha, también hay que recalcular el periodo anterior
+    if not instance._state.adding:
+        instance._fechas_anteriores = RegistroHorasMaquinariaRepository.get_fechas_distintas(
+            pk=instance.pk
+        )
+
+
+@receiver(post_save, sender=RegistroHorasMaquinaria)
+def recalcular_al_guardar(sender, instance, **kwargs):
+    fechas = {instance.fecha, *getattr(instance, "_fechas_anteriores", ())}
+    obtener_servicio("utilizacion").programar_recalculo(fechas)
+
+
+@receiver(post_delete, sender=RegistroHorasMaquinaria)
+def recalcular_al_eliminar(sender, instance, **kwargs):
+    obtener_servicio("utilizacion").programar_recalculo({instance.fecha})
+
+
+@receiver(pre_delete, sender=Proyecto)
+@receiver(pre_delete, sender=Usuario)
+def recalcular_al_desvincular(sender, instance, **kwargs):
+    # on_delete=SET_NULL actualiza los registros sin disparar señales
+    campo = "proyecto_id" if sender is Proyecto else "usuario_id"
+    fechas = RegistroHorasMaquinariaRepository.get_fechas_distintas(**{campo: instance.pk})
+    obtener_servicio("utilizacion").programar_recalculo(fechas)
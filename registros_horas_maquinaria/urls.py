@@ -1,8 +1,11 @@
 from rest_framework.routers import DefaultRouter
 
 from registros_horas_maquinaria.views.registro_horas_maquinaria_view import RegistroHorasMaquinariaViewSet
+from registros_horas_maquinaria.views.utilizacion_view import UtilizacionViewSet
 
 router = DefaultRouter()
+# Antes del prefijo vacío para que "utilizacion" no se tome como un {pk}
+router.register(r'utilizacion', UtilizacionViewSet, basename='utilizacion')
 router.register(r'', RegistroHorasMaquinariaViewSet, basename='registros_horas_maquinaria')
 
 urlpatterns = router.urls
\ No newline at end of file
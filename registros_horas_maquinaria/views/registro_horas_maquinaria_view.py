@@ -3,18 +3,25 @@ from functools import partial
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
 from logins.permissions.rol_permissions import RolPermission
+from registros_horas_maquinaria.models.registro_horas_maquinaria import RegistroHorasMaquinaria
 from registros_horas_maquinaria.serializers.registro_horas_maquinaria_serializer import \
     RegistroHorasMaquinariaSerializer
-from registros_horas_maquinaria.services.registro_horas_maquinaria_service import RegistroHorasMaquinariaService
 from registros_horas_maquinaria.services.registro_horas_maquinaria_service_interface import \
     IRegistroHorasMaquinariaService
 from usuarios.serializers.usuario_serializer import UsuarioSerializer
+from comun.condicional import CondicionalMixin
+from comun.exportacion import ExportacionMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
 
-class RegistroHorasMaquinariaViewSet(viewsets.ModelViewSet):
+class RegistroHorasMaquinariaViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, ExportacionMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de registros de horas de maquinaria.
     Gestiona:
@@ -28,23 +35,29 @@ class RegistroHorasMaquinariaViewSet(viewsets.ModelViewSet):
 
     permission_key = "registro_horas_maquinaria"
     permission_classes = [RolPermission]
+    modelo_condicional = RegistroHorasMaquinaria
 
     def __init__(
         self,
-        service: IRegistroHorasMaquinariaService = RegistroHorasMaquinariaService(),
+        service: IRegistroHorasMaquinariaService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("registro_horas_maquinaria")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todos los registros de horas de maquinaria."""
-        registros = self.service.listar_registros()
-        serializer = RegistroHorasMaquinariaSerializer(registros, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, RegistroHorasMaquinariaSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_registros_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, RegistroHorasMaquinariaSerializer, campos=campos)
+
+        registros = self.service.listar_registros(columnas=columnas)
+        return Response(serializar_listado(registros, RegistroHorasMaquinariaSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                     OBTENER (GET/{id})
@@ -71,6 +84,41 @@ class RegistroHorasMaquinariaViewSet(viewsets.ModelViewSet):
         except ValidationError as e:
             return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
 
+    # -------------------------------------------------------
+    #           IMPORTAR CSV / XLSX (POST /importar)
+    # -------------------------------------------------------
+    @action(detail=False, methods=['post'], url_path='importar', parser_classes=[MultiPartParser])
+    def importar(self, request):
+        """
+        Importa registros de horas desde un archivo CSV o XLSX (campo `archivo`).
+        POST /api/registros-horarios-maquinaria/importar/?parcial=true
+
+        Columnas: maquina, fecha, horas_trabajadas y opcionalmente
+        proyecto, usuario, observaciones.
+        Sin `parcial`, si alguna fila tiene errores no se importa nada.
+
+        Response:
+        {
+            "filas": int,
+            "insertados": int,
+            "errores": [{"fila": int, "errores": {...}}]
+        }
+        """
+        archivo = request.FILES.get("archivo")
+        if not archivo:
+            return Response({"archivo": "Debe adjuntar un archivo CSV o XLSX."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        parcial = request.query_params.get("parcial", "").lower() in ("1", "true")
+
+        try:
+            resultado = self.service.importar_registros(archivo, parcial=parcial)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        codigo = status.HTTP_201_CREATED if resultado["insertados"] else status.HTTP_400_BAD_REQUEST
+        return Response(resultado, status=codigo)
+
     # -------------------------------------------------------
     #                     ACTUALIZAR (PUT/PATCH)
     # -------------------------------------------------------
@@ -109,7 +157,30 @@ class RegistroHorasMaquinariaViewSet(viewsets.ModelViewSet):
         """
         GET /registro-horas/maquina/{id_maquina}/
         Obtiene todos los registros de horas asociados a una máquina.
+        Acepta paginación por cursor con ?cursor= y ?page_size=.
         """
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.obtener_por_maquina_paginado(id_maquina, **paginacion)
+            return self.respuesta_paginada(pagina, RegistroHorasMaquinariaSerializer)
+
         registros = self.service.obtener_por_maquina(id_maquina)
         serializer = RegistroHorasMaquinariaSerializer(registros, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    # -------------------------------------------------------
+    #             EXPORTAR CSV / NDJSON (GET /exportar)
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        """
+        Exporta registros de horas en streaming (CSV o NDJSON).
+        GET /api/registros-horarios-maquinaria/exportar/?formato=csv&desde=2025-01-01&hasta=2025-12-31&maquina=3
+        """
+        try:
+            formato, filtros = self.obtener_parametros_exportacion(request)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        columnas, filas = self.service.exportar_registros(**filtros)
+        return self.respuesta_exportacion(filas, columnas, formato, nombre="registros_horas")
@@ -0,0 +1,85 @@
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from logins.permissions.rol_permissions import RolPermission
+from registros_horas_maquinaria.models.resumen_horas_periodo import ResumenHorasPeriodo
+from registros_horas_maquinaria.serializers.utilizacion_parametros_serializer import \
+    UtilizacionParametrosSerializer
+from registros_horas_maquinaria.serializers.utilizacion_serializer import UtilizacionReporteSerializer
+from registros_horas_maquinaria.services.utilizacion_service_interface import IUtilizacionService
+from comun.servicios import obtener_servicio
+
+
+class UtilizacionViewSet(viewsets.ViewSet):
+    """
+    Reportes de utilización de la flota: horas trabajadas por periodo
+    (día, semana o mes) para cada máquina, proyecto u operador.
+
+    Parámetros comunes: ?periodo=dia|semana|mes&desde=&hasta=&ids=1,2
+
+    Response:
+    {
+        "dimension": str,
+        "periodo": str,
+        "desde": date,
+        "hasta": date,
+        "resultados": [
+            {"inicio": date, "id": int|null, "nombre": str, "horas_trabajadas": "0.00",
+             "registros": int, "cerrado": bool}
+        ]
+    }
+    """
+
+    permission_key = "utilizacion"
+    permission_classes = [RolPermission]
+
+    def __init__(self, service: IUtilizacionService = None, **kwargs):
+        super().__init__(**kwargs)
+        self.service = service or obtener_servicio("utilizacion")
+
+    def _reporte(self, request, dimension):
+        parametros = UtilizacionParametrosSerializer(data=request.query_params)
+        if not parametros.is_valid():
+            return Response(parametros.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            data = self.service.obtener_utilizacion(dimension, **parametros.validated_data)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(UtilizacionReporteSerializer(data).data, status=status.HTTP_200_OK)
+
+    # -------------------------------------------------------
+    #                     POR MÁQUINA
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='maquinas')
+    def por_maquina(self, request):
+        """
+        GET /api/registros-horarios-maquinaria/utilizacion/maquinas/
+        Horas trabajadas por máquina y periodo.
+        """
+        return self._reporte(request, ResumenHorasPeriodo.MAQUINA)
+
+    # -------------------------------------------------------
+    #                     POR PROYECTO
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='proyectos')
+    def por_proyecto(self, request):
+        """
+        GET /api/registros-horarios-maquinaria/utilizacion/proyectos/
+        Horas trabajadas por proyecto y periodo (id null = sin proyecto).
+        """
+        return self._reporte(request, ResumenHorasPeriodo.PROYECTO)
+
+    # -------------------------------------------------------
+    #                     POR OPERADOR
+    # -------------------------------------------------------
+    @action(detail=False, methods=['get'], url_path='operadores')
+    def por_operador(self, request):
+        """
+        GET /api/registros-horarios-maquinaria/utilizacion/operadores/
+        Horas trabajadas por operador (usuario del registro) y periodo.
+        """
+        return self._reporte(request, ResumenHorasPeriodo.USUARIO)
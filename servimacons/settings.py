@@ -57,10 +57,12 @@ INSTALLED_APPS = [
     'registros_horas_maquinaria',
     'alarmas',
     'logins',
+    'comun',
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'comun.middleware.PresupuestoConsultasMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -114,6 +116,110 @@ CLOUDINARY_STORAGE = {
     'API_SECRET': os.getenv('API_SECRET'),
 }
 
+# Subida de archivos en segundo plano (comun.services.media_service)
+MEDIA_BACKEND = os.getenv('MEDIA_BACKEND', 'comun.media.backends.CloudinaryMediaBackend')
+MEDIA_ROOT = BASE_DIR / 'media'
+MEDIA_URL = '/media/'
+MEDIA_STAGING_DIR = BASE_DIR / 'media_staging'
+MEDIA_UPLOAD_WORKERS = int(os.getenv('MEDIA_UPLOAD_WORKERS', 4))
+MEDIA_UPLOAD_PARALELAS = int(os.getenv('MEDIA_UPLOAD_PARALELAS', 6))  # archivos simultáneos por lote
+MEDIA_UPLOAD_REINTENTOS = 3
+MEDIA_UPLOAD_ESPERA_BASE = 1  # segundos; se duplica en cada reintento
+MEDIA_UPLOAD_MAX_INTENTOS = 9
+MEDIA_SUBIDA_SINCRONA = os.getenv('MEDIA_SUBIDA_SINCRONA', 'False') == 'True'
+
+# Normalización de imágenes antes de subirlas (comun.media.imagenes)
+MEDIA_IMAGEN_FORMATO = os.getenv('MEDIA_IMAGEN_FORMATO', 'WEBP')  # WEBP o JPEG
+MEDIA_IMAGEN_CALIDAD = int(os.getenv('MEDIA_IMAGEN_CALIDAD', 80))
+MEDIA_IMAGEN_LADO_MAXIMO = int(os.getenv('MEDIA_IMAGEN_LADO_MAXIMO', 1600))  # px
+MEDIA_IMAGEN_MAX_PIXELES = 50_000_000  # se rechazan imágenes más grandes
+MEDIA_MINIATURA_LADO = int(os.getenv('MEDIA_MINIATURA_LADO', 320))  # px
+
+# Monitoreo de consultas SQL por request (comun.middleware.PresupuestoConsultasMiddleware)
+MONITOREO_CONSULTAS = os.getenv('MONITOREO_CONSULTAS', str(DEBUG)) == 'True'
+# True: superar el presupuesto lanza una excepción (usar en pruebas/CI)
+PRESUPUESTO_CONSULTAS_ESTRICTO = os.getenv('PRESUPUESTO_CONSULTAS_ESTRICTO', 'False') == 'True'
+# Máximo de consultas por ruta (admite patrones glob: '*' = un id)
+PRESUPUESTO_CONSULTAS = {
+    '/api/maquinarias/resumen/': 5,
+    '/api/maquinarias/': 3,
+    '/api/maquinarias/*/': 3,
+    '/api/maquinarias/en-operacion/': 3,
+    '/api/maquinarias/vencidas/': 3,
+    '/api/maquinarias/pendientes/': 3,
+    '/api/maquinarias/al-dia/': 3,
+    '/api/maquinarias/ultimas-maquinarias/': 3,
+    '/api/maquinarias/proximos-mantenimientos/': 3,
+    '/api/mantenimientos/': 3,
+    '/api/mantenimientos/maquina/*/': 3,
+    '/api/mantenimientos-programados/': 3,
+    '/api/mantenimientos-programados/maquina/*/': 3,
+    '/api/proyecto-maquinaria/': 3,
+    '/api/proyecto-maquinaria/maquina/*/': 3,
+    '/api/registros-horarios-maquinaria/': 3,
+    '/api/registros-horarios-maquinaria/maquina/*/': 3,
+    '/api/alarmas/': 3,
+    '/api/alarmas/no-vistas/': 3,
+    '/api/alarmas/historial/': 3,
+}
+
+# Máximo de filas por archivo en la importación masiva de registros de horas
+IMPORTACION_MAX_FILAS = int(os.getenv('IMPORTACION_MAX_FILAS', 5000))
+
+# Filas leídas por bloque en las exportaciones en streaming (CSV / NDJSON)
+EXPORTACION_CHUNK_SIZE = 2000
+
+# Eventos de alarmas en tiempo real (SSE en /api/alarmas/eventos/; requiere ASGI,
+# ver start.sh)
+# local: cada proceso difunde solo los cambios hechos en él (un solo worker)
+# sondeo: cada proceso con conexiones lee los cambios de la BD (varios workers)
+# Por defecto, sondeo si gunicorn levanta más de un worker (WEB_CONCURRENCY)
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 1))
+ALARMAS_EVENTOS_MODO = os.getenv('ALARMAS_EVENTOS_MODO', 'sondeo' if WEB_CONCURRENCY > 1 else 'local')
+ALARMAS_EVENTOS_INTERVALO = int(os.getenv('ALARMAS_EVENTOS_INTERVALO', 3))  # segundos entre sondeos
+ALARMAS_EVENTOS_LATIDO = 15  # segundos entre comentarios keep-alive
+ALARMAS_EVENTOS_DURACION_MAXIMA = 3600  # luego el cliente se reconecta (y se re-autentica)
+
+# Pronóstico de próximos mantenimientos: días recientes de registros de
+# horas con los que se estima el ritmo de uso (horas/día) de cada máquina
+PRONOSTICO_VENTANA_DIAS = 30
+
+# Retención de alarmas: las vistas con más de N días pasan a alarmas_archivo
+# (comando archivar_alarmas, p. ej. diario por cron), en lotes de filas
+ALARMAS_RETENCION_DIAS = int(os.getenv('ALARMAS_RETENCION_DIAS', 90))
+ALARMAS_ARCHIVO_LOTE = 1000
+
+# Cachés. Con REDIS_URL se usa Redis (compartido entre workers; requiere
+# el paquete `redis`); si no, memoria local del proceso (desarrollo/pruebas).
+CACHE_COMPARTIDA = bool(os.getenv('REDIS_URL'))
+if CACHE_COMPARTIDA:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Caché del dashboard de flota y alarmas (comun.cache). Activa por defecto
+# solo con caché compartida: en memoria local la invalidación llega solo al
+# worker que hizo el cambio y los demás servirían datos viejos
+DASHBOARD_CACHE_ACTIVA = os.getenv('DASHBOARD_CACHE_ACTIVA', str(CACHE_COMPARTIDA)) == 'True'
+DASHBOARD_CACHE_ALIAS = 'default'
+DASHBOARD_CACHE_TTL = int(os.getenv('DASHBOARD_CACHE_TTL', 60))  # segundos que un valor es "fresco"
+DASHBOARD_CACHE_STALE_MAX = 300  # segundos extra que se conserva un valor vencido (para SWR)
+DASHBOARD_CACHE_SWR = True  # servir el valor anterior mientras un solo request recalcula
+DASHBOARD_CACHE_BLOQUEO = 10  # segundos máximos de un recálculo (candado)
+
+# Listados completos leídos con values_list() y conversores compilados en vez
+# del ModelSerializer por fila (comun.lectura_rapida); misma forma JSON
+LECTURA_RAPIDA_ACTIVA = os.getenv('LECTURA_RAPIDA_ACTIVA', 'True') == 'True'
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -190,7 +296,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # JWT sin consulta a la BD por request (ver logins.authentication)
+        'logins.authentication.jwt_stateless_authentication.JWTStatelessAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -212,4 +319,23 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'login_id',
 
     'AUTH_HEADER_TYPES': ('Bearer',),
-}
\ No newline at end of file
+}
+
+# Segundos que se cachea la versión de token de cada login. Acota cuánto
+# tarda en aplicarse una revocación en otros procesos si la caché no es
+# compartida (sin REDIS_URL).
+TOKEN_VERSION_CACHE_TTL = int(os.getenv('TOKEN_VERSION_CACHE_TTL', 300))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'comun': {
+            'handlers': ['console'],
+            'level': os.getenv('COMUN_LOG_LEVEL', 'INFO'),
+        },
+    },
+}
@@ -0,0 +1,10 @@
+# Comando de inicio del servicio web (no del build).
+# Las subidas pendientes se reintentan aquí y no en build.sh: sus archivos
+# están en el staging local de esta instancia. Corre en segundo plano para
+# no demorar el arranque; para reintentos periódicos, agendar el mismo
+# comando con cron en esta instancia.
+python manage.py procesar_subidas_pendientes &
+
+# ASGI (workers de uvicorn): los eventos de alarmas (SSE) lo requieren; las
+# vistas síncronas funcionan igual. Workers: WEB_CONCURRENCY (ver settings)
+exec gunicorn servimacons.asgi:application -k uvicorn_worker.UvicornWorker
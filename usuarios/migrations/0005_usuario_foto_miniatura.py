@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('usuarios', '0004_alter_usuario_foto'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usuario',
+            name='foto_miniatura',
+            field=models.CharField(blank=True, max_length=500, null=True),
+        ),
+    ]
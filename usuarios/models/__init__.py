@@ -0,0 +1 @@
+from .usuario import Usuario
@@ -15,6 +15,7 @@ class Usuario(models.Model):
     telefono = models.CharField(max_length=20, null=True, blank=True)
     fecha_ingreso = models.DateField(null=True, blank=True)
     foto = models.CharField(max_length=500, null=True, blank=True)
+    foto_miniatura = models.CharField(max_length=500, null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -1,5 +1,7 @@
 from django.core.exceptions import ObjectDoesNotExist
 from usuarios.models.usuario import Usuario
+from comun.paginacion import paginar_por_cursor
+from comun.seleccion_campos import limitar_columnas
 
 class UsuarioRepository:
     """
@@ -8,9 +10,14 @@ class UsuarioRepository:
         """
 
     @staticmethod
-    def get_all():
+    def get_all(columnas=None):
         """Retorna todos los usuarios."""
-        return Usuario.objects.all()
+        return limitar_columnas(Usuario.objects.all(), columnas)
+
+    @staticmethod
+    def get_page(cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los usuarios paginada por cursor (por llave primaria)."""
+        return paginar_por_cursor(limitar_columnas(Usuario.objects.all(), columnas), cursor, page_size)
 
     @staticmethod
     def get_by_id(**kwargs):
@@ -36,6 +43,11 @@ class UsuarioRepository:
         except ObjectDoesNotExist:
             return None
 
+    @staticmethod
+    def get_ids_existentes(ids):
+        """Retorna el subconjunto de IDs de usuario que existen (una sola consulta)."""
+        return set(Usuario.objects.filter(id_usuario__in=ids).values_list('id_usuario', flat=True))
+
     @staticmethod
     def create(**kwargs):
         """Crea un usuario usando los campos enviados como kwargs."""
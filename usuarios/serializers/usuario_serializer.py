@@ -3,9 +3,13 @@ from datetime import date
 from django.core.validators import EmailValidator, RegexValidator
 from rest_framework import serializers
 from usuarios.models.usuario import Usuario
+from comun.estado_subidas import EstadoSubidaField
+from comun.seleccion_campos import CamposDinamicosMixin
 
 
-class UsuarioSerializer(serializers.ModelSerializer):
+class UsuarioSerializer(CamposDinamicosMixin, serializers.ModelSerializer):
+    foto_estado = EstadoSubidaField("foto")
+
     class Meta:
         model = Usuario
         fields = [
@@ -16,10 +20,12 @@ class UsuarioSerializer(serializers.ModelSerializer):
             'telefono',
             'fecha_ingreso',
             'foto',
+            'foto_miniatura',
+            'foto_estado',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ('id_usuario', 'created_at', 'updated_at')
+        read_only_fields = ('id_usuario', 'foto_miniatura', 'created_at', 'updated_at')
 
         extra_kwargs = {
             'nombre': {
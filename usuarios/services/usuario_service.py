@@ -1,9 +1,7 @@
-import cloudinary.uploader
-from typing import Optional
-
-from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from rest_framework.exceptions import ValidationError, NotFound
 
+from comun.servicios import Dependencia
 from usuarios.repositories.usuario_repository import UsuarioRepository
 from usuarios.serializers.usuario_serializer import UsuarioSerializer
 from usuarios.services.usuario_service_interface import IUsuarioService
@@ -19,34 +17,19 @@ class UsuarioService(IUsuarioService):
     - Operaciones con el repository
     """
 
-    # ----------------------------------------------------------------------
-    # UTILIDAD: Guardar foto físicamente
-    # ----------------------------------------------------------------------
-    def _guardar_foto(self, foto_file: Optional[UploadedFile]) -> Optional[str]:
-        """
-        Guarda la foto en usuarios/files/fotos/
-        Retorna la URL absoluta final que se almacenará en BD.
-        """
-        if not foto_file:
-            return None
-
-        try:
-            resultado = cloudinary.uploader.upload(
-                foto_file,
-                folder="usuarios/photos",  # carpeta lógica en Cloudinary
-                resource_type="image"  # forzamos imagen
-            )
-            return resultado.get("secure_url")
-
-        except Exception as e:
-            raise ValidationError({"foto": "Error al subir la imagen"})
+    # Inyección de dependencias de otros servicios (ver comun.servicios)
+    media_service = Dependencia("media")
 
     # ----------------------------------------------------------------------
     # Listar Usuarios
     # ----------------------------------------------------------------------
-    def listar_usuarios(self):
+    def listar_usuarios(self, columnas=None):
         """Retorna todos los usuarios registrados."""
-        return UsuarioRepository.get_all()
+        return UsuarioRepository.get_all(columnas=columnas)
+
+    def listar_usuarios_paginado(self, cursor=None, page_size=None, columnas=None):
+        """Retorna una página de los usuarios (paginación por cursor)."""
+        return UsuarioRepository.get_page(cursor=cursor, page_size=page_size, columnas=columnas)
 
     # ----------------------------------------------------------------------
     # Obtener Usuario
@@ -65,6 +48,7 @@ class UsuarioService(IUsuarioService):
     # ----------------------------------------------------------------------
     # Crear Usuario
     # ----------------------------------------------------------------------
+    @transaction.atomic
     def crear_usuario(self, data: dict):
         """
         Crea un nuevo usuario.
@@ -90,17 +74,18 @@ class UsuarioService(IUsuarioService):
         if email and UsuarioRepository.get_by_email(email=email):
             raise ValidationError({"email": "Este correo ya está registrado."})
 
-        # Si viene una foto → guardarla
+        usuario = UsuarioRepository.create(**serializer.validated_data)
+
+        # Si viene una foto → subirla en segundo plano
         if foto_file:
-            ruta_foto = self._guardar_foto(foto_file)
-            serializer.validated_data["foto"] = ruta_foto
+            self.media_service.programar_subida(usuario, "foto", foto_file, carpeta="usuarios/photos")
 
-        usuario = UsuarioRepository.create(**serializer.validated_data)
         return usuario
 
     # ----------------------------------------------------------------------
     # Actualizar Usuario
     # ----------------------------------------------------------------------
+    @transaction.atomic
     def actualizar_usuario(self, id_usuario: int, data: dict):
         """
         Actualiza un usuario existente.
@@ -132,14 +117,14 @@ class UsuarioService(IUsuarioService):
                     "email": "Este correo ya está registrado por otro usuario."
                 })
 
-        # ¿Se sube una nueva foto?
-        if foto_file:
-            nueva_ruta = self._guardar_foto(foto_file)
-            serializer.validated_data["foto"] = nueva_ruta
-
         usuario_actualizado = UsuarioRepository.update(
             usuario, **serializer.validated_data
         )
+
+        # ¿Se sube una nueva foto? → en segundo plano
+        if foto_file:
+            self.media_service.programar_subida(usuario_actualizado, "foto", foto_file, carpeta="usuarios/photos")
+
         return usuario_actualizado
 
     # ----------------------------------------------------------------------
@@ -8,7 +8,11 @@ class IUsuarioService(ABC):
     """
 
     @abstractmethod
-    def listar_usuarios(self):
+    def listar_usuarios(self, columnas=None):
+        pass
+
+    @abstractmethod
+    def listar_usuarios_paginado(self, cursor=None, page_size=None, columnas=None):
         pass
 
     @abstractmethod
@@ -1,8 +1,8 @@
 from django.db.models.signals import post_migrate
 from django.dispatch import receiver
 
+from comun.servicios import obtener_servicio
 from usuarios.models.usuario import Usuario
-from usuarios.services.usuario_service import UsuarioService
 
 
 @receiver(post_migrate)
@@ -25,7 +25,7 @@ def crear_usuario_predeterminado(sender, **kwargs):
         "foto" : None,
     }
 
-    service = UsuarioService()
+    service = obtener_servicio("usuario")
     service.crear_usuario(data=usuario)
 
     print("Usuario predeterminado creado correctamente.")
\ No newline at end of file
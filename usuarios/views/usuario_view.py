@@ -2,12 +2,17 @@ from rest_framework import viewsets, status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from usuarios.models.usuario import Usuario
 from logins.permissions.rol_permissions import RolPermission
 from usuarios.serializers.usuario_serializer import UsuarioSerializer
 from usuarios.services.usuario_service_interface import IUsuarioService
-from usuarios.services.usuario_service import UsuarioService
+from comun.condicional import CondicionalMixin
+from comun.paginacion import PaginacionCursorMixin
+from comun.lectura_rapida import serializar_listado
+from comun.seleccion_campos import SeleccionCamposMixin
+from comun.servicios import obtener_servicio
 
-class UsuarioViewSet(viewsets.ModelViewSet):
+class UsuarioViewSet(CondicionalMixin, PaginacionCursorMixin, SeleccionCamposMixin, viewsets.ModelViewSet):
     """
     ViewSet profesional para la gestión de usuarios.
     Gestiona listado, creación, consulta individual,
@@ -17,23 +22,29 @@ class UsuarioViewSet(viewsets.ModelViewSet):
 
     permission_key = "usuario"
     permission_classes = [RolPermission]
+    modelo_condicional = Usuario
 
     def __init__(
         self,
-        service: IUsuarioService = UsuarioService(),
+        service: IUsuarioService = None,
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.service = service
+        self.service = service or obtener_servicio("usuario")
 
     # -------------------------------------------------------
     #                     LISTAR (GET)
     # -------------------------------------------------------
     def list(self, request, *args, **kwargs):
         """Retorna todos los usuarios."""
-        usuarios = self.service.listar_usuarios()
-        serializer = UsuarioSerializer(usuarios, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        campos, columnas = self.obtener_seleccion_campos(request, UsuarioSerializer)
+        paginacion = self.obtener_parametros_cursor(request)
+        if paginacion:
+            pagina = self.service.listar_usuarios_paginado(**paginacion, columnas=columnas)
+            return self.respuesta_paginada(pagina, UsuarioSerializer, campos=campos)
+
+        usuarios = self.service.listar_usuarios(columnas=columnas)
+        return Response(serializar_listado(usuarios, UsuarioSerializer, campos=campos), status=status.HTTP_200_OK)
 
     # -------------------------------------------------------
     #                     OBTENER (GET/{id})